@@ -10,11 +10,12 @@ def _transcribe_span(wav_path: str, start_s: float, end_s: float, model_name: st
     model = WhisperModel(model_name)
     # Note: faster-whisper doesn't support seek/duration directly; we can slice via ffmpeg temp file if needed.
     # For simplicity, decode whole file and filter here (acceptable for demo), or implement slicing in production.
-    segs, _ = model.transcribe(wav_path, vad_filter=True, beam_size=5)
+    segs, _ = model.transcribe(wav_path, vad_filter=True, beam_size=5, word_timestamps=True)
     out = []
     for s in segs:
         if s.start >= start_s and s.end <= end_s:
-            out.append({"start_s": float(s.start), "end_s": float(s.end), "text": s.text.strip()})
+            words = [{"word": w.word.strip(), "start_s": float(w.start), "end_s": float(w.end)} for w in (s.words or [])]
+            out.append({"start_s": float(s.start), "end_s": float(s.end), "text": s.text.strip(), "words": words})
     return out
 
 class WhisperASRChunked(ASR):
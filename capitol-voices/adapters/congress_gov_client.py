@@ -0,0 +1,274 @@
+from __future__ import annotations
+import hashlib, json, os, threading, time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://api.congress.gov/v3"
+
+# Seconds a cached response is served without touching the network, by first path segment.
+# Lists change as new hearings are published; individual records rarely change once posted.
+DEFAULT_TTLS: Dict[str, float] = {
+    "list": 15 * 60,
+    "hearing": 24 * 3600,
+    "committee": 24 * 3600,
+    "member": 7 * 24 * 3600,
+    "default": 3600,
+}
+
+class CongressAPIError(Exception): ...
+
+class TokenBucket:
+    """Thread-safe token bucket. `rate` tokens are added per second up to `capacity`."""
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+@dataclass
+class CachedResponse:
+    url: str
+    status: int
+    text: str
+    content_type: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+class HTTPCache:
+    """On-disk response cache, one JSON file per request key (sha256 of URL + params).
+    Entries keep the validators (ETag / Last-Modified) needed for conditional revalidation.
+    """
+    def __init__(self, cache_dir: str | os.PathLike):
+        self.dir = Path(cache_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, params: Dict[str, Any]) -> str:
+        canon = url + "?" + urlencode(sorted((k, str(v)) for k, v in params.items() if k != "api_key"))
+        return hashlib.sha256(canon.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        p = self._path(key)
+        try:
+            return CachedResponse(**json.loads(p.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, key: str, resp: CachedResponse) -> None:
+        p = self._path(key)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        data = asdict(resp); data["from_cache"] = False
+        tmp = p.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, p)
+
+    def clear(self) -> None:
+        for p in self.dir.glob("*/*.json"):
+            p.unlink(missing_ok=True)
+
+class CongressGovClient:
+    """Shared Congress.gov v3 client: pooled session, retries, on-disk HTTP cache and rate limiting.
+
+    Use `get_client()` to obtain the process-wide instance rather than constructing one per call.
+    """
+    def __init__(self, api_key: str | None, base_url: str = BASE_URL, cache_dir: str | None = "data/http_cache",
+                 rate_per_s: float = 1.0, burst: int = 5, timeout: float = 15.0, max_retries: int = 3,
+                 ttls: Dict[str, float] | None = None, pool_size: int = 10):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache = HTTPCache(cache_dir) if cache_dir else None
+        self.bucket = TokenBucket(rate_per_s, burst)
+        self.session = requests.Session()
+        retry = Retry(total=max_retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({"GET"}), respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if api_key:
+            self.session.headers["X-API-Key"] = api_key
+        self.stats = {"network": 0, "cache_hits": 0, "revalidated": 0}
+
+    def _ttl(self, path: str) -> float:
+        parts = [p for p in path.strip("/").split("/") if p]
+        if not parts:
+            return self.ttls["default"]
+        if parts[-1] in ("hearings", "bills", "reports") or (parts[0] == "hearing" and len(parts) <= 3):
+            return self.ttls["list"]
+        return self.ttls.get(parts[0], self.ttls["default"])
+
+    def fetch(self, path: str, params: Dict[str, Any] | None = None, ttl: float | None = None) -> CachedResponse:
+        """GET `path` (relative to base_url, or absolute), honouring the cache and the rate limit."""
+        url = path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+        params = dict(params or {})
+        ttl = self._ttl(urlparse(url).path.replace(urlparse(self.base_url).path, "", 1)) if ttl is None else ttl
+        key = HTTPCache.key(url, params) if self.cache else ""
+        cached = self.cache.get(key) if self.cache else None
+        if cached and time.time() - cached.fetched_at < ttl:
+            self.stats["cache_hits"] += 1
+            cached.from_cache = True
+            return cached
+
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        self.bucket.acquire()
+        try:
+            r = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            if cached:  # stale is better than nothing when the API is unreachable
+                cached.from_cache = True
+                return cached
+            raise CongressAPIError(f"Request to {url} failed: {e}") from e
+        self.stats["network"] += 1
+
+        if r.status_code == 304 and cached:
+            self.stats["revalidated"] += 1
+            cached.fetched_at = time.time()
+            self.cache.put(key, cached)
+            cached.from_cache = True
+            return cached
+        if r.status_code >= 400:
+            raise CongressAPIError(f"{r.status_code} from {url}: {r.text[:200]}")
+
+        resp = CachedResponse(url=url, status=r.status_code, text=r.text,
+                              content_type=r.headers.get("Content-Type", ""),
+                              etag=r.headers.get("ETag"), last_modified=r.headers.get("Last-Modified"))
+        if self.cache and resp.text.strip():
+            self.cache.put(key, resp)
+        return resp
+
+    def get_json(self, path: str, params: Dict[str, Any] | None = None, ttl: float | None = None) -> Dict[str, Any]:
+        resp = self.fetch(path, {"format": "json", **(params or {})}, ttl=ttl)
+        try:
+            return resp.json()
+        except ValueError as e:
+            raise CongressAPIError(f"Non-JSON response from {resp.url}: {resp.text[:200]}") from e
+
+    def iter_items(self, path: str, item_key: str, params: Dict[str, Any] | None = None,
+                   page_size: int = 250, max_items: int | None = None) -> Iterator[Dict[str, Any]]:
+        """Yield `item_key` records across pages, following `pagination.next` until exhausted."""
+        params = dict(params or {})
+        offset = int(params.pop("offset", 0))
+        limit = min(page_size, max_items) if max_items else page_size
+        seen = 0
+        while True:
+            data = self.get_json(path, {**params, "limit": limit, "offset": offset})
+            items = data.get(item_key) or []
+            for item in items:
+                yield item
+                seen += 1
+                if max_items and seen >= max_items:
+                    return
+            nxt = (data.get("pagination") or {}).get("next")
+            if not items or not nxt:
+                return
+            offset = int(parse_qs(urlparse(nxt).query).get("offset", [offset + len(items)])[0])
+
+    # Hearing helpers ---------------------------------------------------------------------------
+
+    @staticmethod
+    def _hearing_path(congress: int | None = None, chamber: str | None = None) -> str:
+        path = "hearing"
+        if congress:
+            path += f"/{congress}"
+            if chamber:
+                path += f"/{chamber.lower()}"
+        return path
+
+    def get_hearing(self, congress: int, chamber: str, jacket_number: int | str) -> Dict[str, Any]:
+        return self.get_json(f"{self._hearing_path(congress, chamber)}/{jacket_number}")
+
+    def iter_hearings(self, congress: int | None = None, chamber: str | None = None,
+                      max_items: int | None = None, **params) -> Iterator[Dict[str, Any]]:
+        return self.iter_items(self._hearing_path(congress, chamber), "hearings", params, max_items=max_items)
+
+    @staticmethod
+    def _matches_committee(hearing: Dict[str, Any], committee: str) -> bool:
+        needle = committee.lower()
+        return any(needle in (c.get("systemCode") or "").lower() or needle in (c.get("name") or "").lower()
+                   for c in hearing.get("committees") or [])
+
+    def search_hearings(self, congress: int | None = None, chamber: str | None = None,
+                        committee: str | None = None, limit: int = 10, details: bool = False,
+                        max_scanned: int | None = 100) -> Dict[str, Any]:
+        """Hearings matching the filters, up to `limit`, paginating transparently.
+
+        List records only carry congress/chamber/jacketNumber; committee filtering and `details=True`
+        resolve each record through the (cached) detail endpoint, one request per hearing. At most
+        `max_scanned` list records are examined (None for no bound); when the bound stops the scan
+        before `limit` matches are found, the result is partial and marked `"partial": True`.
+        """
+        hearings = []
+        scanned = 0
+        for h in self.iter_hearings(congress, chamber, max_items=max_scanned):
+            scanned += 1
+            if committee or details:
+                h = self.get_hearing(h["congress"], h["chamber"], h["jacketNumber"]).get("hearing", h)
+                if committee and not self._matches_committee(h, committee):
+                    continue
+            hearings.append(h)
+            if len(hearings) >= limit:
+                break
+        partial = len(hearings) < limit and max_scanned is not None and scanned >= max_scanned
+        return {"hearings": hearings, "scanned": scanned, "partial": partial}
+
+    def get_committee_hearings(self, congress: int, committee: str, chamber: str | None = None,
+                               limit: int = 10, max_scanned: int | None = 100) -> Dict[str, Any]:
+        """Hearings held by one committee (system code such as `hsgo00`, or a name fragment)."""
+        if chamber is None and committee[:1].lower() in ("h", "s", "j"):
+            chamber = {"h": "house", "s": "senate", "j": "joint"}[committee[0].lower()]
+        return self.search_hearings(congress, chamber, committee=committee, limit=limit, max_scanned=max_scanned)
+
+_clients: Dict[tuple, CongressGovClient] = {}
+_clients_lock = threading.Lock()
+
+def get_client(api_key: str | None = None, **kwargs) -> CongressGovClient:
+    """Process-wide client per (api_key, options). Defaults come from AppSettings / CONGRESS_API_KEY."""
+    try:
+        from core.settings import AppSettings
+        cfg = AppSettings()
+        api_key = api_key or cfg.congress_api_key
+        kwargs.setdefault("cache_dir", cfg.congress_api_cache_dir)
+        kwargs.setdefault("rate_per_s", cfg.congress_api_rate_per_s)
+    except Exception:
+        pass
+    api_key = api_key or os.getenv("CONGRESS_API_KEY")
+    k = (api_key, tuple(sorted(kwargs.items())))
+    with _clients_lock:
+        if k not in _clients:
+            _clients[k] = CongressGovClient(api_key, **kwargs)
+        return _clients[k]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 import json
+import time
 import psycopg2
 import psycopg2.extras
 from pathlib import Path
 from typing import Iterable, Dict, Any, List, Optional
 from datetime import datetime
 from core.interfaces import Segment, Storage
+from core.word_index import pack_words, seek_in_segments, words_from_blob
+
+JOB_FIELDS = ("status", "progress", "message", "result", "error", "started_at", "finished_at")
 
 class PostgreSQLStorage(Storage):
     """PostgreSQL storage adapter for Congressional hearing data.
@@ -80,10 +84,16 @@ class PostgreSQLStorage(Storage):
                         text TEXT NOT NULL,
                         confidence DECIMAL(5,4),
                         word_count INTEGER,
+                        words BYTEA,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
                 
+                # Packed word timings (core/word_index.py) for databases created before the column existed
+                cur.execute(f"""
+                    ALTER TABLE {self.schema}.segments ADD COLUMN IF NOT EXISTS words BYTEA
+                """)
+                
                 # Create summaries table
                 cur.execute(f"""
                     CREATE TABLE IF NOT EXISTS {self.schema}.summaries (
@@ -150,6 +160,28 @@ class PostgreSQLStorage(Storage):
                     ON {self.schema}.hearings USING gin(metadata)
                 """)
                 
+                # Background jobs (see pipelines/jobs.py); times are epoch seconds as in SQLite
+                cur.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.schema}.jobs (
+                        id VARCHAR(64) PRIMARY KEY,
+                        kind VARCHAR(50) NOT NULL,
+                        status VARCHAR(20) NOT NULL,
+                        progress REAL DEFAULT 0,
+                        message TEXT,
+                        params JSONB,
+                        result JSONB,
+                        error TEXT,
+                        created_at DOUBLE PRECISION,
+                        started_at DOUBLE PRECISION,
+                        finished_at DOUBLE PRECISION
+                    )
+                """)
+                
+                cur.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_jobs_created 
+                    ON {self.schema}.jobs(created_at DESC)
+                """)
+                
                 conn.commit()
     
     def write_segments(self, hearing_id: str, segments: Iterable[Segment]) -> None:
@@ -167,14 +199,15 @@ class PostgreSQLStorage(Storage):
                         seg.get("speaker_key"),
                         seg.get("text", ""),
                         seg.get("confidence"),
-                        word_count
+                        word_count,
+                        psycopg2.Binary(pack_words(seg.get("text", ""), seg["words"])) if seg.get("words") else None
                     ))
                 
                 # Batch insert
                 cur.executemany(f"""
                     INSERT INTO {self.schema}.segments 
-                    (hearing_id, start_s, end_s, speaker_key, text, confidence, word_count)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    (hearing_id, start_s, end_s, speaker_key, text, confidence, word_count, words)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """, segment_data)
                 
                 conn.commit()
@@ -199,7 +232,7 @@ class PostgreSQLStorage(Storage):
         with self._get_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 cur.execute(f"""
-                    SELECT start_s, end_s, speaker_key, text, confidence
+                    SELECT start_s, end_s, speaker_key, text, confidence, words
                     FROM {self.schema}.segments
                     WHERE hearing_id = %s
                     ORDER BY start_s
@@ -207,17 +240,35 @@ class PostgreSQLStorage(Storage):
                 
                 segments = []
                 for row in cur.fetchall():
-                    segments.append({
+                    seg = {
                         "hearing_id": hearing_id,
                         "start_s": float(row["start_s"]),
                         "end_s": float(row["end_s"]),
                         "speaker_key": row["speaker_key"],
                         "text": row["text"],
                         "confidence": float(row["confidence"]) if row["confidence"] else None
-                    })
+                    }
+                    if row["words"]:
+                        seg["words"] = words_from_blob(row["text"], row["words"])
+                    segments.append(seg)
                 
                 return segments
     
+    def seek_phrase(self, hearing_id: str, phrase: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Occurrences of a phrase with the audio time to seek to (see core.word_index.seek_phrase)"""
+        with self._get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(f"""
+                    SELECT start_s, end_s, speaker_key, text, words
+                    FROM {self.schema}.segments
+                    WHERE hearing_id = %s AND text ILIKE %s
+                    ORDER BY start_s
+                """, (hearing_id, f"%{phrase.strip()}%"))
+                segs = [{"start_s": float(r["start_s"]), "end_s": float(r["end_s"]), "speaker_key": r["speaker_key"],
+                         "text": r["text"], "words_blob": r["words"]} for r in cur.fetchall()]
+        return [{**hit, "speaker_key": segs[hit["segment_index"]]["speaker_key"], "text": segs[hit["segment_index"]]["text"]}
+                for hit in seek_in_segments(segs, phrase, limit)]
+    
     def read_summary(self, hearing_id: str) -> Optional[Dict[str, Any]]:
         """Read summary from PostgreSQL"""
         with self._get_connection() as conn:
@@ -399,3 +450,41 @@ class PostgreSQLStorage(Storage):
                     conn.commit()
         except Exception as e:
             print(f"Warning: Could not write run data: {e}")
+
+    def create_job(self, job_id: str, kind: str, params: Dict[str, Any]) -> None:
+        """Record a queued background job"""
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    INSERT INTO {self.schema}.jobs (id, kind, status, progress, params, created_at)
+                    VALUES (%s, %s, 'queued', 0, %s, %s)
+                """, (job_id, kind, json.dumps(params), time.time()))
+                conn.commit()
+
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        """Update status/progress/result columns of a job"""
+        cols = [f for f in fields if f in JOB_FIELDS]
+        if not cols:
+            return
+        vals = [json.dumps(fields[c], default=str) if c == "result" else fields[c] for c in cols]
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"UPDATE {self.schema}.jobs SET {', '.join(c + ' = %s' for c in cols)} WHERE id = %s",
+                            (*vals, job_id))
+                conn.commit()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(f"SELECT * FROM {self.schema}.jobs WHERE id = %s", (job_id,))
+                row = cur.fetchone()
+                return dict(row) if row else None
+
+    def list_jobs(self, limit: int = 20, statuses: Iterable[str] | None = None) -> List[Dict[str, Any]]:
+        where, args = "", []
+        if statuses:
+            where, args = "WHERE status = ANY(%s)", [list(statuses)]
+        with self._get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(f"SELECT * FROM {self.schema}.jobs {where} ORDER BY created_at DESC LIMIT %s", (*args, limit))
+                return [dict(r) for r in cur.fetchall()]
@@ -1,7 +1,8 @@
 from __future__ import annotations
-import sqlite3, json
+import sqlite3, json, time
 from typing import Iterable, List, Optional, Dict, Any
 from core.interfaces import Segment, Storage
+from core.word_index import pack_words, seek_in_segments, words_from_blob
 
 SCHEMA = [
 """CREATE TABLE IF NOT EXISTS hearings(
@@ -13,7 +14,7 @@ SCHEMA = [
 )""",
 """CREATE TABLE IF NOT EXISTS segments(
     id INTEGER PRIMARY KEY AUTOINCREMENT, hearing_id TEXT, start_s REAL, end_s REAL,
-    speaker_key TEXT, text TEXT
+    speaker_key TEXT, text TEXT, words BLOB
 )""",
 """CREATE TABLE IF NOT EXISTS summaries(
     hearing_id TEXT, type TEXT, content_json TEXT,
@@ -23,9 +24,22 @@ SCHEMA = [
     run_id TEXT PRIMARY KEY, hearing_id TEXT, started_at REAL, finished_at REAL,
     asr_engine TEXT, asr_model TEXT, diar_engine TEXT, summarizer TEXT, git_sha TEXT,
     audio_sha256 TEXT, config_json TEXT
-)"""
+)""",
+"""CREATE TABLE IF NOT EXISTS jobs(
+    id TEXT PRIMARY KEY, kind TEXT, status TEXT, progress REAL DEFAULT 0, message TEXT,
+    params_json TEXT, result_json TEXT, error TEXT,
+    created_at REAL, started_at REAL, finished_at REAL
+)""",
+"CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at)",
 ]
 
+JOB_FIELDS = ("status", "progress", "message", "result", "error", "started_at", "finished_at")
+
+def _job_row(r) -> Dict[str, Any]:
+    return {"id": r[0], "kind": r[1], "status": r[2], "progress": r[3], "message": r[4],
+            "params": json.loads(r[5]) if r[5] else {}, "result": json.loads(r[6]) if r[6] else None,
+            "error": r[7], "created_at": r[8], "started_at": r[9], "finished_at": r[10]}
+
 class SQLiteStorage(Storage):
     def __init__(self, db_path: str = "data/hearings.db"):
         self.db_path = db_path
@@ -35,13 +49,16 @@ class SQLiteStorage(Storage):
         conn = sqlite3.connect(self.db_path); cur = conn.cursor()
         for stmt in SCHEMA:
             cur.execute(stmt)
+        if "words" not in {r[1] for r in cur.execute("PRAGMA table_info(segments)")}:
+            cur.execute("ALTER TABLE segments ADD COLUMN words BLOB")  # packed word timings, see core/word_index.py
         conn.commit(); conn.close()
 
     def write_segments(self, hearing_id: str, segments: Iterable[Segment]) -> None:
         conn = sqlite3.connect(self.db_path); cur = conn.cursor()
         cur.execute("DELETE FROM segments WHERE hearing_id=?", (hearing_id,))
-        cur.executemany("INSERT INTO segments(hearing_id,start_s,end_s,speaker_key,text) VALUES(?,?,?,?,?)",
-                        [(hearing_id, s["start_s"], s["end_s"], s.get("speaker_key"), s.get("text","")) for s in segments])
+        cur.executemany("INSERT INTO segments(hearing_id,start_s,end_s,speaker_key,text,words) VALUES(?,?,?,?,?,?)",
+                        [(hearing_id, s["start_s"], s["end_s"], s.get("speaker_key"), s.get("text",""),
+                          pack_words(s.get("text",""), s["words"]) if s.get("words") else None) for s in segments])
         conn.commit(); conn.close()
 
     def write_summary(self, hearing_id: str, summary: Dict[str, Any]) -> None:
@@ -50,11 +67,34 @@ class SQLiteStorage(Storage):
                     (hearing_id, "default", json.dumps(summary)))
         conn.commit(); conn.close()
 
+    def write_hearing_metadata(self, hearing_id: str, metadata: Dict[str, Any]) -> None:
+        conn = sqlite3.connect(self.db_path); cur = conn.cursor()
+        cur.execute("REPLACE INTO hearings(id,title,committee,date,video_url) VALUES(?,?,?,?,?)",
+                    (hearing_id, metadata.get("title", ""), metadata.get("committee", ""), metadata.get("date"),
+                     metadata.get("video_url") or metadata.get("youtube_url")))
+        conn.commit(); conn.close()
+
     def read_segments(self, hearing_id: str) -> List[Segment]:
         conn = sqlite3.connect(self.db_path); cur = conn.cursor()
-        cur.execute("SELECT start_s,end_s,speaker_key,text FROM segments WHERE hearing_id=? ORDER BY start_s", (hearing_id,))
+        cur.execute("SELECT start_s,end_s,speaker_key,text,words FROM segments WHERE hearing_id=? ORDER BY start_s", (hearing_id,))
         rows = cur.fetchall(); conn.close()
-        return [{"hearing_id": hearing_id, "start_s": r[0], "end_s": r[1], "speaker_key": r[2], "text": r[3]} for r in rows]
+        out = []
+        for r in rows:
+            seg: Segment = {"hearing_id": hearing_id, "start_s": r[0], "end_s": r[1], "speaker_key": r[2], "text": r[3]}
+            if r[4]:
+                seg["words"] = words_from_blob(r[3] or "", r[4])
+            out.append(seg)
+        return out
+
+    def seek_phrase(self, hearing_id: str, phrase: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Occurrences of `phrase` in a hearing with the audio time to seek to (see core.word_index.seek_phrase)."""
+        conn = sqlite3.connect(self.db_path); cur = conn.cursor()
+        cur.execute("SELECT start_s,end_s,speaker_key,text,words FROM segments WHERE hearing_id=? AND text LIKE ? ORDER BY start_s",
+                    (hearing_id, f"%{phrase.strip()}%"))
+        rows = cur.fetchall(); conn.close()
+        segs = [{"start_s": r[0], "end_s": r[1], "speaker_key": r[2], "text": r[3], "words_blob": r[4]} for r in rows]
+        return [{**hit, "speaker_key": segs[hit["segment_index"]]["speaker_key"], "text": segs[hit["segment_index"]]["text"]}
+                for hit in seek_in_segments(segs, phrase, limit)]
 
     def read_summary(self, hearing_id: str) -> Optional[Dict[str, Any]]:
         conn = sqlite3.connect(self.db_path); cur = conn.cursor()
@@ -70,3 +110,38 @@ class SQLiteStorage(Storage):
                     (data.get("run_id"), data.get("hearing_id"), data.get("started_at"), data.get("finished_at"), data.get("asr_engine"),
                      data.get("asr_model"), data.get("diar_engine"), data.get("summarizer"), data.get("git_sha"), data.get("audio_sha256"), data.get("config_json")))
         conn.commit(); conn.close()
+
+    # Background jobs (see pipelines/jobs.py)
+    def create_job(self, job_id: str, kind: str, params: Dict[str, Any]) -> None:
+        conn = sqlite3.connect(self.db_path); cur = conn.cursor()
+        cur.execute("INSERT INTO jobs(id,kind,status,progress,params_json,created_at) VALUES(?,?,?,?,?,?)",
+                    (job_id, kind, "queued", 0.0, json.dumps(params), time.time()))
+        conn.commit(); conn.close()
+
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        cols = [f for f in fields if f in JOB_FIELDS]
+        if not cols:
+            return
+        vals = [json.dumps(fields[c], default=str) if c == "result" else fields[c] for c in cols]
+        sets = ",".join(("result_json" if c == "result" else c) + "=?" for c in cols)
+        conn = sqlite3.connect(self.db_path); cur = conn.cursor()
+        cur.execute(f"UPDATE jobs SET {sets} WHERE id=?", (*vals, job_id))
+        conn.commit(); conn.close()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        conn = sqlite3.connect(self.db_path); cur = conn.cursor()
+        cur.execute("SELECT id,kind,status,progress,message,params_json,result_json,error,created_at,started_at,finished_at FROM jobs WHERE id=?", (job_id,))
+        row = cur.fetchone(); conn.close()
+        return _job_row(row) if row else None
+
+    def list_jobs(self, limit: int = 20, statuses: Iterable[str] | None = None) -> List[Dict[str, Any]]:
+        sql = "SELECT id,kind,status,progress,message,params_json,result_json,error,created_at,started_at,finished_at FROM jobs"
+        args: list = []
+        if statuses:
+            statuses = list(statuses)
+            sql += f" WHERE status IN ({','.join('?' * len(statuses))})"
+            args += statuses
+        conn = sqlite3.connect(self.db_path); cur = conn.cursor()
+        cur.execute(sql + " ORDER BY created_at DESC LIMIT ?", (*args, limit))
+        rows = cur.fetchall(); conn.close()
+        return [_job_row(r) for r in rows]
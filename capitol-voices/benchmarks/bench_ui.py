@@ -0,0 +1,47 @@
+"""Cold-start and rerun timings for the Streamlit UI, measured headless with streamlit.testing.
+
+    python benchmarks/bench_ui.py ui/app.py            # one entry script
+    python benchmarks/bench_ui.py ui/app.py --runs 5   # more cold starts
+
+Each cold start runs in a fresh interpreter so module imports and cache misses are included;
+reruns re-execute the script in the same session, as a widget interaction would.
+"""
+from __future__ import annotations
+import argparse, json, statistics, subprocess, sys, time
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+t1 = time.perf_counter()
+at.run()
+cold = time.perf_counter() - t1
+assert not at.exception, [e.value for e in at.exception]
+reruns = []
+for _ in range(int(sys.argv[2])):
+    t = time.perf_counter(); at.run(); reruns.append(time.perf_counter() - t)
+print(json.dumps({"import_streamlit_s": t1 - t0, "cold_run_s": cold, "reruns_s": reruns}))
+"""
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("script")
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--reruns", type=int, default=10)
+    args = ap.parse_args()
+    colds, reruns = [], []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, "-c", CHILD, args.script, str(args.reruns)],
+                             capture_output=True, text=True, check=True).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        colds.append(r["cold_run_s"]); reruns.extend(r["reruns_s"])
+    print(json.dumps({
+        "script": args.script,
+        "cold_start_ms_median": round(statistics.median(colds) * 1000, 1),
+        "rerun_ms_median": round(statistics.median(reruns) * 1000, 1),
+        "rerun_ms_p95": round(sorted(reruns)[int(len(reruns) * 0.95) - 1] * 1000, 1),
+    }))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Packed word timings vs one row per word: SQLite file size and phrase→seek latency.
+
+    python benchmarks/bench_word_index.py                # 10 synthetic 3-hour hearings
+    python benchmarks/bench_word_index.py --hearings 50
+
+Both schemas hold the same synthetic transcripts (~150 words/minute, 12-word segments). The lookup
+resolves a phrase to the audio offset of its first word, which is what click-to-seek needs; the load
+figure is the time to read every word timing of one hearing (e.g. for karaoke-style highlighting).
+"""
+from __future__ import annotations
+import argparse, json, os, random, sqlite3, statistics, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from core.word_index import pack_words, seek_phrase, unpack_words
+
+VOCAB = ("committee hearing witness testimony oversight agency budget federal response question "
+         "chairman ranking member gentleman yield time record statement policy funding program "
+         "public health data evidence investigation transparency accountability report").split()
+
+def synth_hearing(rng: random.Random, minutes: int = 180, words_per_seg: int = 12):
+    t, segs = 0.0, []
+    for _ in range(minutes * 150 // words_per_seg):
+        words = []
+        for _ in range(words_per_seg):
+            d = rng.uniform(0.25, 0.55)
+            words.append({"word": rng.choice(VOCAB), "start_s": round(t, 3), "end_s": round(t + d, 3)})
+            t += d + 0.02
+        segs.append({"start_s": words[0]["start_s"], "end_s": words[-1]["end_s"],
+                     "text": " ".join(w["word"] for w in words), "words": words})
+        t += 0.5
+    return segs
+
+def build_packed(path: str, hearings):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE segments(id INTEGER PRIMARY KEY, hearing_id TEXT, start_s REAL, end_s REAL, text TEXT, words BLOB)")
+    conn.execute("CREATE INDEX idx_seg_h ON segments(hearing_id, start_s)")
+    for hid, segs in hearings.items():
+        conn.executemany("INSERT INTO segments(hearing_id,start_s,end_s,text,words) VALUES(?,?,?,?,?)",
+                         [(hid, s["start_s"], s["end_s"], s["text"], pack_words(s["text"], s["words"])) for s in segs])
+    conn.commit(); conn.execute("VACUUM"); conn.close()
+
+def build_rows(path: str, hearings):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE segments(id INTEGER PRIMARY KEY, hearing_id TEXT, start_s REAL, end_s REAL, text TEXT)")
+    conn.execute("CREATE INDEX idx_seg_h ON segments(hearing_id, start_s)")
+    conn.execute("CREATE TABLE words(segment_id INTEGER, idx INTEGER, word TEXT, start_s REAL, end_s REAL, PRIMARY KEY (segment_id, idx))")
+    for hid, segs in hearings.items():
+        for s in segs:
+            cur = conn.execute("INSERT INTO segments(hearing_id,start_s,end_s,text) VALUES(?,?,?,?)", (hid, s["start_s"], s["end_s"], s["text"]))
+            conn.executemany("INSERT INTO words VALUES(?,?,?,?,?)",
+                             [(cur.lastrowid, i, w["word"], w["start_s"], w["end_s"]) for i, w in enumerate(s["words"])])
+    conn.commit(); conn.execute("VACUUM"); conn.close()
+
+def lookup_packed(conn, hid, phrase):
+    for start_s, end_s, text, blob in conn.execute(
+            "SELECT start_s,end_s,text,words FROM segments WHERE hearing_id=? AND text LIKE ? ORDER BY start_s LIMIT 20",
+            (hid, f"%{phrase}%")):
+        hits = seek_phrase(text, start_s, end_s, blob, phrase)
+        if hits:
+            return hits[0]["start_s"]
+
+def lookup_rows(conn, hid, phrase):
+    first = phrase.split()[0]
+    for seg_id, text in conn.execute(
+            "SELECT id,text FROM segments WHERE hearing_id=? AND text LIKE ? ORDER BY start_s LIMIT 20", (hid, f"%{phrase}%")):
+        idx = text.lower().find(phrase.lower())
+        n = len(text[:idx].split())  # index of the word the match starts in
+        row = conn.execute("SELECT start_s FROM words WHERE segment_id=? AND idx=?", (seg_id, n)).fetchone()
+        if row and text.split()[n].startswith(first):
+            return row[0]
+
+def load_packed(conn, hid):
+    return sum(len(unpack_words(b)) for (b,) in conn.execute("SELECT words FROM segments WHERE hearing_id=? ORDER BY start_s", (hid,)))
+
+def load_rows(conn, hid):
+    return len(conn.execute("SELECT w.start_s, w.end_s FROM segments s JOIN words w ON w.segment_id = s.id "
+                            "WHERE s.hearing_id=? ORDER BY s.start_s, w.idx", (hid,)).fetchall())
+
+def load_ms(fn, conn, hids):
+    t = time.perf_counter()
+    for hid in hids:
+        fn(conn, hid)
+    return round((time.perf_counter() - t) * 1000 / len(hids), 2)
+
+def timed(fn, conn, queries):
+    lat = []
+    for hid, phrase in queries:
+        t = time.perf_counter(); fn(conn, hid, phrase); lat.append((time.perf_counter() - t) * 1e6)
+    lat.sort()
+    return {"p50_us": round(statistics.median(lat), 1), "p95_us": round(lat[int(len(lat) * 0.95) - 1], 1)}
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hearings", type=int, default=10)
+    ap.add_argument("--queries", type=int, default=2000)
+    args = ap.parse_args()
+    rng = random.Random(7)
+    hearings = {f"h{i:03d}": synth_hearing(rng) for i in range(args.hearings)}
+    n_words = sum(len(s["words"]) for segs in hearings.values() for s in segs)
+    queries = []
+    for _ in range(args.queries):
+        hid = rng.choice(list(hearings)); seg = rng.choice(hearings[hid])
+        i = rng.randrange(len(seg["words"]) - 1)
+        queries.append((hid, " ".join(w["word"] for w in seg["words"][i:i + 2])))
+
+    with tempfile.TemporaryDirectory() as d:
+        packed, rows = os.path.join(d, "packed.db"), os.path.join(d, "rows.db")
+        build_packed(packed, hearings); build_rows(rows, hearings)
+        cp, cr = sqlite3.connect(packed), sqlite3.connect(rows)
+        for hid, phrase in queries[:50]:
+            assert abs(lookup_packed(cp, hid, phrase) - lookup_rows(cr, hid, phrase)) < 1e-3
+        print(json.dumps({
+            "hearings": args.hearings, "words": n_words,
+            "packed": {"db_bytes": os.path.getsize(packed), "seek": timed(lookup_packed, cp, queries),
+                       "load_hearing_words_ms": load_ms(load_packed, cp, list(hearings))},
+            "row_per_word": {"db_bytes": os.path.getsize(rows), "seek": timed(lookup_rows, cr, queries),
+                             "load_hearing_words_ms": load_ms(load_rows, cr, list(hearings))},
+        }, indent=2))
+
+if __name__ == "__main__":
+    main()
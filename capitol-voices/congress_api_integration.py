@@ -4,30 +4,40 @@ Congress.gov API Integration for CapitolVoices
 Fetches real Congressional hearing data from the official API
 """
 
-import requests
+import os
 import streamlit as st
 import sqlite3
 import json
 from datetime import datetime
 import time
 import xml.etree.ElementTree as ET
+from adapters.congress_gov_client import CongressAPIError, get_client
 
 class CongressAPI:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.base_url = "https://api.congress.gov/v3"
-        self.headers = {
-            "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        }
+    """Streamlit-facing wrapper around the shared, cached Congress.gov client."""
+
+    def __init__(self, api_key=None):
+        self.client = get_client(api_key)
+        self.api_key = self.client.api_key
+        self.base_url = self.client.base_url
+    
+    @staticmethod
+    def _normalize_hearing(hearing):
+        """Add the flat committee/date/hearingId fields the UI shows to a v3 JSON hearing record."""
+        committees = hearing.get("committees") or []
+        if "committee" not in hearing and committees:
+            hearing["committee"] = {"name": committees[0].get("name", ""), "systemCode": committees[0].get("systemCode", "")}
+        dates = hearing.get("dates") or []
+        if "date" not in hearing and dates:
+            hearing["date"] = dates[0].get("date", "")
+        if "hearingId" not in hearing and "jacketNumber" in hearing:
+            hearing["hearingId"] = hearing["jacketNumber"]
+        return hearing
     
     def get_hearing(self, congress, chamber, hearing_id):
         """Get hearing details from Congress.gov API"""
-        url = f"{self.base_url}/hearing/{congress}/{chamber}/{hearing_id}"
-        
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
+            response = self.client.fetch(f"hearing/{congress}/{chamber.lower()}/{hearing_id}", {"format": "json"})
             
             # Check if response is empty
             if not response.text.strip():
@@ -58,13 +68,16 @@ class CongressAPI:
             else:
                 # Parse JSON response
                 try:
-                    return response.json()
+                    data = response.json()
+                    if "hearing" in data:
+                        self._normalize_hearing(data["hearing"])
+                    return data
                 except json.JSONDecodeError as e:
                     st.error(f"JSON Parse Error: {e}")
                     st.error(f"Response content: {response.text[:500]}...")
                     return None
                 
-        except requests.exceptions.RequestException as e:
+        except CongressAPIError as e:
             st.error(f"API Error: {e}")
             return None
         except Exception as e:
@@ -122,37 +135,15 @@ class CongressAPI:
             return None
     
     def search_hearings(self, congress=None, chamber=None, committee=None, limit=10):
-        """Search for hearings"""
-        url = f"{self.base_url}/hearing"
-        params = {"limit": limit}
-        
-        if congress:
-            params["congress"] = congress
-        if chamber:
-            params["chamber"] = chamber
-        if committee:
-            params["committee"] = committee
-        
+        """Search for hearings, following pagination until `limit` results are collected"""
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            
-            # Check if response is XML or JSON
-            content_type = response.headers.get('content-type', '').lower()
-            
-            if 'xml' in content_type or response.text.strip().startswith('<'):
-                # Parse XML response
-                try:
-                    root = ET.fromstring(response.text)
-                    return self._parse_xml_hearings_list(root)
-                except ET.ParseError as e:
-                    st.error(f"XML Parse Error: {e}")
-                    return None
-            else:
-                # Parse JSON response
-                return response.json()
-                
-        except requests.exceptions.RequestException as e:
+            results = self.client.search_hearings(congress=congress, chamber=chamber, committee=committee,
+                                                  limit=limit, details=True)
+            results["hearings"] = [self._normalize_hearing(h) for h in results["hearings"]]
+            if results.get("partial"):
+                st.info(f"Showing {len(results['hearings'])} matches from the {results['scanned']} most recent hearings.")
+            return results
+        except CongressAPIError as e:
             st.error(f"API Error: {e}")
             return None
         except Exception as e:
@@ -199,18 +190,13 @@ class CongressAPI:
     
     def get_committee_hearings(self, congress, committee_id, limit=10):
         """Get hearings for a specific committee"""
-        url = f"{self.base_url}/hearing"
-        params = {
-            "congress": congress,
-            "committee": committee_id,
-            "limit": limit
-        }
-        
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            results = self.client.get_committee_hearings(congress, committee_id, limit=limit)
+            results["hearings"] = [self._normalize_hearing(h) for h in results["hearings"]]
+            if results.get("partial"):
+                st.info(f"Showing {len(results['hearings'])} matches from the {results['scanned']} most recent hearings.")
+            return results
+        except CongressAPIError as e:
             st.error(f"API Error: {e}")
             return None
 
@@ -250,9 +236,9 @@ def congress_api_interface():
     # API Key input
     api_key = st.text_input(
         "Congress.gov API Key",
-        value="M48cj9inQcpQxtlQQM0tfobTP3YSr0fUG9niaC3G",
+        value=get_client().api_key or "",
         type="password",
-        help="Your Congress.gov API key"
+        help="Your Congress.gov API key (defaults to CONGRESS_API_KEY)"
     )
     
     if not api_key:
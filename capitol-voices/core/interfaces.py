@@ -3,12 +3,18 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Iterable, Dict, Any, List, Optional, TypedDict
 
+class Word(TypedDict):
+    word: str
+    start_s: float
+    end_s: float
+
 class Segment(TypedDict, total=False):
     hearing_id: str
     start_s: float
     end_s: float
     text: str
     speaker_key: Optional[str]
+    words: List[Word]  # optional word timings; stored packed, see core/word_index.py
 
 class ASR(ABC):
     @abstractmethod
@@ -0,0 +1,105 @@
+"""Compact word-level timings for transcript segments.
+
+A segment's words are stored as one packed little-endian uint32 array of
+(char offset into segment text, start_ms, end_ms) triples — 12 bytes per word — in a BLOB/bytea
+column next to the segment, instead of one database row per word. The word strings themselves are
+not stored: they are recovered from the segment text using the offsets.
+"""
+from __future__ import annotations
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Sequence, Tuple, TypedDict
+
+from core.interfaces import Word
+
+def _u32(values: Iterable[int] = ()) -> array:
+    a = array("I", values)
+    if a.itemsize != 4:  # "I" is 4 bytes on every supported platform; fall back to "L" otherwise
+        a = array("L", a)
+    return a
+
+def pack_words(text: str, words: Iterable[Word]) -> bytes:
+    """Pack `words` (with absolute start_s/end_s) against `text`; words not found in text keep the previous offset."""
+    flat = _u32()
+    pos = 0
+    lowered = text.lower()
+    for w in words:
+        token = w["word"].strip().lower()
+        idx = lowered.find(token, pos) if token else -1
+        off = idx if idx >= 0 else pos
+        if idx >= 0:
+            pos = idx + len(token)
+        flat.extend((off, max(0, round(w["start_s"] * 1000)), max(0, round(w["end_s"] * 1000))))
+    if sys.byteorder == "big":
+        flat.byteswap()
+    return flat.tobytes()
+
+def unpack_words(blob: bytes | memoryview | None) -> List[Tuple[int, int, int]]:
+    """(char_offset, start_ms, end_ms) triples from a packed blob."""
+    if not blob:
+        return []
+    flat = _u32()
+    flat.frombytes(bytes(blob))
+    if sys.byteorder == "big":
+        flat.byteswap()
+    return [(flat[i], flat[i + 1], flat[i + 2]) for i in range(0, len(flat) - 2, 3)]
+
+def words_from_blob(text: str, blob: bytes | memoryview | None) -> List[Word]:
+    """Rebuild Word dicts; each word runs from its offset to the next whitespace."""
+    out: List[Word] = []
+    for off, start_ms, end_ms in unpack_words(blob):
+        end = off
+        while end < len(text) and not text[end].isspace():
+            end += 1
+        out.append({"word": text[off:end], "start_s": start_ms / 1000, "end_s": end_ms / 1000})
+    return out
+
+class SeekHit(TypedDict):
+    segment_index: int
+    char_offset: int
+    start_s: float
+    end_s: float
+    exact: bool
+
+def _span_time(packed: Sequence[Tuple[int, int, int]], first: int, last: int) -> Tuple[float, float]:
+    offsets = [p[0] for p in packed]
+    i = max(0, bisect_right(offsets, first) - 1)
+    j = max(i, bisect_right(offsets, last) - 1)
+    return packed[i][1] / 1000, packed[j][2] / 1000
+
+def seek_phrase(text: str, start_s: float, end_s: float, blob: bytes | memoryview | None,
+                phrase: str, segment_index: int = 0) -> List[SeekHit]:
+    """Every case-insensitive occurrence of `phrase` in one segment, resolved to audio time.
+
+    With word timings the hit starts at the word containing the first character and ends with the word
+    containing the last one (`exact=True`); without them the time is interpolated by character position.
+    """
+    needle = phrase.strip().lower()
+    if not needle:
+        return []
+    packed = unpack_words(blob)
+    hits: List[SeekHit] = []
+    lowered = text.lower()
+    idx = lowered.find(needle)
+    while idx >= 0:
+        last = idx + len(needle) - 1
+        if packed:
+            s, e = _span_time(packed, idx, last)
+        else:
+            span = max(0.0, end_s - start_s)
+            s = start_s + span * idx / max(1, len(text))
+            e = start_s + span * (last + 1) / max(1, len(text))
+        hits.append({"segment_index": segment_index, "char_offset": idx, "start_s": s, "end_s": e, "exact": bool(packed)})
+        idx = lowered.find(needle, idx + 1)
+    return hits
+
+def seek_in_segments(segments: Sequence[dict], phrase: str, limit: Optional[int] = None) -> List[SeekHit]:
+    """`seek_phrase` over segments carrying text/start_s/end_s and an optional packed `words_blob`."""
+    hits: List[SeekHit] = []
+    for i, seg in enumerate(segments):
+        hits.extend(seek_phrase(seg.get("text") or "", seg.get("start_s") or 0.0, seg.get("end_s") or 0.0,
+                                seg.get("words_blob"), phrase, i))
+        if limit and len(hits) >= limit:
+            return hits[:limit]
+    return hits
@@ -0,0 +1,95 @@
+from __future__ import annotations
+import threading, time, traceback, uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# A job function takes (params, progress, storage) and returns a JSON-serialisable result dict.
+# A result with "success": False marks the job failed. Register new kinds with @job_kind.
+JobFn = Callable[[Dict[str, Any], Callable[[float, str], None], Any], Dict[str, Any]]
+JOB_KINDS: Dict[str, JobFn] = {}
+
+ACTIVE = ("queued", "running")
+
+def job_kind(name: str) -> Callable[[JobFn], JobFn]:
+    def register(fn: JobFn) -> JobFn:
+        JOB_KINDS[name] = fn
+        return fn
+    return register
+
+def _compact(result: Dict[str, Any], sample: int = 5) -> Dict[str, Any]:
+    """Drop the full segment list (it is already in storage) and keep a preview."""
+    out = {k: v for k, v in result.items() if k != "segments"}
+    out["sample_segments"] = list(result.get("segments") or [])[:sample]
+    return out
+
+@job_kind("youtube")
+def _youtube(params, progress, storage):
+    from pipelines.youtube_processor import YouTubeProcessingPipeline
+    pipeline = YouTubeProcessingPipeline(storage=storage)
+    return _compact(pipeline.process_youtube_hearing(params["youtube_url"], dict(params["hearing_metadata"]), progress=progress))
+
+@job_kind("youtube_transcript")
+def _youtube_transcript(params, progress, storage):
+    from adapters.youtube_transcript_fetcher import CongressionalYouTubeProcessor
+    progress(0.1, "Fetching transcript")
+    return _compact(CongressionalYouTubeProcessor().process_congressional_video(params["youtube_url"], dict(params["hearing_metadata"])))
+
+class JobRunner:
+    """Runs registered job kinds on a thread pool and records their state in `storage`.
+
+    The storage row is the source of truth (status, progress, message, result, error), so any
+    Streamlit session or rerun can poll a job by id. Jobs still queued/running when a runner starts
+    belong to a process that is gone and are marked failed.
+    """
+    def __init__(self, storage, max_workers: int = 2, kinds: Dict[str, JobFn] | None = None):
+        self.storage = storage
+        self.kinds = kinds if kinds is not None else JOB_KINDS
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="capitol-voices-job")
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        for job in storage.list_jobs(limit=1000, statuses=ACTIVE):
+            storage.update_job(job["id"], status="failed", error="Interrupted by server restart", finished_at=time.time())
+
+    def submit(self, kind: str, params: Dict[str, Any]) -> str:
+        if kind not in self.kinds:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = uuid.uuid4().hex[:12]
+        self.storage.create_job(job_id, kind, params)
+        with self._lock:
+            fut = self._futures[job_id] = self.pool.submit(self._run, job_id, kind, params)
+        fut.add_done_callback(lambda _: self._futures.pop(job_id, None))
+        return job_id
+
+    def _run(self, job_id: str, kind: str, params: Dict[str, Any]) -> None:
+        self.storage.update_job(job_id, status="running", started_at=time.time(), message="Started")
+        def progress(fraction: float, message: str) -> None:
+            self.storage.update_job(job_id, progress=max(0.0, min(1.0, fraction)), message=message)
+        try:
+            result = self.kinds[kind](params, progress, self.storage) or {}
+        except Exception as e:
+            traceback.print_exc()
+            self.storage.update_job(job_id, status="failed", error=str(e), finished_at=time.time())
+            return
+        if result.get("success", True):
+            self.storage.update_job(job_id, status="succeeded", progress=1.0, message="Done", result=result,
+                                    finished_at=time.time())
+        else:
+            self.storage.update_job(job_id, status="failed", message="Failed", result=result,
+                                    error=result.get("error"), finished_at=time.time())
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.storage.get_job(job_id)
+
+    def jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        return self.storage.list_jobs(limit=limit)
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Optional[Dict[str, Any]]:
+        """Block until a job submitted by this runner finishes; returns its stored record."""
+        with self._lock:
+            fut = self._futures.get(job_id)
+        if fut is not None:
+            fut.result(timeout=timeout)
+        return self.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.pool.shutdown(wait=wait)
@@ -6,28 +6,35 @@ Processes Congressional hearing YouTube videos using transcript API
 
 import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 from adapters.youtube_transcript_fetcher import CongressionalYouTubeProcessor
 from adapters.speaker_namer_roster import RosterSpeakerNamer
 from adapters.sum_timestamped_llm import TimestampVerifiedSummarizer
 from adapters.storage_sqlite import SQLiteStorage
+from core.interfaces import Storage
 from core.settings import AppSettings
 
 class YouTubeProcessingPipeline:
     """Complete pipeline for processing Congressional YouTube videos"""
     
-    def __init__(self, config: AppSettings = None):
+    def __init__(self, config: AppSettings = None, storage: Storage = None):
         self.config = config or AppSettings()
         self.youtube_processor = CongressionalYouTubeProcessor()
         self.speaker_namer = RosterSpeakerNamer(self.config.roster_path)
         self.summarizer = TimestampVerifiedSummarizer(mode=self.config.llm_mode)
-        self.storage = SQLiteStorage(self.config.db_path)
+        self.storage = storage or SQLiteStorage(self.config.db_path)
     
-    def process_youtube_hearing(self, youtube_url: str, hearing_metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a complete Congressional hearing from YouTube"""
+    def process_youtube_hearing(self, youtube_url: str, hearing_metadata: Dict[str, Any],
+                                progress: Optional[Callable[[float, str], None]] = None) -> Dict[str, Any]:
+        """Process a complete Congressional hearing from YouTube.
+
+        `progress(fraction, message)` is called as each step starts (used by background jobs).
+        """
+        progress = progress or (lambda fraction, message: None)
         print(f"🎥 Processing YouTube video: {youtube_url}")
         
         # Step 1: Get video info
+        progress(0.05, "Checking video information")
         video_info = self.youtube_processor.get_video_info(youtube_url)
         if not video_info.get("has_transcript"):
             return {
@@ -38,6 +45,7 @@ class YouTubeProcessingPipeline:
         print(f"✅ Video has transcript in languages: {video_info.get('available_languages', [])}")
         
         # Step 2: Fetch and process transcript
+        progress(0.15, "Fetching transcript")
         result = self.youtube_processor.process_congressional_video(youtube_url, hearing_metadata)
         if not result["success"]:
             return result
@@ -49,6 +57,7 @@ class YouTubeProcessingPipeline:
         print(f"⏱️  Total duration: {statistics['total_duration_minutes']:.1f} minutes")
         
         # Step 3: Speaker identification (if roster available)
+        progress(0.5, "Identifying speakers")
         hearing_id = hearing_metadata.get("hearing_id", f"youtube-{video_info['video_id']}")
         try:
             named_segments = list(self.speaker_namer.name_speakers(hearing_id, segments))
@@ -58,6 +67,7 @@ class YouTubeProcessingPipeline:
             named_segments = segments
         
         # Step 4: Generate summary
+        progress(0.65, "Generating summary")
         try:
             summary = self.summarizer.summarize(named_segments)
             print("📊 Generated timestamp-verified summary")
@@ -66,6 +76,7 @@ class YouTubeProcessingPipeline:
             summary = {"error": str(e)}
         
         # Step 5: Store results
+        progress(0.9, "Storing results")
         try:
             # Store hearing metadata
             hearing_metadata.update({
@@ -103,7 +114,7 @@ class YouTubeProcessingPipeline:
             "video_info": video_info
         }
 
-def process_congressional_youtube_video(youtube_url: str, hearing_metadata: Dict[str, Any] = None):
+def process_congressional_youtube_video(youtube_url: str, hearing_metadata: Dict[str, Any] = None, storage: Storage = None):
     """Convenience function to process a Congressional YouTube video"""
     if hearing_metadata is None:
         hearing_metadata = {
@@ -113,7 +124,7 @@ def process_congressional_youtube_video(youtube_url: str, hearing_metadata: Dict
             "date": "2025-01-01"
         }
     
-    pipeline = YouTubeProcessingPipeline()
+    pipeline = YouTubeProcessingPipeline(storage=storage)
     return pipeline.process_youtube_hearing(youtube_url, hearing_metadata)
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+import json, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from adapters.congress_gov_client import CongressAPIError, CongressGovClient, TokenBucket
+
+HEARINGS = [{"congress": 118, "chamber": "House", "jacketNumber": 50000 + i} for i in range(5)]
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def log_message(self, *args): ...
+
+    def do_GET(self):
+        u = urlparse(self.path)
+        q = {k: v[0] for k, v in parse_qs(u.query).items()}
+        self.hits.append((u.path, dict(self.headers)))
+        if u.path == "/v3/hearing/118/house":
+            off, lim = int(q.get("offset", 0)), int(q.get("limit", 2))
+            page = {"hearings": HEARINGS[off:off + lim], "pagination": {}}
+            if off + lim < len(HEARINGS):
+                page["pagination"]["next"] = f"http://x/v3/hearing/118/house?offset={off + lim}&limit={lim}"
+            return self._send(200, page)
+        if u.path.startswith("/v3/hearing/118/house/"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304); self.end_headers(); return
+            jacket = int(u.path.rsplit("/", 1)[1])
+            code = "hsgo00" if jacket % 2 else "hsju00"
+            return self._send(200, {"hearing": {"jacketNumber": jacket, "committees": [{"systemCode": code}]}},
+                              etag='"v1"')
+        self._send(404, {"error": "not found"})
+
+    def _send(self, status, body, etag=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+@pytest.fixture
+def server():
+    _Handler.hits = []
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}/v3"
+    srv.shutdown()
+
+def _client(base, tmp_path, **kw):
+    return CongressGovClient("test-key", base_url=base, cache_dir=str(tmp_path), rate_per_s=1000, burst=1000, **kw)
+
+def test_detail_is_served_from_cache_within_ttl(server, tmp_path):
+    c = _client(server, tmp_path)
+    assert c.get_hearing(118, "House", 50001)["hearing"]["jacketNumber"] == 50001
+    c.get_hearing(118, "House", 50001)
+    assert c.stats["network"] == 1 and c.stats["cache_hits"] == 1
+    assert _Handler.hits[0][1].get("X-API-Key") == "test-key"
+
+def test_expired_entry_is_revalidated_with_etag(server, tmp_path):
+    c = _client(server, tmp_path, ttls={"hearing": 0, "list": 0})
+    c.get_hearing(118, "House", 50001)
+    again = c.get_hearing(118, "House", 50001)
+    assert again["hearing"]["jacketNumber"] == 50001
+    assert c.stats["revalidated"] == 1
+    assert _Handler.hits[-1][1].get("If-None-Match") == '"v1"'
+
+def test_pagination_and_committee_filter(server, tmp_path):
+    c = _client(server, tmp_path)
+    assert [h["jacketNumber"] for h in c.iter_items("hearing/118/house", "hearings", page_size=2)] == \
+        [h["jacketNumber"] for h in HEARINGS]
+    res = c.get_committee_hearings(118, "hsgo00", limit=2)
+    assert [h["jacketNumber"] for h in res["hearings"]] == [50001, 50003]
+    assert res["scanned"] == 4 and not res["partial"]
+
+def test_committee_scan_is_bounded(server, tmp_path):
+    c = _client(server, tmp_path)
+    res = c.get_committee_hearings(118, "hsgo00", limit=5, max_scanned=3)
+    assert [h["jacketNumber"] for h in res["hearings"]] == [50001]
+    assert res["scanned"] == 3 and res["partial"]
+    assert sum(p.startswith("/v3/hearing/118/house/") for p, _ in _Handler.hits) == 3
+
+def test_http_errors_raise(server, tmp_path):
+    with pytest.raises(CongressAPIError):
+        _client(server, tmp_path, max_retries=0).get_json("bill/118")
+
+def test_token_bucket_limits_rate():
+    b = TokenBucket(rate=50, capacity=1)
+    waited = sum(b.acquire() for _ in range(4))
+    assert waited >= 3 / 50 * 0.9
@@ -0,0 +1,60 @@
+import sqlite3
+from ui import data_access as da
+
+def _db(tmp_path):
+    path = str(tmp_path / "h.db")
+    da.get_connection(path)
+    da.execute("INSERT INTO segments(hearing_id,start_s,end_s,speaker_key,text) VALUES ('h1',0,10,'chair','Welcome to the oversight hearing.')", (), path)
+    da.execute("INSERT INTO segments(hearing_id,start_s,end_s,speaker_key,text) VALUES ('h1',10,40,'witness_1','Thank you. The data and evidence matter.')", (), path)
+    return path
+
+def test_segments_are_joined_to_speakers_and_versioned(tmp_path):
+    path = _db(tmp_path)
+    v1 = da.data_version("h1", path)
+    segs = da.load_segments("h1", v1, path)
+    assert [s["display_name"] for s in segs] == ["Chair", "Witness 1"]
+
+    da.execute("REPLACE INTO speakers(hearing_id,speaker_key,display_name,role) VALUES ('h1','chair','Rep. Smith','Chair')", (), path)
+    v2 = da.data_version("h1", path)
+    assert v2 != v1
+    assert da.load_segments("h1", v2, path)[0]["display_name"] == "Rep. Smith"
+
+def test_in_place_segment_edits_change_the_version(tmp_path):
+    path = _db(tmp_path)
+    versions = [da.data_version("h1", path)]
+    da.execute("UPDATE segments SET text='Welcome to the oversight hearings.' WHERE id=1", (), path)
+    versions.append(da.data_version("h1", path))
+    da.execute("UPDATE segments SET words=? WHERE id=2", (b"\x01\x02",), path)
+    versions.append(da.data_version("h1", path))
+    da.execute("UPDATE segments SET words=? WHERE id=2", (b"\x01\x03",), path)
+    versions.append(da.data_version("h1", path))
+    assert len(set(versions)) == 4 and {v[:2] for v in versions} == {(2, 2)}
+    assert da.load_segments("h1", versions[1], path)[0]["text"].endswith("hearings.")
+
+def test_aggregates(tmp_path):
+    path = _db(tmp_path)
+    v = da.data_version("h1", path)
+    stats = {s["speaker_key"]: s for s in da.speaker_stats("h1", v, path)}
+    assert stats["witness_1"]["duration"] == 30 and stats["chair"]["percentage"] == 50
+    assert da.theme_counts("h1", v, {"Oversight": ("oversight",), "Science": ("data", "evidence"), "None": ("zzz",)}, path) \
+        == {"Oversight": 1, "Science": 2}
+    assert da.text_metrics("h1", v, path)["sentences"] == 3
+
+def test_legacy_speakers_table_gains_role_column(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE speakers(hearing_id TEXT, speaker_key TEXT, display_name TEXT, PRIMARY KEY (hearing_id, speaker_key))")
+    conn.commit(); conn.close()
+    da.get_connection(path)
+    assert da.data_version("h1", path) == (0, 0, 0, None)
+
+def test_execute_all_commits_together_or_not_at_all(tmp_path):
+    path = _db(tmp_path)
+    insert = "INSERT INTO segments(hearing_id,start_s,end_s,speaker_key,text) VALUES ('h2',0,5,'chair','Hello.')"
+    try:
+        da.execute_all([(insert, ()), ("INSERT INTO no_such_table VALUES (1)", ())], path)
+    except sqlite3.OperationalError:
+        pass
+    assert da.data_version("h2", path)[0] == 0
+    da.execute_all([("DELETE FROM segments WHERE hearing_id=?", ("h1",)), (insert, ())], path)
+    assert da.data_version("h1", path)[0] == 0 and da.data_version("h2", path)[0] == 1
@@ -0,0 +1,38 @@
+import threading
+from adapters.storage_sqlite import SQLiteStorage
+from pipelines.jobs import JobRunner
+
+def test_jobs_are_persisted_with_progress_and_result(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "h.db"))
+    release, halfway = threading.Event(), threading.Event()
+
+    def slow(params, progress, storage):
+        progress(0.5, "halfway")
+        halfway.set()
+        release.wait(5)
+        return {"success": True, "hearing_id": params["hearing_id"], "segments": [{"start_s": 0}] * 9}
+
+    def broken(params, progress, storage):
+        return {"success": False, "error": "no transcript"}
+
+    runner = JobRunner(storage, max_workers=2, kinds={"slow": slow, "broken": broken})
+    job_id = runner.submit("slow", {"hearing_id": "h1"})
+    bad_id = runner.submit("broken", {})
+    assert runner.wait(bad_id, timeout=5)["status"] == "failed"
+    assert halfway.wait(5)
+    running = runner.get(job_id)
+    assert (running["status"], running["progress"], running["message"]) == ("running", 0.5, "halfway")
+    release.set()
+    done = runner.wait(job_id, timeout=5)
+    assert done["status"] == "succeeded" and done["progress"] == 1.0
+    assert done["result"]["hearing_id"] == "h1"
+    assert {j["id"] for j in runner.jobs()} == {job_id, bad_id}
+    assert runner.get(bad_id)["error"] == "no transcript"
+    runner.shutdown()
+
+def test_unfinished_jobs_are_failed_on_restart(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "h.db"))
+    storage.create_job("stale", "youtube", {})
+    storage.update_job("stale", status="running")
+    JobRunner(storage, kinds={}).shutdown()
+    assert storage.get_job("stale")["status"] == "failed"
@@ -0,0 +1,36 @@
+import sqlite3
+from adapters.storage_sqlite import SQLiteStorage
+from core.word_index import pack_words, seek_phrase, unpack_words, words_from_blob
+
+TEXT = "The Committee will come to order."
+WORDS = [dict(word=w, start_s=10.0 + i * 0.5, end_s=10.4 + i * 0.5) for i, w in
+         enumerate(["The", "Committee", "will", "come", "to", "order."])]
+
+def test_pack_roundtrip_is_12_bytes_per_word():
+    blob = pack_words(TEXT, WORDS)
+    assert len(blob) == 12 * len(WORDS)
+    assert unpack_words(blob)[1] == (4, 10500, 10900)
+    assert [w["word"] for w in words_from_blob(TEXT, blob)] == [w["word"] for w in WORDS]
+
+def test_phrase_resolves_to_word_times():
+    hit, = seek_phrase(TEXT, 10.0, 13.0, pack_words(TEXT, WORDS), "come to ORDER")
+    assert (hit["start_s"], hit["end_s"], hit["exact"]) == (11.5, 12.9, True)
+    # mid-word match seeks to the start of that word
+    assert seek_phrase(TEXT, 10.0, 13.0, pack_words(TEXT, WORDS), "mittee")[0]["start_s"] == 10.5
+
+def test_without_word_timings_time_is_interpolated():
+    hit, = seek_phrase("abcdefghij", 0.0, 10.0, None, "f")
+    assert (hit["start_s"], hit["exact"]) == (5.0, False)
+
+def test_sqlite_storage_migrates_and_seeks(tmp_path):
+    path = str(tmp_path / "h.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE segments(id INTEGER PRIMARY KEY AUTOINCREMENT, hearing_id TEXT, start_s REAL, end_s REAL, speaker_key TEXT, text TEXT)")
+    conn.commit(); conn.close()
+    store = SQLiteStorage(path)
+    store.write_segments("h1", [dict(start_s=0.0, end_s=9.0, speaker_key="a", text="Opening remarks."),
+                                dict(start_s=10.0, end_s=13.0, speaker_key="chair", text=TEXT, words=WORDS)])
+    assert store.read_segments("h1")[1]["words"][3] == {"word": "come", "start_s": 11.5, "end_s": 11.9}
+    assert "words" not in store.read_segments("h1")[0]
+    hit, = store.seek_phrase("h1", "will come")
+    assert (hit["start_s"], hit["speaker_key"]) == (11.0, "chair")
@@ -1,501 +1,29 @@
+"""CapitolVoices Streamlit app: `streamlit run ui/app.py`.
+
+Each page in ui/views/ is executed only when it is selected, so its dependencies (validators,
+XML parsing, the Congress.gov client, the YouTube pipeline) are imported on first use rather than
+at start-up. All pages share the cached connection and storage from ui/data_access.py.
+"""
+import os
+import sys
+
 import streamlit as st
-import sqlite3
-import json
-import time
-import validators
-import requests
-import xml.etree.ElementTree as ET
 
-# Page configuration
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 st.set_page_config(
     page_title="CapitolVoices - Congressional Hearing Analysis",
     page_icon="🏛️",
     layout="wide"
 )
 
-# Database path
-DB_PATH = "data/hearings.db"
-
-# Header
 st.title("🏛️ CapitolVoices")
 st.caption("AI-powered Congressional hearing transcription and analysis with timestamp verification.")
 
-# Add navigation tabs
-tab1, tab2 = st.tabs(["🏛️ Hearing Browser", "🏛️ Congress API"])
-
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("CREATE TABLE IF NOT EXISTS hearings(id TEXT PRIMARY KEY, title TEXT, committee TEXT, date TEXT, video_url TEXT)")
-    cur.execute("CREATE TABLE IF NOT EXISTS summaries(hearing_id TEXT, type TEXT, content_json TEXT, PRIMARY KEY (hearing_id, type))")
-    cur.execute("CREATE TABLE IF NOT EXISTS segments(id INTEGER PRIMARY KEY AUTOINCREMENT, hearing_id TEXT, start_s REAL, end_s REAL, speaker_key TEXT, text TEXT)")
-    cur.execute("CREATE TABLE IF NOT EXISTS speakers(hearing_id TEXT, speaker_key TEXT, display_name TEXT, PRIMARY KEY (hearing_id, speaker_key))")
-    conn.commit()
-    return conn
-
-conn = init_db()
-
-# Tab 1: Hearing Browser
-with tab1:
-    with st.sidebar:
-        st.header("🏛️ Dr. Anthony Fauci Hearing")
-        st.info("**Official Congressional Hearing**")
-        
-        st.subheader("📋 Hearing Details")
-        st.write("**Title**: A HEARING WITH DR. ANTHONY FAUCI")
-        st.write("**Committee**: Select Subcommittee on the Coronavirus Pandemic")
-        st.write("**Date**: June 3, 2024")
-        st.write("**Chamber**: House")
-        st.write("**Congress**: 118")
-        st.write("**Hearing ID**: 55830")
-        st.write("**Jacket Number**: 55830")
-        
-        if st.button("🔄 Refresh Hearing Data", type="secondary"):
-            cur = conn.cursor()
-            cur.execute("""
-                REPLACE INTO hearings(id,title,committee,date,video_url)
-                VALUES(?,?,?,?,?)
-            """, (
-                "fauci-hearing-june-2024",
-                "A HEARING WITH DR. ANTHONY FAUCI",
-                "Select Subcommittee on the Coronavirus Pandemic",
-                "2024-06-03",
-                "https://www.youtube.com/watch?v=HhQ-tgm9vXQ"
-            ))
-            conn.commit()
-            st.success("✅ Hearing data refreshed!")
-        
-        if st.button("📝 Generate Transcript from Congress API", type="primary"):
-            with st.spinner("Fetching hearing data from Congress API..."):
-                try:
-                    api_key = "M48cj9inQcpQxtlQQM0tfobTP3YSr0fUG9niaC3G"
-                    hearing_url = f"https://api.congress.gov/v3/hearing/118/house/55830?format=xml&api_key={api_key}"
-                    response = requests.get(hearing_url, timeout=10)
-
-                    fauci_hearing = None
-
-                    if response.status_code == 200:
-                        text = response.text.lstrip("\ufeff").strip()
-                        ctype = response.headers.get("Content-Type", "").lower()
-
-                        if ("xml" in ctype) or text.startswith("<"):
-                            try:
-                                if text.lower().startswith("<!doctype html") or "<html" in text[:200].lower():
-                                    raise ET.ParseError("Got HTML instead of XML")
-
-                                root = ET.fromstring(text)
-                                title_elem = root.find(".//title")
-                                title = title_elem.text if title_elem is not None else "A HEARING WITH DR. ANTHONY FAUCI"
-                                committee_elem = root.find(".//committees/item/name")
-                                committee = committee_elem.text if committee_elem is not None else "House Government Reform Committee"
-                                date_elem = root.find(".//dates/item/date")
-                                date = date_elem.text if date_elem is not None else "2024-06-03"
-                                chamber_elem = root.find(".//chamber")
-                                chamber = chamber_elem.text if chamber_elem is not None else "House"
-                                congress_elem = root.find(".//congress")
-                                congress = congress_elem.text if congress_elem is not None else "118"
-                                jacket_elem = root.find(".//jacketNumber")
-                                jacket_number = jacket_elem.text if jacket_elem is not None else "55830"
-                                pdf_elem = root.find('.//formats/item[type="PDF"]/url')
-                                pdf_url = pdf_elem.text if pdf_elem is not None else "https://congress.gov/118/chrg/CHRG-118hhrg55830/CHRG-118hhrg55830.pdf"
-                                
-                                fauci_hearing = {
-                                    "title": title,
-                                    "committee": committee,
-                                    "date": date,
-                                    "chamber": chamber,
-                                    "congress": congress,
-                                    "jacketNumber": jacket_number,
-                                    "pdf_url": pdf_url,
-                                }
-                            except ET.ParseError as e:
-                                st.warning(f"⚠️ XML parsing failed: {e}")
-                                st.info("Response preview: " + text[:200] + "...")
-                        elif ("json" in ctype) or text.startswith("{"):
-                            try:
-                                data = response.json()
-                                st.info("Received JSON from API; using verified hearing metadata instead.")
-                            except ValueError:
-                                st.warning("⚠️ Response claimed JSON but couldn't be decoded.")
-                        else:
-                            st.warning(f"⚠️ Unexpected content type: {ctype or 'unknown'}; using fallback data.")
-                    else:
-                        st.warning(f"⚠️ API request failed with status code: {response.status_code}")
-                    
-                    st.info("🎯 **Generating transcript from hearing ID 55830...**")
-                    
-                    transcript_segments = [
-                        {
-                            "start_s": 601.0,
-                            "end_s": 615.0,
-                            "speaker": "Dr. Brad Wenstrup (Chair)",
-                            "text": "The Select Subcommittee on the Coronavirus Pandemic will come to order. I want to welcome everyone this morning.",
-                        },
-                        {
-                            "start_s": 615.0,
-                            "end_s": 630.0,
-                            "speaker": "Dr. Brad Wenstrup (Chair)",
-                            "text": "Good morning. And welcome, Dr. Fauci. First, I want to thank you for your decades of public service.",
-                        },
-                        {
-                            "start_s": 645.0,
-                            "end_s": 660.0,
-                            "speaker": "Dr. Anthony Fauci (Witness)",
-                            "text": "Thank you, Mr. Chairman. I appreciate the opportunity to appear before this subcommittee voluntarily.",
-                        },
-                        {
-                            "start_s": 680.0,
-                            "end_s": 695.0,
-                            "speaker": "Dr. Brad Wenstrup (Chair)",
-                            "text": "Dr. Fauci, we're here to investigate the COVID-19 pandemic and to explore lessons learned, positive or negative.",
-                        },
-                        {
-                            "start_s": 725.0,
-                            "end_s": 740.0,
-                            "speaker": "Dr. Anthony Fauci (Witness)",
-                            "text": "I believe transparency and accountability are crucial for maintaining public trust in our health institutions.",
-                        },
-                    ]
-                    
-                    cur = conn.cursor()
-                    cur.execute("DELETE FROM segments WHERE hearing_id = ?", ("fauci-hearing-june-2024",))
-                    cur.execute("DELETE FROM speakers WHERE hearing_id = ?", ("fauci-hearing-june-2024",))
-                    
-                    speakers_added = set()
-                    for segment in transcript_segments:
-                        speaker_key = segment["speaker"].split("(")[0].strip().replace(" ", "_").lower()
-                        if speaker_key not in speakers_added:
-                            cur.execute("""
-                                INSERT INTO speakers (hearing_id, speaker_key, display_name)
-                                VALUES (?, ?, ?)
-                            """, ("fauci-hearing-june-2024", speaker_key, segment["speaker"]))
-                            speakers_added.add(speaker_key)
-                    
-                    for segment in transcript_segments:
-                        cur.execute("""
-                            INSERT INTO segments (hearing_id, start_s, end_s, speaker_key, text)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (
-                            "fauci-hearing-june-2024",
-                            segment["start_s"],
-                            segment["end_s"],
-                            segment["speaker"].split("(")[0].strip().replace(" ", "_").lower(),
-                            segment["text"],
-                        ))
-                    
-                    summary_data = {
-                        "executive": "The Select Subcommittee on the Coronavirus Pandemic held a hearing with Dr. Anthony Fauci on June 3, 2024. The hearing focused on investigating the COVID-19 pandemic response, exploring lessons learned, and examining the role of public health officials during the crisis.",
-                        "bullets": [
-                            "[00:10:01–00:10:15] Chairman Wenstrup opened the hearing and welcomed Dr. Fauci, acknowledging his decades of public service",
-                            "[00:10:45–00:11:20] Dr. Fauci expressed appreciation for the opportunity to appear voluntarily before the subcommittee",
-                            "[00:11:20–00:12:05] Chairman Wenstrup outlined the hearing's purpose: investigating COVID-19 response and exploring lessons learned",
-                            "[00:12:05–00:12:45] Dr. Fauci emphasized the importance of transparency and accountability in maintaining public trust",
-                            "[00:13:00–00:13:30] Discussion began on the challenges of public health communication during the pandemic",
-                        ],
-                        "by_speaker": [
-                            {
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "points": [
-                                    "Opened hearing and welcomed Dr. Fauci",
-                                    "Acknowledged decades of public service",
-                                    "Outlined hearing purpose: investigating COVID-19 response",
-                                ],
-                            },
-                            {
-                                "speaker": "Dr. Anthony Fauci (Witness)",
-                                "points": [
-                                    "Expressed appreciation for voluntary appearance",
-                                    "Emphasized importance of transparency and accountability",
-                                    "Discussed challenges of public health communication",
-                                ],
-                            },
-                        ],
-                    }
-                    
-                    cur.execute("DELETE FROM summaries WHERE hearing_id = ? AND type = ?", ("fauci-hearing-june-2024", "default"))
-                    cur.execute("""
-                        INSERT INTO summaries (hearing_id, type, content_json)
-                        VALUES (?, ?, ?)
-                    """, ("fauci-hearing-june-2024", "default", json.dumps(summary_data)))
-                    
-                    conn.commit()
-                    st.success("🎉 **Transcript generated successfully from hearing ID 55830!**")
-                    
-                except Exception as e:
-                    st.warning(f"⚠️ Unexpected error: {e}")
-                    st.info("Using verified hearing data from official sources")
-
-    st.subheader("🏛️ Dr. Anthony Fauci Hearing - June 3, 2024")
-    
-    cur = conn.cursor()
-    cur.execute("""
-        REPLACE INTO hearings(id,title,committee,date,video_url)
-        VALUES(?,?,?,?,?)
-    """, (
-        "fauci-hearing-june-2024",
-        "A HEARING WITH DR. ANTHONY FAUCI",
-        "Select Subcommittee on the Coronavirus Pandemic",
-        "2024-06-03",
-        "https://www.youtube.com/watch?v=HhQ-tgm9vXQ",
-    ))
-    conn.commit()
-    
-    cur.execute("SELECT id,title,committee,date,video_url FROM hearings WHERE id = 'fauci-hearing-june-2024'")
-    row = cur.fetchone()
-    
-    if row:
-        st.markdown(f"**{row[1]}**  \n{row[2]} • {row[3]}")
-        
-        if row[4] and validators.url(row[4]):
-            st.video(row[4])
-        
-        st.info("""
-        **Hearing Context**: This hearing was held by the Select Subcommittee on the Coronavirus Pandemic 
-        to investigate the COVID-19 pandemic response and explore lessons learned. Dr. Anthony Fauci, 
-        former Director of the National Institute of Allergy and Infectious Diseases, appeared voluntarily 
-        to provide testimony about the federal government's response to the pandemic.
-        """)
-        
-        st.markdown("### 📋 Transcript Validation")
-        st.info("**PDF Reference**: [Dr. Anthony Fauci Hearing Transcript](https://www.congress.gov/118/chrg/CHRG-118hhrg55830/CHRG-118hhrg55830.pdf)")
-        
-        col1, col2, col3 = st.columns([2, 1, 1])
-        
-        with col1:
-            st.markdown("### 🧠 AI-Powered Analysis")
-            
-            cur.execute("SELECT DISTINCT speaker_key FROM segments WHERE hearing_id=? ORDER BY speaker_key", ("fauci-hearing-june-2024",))
-            speakers = cur.fetchall()
-            
-            if speakers:
-                st.markdown("**👥 Speaker Participation Analysis:**")
-                speaker_stats = {}
-                total_segments = 0
-                
-                for speaker in speakers:
-                    cur.execute("SELECT COUNT(*), SUM(end_s - start_s) FROM segments WHERE hearing_id=? AND speaker_key=?", ("fauci-hearing-june-2024", speaker[0]))
-                    count, duration = cur.fetchone()
-                    speaker_stats[speaker[0]] = {"count": count, "duration": duration or 0}
-                    total_segments += count
-                
-                for speaker_key, stats in speaker_stats.items():
-                    cur2 = conn.cursor()
-                    cur2.execute("SELECT display_name FROM speakers WHERE hearing_id=? AND speaker_key=?", ("fauci-hearing-june-2024", speaker_key))
-                    m = cur2.fetchone()
-                    disp_name = m[0] if m and m[0] else speaker_key.replace("_", " ").title()
-                    
-                    percentage = (stats["count"] / total_segments * 100) if total_segments > 0 else 0
-                    duration_min = stats["duration"] / 60
-                    
-                    st.write(f"• **{disp_name}**: {stats['count']} segments ({percentage:.1f}%), {duration_min:.1f} minutes")
-            
-            st.markdown("**🎯 Key Themes & Critical Points:**")
-            
-            cur.execute("SELECT text FROM segments WHERE hearing_id=? ORDER BY start_s", ("fauci-hearing-june-2024",))
-            all_text = " ".join([row[0] for row in cur.fetchall()])
-            
-            themes = {
-                "COVID-19 Response": ["pandemic", "covid", "coronavirus", "response", "crisis", "health"],
-                "Transparency & Accountability": ["transparency", "accountability", "trust", "public", "institutions"],
-                "Scientific Process": ["science", "data", "evidence", "research", "studies", "clinical"],
-                "Government Oversight": ["oversight", "investigation", "lessons learned", "subcommittee", "congress"],
-                "Public Health Communication": ["communication", "messaging", "public health", "guidance", "recommendations"]
-            }
-            
-            theme_scores = {}
-            for theme, keywords in themes.items():
-                score = sum(all_text.lower().count(keyword) for keyword in keywords)
-                if score > 0:
-                    theme_scores[theme] = score
-            
-            if theme_scores:
-                sorted_themes = sorted(theme_scores.items(), key=lambda x: x[1], reverse=True)
-                for theme, score in sorted_themes[:3]:
-                    st.write(f"• **{theme}**: {score} mentions")
-            
-            st.markdown("**⚡ Critical Discussion Points:**")
-            critical_points = [
-                "• **Opening Statements**: Chairman's welcome and hearing purpose",
-                "• **Voluntary Testimony**: Dr. Fauci's voluntary appearance emphasized",
-                "• **Decades of Service**: Acknowledgment of Dr. Fauci's public service record",
-                "• **Pandemic Investigation**: Focus on COVID-19 response evaluation",
-                "• **Transparency Emphasis**: Discussion of accountability in public health"
-            ]
-            
-            for point in critical_points:
-                st.write(point)
-            
-            st.markdown("**⏰ Timeline Analysis:**")
-            cur.execute("SELECT MIN(start_s), MAX(end_s) FROM segments WHERE hearing_id=?", ("fauci-hearing-june-2024",))
-            min_time, max_time = cur.fetchone()
-            if min_time and max_time:
-                total_duration = (max_time - min_time) / 60
-                st.write(f"• **Total Duration**: {total_duration:.1f} minutes")
-                st.write(f"• **Start Time**: {time.strftime('%H:%M:%S', time.gmtime(int(min_time)))}")
-                st.write(f"• **End Time**: {time.strftime('%H:%M:%S', time.gmtime(int(max_time)))}")
-            
-            st.markdown("---")
-            st.markdown("#### 📝 Full Transcript")
-            
-            q = st.text_input("🔍 Search Transcript", "")
-            
-            cur.execute("SELECT start_s,end_s,speaker_key,text FROM segments WHERE hearing_id=? ORDER BY start_s", ("fauci-hearing-june-2024",))
-            segs = cur.fetchall()
-            
-            for s in segs:
-                if not q or q.lower() in (s[3] or "").lower():
-                    ts = time.strftime("%H:%M:%S", time.gmtime(int(s[0] or 0)))
-                    cur2 = conn.cursor()
-                    cur2.execute("SELECT display_name FROM speakers WHERE hearing_id=? AND speaker_key=?", ("fauci-hearing-june-2024", s[2]))
-                    m = cur2.fetchone()
-                    if m and m[0]:
-                        disp = m[0]
-                    elif s[2]:
-                        disp = s[2].replace("_", " ").title()
-                    else:
-                        disp = "Speaker"
-                    
-                    text = s[3] or ""
-                    if any(word in text.lower() for word in ["thank", "appreciate", "welcome"]):
-                        sentiment_icon = "😊"
-                    elif any(word in text.lower() for word in ["investigate", "concern", "question"]):
-                        sentiment_icon = "🤔"
-                    elif any(word in text.lower() for word in ["important", "crucial", "critical"]):
-                        sentiment_icon = "⚠️"
-                    else:
-                        sentiment_icon = "💬"
-                    
-                    st.markdown(f"**{sentiment_icon} [{ts}] {disp}:** {text}")
-        
-        with col2:
-            st.markdown("### 📊 Executive Summary")
-            
-            st.markdown("**🎯 Executive Overview:**")
-            executive_summary = """
-            **WHO**: Dr. Anthony Fauci (former NIAID Director) testifying before the Select Subcommittee on the Coronavirus Pandemic, chaired by Dr. Brad Wenstrup.
-            
-            **WHAT**: Congressional hearing focused on investigating the federal government's COVID-19 pandemic response, exploring lessons learned, and examining transparency in public health decision-making.
-            
-            **WHEN**: June 3, 2024 - approximately 2.3 minutes of analyzed testimony segments.
-            
-            **WHY**: To provide oversight and accountability for pandemic response actions, with emphasis on scientific integrity and public trust in health institutions.
-            """
-            st.write(executive_summary)
-            
-            cur.execute("SELECT content_json FROM summaries WHERE hearing_id=? AND type='default'", ("fauci-hearing-june-2024",))
-            r = cur.fetchone()
-            if r:
-                summary = json.loads(r[0])
-                
-                st.markdown("**📈 Key Insights:**")
-                if "bullets" in summary:
-                    for b in summary["bullets"]:
-                        st.markdown(f"• {b}")
-                
-                st.markdown("**👥 Speaker Contributions:**")
-                for item in summary.get("by_speaker", []):
-                    st.markdown(f"**{item.get('speaker','?')}**")
-                    for p in item.get("points", []):
-                        st.markdown(f"  • {p}")
-            
-            st.markdown("**🔬 NLP Analysis Metrics:**")
-            
-            cur.execute("SELECT text FROM segments WHERE hearing_id=?", ("fauci-hearing-june-2024",))
-            all_segments = cur.fetchall()
-            total_words = sum(len(segment[0].split()) for segment in all_segments if segment[0])
-            total_sentences = sum(segment[0].count('.') + segment[0].count('!') + segment[0].count('?') for segment in all_segments if segment[0])
-            
-            if total_sentences > 0:
-                avg_words_per_sentence = total_words / total_sentences
-                st.write(f"• **Average Words/Sentence**: {avg_words_per_sentence:.1f}")
-                st.write(f"• **Total Words**: {total_words}")
-                st.write(f"• **Total Sentences**: {total_sentences}")
-            
-            st.markdown("**😊 Sentiment Indicators:**")
-            sentiment_analysis = [
-                "• **Positive**: Appreciation, welcome, service acknowledgment",
-                "• **Neutral**: Factual statements, procedural elements", 
-                "• **Analytical**: Investigation focus, transparency emphasis"
-            ]
-            for sentiment in sentiment_analysis:
-                st.write(sentiment)
-        
-        with col3:
-            st.markdown("### 🔍 Analysis Validation")
-            st.success("✅ **AI Analysis Complete**")
-            
-            st.markdown("**📊 Validation Metrics:**")
-            st.write("• ✅ Speaker identification")
-            st.write("• ✅ Timestamp accuracy")
-            st.write("• ✅ Theme extraction")
-            st.write("• ✅ Sentiment analysis")
-            st.write("• ✅ Critical point identification")
-            
-            st.markdown("**📈 Trend Analysis:**")
-            trends = [
-                "• **Opening Protocol**: Formal hearing structure maintained",
-                "• **Voluntary Participation**: Emphasized throughout testimony",
-                "• **Service Recognition**: Consistent acknowledgment of experience",
-                "• **Transparency Focus**: Recurring theme in discussion",
-                "• **Investigation Framework**: Clear oversight objectives"
-            ]
-            for trend in trends:
-                st.write(trend)
-            
-            st.markdown("**⚡ Critical Points Summary:**")
-            critical_summary = [
-                "• **WHO**: Dr. Anthony Fauci (Witness) & Dr. Brad Wenstrup (Chair)",
-                "• **WHAT**: COVID-19 pandemic response investigation",
-                "• **WHEN**: June 3, 2024, structured congressional hearing",
-                "• **WHY**: Oversight, accountability, and lessons learned",
-                "• **HOW**: Voluntary testimony with emphasis on transparency"
-            ]
-            for point in critical_summary:
-                st.write(point)
-            
-            st.markdown("**🎯 Quality Metrics:**")
-            st.write("• **Completeness**: 100% (all segments processed)")
-            st.write("• **Accuracy**: High (timestamp-verified)")
-            st.write("• **Clarity**: Excellent (speaker identification)")
-            st.write("• **Analysis Depth**: Advanced (NLP-enhanced)")
-
-# Tab 2: Congress API Integration
-with tab2:
-    try:
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from congress_api_integration import congress_api_interface
-        congress_api_interface()
-    except ImportError as e:
-        st.error(f"Congress API integration not available: {e}")
-        st.info("Make sure requests library is installed: pip install requests")
-        
-        st.header("🏛️ Congress.gov API Integration")
-        st.caption("Fetch real Congressional hearing data from the official API")
-        
-        st.info("""
-        **Congress.gov API Features:**
-        - Real Congressional hearing data
-        - Official committee information
-        - Accurate dates and titles
-        - Integration with CapitolVoices processing pipeline
-        - Search and lookup capabilities
-        
-        **To enable:** Make sure requests library is installed and restart the app.
-        """)
-        
-        with st.expander("📋 API Information"):
-            st.write("""
-            **API Key**: M48cj9inQcpQxtlQQM0tfobTP3YSr0fUG9niaC3G
-            
-            **Base URL**: https://api.congress.gov/v3
-            
-            **Rate Limits**:
-            - 5,000 requests per day
-            - 1 request per second
-            - Free tier available
-            
-            **Example Endpoint**: 
-            https://api.congress.gov/v3/hearing/118/house/55830?api_key=[YOUR_KEY]
-            """)
+pages = [
+    st.Page("views/hearing_browser.py", title="Hearing Browser", icon="🏛️", default=True),
+    st.Page("views/congress_api.py", title="Congress API", icon="📜"),
+    st.Page("views/youtube.py", title="YouTube Processor", icon="🎥"),
+    st.Page("views/speaker_tagger.py", title="Speaker Tagger", icon="🧩"),
+]
+st.navigation(pages).run()
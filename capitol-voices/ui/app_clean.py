@@ -1,491 +0,0 @@
-import streamlit as st
-import sqlite3
-import json
-import time
-import validators
-import requests
-import xml.etree.ElementTree as ET
-
-# Page configuration
-st.set_page_config(
-    page_title="CapitolVoices - Congressional Hearing Analysis",
-    page_icon="🏛️",
-    layout="wide"
-)
-
-# Database path
-DB_PATH = "data/hearings.db"
-
-# Header
-st.title("🏛️ CapitolVoices")
-st.caption("AI-powered Congressional hearing transcription and analysis with timestamp verification.")
-
-# Add navigation tabs
-tab1, tab2 = st.tabs(["🏛️ Hearing Browser", "🏛️ Congress API"])
-
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("CREATE TABLE IF NOT EXISTS hearings(id TEXT PRIMARY KEY, title TEXT, committee TEXT, date TEXT, video_url TEXT)")
-    cur.execute("CREATE TABLE IF NOT EXISTS summaries(hearing_id TEXT, type TEXT, content_json TEXT, PRIMARY KEY (hearing_id, type))")
-    cur.execute("CREATE TABLE IF NOT EXISTS segments(id INTEGER PRIMARY KEY AUTOINCREMENT, hearing_id TEXT, start_s REAL, end_s REAL, speaker_key TEXT, text TEXT)")
-    conn.commit()
-    return conn
-
-conn = init_db()
-
-# Tab 1: Hearing Browser
-with tab1:
-    with st.sidebar:
-        st.header("🏛️ Dr. Anthony Fauci Hearing")
-        st.info("**Official Congressional Hearing**")
-        
-        # Display the hearing details from Congress API
-        st.subheader("📋 Hearing Details")
-        st.write("**Title**: A HEARING WITH DR. ANTHONY FAUCI")
-        st.write("**Committee**: Select Subcommittee on the Coronavirus Pandemic")
-        st.write("**Date**: June 3, 2024")
-        st.write("**Chamber**: House")
-        st.write("**Congress**: 118")
-        st.write("**Hearing ID**: 55830")
-        st.write("**Jacket Number**: 55830")
-        
-        # Button to refresh hearing data
-        if st.button("🔄 Refresh Hearing Data", type="secondary"):
-            cur = conn.cursor()
-            cur.execute("""
-                REPLACE INTO hearings(id,title,committee,date,video_url)
-                VALUES(?,?,?,?,?)
-            """, (
-                "fauci-hearing-june-2024",
-                "A HEARING WITH DR. ANTHONY FAUCI",
-                "Select Subcommittee on the Coronavirus Pandemic",
-                "2024-06-03",
-                "https://www.youtube.com/watch?v=HhQ-tgm9vXQ"
-            ))
-            conn.commit()
-            st.success("✅ Hearing data refreshed!")
-        
-        # Button to generate transcript from Congress API
-        if st.button("📝 Generate Transcript from Congress API", type="primary"):
-            with st.spinner("Fetching hearing data from Congress API..."):
-                try:
-                    api_key = "M48cj9inQcpQxtlQQM0tfobTP3YSr0fUG9niaC3G"
-                    
-                    # Try to fetch the specific hearing ID 55830
-                    hearing_url = f"https://api.congress.gov/v3/hearing/118/house/55830?api_key={api_key}"
-                    
-                    response = requests.get(hearing_url, timeout=10)
-                    if response.status_code == 200:
-                        # Check if response is empty or malformed
-                        if not response.text.strip():
-                            st.warning("⚠️ Empty response from Congress API")
-                            st.info("This may be due to API rate limiting. Using verified hearing data from official sources.")
-                            fauci_hearing = None
-                        else:
-                            try:
-                                # Clean and validate XML response
-                                xml_content = response.text.strip()
-                                if not xml_content:
-                                    st.warning("⚠️ Empty XML response from Congress API")
-                                    fauci_hearing = None
-                                else:
-                                    # Parse XML response
-                                    root = ET.fromstring(xml_content)
-                                    
-                                    # Extract hearing data from XML
-                                    title_elem = root.find('.//title')
-                                    title = title_elem.text if title_elem is not None else "A HEARING WITH DR. ANTHONY FAUCI"
-                                    
-                                    committee_elem = root.find('.//committees/item/name')
-                                    committee = committee_elem.text if committee_elem is not None else "House Government Reform Committee"
-                                    
-                                    date_elem = root.find('.//dates/item/date')
-                                    date = date_elem.text if date_elem is not None else "2024-06-03"
-                                    
-                                    chamber_elem = root.find('.//chamber')
-                                    chamber = chamber_elem.text if chamber_elem is not None else "House"
-                                    
-                                    congress_elem = root.find('.//congress')
-                                    congress = congress_elem.text if congress_elem is not None else "118"
-                                    
-                                    jacket_elem = root.find('.//jacketNumber')
-                                    jacket_number = jacket_elem.text if jacket_elem is not None else "55830"
-                                    
-                                    # Get PDF URL
-                                    pdf_elem = root.find('.//formats/item[type="PDF"]/url')
-                                    pdf_url = pdf_elem.text if pdf_elem is not None else "https://congress.gov/118/chrg/CHRG-118hhrg55830/CHRG-118hhrg55830.pdf"
-                                    
-                                    fauci_hearing = {
-                                        "title": title,
-                                        "committee": committee,
-                                        "date": date,
-                                        "chamber": chamber,
-                                        "congress": congress,
-                                        "jacketNumber": jacket_number,
-                                        "pdf_url": pdf_url
-                                    }
-                            except ET.ParseError as e:
-                                st.warning(f"⚠️ XML parsing failed: {e}")
-                                st.info("This is likely due to API rate limiting or temporary issues. Using verified hearing data from official sources.")
-                                st.info("**Response content preview**: " + response.text[:200] + "...")
-                                fauci_hearing = None
-                            except Exception as e:
-                                st.warning(f"⚠️ Unexpected XML processing error: {e}")
-                                st.info("Using verified hearing data from official sources.")
-                                fauci_hearing = None
-                    else:
-                        st.warning(f"⚠️ API request failed with status code: {response.status_code}")
-                        fauci_hearing = None
-                    
-                    if fauci_hearing:
-                        st.success("✅ Found Dr. Anthony Fauci hearing in Congress API!")
-                        
-                        # Display the extracted data
-                        st.write(f"**API Title**: {fauci_hearing['title']}")
-                        st.write(f"**API Committee**: {fauci_hearing['committee']}")
-                        st.write(f"**API Date**: {fauci_hearing['date']}")
-                        st.write(f"**API Chamber**: {fauci_hearing['chamber']}")
-                        st.write(f"**API Congress**: {fauci_hearing['congress']}")
-                        st.write(f"**API Jacket Number**: {fauci_hearing['jacketNumber']}")
-                        st.write(f"**API PDF URL**: [Official Transcript]({fauci_hearing['pdf_url']})")
-                        
-                        # Update database with API data
-                        cur = conn.cursor()
-                        cur.execute("""
-                            REPLACE INTO hearings(id,title,committee,date,video_url)
-                            VALUES(?,?,?,?,?)
-                        """, (
-                            "fauci-hearing-june-2024",
-                            fauci_hearing['title'],
-                            fauci_hearing['committee'],
-                            fauci_hearing['date'],
-                            "https://www.youtube.com/watch?v=HhQ-tgm9vXQ"
-                        ))
-                        conn.commit()
-                        st.success("✅ Hearing data updated with Congress API information!")
-                        
-                        # Generate transcript from the hearing data
-                        st.info("🎯 **Generating transcript from hearing ID 55830...**")
-                        
-                        # Create realistic transcript segments based on the hearing
-                        transcript_segments = [
-                            {
-                                "start_s": 601.0,
-                                "end_s": 615.0,
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "text": "The Select Subcommittee on the Coronavirus Pandemic will come to order. I want to welcome everyone this morning."
-                            },
-                            {
-                                "start_s": 615.0,
-                                "end_s": 630.0,
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "text": "Good morning. And welcome, Dr. Fauci. First, I want to thank you for your decades of public service."
-                            },
-                            {
-                                "start_s": 645.0,
-                                "end_s": 660.0,
-                                "speaker": "Dr. Anthony Fauci (Witness)",
-                                "text": "Thank you, Mr. Chairman. I appreciate the opportunity to appear before this subcommittee voluntarily."
-                            },
-                            {
-                                "start_s": 680.0,
-                                "end_s": 695.0,
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "text": "Dr. Fauci, we're here to investigate the COVID-19 pandemic and to explore lessons learned, positive or negative."
-                            },
-                            {
-                                "start_s": 725.0,
-                                "end_s": 740.0,
-                                "speaker": "Dr. Anthony Fauci (Witness)",
-                                "text": "I believe transparency and accountability are crucial for maintaining public trust in our health institutions."
-                            }
-                        ]
-                        
-                        # Store transcript segments in database
-                        cur.execute("DELETE FROM segments WHERE hearing_id = ?", ("fauci-hearing-june-2024",))
-                        
-                        for segment in transcript_segments:
-                            cur.execute("""
-                                INSERT INTO segments (hearing_id, start_s, end_s, speaker_key, text)
-                                VALUES (?, ?, ?, ?, ?)
-                            """, (
-                                "fauci-hearing-june-2024",
-                                segment["start_s"],
-                                segment["end_s"],
-                                segment["speaker"].split("(")[0].strip().replace(" ", "_").lower(),
-                                segment["text"]
-                            ))
-                        
-                        # Create summary
-                        summary_data = {
-                            "executive": f"The {fauci_hearing['committee']} held a hearing with Dr. Anthony Fauci on {fauci_hearing['date']}. The hearing focused on investigating the COVID-19 pandemic response, exploring lessons learned, and examining the role of public health officials during the crisis.",
-                            "bullets": [
-                                "[00:10:01–00:10:15] Chairman Wenstrup opened the hearing and welcomed Dr. Fauci, acknowledging his decades of public service",
-                                "[00:10:45–00:11:20] Dr. Fauci expressed appreciation for the opportunity to appear voluntarily before the subcommittee",
-                                "[00:11:20–00:12:05] Chairman Wenstrup outlined the hearing's purpose: investigating COVID-19 response and exploring lessons learned",
-                                "[00:12:05–00:12:45] Dr. Fauci emphasized the importance of transparency and accountability in maintaining public trust",
-                                "[00:13:00–00:13:30] Discussion began on the challenges of public health communication during the pandemic"
-                            ],
-                            "by_speaker": [
-                                {
-                                    "speaker": "Dr. Brad Wenstrup (Chair)",
-                                    "points": ["Opened hearing and welcomed Dr. Fauci", "Acknowledged decades of public service", "Outlined hearing purpose: investigating COVID-19 response"]
-                                },
-                                {
-                                    "speaker": "Dr. Anthony Fauci (Witness)",
-                                    "points": ["Expressed appreciation for voluntary appearance", "Emphasized importance of transparency and accountability", "Discussed challenges of public health communication"]
-                                }
-                            ]
-                        }
-                        
-                        # Store summary
-                        cur.execute("DELETE FROM summaries WHERE hearing_id = ? AND type = ?", ("fauci-hearing-june-2024", "default"))
-                        cur.execute("""
-                            INSERT INTO summaries (hearing_id, type, content_json)
-                            VALUES (?, ?, ?)
-                        """, ("fauci-hearing-june-2024", "default", json.dumps(summary_data)))
-                        
-                        conn.commit()
-                        st.success("🎉 **Transcript generated successfully from hearing ID 55830!**")
-                        st.info("The transcript is now available in the Hearing Browser with speaker identification and timestamp verification.")
-                    else:
-                        st.warning("⚠️ Dr. Anthony Fauci hearing not found in Congress API search")
-                        st.info("**Search Results Summary:**")
-                        st.write("• Searched total hearings")
-                        st.write("• Searched for terms: 'fauci', 'anthony', 'coronavirus', 'pandemic', 'covid'")
-                        st.write("• Using verified hearing data from official sources")
-                        
-                        # Still update with our known data and generate transcript
-                        cur = conn.cursor()
-                        cur.execute("""
-                            REPLACE INTO hearings(id,title,committee,date,video_url)
-                            VALUES(?,?,?,?,?)
-                        """, (
-                            "fauci-hearing-june-2024",
-                            "A HEARING WITH DR. ANTHONY FAUCI",
-                            "Select Subcommittee on the Coronavirus Pandemic",
-                            "2024-06-03",
-                            "https://www.youtube.com/watch?v=HhQ-tgm9vXQ"
-                        ))
-                        conn.commit()
-                        st.success("✅ Using verified hearing data from official sources")
-                        
-                        # Generate transcript even when API fails
-                        st.info("🎯 **Generating transcript from hearing ID 55830 (fallback mode)...**")
-                        
-                        # Create realistic transcript segments based on the hearing
-                        transcript_segments = [
-                            {
-                                "start_s": 601.0,
-                                "end_s": 615.0,
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "text": "The Select Subcommittee on the Coronavirus Pandemic will come to order. I want to welcome everyone this morning."
-                            },
-                            {
-                                "start_s": 615.0,
-                                "end_s": 630.0,
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "text": "Good morning. And welcome, Dr. Fauci. First, I want to thank you for your decades of public service."
-                            },
-                            {
-                                "start_s": 645.0,
-                                "end_s": 660.0,
-                                "speaker": "Dr. Anthony Fauci (Witness)",
-                                "text": "Thank you, Mr. Chairman. I appreciate the opportunity to appear before this subcommittee voluntarily."
-                            },
-                            {
-                                "start_s": 680.0,
-                                "end_s": 695.0,
-                                "speaker": "Dr. Brad Wenstrup (Chair)",
-                                "text": "Dr. Fauci, we're here to investigate the COVID-19 pandemic and to explore lessons learned, positive or negative."
-                            },
-                            {
-                                "start_s": 725.0,
-                                "end_s": 740.0,
-                                "speaker": "Dr. Anthony Fauci (Witness)",
-                                "text": "I believe transparency and accountability are crucial for maintaining public trust in our health institutions."
-                            }
-                        ]
-                        
-                        # Store transcript segments in database
-                        cur.execute("DELETE FROM segments WHERE hearing_id = ?", ("fauci-hearing-june-2024",))
-                        
-                        for segment in transcript_segments:
-                            cur.execute("""
-                                INSERT INTO segments (hearing_id, start_s, end_s, speaker_key, text)
-                                VALUES (?, ?, ?, ?, ?)
-                            """, (
-                                "fauci-hearing-june-2024",
-                                segment["start_s"],
-                                segment["end_s"],
-                                segment["speaker"].split("(")[0].strip().replace(" ", "_").lower(),
-                                segment["text"]
-                            ))
-                        
-                        # Create summary
-                        summary_data = {
-                            "executive": "The Select Subcommittee on the Coronavirus Pandemic held a hearing with Dr. Anthony Fauci on June 3, 2024. The hearing focused on investigating the COVID-19 pandemic response, exploring lessons learned, and examining the role of public health officials during the crisis.",
-                            "bullets": [
-                                "[00:10:01–00:10:15] Chairman Wenstrup opened the hearing and welcomed Dr. Fauci, acknowledging his decades of public service",
-                                "[00:10:45–00:11:20] Dr. Fauci expressed appreciation for the opportunity to appear voluntarily before the subcommittee",
-                                "[00:11:20–00:12:05] Chairman Wenstrup outlined the hearing's purpose: investigating COVID-19 response and exploring lessons learned",
-                                "[00:12:05–00:12:45] Dr. Fauci emphasized the importance of transparency and accountability in maintaining public trust",
-                                "[00:13:00–00:13:30] Discussion began on the challenges of public health communication during the pandemic"
-                            ],
-                            "by_speaker": [
-                                {
-                                    "speaker": "Dr. Brad Wenstrup (Chair)",
-                                    "points": ["Opened hearing and welcomed Dr. Fauci", "Acknowledged decades of public service", "Outlined hearing purpose: investigating COVID-19 response"]
-                                },
-                                {
-                                    "speaker": "Dr. Anthony Fauci (Witness)",
-                                    "points": ["Expressed appreciation for voluntary appearance", "Emphasized importance of transparency and accountability", "Discussed challenges of public health communication"]
-                                }
-                            ]
-                        }
-                        
-                        # Store summary
-                        cur.execute("DELETE FROM summaries WHERE hearing_id = ? AND type = ?", ("fauci-hearing-june-2024", "default"))
-                        cur.execute("""
-                            INSERT INTO summaries (hearing_id, type, content_json)
-                            VALUES (?, ?, ?)
-                        """, ("fauci-hearing-june-2024", "default", json.dumps(summary_data)))
-                        
-                        conn.commit()
-                        st.success("🎉 **Transcript generated successfully from hearing ID 55830 (fallback mode)!**")
-                        st.info("The transcript is now available in the Hearing Browser with speaker identification and timestamp verification.")
-                        
-                except requests.exceptions.Timeout:
-                    st.warning("⚠️ Congress API request timed out")
-                    st.info("This may be due to network issues or API rate limiting. Using verified hearing data from official sources.")
-                except requests.exceptions.RequestException as e:
-                    st.warning(f"⚠️ Congress API request failed: {e}")
-                    st.info("This may be due to network issues or API rate limiting. Using verified hearing data from official sources.")
-                except Exception as e:
-                    st.warning(f"⚠️ Unexpected error: {e}")
-                    st.info("Using verified hearing data from official sources")
-
-    st.subheader("🏛️ Dr. Anthony Fauci Hearing - June 3, 2024")
-    
-    # Ensure the Fauci hearing exists in database
-    cur = conn.cursor()
-    cur.execute("""
-        REPLACE INTO hearings(id,title,committee,date,video_url)
-        VALUES(?,?,?,?,?)
-    """, (
-        "fauci-hearing-june-2024",
-        "A HEARING WITH DR. ANTHONY FAUCI",
-        "Select Subcommittee on the Coronavirus Pandemic",
-        "2024-06-03",
-        "https://www.youtube.com/watch?v=HhQ-tgm9vXQ"
-    ))
-    conn.commit()
-    
-    # Get the hearing data
-    cur.execute("SELECT id,title,committee,date,video_url FROM hearings WHERE id = 'fauci-hearing-june-2024'")
-    row = cur.fetchone()
-    
-    if row:
-        st.markdown(f"**{row[1]}**  \n{row[2]} • {row[3]}")
-        
-        # Display the YouTube video
-        if row[4] and validators.url(row[4]):
-            st.video(row[4])
-        
-        # Add hearing context
-        st.info("""
-        **Hearing Context**: This hearing was held by the Select Subcommittee on the Coronavirus Pandemic 
-        to investigate the COVID-19 pandemic response and explore lessons learned. Dr. Anthony Fauci, 
-        former Director of the National Institute of Allergy and Infectious Diseases, appeared voluntarily 
-        to provide testimony about the federal government's response to the pandemic.
-        """)
-        
-        # Add transcript validation section
-        st.markdown("### 📋 Transcript Validation")
-        st.info("**PDF Reference**: [Dr. Anthony Fauci Hearing Transcript](https://www.congress.gov/118/chrg/CHRG-118hhrg55830/CHRG-118hhrg55830.pdf)")
-        
-        col1, col2, col3 = st.columns([2,1,1])
-        with col1:
-            st.markdown("### Generated Transcript")
-            cur.execute("SELECT start_s,end_s,speaker_key,text FROM segments WHERE hearing_id=? ORDER BY start_s", ("fauci-hearing-june-2024",))
-            segs = cur.fetchall()
-            q = st.text_input("Search Transcript", "")
-            for s in segs:
-                if not q or q.lower() in (s[3] or "").lower():
-                    ts = time.strftime('%H:%M:%S', time.gmtime(int(s[0] or 0)))
-                    cur2 = conn.cursor()
-                    cur2.execute("SELECT display_name FROM speakers WHERE hearing_id=? AND speaker_key=?", ("fauci-hearing-june-2024", s[2]))
-                    m = cur2.fetchone()
-                    disp = m[0] if m and m[0] else (s[2] or 'Speaker')
-                    st.markdown(f"**[{ts}] {disp}:** {s[3]}")
-        
-        with col2:
-            st.markdown("### Summary")
-            cur.execute("SELECT content_json FROM summaries WHERE hearing_id=? AND type='default'", ("fauci-hearing-june-2024",))
-            r = cur.fetchone()
-            if r:
-                summary = json.loads(r[0])
-                st.write(summary.get("executive","(none)"))
-                if "bullets" in summary:
-                    st.markdown("**Key Bullets (timestamp-verified)**")
-                    for b in summary["bullets"]:
-                        st.markdown(f"- {b}")
-                st.markdown("**By Speaker**")
-                for item in summary.get("by_speaker", []):
-                    st.markdown(f"- **{item.get('speaker','?')}**")
-                    for p in item.get("points", []):
-                        st.markdown(f"  - {p}")
-        
-        with col3:
-            st.markdown("### Validation Status")
-            st.success("✅ **Transcript Generated**")
-            st.info("**Validation Points:**")
-            st.write("• Speaker identification")
-            st.write("• Timestamp accuracy")
-            st.write("• Opening statements")
-            st.write("• Key testimony points")
-            st.write("• Question and answer flow")
-
-# Tab 2: Congress API Integration
-with tab2:
-    try:
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from congress_api_integration import congress_api_interface
-        congress_api_interface()
-    except ImportError as e:
-        st.error(f"Congress API integration not available: {e}")
-        st.info("Make sure requests library is installed: pip install requests")
-        
-        # Show a simple interface instead
-        st.header("🏛️ Congress.gov API Integration")
-        st.caption("Fetch real Congressional hearing data from the official API")
-        
-        st.info("""
-        **Congress.gov API Features:**
-        - Real Congressional hearing data
-        - Official committee information
-        - Accurate dates and titles
-        - Integration with CapitolVoices processing pipeline
-        - Search and lookup capabilities
-        
-        **To enable:** Make sure requests library is installed and restart the app.
-        """)
-        
-        # Show API information
-        with st.expander("📋 API Information"):
-            st.write("""
-            **API Key**: M48cj9inQcpQxtlQQM0tfobTP3YSr0fUG9niaC3G
-            
-            **Base URL**: https://api.congress.gov/v3
-            
-            **Rate Limits**:
-            - 5,000 requests per day
-            - 1 request per second
-            - Free tier available
-            
-            **Example Endpoint**: 
-            https://api.congress.gov/v3/hearing/118/house/55830?api_key=[YOUR_KEY]
-            """)
\ No newline at end of file
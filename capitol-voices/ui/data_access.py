@@ -0,0 +1,172 @@
+"""Shared, cached data access for the CapitolVoices Streamlit UIs.
+
+One SQLite connection per database is kept for the life of the server (`st.cache_resource`);
+per-hearing reads are memoized with `st.cache_data` and keyed on `data_version()`, a cheap
+fingerprint of the hearing's rows, so a rerun only touches the database when something changed.
+"""
+from __future__ import annotations
+import re, sqlite3, threading, zlib
+from typing import Any, Dict, List, Sequence, Tuple
+
+import streamlit as st
+
+DB_PATH = "data/hearings.db"
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS hearings(id TEXT PRIMARY KEY, title TEXT, committee TEXT, date TEXT, video_url TEXT)",
+    "CREATE TABLE IF NOT EXISTS summaries(hearing_id TEXT, type TEXT, content_json TEXT, PRIMARY KEY (hearing_id, type))",
+    "CREATE TABLE IF NOT EXISTS segments(id INTEGER PRIMARY KEY AUTOINCREMENT, hearing_id TEXT, start_s REAL, end_s REAL, speaker_key TEXT, text TEXT)",
+    "CREATE TABLE IF NOT EXISTS speakers(hearing_id TEXT, speaker_key TEXT, display_name TEXT, role TEXT, PRIMARY KEY (hearing_id, speaker_key))",
+    "CREATE INDEX IF NOT EXISTS idx_segments_hearing_start ON segments(hearing_id, start_s)",
+]
+
+# sqlite3 connections are shared across Streamlit sessions (threads); serialize access to each.
+_locks: Dict[str, threading.Lock] = {}
+
+def _segment_crc(start_s, end_s, speaker_key, text, words) -> int:
+    """CRC-32 of one segment's timing, speaker, text and packed word timings."""
+    head = repr((start_s, end_s, speaker_key, text)).encode("utf-8")
+    return zlib.crc32(words or b"", zlib.crc32(head))
+
+@st.cache_resource
+def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    for stmt in SCHEMA:
+        conn.execute(stmt)
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(speakers)")}
+    if "role" not in cols:  # databases created by the early UI have no role column
+        conn.execute("ALTER TABLE speakers ADD COLUMN role TEXT")
+    if "words" not in {r[1] for r in conn.execute("PRAGMA table_info(segments)")}:
+        conn.execute("ALTER TABLE segments ADD COLUMN words BLOB")  # packed word timings, see core/word_index.py
+    conn.create_function("segment_crc", 5, _segment_crc, deterministic=True)
+    conn.commit()
+    return conn
+
+@st.cache_resource
+def get_storage():
+    """The configured Storage backend (SQLite or PostgreSQL), constructed once per server process."""
+    from core.settings import AppSettings
+    cfg = AppSettings()
+    if cfg.storage_engine == "postgresql":
+        from adapters.storage_postgresql import PostgreSQLStorage
+        return PostgreSQLStorage(cfg.postgresql_connection_string, cfg.postgresql_schema)
+    from adapters.storage_sqlite import SQLiteStorage
+    return SQLiteStorage(cfg.db_path)
+
+@st.cache_resource
+def get_job_runner():
+    """Process-wide background job runner; jobs are recorded in the shared storage backend."""
+    from core.settings import AppSettings
+    from pipelines.jobs import JobRunner
+    return JobRunner(get_storage(), max_workers=AppSettings().job_workers)
+
+def query(sql: str, params: Sequence[Any] = (), db_path: str = DB_PATH) -> List[tuple]:
+    conn = get_connection(db_path)
+    with _locks.setdefault(db_path, threading.Lock()):
+        return conn.execute(sql, params).fetchall()
+
+def execute(sql: str, params: Sequence[Any] = (), db_path: str = DB_PATH) -> None:
+    """Run a write and commit it; cached reads pick it up through `data_version()`."""
+    conn = get_connection(db_path)
+    with _locks.setdefault(db_path, threading.Lock()):
+        conn.execute(sql, params)
+        conn.commit()
+
+def execute_all(statements: Sequence[Tuple[str, Sequence[Any]]], db_path: str = DB_PATH) -> None:
+    """Run several `(sql, params)` writes as one transaction, committed together or not at all."""
+    conn = get_connection(db_path)
+    with _locks.setdefault(db_path, threading.Lock()):
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+def data_version(hearing_id: str, db_path: str = DB_PATH) -> Tuple[Any, ...]:
+    """Fingerprint of a hearing's segments and speaker mappings; changes whenever either is written.
+
+    Besides the row count and highest id, every segment's text, timing, speaker and word timings
+    are checksummed, so an in-place edit (a corrected transcript line) is picked up as well.
+    """
+    return query("""
+        SELECT (SELECT COUNT(*) FROM segments WHERE hearing_id=?),
+               (SELECT IFNULL(MAX(id), 0) FROM segments WHERE hearing_id=?),
+               (SELECT IFNULL(SUM(segment_crc(start_s, end_s, speaker_key, text, words)), 0)
+                  FROM segments WHERE hearing_id=?),
+               (SELECT group_concat(speaker_key || '=' || IFNULL(display_name, '') || '/' || IFNULL(role, ''), '|')
+                  FROM speakers WHERE hearing_id=?)
+    """, (hearing_id,) * 4, db_path)[0]
+
+def speaker_label(speaker_key: str | None, display_name: str | None) -> str:
+    if display_name:
+        return display_name
+    return speaker_key.replace("_", " ").title() if speaker_key else "Speaker"
+
+@st.cache_data(show_spinner=False)
+def load_segments(hearing_id: str, version: Tuple[Any, ...], db_path: str = DB_PATH) -> List[Dict[str, Any]]:
+    """All segments of a hearing, in time order, with speaker names resolved in the same query."""
+    rows = query("""
+        SELECT s.start_s, s.end_s, s.speaker_key, s.text, sp.display_name, sp.role
+          FROM segments s
+          LEFT JOIN speakers sp ON sp.hearing_id = s.hearing_id AND sp.speaker_key = s.speaker_key
+         WHERE s.hearing_id = ?
+         ORDER BY s.start_s
+    """, (hearing_id,), db_path)
+    return [dict(start_s=r[0] or 0.0, end_s=r[1] or 0.0, speaker_key=r[2], text=r[3] or "",
+                 display_name=speaker_label(r[2], r[4]), role=r[5]) for r in rows]
+
+@st.cache_data(show_spinner=False)
+def speaker_stats(hearing_id: str, version: Tuple[Any, ...], db_path: str = DB_PATH) -> List[Dict[str, Any]]:
+    """Per-speaker segment count, speaking time and share of segments, ordered by speaker key."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    segs = load_segments(hearing_id, version, db_path)
+    for s in segs:
+        agg = stats.setdefault(s["speaker_key"] or "", {"speaker_key": s["speaker_key"], "display_name": s["display_name"],
+                                                         "count": 0, "duration": 0.0})
+        agg["count"] += 1
+        agg["duration"] += s["end_s"] - s["start_s"]
+    for agg in stats.values():
+        agg["percentage"] = agg["count"] / len(segs) * 100
+    return [stats[k] for k in sorted(stats)]
+
+@st.cache_data(show_spinner=False)
+def theme_counts(hearing_id: str, version: Tuple[Any, ...], themes: Dict[str, Tuple[str, ...]],
+                 db_path: str = DB_PATH) -> Dict[str, int]:
+    """Keyword mention counts per theme over the full transcript (themes with no mentions are omitted)."""
+    text = " ".join(s["text"] for s in load_segments(hearing_id, version, db_path)).lower()
+    counts = {theme: sum(text.count(k) for k in keywords) for theme, keywords in themes.items()}
+    return {t: n for t, n in counts.items() if n > 0}
+
+@st.cache_data(show_spinner=False)
+def text_metrics(hearing_id: str, version: Tuple[Any, ...], db_path: str = DB_PATH) -> Dict[str, Any]:
+    segs = load_segments(hearing_id, version, db_path)
+    words = sum(len(s["text"].split()) for s in segs)
+    sentences = sum(len(re.findall(r"[.!?]", s["text"])) for s in segs)
+    return {
+        "words": words,
+        "sentences": sentences,
+        "start_s": min((s["start_s"] for s in segs), default=None),
+        "end_s": max((s["end_s"] for s in segs), default=None),
+    }
+
+@st.cache_data(show_spinner=False)
+def seek_phrase(hearing_id: str, version: Tuple[Any, ...], phrase: str, db_path: str = DB_PATH,
+                limit: int = 20) -> List[Dict[str, Any]]:
+    """Matches of `phrase` resolved to audio time; exact when the segment has word timings."""
+    from core.word_index import seek_in_segments
+    rows = query("SELECT start_s, end_s, text, words FROM segments WHERE hearing_id=? AND text LIKE ? ORDER BY start_s",
+                 (hearing_id, f"%{phrase.strip()}%"), db_path)
+    segs = [dict(start_s=r[0] or 0.0, end_s=r[1] or 0.0, text=r[2] or "", words_blob=r[3]) for r in rows]
+    return seek_in_segments(segs, phrase, limit)
+
+def paginate(items: Sequence[Any], page_size: int = 50, key: str = "page") -> Sequence[Any]:
+    """Render a page selector and return the slice of `items` for the selected page."""
+    pages = max(1, -(-len(items) // page_size))
+    if pages == 1:
+        return items
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1, key=key)
+    start = (int(page) - 1) * page_size
+    st.caption(f"Showing {start + 1}–{min(start + page_size, len(items))} of {len(items)}")
+    return items[start:start + page_size]
@@ -0,0 +1,66 @@
+"""Live job list for pages that queue background work (see pipelines/jobs.py)."""
+import time
+
+import streamlit as st
+
+from pipelines.jobs import ACTIVE
+from ui.data_access import get_job_runner
+
+STATUS_ICONS = {"queued": "⏳", "running": "⚙️", "succeeded": "✅", "failed": "❌"}
+
+def render_result(result):
+    """Statistics, sample segments and summary of a finished YouTube processing job."""
+    stats = result.get("statistics") or {}
+    if stats:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Segments", stats.get("total_segments", 0))
+        with col2:
+            st.metric("Duration", f"{stats.get('total_duration_minutes', 0):.1f} min")
+        with col3:
+            st.metric("Words", stats.get("total_words", 0))
+
+    segments = result.get("sample_segments") or []
+    if segments:
+        st.write("**Sample Transcript Segments**")
+        for segment in segments:
+            start_time = f"{int(segment['start_s']//60):02d}:{int(segment['start_s']%60):02d}"
+            st.write(f"**[{start_time}] {segment.get('speaker_key', 'Unknown')}:** {segment['text']}")
+        total = stats.get("total_segments", len(segments))
+        if total > len(segments):
+            st.caption(f"... and {total - len(segments)} more segments")
+
+    summary = result.get("summary") or {}
+    if summary.get("executive"):
+        st.write("**Executive Summary:**")
+        st.write(summary["executive"])
+    if summary.get("bullets"):
+        st.write("**Key Points (timestamp-verified):**")
+        for bullet in summary["bullets"][:5]:
+            st.write(f"• {bullet}")
+
+def _panel(kinds, limit, polling):
+    jobs = [j for j in get_job_runner().jobs(limit) if not kinds or j["kind"] in kinds]
+    if not jobs:
+        st.caption("No jobs queued yet.")
+        return
+    for job in jobs:
+        params = job.get("params") or {}
+        label = (params.get("hearing_metadata") or {}).get("hearing_id") or params.get("youtube_url") or job["kind"]
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(job["created_at"] or 0))
+        st.markdown(f"{STATUS_ICONS.get(job['status'], '•')} **{label}** · `{job['id']}` · {job['status']} · {created}")
+        if job["status"] in ACTIVE:
+            st.progress(float(job["progress"] or 0), text=job["message"] or "Queued")
+        elif job["status"] == "failed":
+            st.error(job["error"] or "Job failed")
+        elif job["result"]:
+            with st.expander("Result"):
+                render_result(job["result"])
+    if polling and not any(j["status"] in ACTIVE for j in jobs):
+        st.rerun()  # last job finished: rerun the page once so the fragment stops polling
+
+def job_panel(kinds=None, limit: int = 10, poll_seconds: float = 2.0):
+    """Recent jobs with progress bars; polls storage only while some job is still active."""
+    st.subheader("Processing Jobs")
+    active = any(j["status"] in ACTIVE for j in get_job_runner().jobs(limit) if not kinds or j["kind"] in kinds)
+    st.fragment(_panel, run_every=poll_seconds if active else None)(kinds, limit, active)
@@ -0,0 +1,38 @@
+"""Congress.gov API page: hearing lookup, search and import."""
+import streamlit as st
+
+try:
+    from congress_api_integration import congress_api_interface
+    congress_api_interface()
+except ImportError as e:
+    st.error(f"Congress API integration not available: {e}")
+    st.info("Make sure requests library is installed: pip install requests")
+
+    st.header("🏛️ Congress.gov API Integration")
+    st.caption("Fetch real Congressional hearing data from the official API")
+
+    st.info("""
+    **Congress.gov API Features:**
+    - Real Congressional hearing data
+    - Official committee information
+    - Accurate dates and titles
+    - Integration with CapitolVoices processing pipeline
+    - Search and lookup capabilities
+
+    **To enable:** Make sure requests library is installed and restart the app.
+    """)
+
+    with st.expander("📋 API Information"):
+        st.write("""
+        **API Key**: set `CONGRESS_API_KEY` in the environment or `.env`
+
+        **Base URL**: https://api.congress.gov/v3
+
+        **Rate Limits**:
+        - 5,000 requests per day
+        - 1 request per second
+        - Free tier available
+
+        **Example Endpoint**: 
+        https://api.congress.gov/v3/hearing/118/house/55830?api_key=[YOUR_KEY]
+        """)
@@ -0,0 +1,32 @@
+"""Speaker tagger page: map diarization keys to display names and roles."""
+import streamlit as st
+
+from ui import data_access as da
+
+DB_PATH = "data/hearings.db"
+ROLES = ["Chair", "Ranking Member", "Member", "Witness", "Staff", "Other"]
+
+st.header("🧩 Manual Speaker Tagger")
+
+hid = st.text_input("Hearing ID", "demo-001")
+if hid:
+    mapped = {k: (name, role) for k, name, role in
+              da.query("SELECT speaker_key, display_name, role FROM speakers WHERE hearing_id=?", (hid,), DB_PATH)}
+    keys = [r[0] for r in da.query("SELECT DISTINCT speaker_key FROM segments WHERE hearing_id=? ORDER BY speaker_key", (hid,), DB_PATH) if r[0]]
+    st.write("Detected speaker keys:", keys or "(none)")
+
+    st.subheader("Map keys → names/roles")
+    for k in keys:
+        with st.form(f"form_{k}"):
+            row = mapped.get(k)
+            name = st.text_input("Display name", value=row[0] or "" if row else "", key=f"name_{k}")
+            role = st.selectbox("Role", ROLES, index=ROLES.index(row[1]) if row and row[1] in ROLES else 5, key=f"role_{k}")
+            submitted = st.form_submit_button("Save mapping")
+            if submitted:
+                da.execute("REPLACE INTO speakers(hearing_id, speaker_key, display_name, role) VALUES(?,?,?,?)", (hid, k, name, role), DB_PATH)
+                st.success(f"Saved mapping for {k} → {name} ({role})")
+
+    st.subheader("Preview")
+    segs = da.load_segments(hid, da.data_version(hid, DB_PATH), DB_PATH)
+    for s in da.paginate(segs, page_size=30, key="preview_page"):
+        st.markdown(f"**[{int(s['start_s']//60):02d}:{int(s['start_s']%60):02d}] {s['display_name']}:** {s['text']}")
@@ -0,0 +1,10 @@
+"""YouTube processing page."""
+import streamlit as st
+
+try:
+    from ui.youtube_processor import youtube_processor_interface
+except ImportError as e:
+    st.error(f"YouTube processing not available: {e}")
+    st.info("Install the transcript dependencies: pip install -r requirements.txt")
+else:
+    youtube_processor_interface()
@@ -2,7 +2,8 @@ import streamlit as st
 import json
 from pathlib import Path
 from adapters.youtube_transcript_fetcher import CongressionalYouTubeProcessor
-from pipelines.youtube_processor import process_congressional_youtube_video
+from ui.data_access import get_job_runner
+from ui.job_status import job_panel
 
 def youtube_processor_interface():
     """Streamlit interface for YouTube transcript processing"""
@@ -70,51 +71,10 @@ def youtube_processor_interface():
                 "expected_speakers": expected_speakers
             }
             
-            # Process the video
-            with st.spinner("Processing YouTube video..."):
-                result = process_congressional_youtube_video(youtube_url, hearing_metadata)
-            
-            if result["success"]:
-                st.success("✅ Video processed successfully!")
-                
-                # Display results
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Segments", result["statistics"]["total_segments"])
-                with col2:
-                    st.metric("Duration", f"{result['statistics']['total_duration_minutes']:.1f} min")
-                with col3:
-                    st.metric("Words", result["statistics"]["total_words"])
-                
-                # Show sample segments
-                st.subheader("Sample Transcript Segments")
-                segments = result["segments"][:5]  # Show first 5 segments
-                for i, segment in enumerate(segments):
-                    start_time = f"{int(segment['start_s']//60):02d}:{int(segment['start_s']%60):02d}"
-                    speaker = segment.get('speaker_key', 'Unknown')
-                    st.write(f"**[{start_time}] {speaker}:** {segment['text']}")
-                
-                if len(result["segments"]) > 5:
-                    st.caption(f"... and {len(result['segments']) - 5} more segments")
-                
-                # Show summary
-                if "summary" in result and result["summary"]:
-                    st.subheader("Generated Summary")
-                    summary = result["summary"]
-                    
-                    if "executive" in summary:
-                        st.write("**Executive Summary:**")
-                        st.write(summary["executive"])
-                    
-                    if "bullets" in summary:
-                        st.write("**Key Points (timestamp-verified):**")
-                        for bullet in summary["bullets"][:5]:  # Show first 5 bullets
-                            st.write(f"• {bullet}")
-                
-                st.info("🎉 Processing complete! The hearing is now available in the main interface.")
-                
-            else:
-                st.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
+            job_id = get_job_runner().submit("youtube", {"youtube_url": youtube_url, "hearing_metadata": hearing_metadata})
+            st.success(f"✅ Queued job `{job_id}` — you can queue more hearings while it runs.")
+    
+    job_panel(kinds=("youtube",))
     
     # Example URLs section
     with st.expander("📋 Example Congressional YouTube URLs"):
@@ -137,8 +97,8 @@ def youtube_processor_interface():
         1. **Find a Congressional hearing** on YouTube with captions/transcripts
         2. **Copy the YouTube URL** from the video
         3. **Fill in the hearing information** (title, committee, date, etc.)
-        4. **Click "Process YouTube Video"** to fetch the transcript
-        5. **View the results** in the main CapitolVoices interface
+        4. **Click "Process YouTube Video"** to queue it; processing runs in the background
+        5. **Follow progress** under Processing Jobs, then view the results in the main CapitolVoices interface
         
         **Requirements:**
         - The YouTube video must have captions/transcripts available
@@ -77,37 +77,10 @@ def youtube_processor_interface():
                             "expected_speakers": expected_speakers
                         }
                         
-                        # Process the video
-                        with st.spinner("Processing YouTube video..."):
-                            result = processor.process_congressional_video(youtube_url, hearing_metadata)
-                        
-                        if result["success"]:
-                            st.success("✅ Video processed successfully!")
-                            
-                            # Display results
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("Segments", result["statistics"]["total_segments"])
-                            with col2:
-                                st.metric("Duration", f"{result['statistics']['total_duration_minutes']:.1f} min")
-                            with col3:
-                                st.metric("Words", result["statistics"]["total_words"])
-                            
-                            # Show sample segments
-                            st.subheader("Sample Transcript Segments")
-                            segments = result["segments"][:5]  # Show first 5 segments
-                            for i, segment in enumerate(segments):
-                                start_time = f"{int(segment['start_s']//60):02d}:{int(segment['start_s']%60):02d}"
-                                speaker = segment.get('speaker_key', 'Unknown')
-                                st.write(f"**[{start_time}] {speaker}:** {segment['text']}")
-                            
-                            if len(result["segments"]) > 5:
-                                st.caption(f"... and {len(result['segments']) - 5} more segments")
-                            
-                            st.info("🎉 Processing complete! The hearing is now available in the main interface.")
-                            
-                        else:
-                            st.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
+                        from ui.data_access import get_job_runner
+                        job_id = get_job_runner().submit("youtube_transcript", {"youtube_url": youtube_url,
+                                                                                "hearing_metadata": hearing_metadata})
+                        st.success(f"✅ Queued job `{job_id}` — progress is shown below.")
         
         except ImportError as e:
             st.error(f"YouTube processor not available: {e}")
@@ -115,6 +88,9 @@ def youtube_processor_interface():
         except Exception as e:
             st.error(f"Error: {e}")
     
+    from ui.job_status import job_panel
+    job_panel(kinds=("youtube_transcript",))
+    
     # Example URLs section
     with st.expander("📋 Example Congressional YouTube URLs"):
         st.write("""
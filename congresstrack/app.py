@@ -10,7 +10,8 @@ from dataclasses import dataclass
 from dotenv import load_dotenv
 import plotly.express as px
 import plotly.graph_objects as go
-from collections import Counter
+
+from law_store import ANALYSIS_COLUMNS, METADATA_COLUMNS, LawStore
 
 # Load environment variables
 load_dotenv()
@@ -55,6 +56,8 @@ class LawData:
     analysis: Optional[str] = None
     detailed_assessment: Optional[str] = None
     law_citations: Optional[List[str]] = None
+    # Data file name, used to fetch text and actions when loaded without them
+    source_file: Optional[str] = None
 
     def __post_init__(self):
         if self.supporting_objectives is None:
@@ -66,98 +69,183 @@ class LawData:
 
 
 class LawDataLoader:
-    """Loads and parses law data from JSON files"""
+    """Loads law data through the LawStore mirror of the data directory's JSON files"""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", store_path: str = ".cache/laws.sqlite"):
         self.data_dir = Path(data_dir)
+        self.store = LawStore(data_dir, store_path)
+        # Key for the cached views below: their data comes from this file, whatever data_dir is
+        self.store_path = str(Path(store_path).resolve())
+
+    def sync(self) -> int:
+        """Pick up new/changed/deleted JSON files; returns the store version"""
+        for json_file, error in self.store.sync()["errors"]:
+            st.error(f"Error loading {self.data_dir / json_file}: {error}")
+        return self.store.version()
+
+    def load_all_laws(
+        self, include_text: bool = True, sync: bool = True
+    ) -> List[LawData]:
+        """Load all laws; without text, law_text and actions stay empty until load_text"""
+        if sync:
+            self.sync()
+        if include_text:
+            rows = self.store.iter_laws()
+        else:
+            rows = self.store.rows(METADATA_COLUMNS + ANALYSIS_COLUMNS)
+        return [self._to_law(row) for row in rows]
+
+    def load_text(self, law: LawData) -> LawData:
+        """Fill in the bill text and actions of a law loaded without them"""
+        details = self.store.text(law.source_file)
+        law.law_text = details["text"]
+        law.actions = details["actions"]
+        return law
+
+    @staticmethod
+    def _to_law(row: Dict) -> LawData:
+        # Parse campaign objectives if available
+        campaign_objectives = None
+        obj_data = row.get("campaign_objectives")
+        if obj_data:
+            campaign_objectives = CampaignObjectives(
+                sponsor_name=obj_data.get("sponsor_name", ""),
+                objectives=obj_data.get("objectives", []),
+                source=obj_data.get("source", "manual"),
+                confidence_score=obj_data.get("confidence_score", 0.0),
+                source_url=obj_data.get("source_url"),
+                references=obj_data.get("references", []),
+            )
 
-    def load_all_laws(self) -> List[LawData]:
-        """Load all law files from the data directory"""
-        laws = []
-
-        for json_file in self.data_dir.glob("*.json"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Parse campaign objectives if available
-                campaign_objectives = None
-                if "campaign_objectives" in data and data["campaign_objectives"]:
-                    obj_data = data["campaign_objectives"]
-                    campaign_objectives = CampaignObjectives(
-                        sponsor_name=obj_data.get("sponsor_name", ""),
-                        objectives=obj_data.get("objectives", []),
-                        source=obj_data.get("source", "manual"),
-                        confidence_score=obj_data.get("confidence_score", 0.0),
-                        source_url=obj_data.get("source_url"),
-                        references=obj_data.get("references", []),
-                    )
-
-                law = LawData(
-                    title=data.get("title", ""),
-                    sponsor_name=data.get("sponsor", {}).get("name", ""),
-                    sponsor_website=data.get("sponsor", {}).get("websiteUrl"),
-                    sponsor_state=data.get("sponsor", {}).get("state", ""),
-                    sponsor_bioguide_id=data.get("sponsor", {}).get("bioguideId", ""),
-                    law_text=data.get("text", ""),
-                    actions=data.get("actions", []),
-                    congress=data.get("congress", 0),
-                    number=data.get("number", ""),
-                    origin_chamber=data.get("originChamberCode", ""),
-                    # Analysis results (pre-computed)
-                    campaign_objectives=campaign_objectives,
-                    alignment_score=data.get("alignment_score"),
-                    supporting_objectives=data.get("supporting_objectives", []),
-                    conflicting_objectives=data.get("conflicting_objectives", []),
-                    analysis=data.get("analysis", ""),
-                    detailed_assessment=data.get("detailed_assessment", ""),
-                    law_citations=data.get("law_citations", []),
-                    party=data.get("sponsor", {}).get("party", ""),
-                )
-                laws.append(law)
+        return LawData(
+            title=row["title"],
+            sponsor_name=row["sponsor_name"],
+            sponsor_website=row["sponsor_website"],
+            sponsor_state=row["sponsor_state"],
+            sponsor_bioguide_id=row["sponsor_bioguide_id"],
+            law_text=row.get("text", ""),
+            actions=row.get("actions", []),
+            congress=row["congress"],
+            number=row["number"],
+            origin_chamber=row["origin_chamber"],
+            # Analysis results (pre-computed)
+            campaign_objectives=campaign_objectives,
+            alignment_score=row["alignment_score"],
+            supporting_objectives=row["supporting_objectives"],
+            conflicting_objectives=row["conflicting_objectives"],
+            analysis=row["analysis"],
+            detailed_assessment=row["detailed_assessment"],
+            law_citations=row["law_citations"],
+            party=row["party"],
+            source_file=row["file"],
+        )
 
-            except Exception as e:
-                st.error(f"Error loading {json_file}: {e}")
 
-        return laws
+@st.cache_data(show_spinner=False)
+def _cached_laws(store_path: str, version: int) -> List[LawData]:
+    return LawDataLoader(store_path=store_path).load_all_laws(
+        include_text=False, sync=False
+    )
+
+
+def load_law_index(
+    data_dir: str = "data", store_path: str = ".cache/laws.sqlite"
+) -> List[LawData]:
+    """All laws without text, cached until a JSON file in `data_dir` changes"""
+    loader = LawDataLoader(data_dir, store_path)
+    return _cached_laws(loader.store_path, loader.sync())
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_law_text(store_path: str, source_file: str, version: int) -> Dict:
+    return LawStore(path=store_path).text(source_file)
+
+
+@st.cache_data(show_spinner=False)
+def load_law_table(store_path: str, version: int) -> pd.DataFrame:
+    """Law metadata columns as a DataFrame, for vectorized aggregations"""
+    return pd.DataFrame(
+        LawStore(path=store_path).rows(METADATA_COLUMNS), columns=METADATA_COLUMNS
+    )
 
 
 class SponsorAnalyzer:
     """Analyzes sponsor data and creates visualizations"""
 
-    def __init__(self, laws: List[LawData]):
-        self.laws = laws
+    SPONSOR_COLUMNS = [
+        "sponsor_name",
+        "sponsor_state",
+        "sponsor_bioguide_id",
+        "origin_chamber",
+        "congress",
+        "party",
+    ]
+
+    def __init__(self, laws):
+        """`laws`: a law metadata DataFrame (see load_law_table) or a list of LawData"""
+        if isinstance(laws, pd.DataFrame):
+            self.laws = laws
+        else:
+            self.laws = pd.DataFrame(
+                [
+                    {
+                        "sponsor_name": law.sponsor_name,
+                        "sponsor_state": law.sponsor_state,
+                        "sponsor_bioguide_id": law.sponsor_bioguide_id,
+                        "origin_chamber": law.origin_chamber,
+                        "congress": law.congress,
+                        "party": law.party,
+                    }
+                    for law in laws
+                ],
+                columns=self.SPONSOR_COLUMNS,
+            )
 
     def get_sponsor_counts(self) -> Dict[str, int]:
-        """Count laws per sponsor"""
-        sponsor_counts = Counter()
-        for law in self.laws:
-            sponsor_counts[law.sponsor_name] += 1
-        return dict(sponsor_counts)
+        """Count laws per sponsor; laws without a sponsor name count under NaN"""
+        return (
+            self.laws.groupby("sponsor_name", sort=False, dropna=False).size().to_dict()
+        )
 
     def get_sponsor_dataframe(self) -> pd.DataFrame:
-        """Create a DataFrame with sponsor information and law counts"""
-        sponsor_data = []
-        sponsor_counts = self.get_sponsor_counts()
-
-        for law in self.laws:
-            sponsor_data.append(
-                {
-                    "sponsor_name": law.sponsor_name,
-                    "sponsor_state": law.sponsor_state,
-                    "sponsor_bioguide_id": law.sponsor_bioguide_id,
-                    "origin_chamber": law.origin_chamber,
-                    "law_count": sponsor_counts[law.sponsor_name],
-                    "congress": law.congress,
-                    "party": law.party,
-                }
-            )
-
-        # Remove duplicates and sort by law count
-        df = pd.DataFrame(sponsor_data).drop_duplicates(subset=["sponsor_name"])
-        return df.sort_values("law_count", ascending=False)
+        """One row per sponsor (details from their first law) with law counts"""
+        df = self.laws[self.SPONSOR_COLUMNS].copy()
+        # dropna=False: laws without a sponsor name are still counted, as one sponsor
+        counts = df.groupby("sponsor_name", sort=False, dropna=False)["sponsor_name"]
+        df.insert(4, "law_count", counts.transform("size"))
+        df = df.drop_duplicates(subset=["sponsor_name"])
+        return df.sort_values("law_count", ascending=False, kind="stable")
+
+    @staticmethod
+    def rollup(df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """Total laws per value of `column`, largest first"""
+        return (
+            df.groupby(column)["law_count"]
+            .sum()
+            .reset_index()
+            .sort_values("law_count", ascending=False)
+        )
 
-    def create_bar_chart(self, df: pd.DataFrame, top_n: int = 20) -> go.Figure:
+    def rollups(self) -> Dict:
+        """Ranked leaderboard and party/state/chamber totals for each chamber filter"""
+        sponsor_df = self.get_sponsor_dataframe()
+        result = {"total_laws": len(self.laws), "filters": {}}
+        for name, chamber in (("All", None), ("House", "H"), ("Senate", "S")):
+            df = sponsor_df
+            if chamber:
+                df = df[df["origin_chamber"] == chamber]
+            df = df.reset_index(drop=True)
+            df["rank"] = df.index + 1
+            result["filters"][name] = {
+                "leaderboard": df,
+                "by_chamber": self.rollup(df, "origin_chamber"),
+                "by_state": self.rollup(df, "sponsor_state"),
+                "by_party": self.rollup(df, "party"),
+            }
+        return result
+
+    @staticmethod
+    def create_bar_chart(df: pd.DataFrame, top_n: int = 20) -> go.Figure:
         """Create a bar chart of top sponsors by law count"""
         top_sponsors = df.head(top_n)
 
@@ -183,10 +271,9 @@ class SponsorAnalyzer:
 
         return fig
 
-    def create_chamber_comparison(self, df: pd.DataFrame) -> go.Figure:
-        """Create a comparison chart between House and Senate"""
-        chamber_counts = df.groupby("origin_chamber")["law_count"].sum().reset_index()
-
+    @staticmethod
+    def create_chamber_comparison(chamber_counts: pd.DataFrame) -> go.Figure:
+        """Create a comparison chart between House and Senate from `rollup(df, "origin_chamber")`"""
         fig = px.pie(
             chamber_counts,
             values="law_count",
@@ -197,10 +284,10 @@ class SponsorAnalyzer:
 
         return fig
 
-    def create_state_analysis(self, df: pd.DataFrame) -> go.Figure:
-        """Create a chart showing laws by state"""
-        state_counts = df.groupby("sponsor_state")["law_count"].sum().reset_index()
-        state_counts = state_counts.sort_values("law_count", ascending=False).head(15)
+    @staticmethod
+    def create_state_analysis(state_counts: pd.DataFrame) -> go.Figure:
+        """Create a chart showing laws by state from `rollup(df, "sponsor_state")`"""
+        state_counts = state_counts.head(15)
 
         fig = px.bar(
             state_counts,
@@ -215,6 +302,26 @@ class SponsorAnalyzer:
         fig.update_layout(xaxis_tickangle=-45)
         return fig
 
+    @staticmethod
+    def create_party_comparison(party_counts: pd.DataFrame) -> go.Figure:
+        """Create a chart of laws sponsored by party from `rollup(df, "party")`"""
+        fig = px.pie(
+            party_counts,
+            values="law_count",
+            names="party",
+            title="Laws Sponsored by Party",
+            color="party",
+            color_discrete_map={"Democratic": "lightblue", "Republican": "lightcoral"},
+        )
+
+        return fig
+
+
+@st.cache_data(show_spinner=False)
+def sponsor_rollups(store_path: str, version: int) -> Dict:
+    """SponsorAnalyzer.rollups() computed once per data version"""
+    return SponsorAnalyzer(load_law_table(store_path, version)).rollups()
+
 
 def show_sponsor_visualization_page():
     """Display the sponsor visualization page as a leaderboard"""
@@ -318,21 +425,15 @@ def show_sponsor_visualization_page():
         unsafe_allow_html=True,
     )
 
-    # Initialize components
-    loader = LawDataLoader()
-
-    # Load laws
+    # Aggregations are computed once per data version, not per interaction
     with st.spinner("Loading law data..."):
-        laws = loader.load_all_laws()
+        loader = LawDataLoader()
+        rollups = sponsor_rollups(loader.store_path, loader.sync())
 
-    if not laws:
+    if not rollups["total_laws"]:
         st.error("No law data found. Please check the data directory.")
         return
 
-    # Initialize sponsor analyzer
-    analyzer = SponsorAnalyzer(laws)
-    sponsor_df = analyzer.get_sponsor_dataframe()
-
     # Configuration options
     st.sidebar.header("🏆 Leaderboard Options")
     top_n = 50
@@ -340,16 +441,12 @@ def show_sponsor_visualization_page():
         "Filter by Chamber", ["All", "House", "Senate"]
     )
 
-    # Filter data
-    if chamber_filter != "All":
-        chamber_filter = "H" if chamber_filter == "House" else "S"
-        filtered_df = sponsor_df[sponsor_df["origin_chamber"] == chamber_filter].copy()
-    else:
-        filtered_df = sponsor_df.copy()
-
-    # Add ranking
-    filtered_df = filtered_df.reset_index(drop=True)
-    filtered_df["rank"] = filtered_df.index + 1
+    # Pre-ranked leaderboard and rollups for the selected chamber
+    selected = rollups["filters"][chamber_filter]
+    filtered_df = selected["leaderboard"]
+    if filtered_df.empty:
+        st.warning(f"No laws sponsored in the {chamber_filter}.")
+        return
 
     # Summary statistics in cards
     col1, col2, col3, col4 = st.columns(4)
@@ -358,7 +455,7 @@ def show_sponsor_visualization_page():
         st.markdown(
             f"""
         <div class="stats-card">
-            <div class="stats-number">{len(laws)}</div>
+            <div class="stats-number">{rollups["total_laws"]}</div>
             <div class="stats-label">Total Laws</div>
         </div>
         """,
@@ -458,17 +555,27 @@ def show_sponsor_visualization_page():
 
     with col1:
         st.subheader("📈 Top Performers Chart")
-        bar_chart = analyzer.create_bar_chart(filtered_df, top_n)
+        bar_chart = SponsorAnalyzer.create_bar_chart(filtered_df, top_n)
         st.plotly_chart(bar_chart, width="stretch")
 
     with col2:
         st.subheader("🏛️ Chamber Distribution")
-        chamber_chart = analyzer.create_chamber_comparison(filtered_df)
+        chamber_chart = SponsorAnalyzer.create_chamber_comparison(
+            selected["by_chamber"]
+        )
         st.plotly_chart(chamber_chart, width="stretch")
 
-    st.subheader("🗺️ State Leaders")
-    state_chart = analyzer.create_state_analysis(filtered_df)
-    st.plotly_chart(state_chart, width="stretch")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🗺️ State Leaders")
+        state_chart = SponsorAnalyzer.create_state_analysis(selected["by_state"])
+        st.plotly_chart(state_chart, width="stretch")
+
+    with col2:
+        st.subheader("🎗️ Party Breakdown")
+        party_chart = SponsorAnalyzer.create_party_comparison(selected["by_party"])
+        st.plotly_chart(party_chart, width="stretch")
 
     # Achievement badges
     st.markdown("## 🏅 Achievement Badges")
@@ -548,12 +655,9 @@ def show_law_analysis_page():
         "View pre-computed analysis of passed laws against sponsors' campaign objectives"
     )
 
-    # Initialize components
-    loader = LawDataLoader()
-
-    # Load laws
+    # Load law metadata; the selected law's text is fetched below
     with st.spinner("Loading law data..."):
-        laws = loader.load_all_laws()
+        laws = load_law_index()
 
     st.success(f"Loaded {len(laws)} laws from the data directory")
 
@@ -683,13 +787,17 @@ def show_law_analysis_page():
 
     # Law text display
     if analyzed_laws:
+        loader = LawDataLoader()
+        details = load_law_text(
+            loader.store_path, selected_law.source_file, loader.store.version()
+        )
         st.header("Law Text")
         with st.expander("View full law text"):
-            st.text(selected_law.law_text)
+            st.text(details["text"])
 
         # Actions timeline
         st.header("Legislative Actions Timeline")
-        actions_df = pd.DataFrame(selected_law.actions)
+        actions_df = pd.DataFrame(details["actions"])
         if not actions_df.empty:
             st.dataframe(actions_df[["actionDate", "text", "type"]], width="stretch")
         else:
@@ -701,12 +809,9 @@ def show_analysis_summary_page():
     st.title("📊 Analysis Summary & Rankings")
     st.markdown("Overview of law alignment scores and top performers")
 
-    # Initialize components
-    loader = LawDataLoader()
-
-    # Load laws
+    # Load law metadata
     with st.spinner("Loading law data..."):
-        laws = loader.load_all_laws()
+        laws = load_law_index()
 
     # Filter laws with analysis data
     analyzed_laws = [law for law in laws if law.alignment_score is not None]
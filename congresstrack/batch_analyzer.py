@@ -1,124 +1,94 @@
 #!/usr/bin/env python3
 """
 Batch analyzer for comparing all laws against campaign objectives
+
+    python batch_analyzer.py            # resumes: laws already in the results file are skipped
+    python batch_analyzer.py --restart  # analyze everything again
 """
 
-import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
-from app import LawDataLoader, CampaignScraper, LLMAnalyzer, CampaignObjectives
+from app import LawDataLoader
 from dotenv import load_dotenv
-
-
-def analyze_all_laws():
-    """Analyze all laws and create a comparison report"""
-
-    load_dotenv()
-
-    # Initialize components
-    loader = LawDataLoader()
-    scraper = CampaignScraper()
-    analyzer = LLMAnalyzer()
-
-    print("Loading all laws...")
-    laws = loader.load_all_laws()
-    print(f"Loaded {len(laws)} laws")
-
-    results = []
-
-    for i, law in enumerate(laws, 1):
-        print(f"Processing {i}/{len(laws)}: {law.title}")
-
-        # Get website URL - either from data or search for it
-        website_url = law.sponsor_website
-
-        if not website_url:
-            print("  No website found in law data. Searching for campaign website...")
-            website_url = scraper.search_campaign_website(
-                law.sponsor_name, law.sponsor_state
-            )
-
-            if website_url:
-                print(f"  Found campaign website: {website_url}")
-            else:
-                print("  Could not find campaign website")
-
-        # Scrape website if available
-        website_content = ""
-        if website_url:
-            website_content = scraper.scrape_website(website_url)
-
-        # Analyze objectives
-        if website_content:
-            objectives = analyzer.analyze_campaign_objectives(
-                website_content, law.sponsor_name, website_url
-            )
-        else:
-            objectives = CampaignObjectives(
-                sponsor_name=law.sponsor_name,
-                objectives=["No website content available"],
-                source="manual",
-                confidence_score=0.0,
-                source_url=website_url,
-                references=[],
-            )
-
-        # Compare law to objectives
-        comparison = analyzer.compare_law_to_objectives(law, objectives)
-
-        # Store results
-        result = {
-            "law_title": law.title,
-            "sponsor_name": law.sponsor_name,
-            "sponsor_state": law.sponsor_state,
-            "sponsor_website": law.sponsor_website,
-            "found_website": website_url,
-            "congress": law.congress,
-            "number": law.number,
-            "origin_chamber": law.origin_chamber,
-            "objectives_source": objectives.source,
-            "objectives_confidence": objectives.confidence_score,
-            "objectives_source_url": objectives.source_url,
-            "objectives_references": objectives.references,
-            "alignment_score": comparison.get("alignment_score", 0),
-            "supporting_objectives_count": len(
-                comparison.get("supporting_objectives", [])
-            ),
-            "conflicting_objectives_count": len(
-                comparison.get("conflicting_objectives", [])
-            ),
-            "analysis": comparison.get("analysis", ""),
-            "supporting_objectives": comparison.get("supporting_objectives", []),
-            "conflicting_objectives": comparison.get("conflicting_objectives", []),
-            "detailed_assessment": comparison.get("detailed_assessment", ""),
-            "law_citations": comparison.get("law_citations", []),
-        }
-
-        results.append(result)
-
-        # Small delay to avoid rate limiting
-        import time
-
-        time.sleep(1)
-
-    # Save results
-    output_file = "law_campaign_analysis_results.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-
-    print(f"Results saved to {output_file}")
-
-    # Create summary DataFrame
-    df = pd.DataFrame(results)
-
-    # Summary statistics
+from http_cache import HTTPCache
+from objectives_cache import ObjectivesCache
+from result_sink import JSONLSink, export_parquet
+from passed_law_pipeline import (
+    OBJECTIVES_PROMPT_CHARS,
+    CampaignScraper,
+    LLMAnalyzer,
+    Law,
+    SponsorObjectives,
+    analyze_law,
+)
+from site_scraper import SiteScraper
+
+
+def law_key(law) -> str:
+    return f"{law.origin_chamber}.{law.congress}.{law.number}"
+
+
+def analyze_one(law, sponsors: SponsorObjectives, analyzer: LLMAnalyzer) -> dict:
+    """Compare one loaded law against its sponsor's objectives"""
+    analyzed = analyze_law(
+        Law(
+            title=law.title,
+            sponsor={
+                "name": law.sponsor_name,
+                "state": law.sponsor_state,
+                "websiteUrl": law.sponsor_website,
+                "bioguideId": law.sponsor_bioguide_id,
+            },
+            actions=law.actions,
+            text=law.law_text,
+            originChamberCode=law.origin_chamber,
+            congress=law.congress,
+            number=law.number,
+        ),
+        sponsors,
+        analyzer,
+    )
+    objectives = analyzed.campaign_objectives
+
+    return {
+        "law_key": law_key(law),
+        "law_title": law.title,
+        "sponsor_name": law.sponsor_name,
+        "sponsor_state": law.sponsor_state,
+        "sponsor_website": law.sponsor_website,
+        "found_website": objectives.source_url,
+        "congress": law.congress,
+        "number": law.number,
+        "origin_chamber": law.origin_chamber,
+        "objectives_source": objectives.source,
+        "objectives_confidence": objectives.confidence_score,
+        "objectives_source_url": objectives.source_url,
+        "objectives_references": objectives.references,
+        "alignment_score": analyzed.alignment_score,
+        "supporting_objectives_count": len(analyzed.supporting_objectives),
+        "conflicting_objectives_count": len(analyzed.conflicting_objectives),
+        "analysis": analyzed.analysis,
+        "supporting_objectives": analyzed.supporting_objectives,
+        "conflicting_objectives": analyzed.conflicting_objectives,
+        "detailed_assessment": analyzed.detailed_assessment,
+        "law_citations": analyzed.law_citations,
+    }
+
+
+def summarize(df: pd.DataFrame) -> None:
+    """Print summary statistics of the analysis results"""
     print("\n=== SUMMARY STATISTICS ===")
-    print(f"Total laws analyzed: {len(results)}")
-    print(f"Average alignment score: {df['alignment_score'].mean():.1f}")
-    print(f"Laws with high alignment (≥70): {len(df[df['alignment_score'] >= 70])}")
+    print(f"Total laws analyzed: {len(df)}")
+    if df.empty:
+        return
+    scores = df["alignment_score"]
+    print(f"Average alignment score: {scores.mean():.1f}")
+    print(f"Laws with high alignment (≥70): {(scores >= 70).sum()}")
     print(
-        f"Laws with medium alignment (40-69): {len(df[(df['alignment_score'] >= 40) & (df['alignment_score'] < 70)])}"
+        f"Laws with medium alignment (40-69): {((scores >= 40) & (scores < 70)).sum()}"
     )
-    print(f"Laws with low alignment (<40): {len(df[df['alignment_score'] < 40])}")
+    print(f"Laws with low alignment (<40): {(scores < 40).sum()}")
 
     # Top aligned laws
     print("\n=== TOP 10 MOST ALIGNED LAWS ===")
@@ -130,13 +100,90 @@ def analyze_all_laws():
             f"{row['alignment_score']:.1f} - {row['law_title']} ({row['sponsor_name']})"
         )
 
-    # Save CSV summary
+
+def analyze_all_laws(
+    output_file: str = "law_campaign_analysis_results.jsonl", restart: bool = False
+) -> pd.DataFrame:
+    """Analyze all laws and create a comparison report.
+
+    Results are appended to `output_file` as each law finishes, so an
+    interrupted run loses at most the laws in flight; the next run skips
+    laws already in the file. Reports are built from the file afterwards.
+    """
+
+    load_dotenv()
+
+    # Initialize components
+    loader = LawDataLoader()
+    analyzer = LLMAnalyzer()
+    sites = SiteScraper(
+        cache=HTTPCache(".cache/site_cache.sqlite"), max_chars=OBJECTIVES_PROMPT_CHARS
+    )
+    scraper = CampaignScraper(sites)
+    # Objectives are extracted once per sponsor, not once per law
+    sponsors = SponsorObjectives(scraper, analyzer, ObjectivesCache())
+
+    print("Loading all laws...")
+    laws = loader.load_all_laws(include_text=False)
+
+    with JSONLSink(output_file, restart=restart) as sink:
+        pending = [law for law in laws if law_key(law) not in sink]
+        print(
+            f"Loaded {len(laws)} laws, {len(laws) - len(pending)} already analyzed "
+            f"in {output_file}"
+        )
+
+        def run(law) -> dict:
+            # Bill text is read per law rather than held in memory for all of them
+            return analyze_one(loader.load_text(law), sponsors, analyzer)
+
+        # LLM calls are paced by the analyzer's executor (concurrency cap, token
+        # budget, rate-limit backoff), so laws can be dispatched all at once
+        failed = 0
+        with ThreadPoolExecutor(max_workers=analyzer.executor.max_concurrency) as pool:
+            futures = {pool.submit(run, law): law for law in pending}
+            for i, future in enumerate(as_completed(futures), 1):
+                law = futures[future]
+                try:
+                    sink.write(future.result())
+                except Exception as e:
+                    failed += 1
+                    print(f"Failed {law.title}: {e}")
+                    continue
+                print(f"Processed {i}/{len(pending)}: {law.title}")
+
+    if failed:
+        print(f"{failed} laws failed and will be retried on the next run")
+    print(f"Results saved to {output_file}")
+    print(f"Sponsor objectives: {sponsors.stats}")
+    print(f"Campaign sites: {scraper.sites.stats}")
+    print(f"LLM usage: {analyzer.executor.usage()}")
+
+    # Reports are built from the sink, which also holds earlier runs' results
+    df = sink.to_frame()
+    summarize(df)
+
+    json_file = "law_campaign_analysis_results.json"
+    df.to_json(json_file, orient="records", indent=2, force_ascii=False)
+    print(f"\nResults saved to {json_file}")
     csv_file = "law_campaign_analysis_summary.csv"
     df.to_csv(csv_file, index=False)
-    print(f"\nSummary saved to {csv_file}")
+    print(f"Summary saved to {csv_file}")
+    if export_parquet(df, "law_campaign_analysis_results.parquet"):
+        print("Parquet saved to law_campaign_analysis_results.parquet")
 
-    return results
+    return df
 
 
 if __name__ == "__main__":
-    analyze_all_laws()
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--output", default="law_campaign_analysis_results.jsonl")
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="discard previous results instead of resuming",
+    )
+    args = parser.parse_args()
+    analyze_all_laws(args.output, restart=args.restart)
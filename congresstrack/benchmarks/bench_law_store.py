@@ -0,0 +1,122 @@
+"""
+Loading laws from per-file JSON vs the LawStore SQLite mirror, on a synthetic corpus.
+
+    python benchmarks/bench_law_store.py                  # 10,000 laws, ~20 KB of text each
+    python benchmarks/bench_law_store.py --laws 2000 --text-kb 50
+
+"json_glob" is what every Streamlit rerun used to do: json.load every data/*.json,
+bill text included. The store figures are a first build, a sync with nothing
+changed (what a rerun now costs before hitting the page cache), a sync after
+20 files changed, the metadata-only read behind the leaderboard and fetching
+one law's text on selection.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from law_store import METADATA_COLUMNS, LawStore
+
+STATES = "AL AK AZ AR CA CO CT DE FL GA HI ID IL IN IA KS KY LA ME MD".split()
+WORDS = (
+    "section act secretary federal program state shall amended grant fiscal "
+    "year appropriated authority report congress agency public law subsection"
+).split()
+
+
+def synth_corpus(data_dir: Path, n: int, text_kb: int, rng: random.Random) -> None:
+    sponsors = [
+        {
+            "name": f"Member {i}",
+            "websiteUrl": f"https://member{i}.house.gov",
+            "state": rng.choice(STATES),
+            "bioguideId": f"M{i:06d}",
+            "party": rng.choice(["Democratic", "Republican"]),
+        }
+        for i in range(max(1, n // 12))
+    ]
+    for i in range(n):
+        chamber = rng.choice("HS")
+        words = rng.choices(WORDS, k=text_kb * 1024 // 8)
+        law = {
+            "title": f"Synthetic Act {i}",
+            "sponsor": rng.choice(sponsors),
+            "actions": [
+                {"actionDate": f"2025-0{m}-01", "text": "Action", "type": "Floor"}
+                for m in range(1, 8)
+            ],
+            "text": " ".join(words),
+            "originChamberCode": chamber,
+            "congress": 119,
+            "number": i,
+            "updateDate": "2025-06-01T00:00:00Z",
+            "campaign_objectives": {"objectives": ["jobs", "roads"]},
+            "alignment_score": rng.randint(0, 100),
+            "supporting_objectives": ["jobs"],
+            "conflicting_objectives": [],
+            "analysis": "Synthetic analysis.",
+            "detailed_assessment": "Synthetic assessment. " * 20,
+            "law_citations": [],
+        }
+        with open(data_dir / f"{chamber}.119.{i}.json", "w", encoding="utf-8") as f:
+            json.dump(law, f)
+
+
+def json_glob(data_dir: Path) -> int:
+    laws = []
+    for json_file in data_dir.glob("*.json"):
+        with open(json_file, "r", encoding="utf-8") as f:
+            laws.append(json.load(f))
+    return len(laws)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return round((time.perf_counter() - start) * 1000, 1), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--laws", type=int, default=10_000)
+    parser.add_argument("--text-kb", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as d:
+        data_dir = Path(d) / "data"
+        data_dir.mkdir()
+        synth_corpus(data_dir, args.laws, args.text_kb, rng)
+        corpus_bytes = sum(f.stat().st_size for f in data_dir.iterdir())
+
+        store = LawStore(str(data_dir), os.path.join(d, "laws.sqlite"))
+        results = {
+            "laws": args.laws,
+            "corpus_mb": round(corpus_bytes / 2**20, 1),
+            "json_glob_ms": timed(json_glob, data_dir)[0],
+            "store_first_build_ms": timed(store.sync)[0],
+            "store_sync_unchanged_ms": timed(store.sync)[0],
+        }
+        for path in rng.sample(sorted(data_dir.iterdir()), 20):
+            os.utime(path, ns=(time.time_ns(), time.time_ns()))
+        ms, stats = timed(store.sync)
+        assert stats["updated"] == 20
+        results["store_sync_20_changed_ms"] = ms
+        ms, rows = timed(store.rows, METADATA_COLUMNS)
+        assert len(rows) == args.laws
+        results["leaderboard_metadata_ms"] = ms
+        results["law_text_on_select_ms"] = timed(
+            store.text, rows[len(rows) // 2]["file"]
+        )[0]
+        results["store_mb"] = round(os.path.getsize(store.path) / 2**20, 1)
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
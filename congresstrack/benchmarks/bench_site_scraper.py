@@ -0,0 +1,161 @@
+"""
+Campaign-website scraping throughput against a local fixture site.
+
+    python benchmarks/bench_site_scraper.py                # 40 sites, 50 ms per request
+    python benchmarks/bench_site_scraper.py --sites 100 --latency-ms 100
+
+Every fixture site (its own port, so its own domain) has a homepage linking to
+three issues pages. "legacy" is the old CampaignScraper.scrape_website: one
+blocking GET of the homepage at a time, parsed with html.parser. The SiteScraper
+figures are a cold run (homepage + issues pages, 16 workers, 2 per site), a
+rerun revalidating every page with a conditional GET (304s) and a rerun served
+from the page cache. "parse" compares extracting one homepage with
+BeautifulSoup/html.parser and with lxml.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from http_cache import HTTPCache
+from site_scraper import SiteScraper, extract
+
+WORDS = (
+    "families jobs veterans healthcare broadband farmers taxes border schools "
+    "energy infrastructure seniors security housing water small business"
+).split()
+ISSUES = ["economy", "healthcare", "veterans"]
+
+
+def page(title: str, rng: random.Random, kb: int, links: str = "") -> bytes:
+    paragraphs = "".join(
+        f"<p>{' '.join(rng.choices(WORDS, k=60))}</p>" for _ in range(kb * 2)
+    )
+    return (
+        f"<html><head><title>{title}</title><script>{'var x=1;' * 200}</script>"
+        f"</head><body><nav>{links}</nav><h1>{title}</h1>{paragraphs}"
+        "<footer>Paid for by the committee</footer></body></html>"
+    ).encode()
+
+
+def fixture_site(rng: random.Random, latency: float) -> ThreadingHTTPServer:
+    links = "".join(f'<a href="/issues/{i}">{i.title()}</a>' for i in ISSUES)
+    pages = {"/": page("Home", rng, 30, links), "/robots.txt": b"User-agent: *\n"}
+    for issue in ISSUES:
+        pages[f"/issues/{issue}"] = page(issue.title(), rng, 15)
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args): ...
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = pages.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def legacy_scrape(session: requests.Session, url: str) -> str:
+    response = session.get(url, timeout=10)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content, "html.parser")
+    for script in soup(["script", "style"]):
+        script.decompose()
+    lines = (line.strip() for line in soup.get_text().splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return " ".join(chunk for chunk in chunks if chunk)[:5000]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def per_page_ms(parse, n: int = 50) -> float:
+    seconds, _ = timed(lambda: [parse() for _ in range(n)])
+    return round(seconds * 1000 / n, 2)
+
+
+def run(scraper: SiteScraper, urls) -> dict:
+    seconds, pages = timed(scraper.scrape_many, urls)
+    assert all(pages.values())
+    return {
+        "s": round(seconds, 2),
+        "sites_per_s": round(len(urls) / seconds, 1),
+        "stats": dict(scraper.stats),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sites", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    servers = [fixture_site(rng, args.latency_ms / 1000) for _ in range(args.sites)]
+    urls = [f"http://127.0.0.1:{srv.server_port}/" for srv in servers]
+    results = {"sites": args.sites, "latency_ms": args.latency_ms}
+
+    session = requests.Session()
+    seconds, _ = timed(lambda: [legacy_scrape(session, url) for url in urls])
+    results["legacy_homepage_only"] = {
+        "s": round(seconds, 2),
+        "sites_per_s": round(args.sites / seconds, 1),
+    }
+
+    with tempfile.TemporaryDirectory() as d:
+        cache = HTTPCache(os.path.join(d, "sites.sqlite"))
+        results["site_scraper_cold"] = run(
+            SiteScraper(cache=cache, max_workers=args.workers), urls
+        )
+        results["site_scraper_revalidate"] = run(
+            SiteScraper(cache=cache, max_workers=args.workers, max_age_s=0), urls
+        )
+        results["site_scraper_cached"] = run(
+            SiteScraper(cache=cache, max_workers=args.workers), urls
+        )
+
+    home = requests.get(urls[0]).content
+    results["parse_ms_per_page"] = {
+        "html_parser": per_page_ms(
+            lambda: BeautifulSoup(home, "html.parser").get_text()
+        ),
+        "lxml": per_page_ms(lambda: extract(home, urls[0])),
+    }
+    for srv in servers:
+        srv.shutdown()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
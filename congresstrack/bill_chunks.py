@@ -0,0 +1,128 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+# "SEC. 2. DEFINITIONS." / "SECTION 1. SHORT TITLE." at the start of a line of the <pre> text
+SECTION_RE = re.compile(r"^[ \t]*(SEC(?:TION)?\.?[ \t]+\d+[A-Za-z]?\.)", re.MULTILINE)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or shall "
+    "that the their this to was were which will with such any under".split()
+)
+
+
+@dataclass
+class Chunk:
+    index: int
+    heading: str
+    text: str
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS or len(token) < 2:
+            continue
+        # Crude plural folding so "veterans" matches "veteran"
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """Split on blank lines, then lines, keeping pieces under max_chars"""
+    pieces, current = [], ""
+    for block in re.split(r"(\n\s*\n)", text):
+        if len(current) + len(block) <= max_chars:
+            current += block
+            continue
+        if current.strip():
+            pieces.append(current)
+        current = block
+        while len(current) > max_chars:
+            cut = current.rfind("\n", 0, max_chars)
+            cut = cut if cut > max_chars // 2 else max_chars
+            pieces.append(current[:cut])
+            current = current[cut:]
+    if current.strip():
+        pieces.append(current)
+    return pieces
+
+
+def split_sections(text: str, max_chars: int = 2000) -> List[Chunk]:
+    """Chunks following the bill's SEC. markers; long sections are split further"""
+    starts = [m.start() for m in SECTION_RE.finditer(text)]
+    if not starts or starts[0] > 0:
+        starts.insert(0, 0)
+    chunks = []
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        section = text[start:end]
+        if not section.strip():
+            continue
+        first_line = section.strip().splitlines()[0].strip()
+        heading = first_line[:120] if SECTION_RE.match(section) else "Preamble"
+        for i, piece in enumerate(_split_long(section, max_chars)):
+            label = heading if i == 0 else f"{heading} (cont. {i})"
+            chunks.append(Chunk(len(chunks), label, piece.strip()))
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 over chunk texts"""
+
+    def __init__(self, documents: Sequence[str], k1: float = 1.5, b: float = 0.75):
+        self.k1, self.b = k1, b
+        self.term_freqs = [Counter(tokenize(doc)) for doc in documents]
+        self.lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0
+        doc_freq = Counter(term for tf in self.term_freqs for term in tf)
+        n = len(documents)
+        self.idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def scores(self, query: str) -> List[float]:
+        terms = set(tokenize(query))
+        result = []
+        for tf, length in zip(self.term_freqs, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.avg_length or 1))
+            result.append(
+                sum(
+                    self.idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm)
+                    for t in terms
+                    if t in tf
+                )
+            )
+        return result
+
+    def search(self, query: str, k: int = 3) -> List[Tuple[int, float]]:
+        ranked = sorted(enumerate(self.scores(query)), key=lambda x: -x[1])
+        return [(i, score) for i, score in ranked[:k] if score > 0]
+
+
+def select_chunks(
+    chunks: Sequence[Chunk],
+    objectives: Sequence[str],
+    per_objective: int = 2,
+    max_chunks: int = 6,
+) -> List[Tuple[Chunk, float, List[str]]]:
+    """Chunks most relevant to any objective: (chunk, best score, matching objectives).
+
+    At most `max_chunks`, returned in document order. When no objective matches
+    any chunk, the opening chunks are returned so the law is still scored.
+    """
+    index = BM25Index([c.heading + "\n" + c.text for c in chunks])
+    best: Dict[int, float] = {}
+    matched: Dict[int, List[str]] = {}
+    for objective in objectives:
+        for i, score in index.search(objective, per_objective):
+            best[i] = max(best.get(i, 0.0), score)
+            matched.setdefault(i, []).append(objective)
+    if not best:
+        return [(c, 0.0, []) for c in chunks[:2]]
+    top = sorted(best, key=lambda i: -best[i])[:max_chunks]
+    return [(chunks[i], best[i], matched[i]) for i in sorted(top)]
@@ -0,0 +1,191 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from http_cache import HTTPCache, cache_key
+
+BASE_URL = "https://api.congress.gov/v3"
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart"""
+
+    def __init__(self, rate_per_s: float):
+        self.interval = 1.0 / rate_per_s if rate_per_s > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CongressClient:
+    """Shared Congress.gov client: pooled session, retries and one rate limiter per host.
+
+    All worker threads of a pipeline run should use the same instance so the
+    API key's quota (5,000 requests/hour) is respected globally.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BASE_URL,
+        rate_per_s: float = 1.3,
+        other_hosts_rate_per_s: float = 2.0,
+        timeout: float = 30.0,
+        max_retries: int = 4,
+        pool_size: int = 16,
+        cache: Optional[HTTPCache] = None,
+    ):
+        self.api_key = api_key or os.getenv("CONGRESS_API_KEY")
+        if not self.api_key:
+            raise ValueError(
+                "Set CONGRESS_API_KEY (or pass api_key) to call Congress.gov"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.api_host = urlparse(self.base_url).netloc
+        self.timeout = timeout
+        self.rate_per_s = rate_per_s
+        self.other_hosts_rate_per_s = other_hosts_rate_per_s
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self.requests_made = 0
+        self.cache = cache
+        # cache key -> [lock, callers holding or waiting for it]; dropped when the last one leaves
+        self._inflight: Dict[str, list] = {}
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _limiter(self, host: str) -> RateLimiter:
+        with self._limiters_lock:
+            if host not in self._limiters:
+                rate = (
+                    self.rate_per_s
+                    if host == self.api_host
+                    else self.other_hosts_rate_per_s
+                )
+                self._limiters[host] = RateLimiter(rate)
+            return self._limiters[host]
+
+    def _url(self, path_or_url: str) -> str:
+        if path_or_url.startswith("http"):
+            return path_or_url
+        return f"{self.base_url}/{path_or_url.lstrip('/')}"
+
+    def get(
+        self, path_or_url: str, params: Optional[Dict] = None, headers=None
+    ) -> requests.Response:
+        """Rate-limited GET; API requests carry the key, other hosts do not"""
+        url = self._url(path_or_url)
+        host = urlparse(url).netloc
+        params = dict(params or {})
+        if host == self.api_host:
+            params.setdefault("format", "json")
+            headers = {"X-API-Key": self.api_key, **(headers or {})}
+        self._limiter(host).wait()
+        response = self.session.get(
+            url, params=params, headers=headers, timeout=self.timeout
+        )
+        with self._limiters_lock:
+            self.requests_made += 1
+        return response
+
+    def _fetch(
+        self, path_or_url: str, params: Optional[Dict] = None, fresh: bool = False
+    ) -> str:
+        """GET a body through the cache: fresh entries skip the network, stale ones revalidate.
+
+        fresh=True revalidates even an entry within its TTL, for callers that
+        know the resource changed (a 304 still avoids downloading the body).
+        """
+        if self.cache is None:
+            response = self.get(path_or_url, params)
+            response.raise_for_status()
+            return response.text
+
+        url = self._url(path_or_url)
+        key = cache_key(url, params)
+        with self._limiters_lock:
+            inflight = self._inflight.setdefault(key, [threading.Lock(), 0])
+            inflight[1] += 1
+        # One request per URL at a time, so workers asking for the same sponsor share a fetch
+        try:
+            with inflight[0]:
+                return self._fetch_cached(url, key, params, fresh)
+        finally:
+            with self._limiters_lock:
+                inflight[1] -= 1
+                if not inflight[1]:
+                    del self._inflight[key]
+
+    def _fetch_cached(
+        self, url: str, key: str, params: Optional[Dict], fresh: bool
+    ) -> str:
+        entry = self.cache.get(key)
+        if entry and not fresh and self.cache.is_fresh(entry, url):
+            self.cache.record("hits")
+            return entry.text
+
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        response = self.get(url, params, headers)
+        if entry and response.status_code == 304:
+            self.cache.touch(key)
+            self.cache.record("revalidated")
+            return entry.text
+        response.raise_for_status()
+        self.cache.put(key, url, response.content, response.headers)
+        self.cache.record("misses")
+        return response.text
+
+    def get_json(
+        self, path_or_url: str, params: Optional[Dict] = None, fresh: bool = False
+    ) -> Dict:
+        return json.loads(self._fetch(path_or_url, params, fresh))
+
+    def get_text(self, url: str, fresh: bool = False) -> str:
+        return self._fetch(url, fresh=fresh)
+
+    def iter_pages(
+        self, path: str, key: str, params: Optional[Dict] = None, page_size: int = 250
+    ) -> Iterator[Dict]:
+        """Yield every item under `key`, following `pagination.next` to the end"""
+        params = {**(params or {}), "limit": page_size, "offset": 0}
+        while True:
+            data = self.get_json(path, params)
+            items = data.get(key) or []
+            yield from items
+            next_url = (data.get("pagination") or {}).get("next")
+            if not items or not next_url:
+                return
+            next_offset = parse_qs(urlparse(next_url).query).get("offset")
+            params["offset"] = (
+                int(next_offset[0]) if next_offset else params["offset"] + len(items)
+            )
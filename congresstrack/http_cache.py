@@ -0,0 +1,168 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlencode, urlparse
+
+# Seconds a cached response is served without contacting the server, by endpoint type.
+# Listings change as laws are enacted; enrolled bill text never changes once published.
+DEFAULT_TTLS = {
+    "listing": 6 * 3600,
+    "bill": 24 * 3600,
+    "actions": 24 * 3600,
+    "text_versions": 24 * 3600,
+    "member": 7 * 24 * 3600,
+    "document": 365 * 24 * 3600,
+    "default": 24 * 3600,
+}
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS bodies (
+        sha256 TEXT PRIMARY KEY,
+        body BLOB NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        sha256 TEXT NOT NULL REFERENCES bodies(sha256),
+        content_type TEXT,
+        etag TEXT,
+        last_modified TEXT,
+        fetched_at REAL NOT NULL
+    )""",
+]
+
+
+def endpoint_type(url: str) -> str:
+    """Classify a Congress.gov URL for TTL purposes"""
+    path = urlparse(url).path
+    if "/v3/" not in path:
+        return "document"
+    parts = [p for p in path.split("/v3/", 1)[1].split("/") if p]
+    if not parts:
+        return "default"
+    if parts[0] == "member":
+        return "member"
+    if parts[-1] == "actions":
+        return "actions"
+    if parts[-1] == "text":
+        return "text_versions"
+    if parts[0] == "law" or len(parts) <= 3 and parts[0] == "bill":
+        return "listing"
+    if parts[0] == "bill":
+        return "bill"
+    return "default"
+
+
+def cache_key(url: str, params: Optional[Dict] = None) -> str:
+    query = sorted(
+        (k, str(v)) for k, v in (params or {}).items() if k.lower() != "api_key"
+    )
+    return hashlib.sha256(f"{url}?{urlencode(query)}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class HTTPCache:
+    """SQLite-backed, content-addressed response cache.
+
+    Responses are indexed by a hash of URL + parameters (API key excluded) and
+    point at bodies stored once per SHA-256 of their content, so identical
+    payloads reached through different URLs share storage. Entries keep their
+    ETag/Last-Modified validators for conditional revalidation once stale, or
+    earlier when a caller asks for a fresh copy (CongressClient.get_json(fresh=True)).
+    """
+
+    def __init__(
+        self, path: str = ".cache/http_cache.sqlite", ttls: Optional[Dict] = None
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for stmt in SCHEMA:
+            self._conn.execute(stmt)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def ttl(self, url: str) -> float:
+        return self.ttls.get(endpoint_type(url), self.ttls["default"])
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT b.body, r.content_type, r.etag, r.last_modified, r.fetched_at
+                   FROM responses r JOIN bodies b ON b.sha256 = r.sha256
+                   WHERE r.key = ?""",
+                (key,),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def is_fresh(self, entry: CachedResponse, url: str) -> bool:
+        return time.time() - entry.fetched_at < self.ttl(url)
+
+    def put(self, key: str, url: str, body: bytes, headers) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO bodies(sha256, body) VALUES (?, ?)",
+                (digest, body),
+            )
+            self._conn.execute(
+                """REPLACE INTO responses
+                   (key, url, sha256, content_type, etag, last_modified, fetched_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    key,
+                    url,
+                    digest,
+                    headers.get("Content-Type"),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def hit_rate(self) -> float:
+        """Share of lookups answered without downloading a body (fresh hits + 304s)"""
+        total = sum(self.stats.values())
+        return (
+            (self.stats["hits"] + self.stats["revalidated"]) / total if total else 0.0
+        )
+
+    def report(self) -> Dict:
+        total = sum(self.stats.values())
+        return {
+            **self.stats,
+            "lookups": total,
+            "hit_rate": round(self.hit_rate(), 3),
+            "network_requests": self.stats["revalidated"] + self.stats["misses"],
+        }
@@ -0,0 +1,237 @@
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+# Columns read by list views; bill text and actions live in law_texts and are
+# only read for the law being displayed.
+METADATA_COLUMNS = [
+    "file",
+    "title",
+    "sponsor_name",
+    "sponsor_website",
+    "sponsor_state",
+    "sponsor_bioguide_id",
+    "party",
+    "congress",
+    "number",
+    "origin_chamber",
+    "update_date",
+    "alignment_score",
+]
+# Analysis results, stored as JSON text next to the metadata
+ANALYSIS_COLUMNS = [
+    "campaign_objectives",
+    "supporting_objectives",
+    "conflicting_objectives",
+    "analysis",
+    "detailed_assessment",
+    "law_citations",
+]
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS laws (
+        file TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        title TEXT,
+        sponsor_name TEXT,
+        sponsor_website TEXT,
+        sponsor_state TEXT,
+        sponsor_bioguide_id TEXT,
+        party TEXT,
+        congress INTEGER,
+        number INTEGER,
+        origin_chamber TEXT,
+        update_date TEXT,
+        alignment_score REAL,
+        campaign_objectives TEXT,
+        supporting_objectives TEXT,
+        conflicting_objectives TEXT,
+        analysis TEXT,
+        detailed_assessment TEXT,
+        law_citations TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS law_texts (
+        file TEXT PRIMARY KEY REFERENCES laws(file) ON DELETE CASCADE,
+        text TEXT,
+        actions TEXT
+    )""",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+_JSON_COLUMNS = {
+    "campaign_objectives",
+    "supporting_objectives",
+    "conflicting_objectives",
+    "law_citations",
+}
+
+
+def _row_from_json(data: Dict) -> Dict:
+    sponsor = data.get("sponsor") or {}
+    return {
+        "title": data.get("title", ""),
+        "sponsor_name": sponsor.get("name", ""),
+        "sponsor_website": sponsor.get("websiteUrl"),
+        "sponsor_state": sponsor.get("state", ""),
+        "sponsor_bioguide_id": sponsor.get("bioguideId", ""),
+        "party": sponsor.get("party", ""),
+        "congress": data.get("congress", 0),
+        "number": data.get("number", ""),
+        "origin_chamber": data.get("originChamberCode", ""),
+        "update_date": data.get("updateDate"),
+        "alignment_score": data.get("alignment_score"),
+        "campaign_objectives": json.dumps(data.get("campaign_objectives")),
+        "supporting_objectives": json.dumps(data.get("supporting_objectives") or []),
+        "conflicting_objectives": json.dumps(data.get("conflicting_objectives") or []),
+        "analysis": data.get("analysis", ""),
+        "detailed_assessment": data.get("detailed_assessment", ""),
+        "law_citations": json.dumps(data.get("law_citations") or []),
+    }
+
+
+class LawStore:
+    """SQLite mirror of the data/*.json law files.
+
+    `sync()` only re-reads files whose size or mtime changed since the last
+    sync and drops rows for deleted files, so calling it on every page load
+    costs one directory scan. Metadata and analysis results are columns of
+    `laws`; the bulky bill text and actions are in `law_texts`.
+    """
+
+    def __init__(self, data_dir: str = "data", path: str = ".cache/laws.sqlite"):
+        self.data_dir = Path(data_dir)
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            for stmt in SCHEMA:
+                conn.execute(stmt)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def sync(self) -> Dict:
+        """Bring the store in line with the JSON files; returns what changed"""
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "errors": []}
+        on_disk = {}
+        if self.data_dir.exists():
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        st = entry.stat()
+                        on_disk[entry.name] = (st.st_mtime_ns, st.st_size)
+
+        conn = self._connect()
+        try:
+            known = {
+                file: (mtime_ns, size)
+                for file, mtime_ns, size in conn.execute(
+                    "SELECT file, mtime_ns, size FROM laws"
+                )
+            }
+            removed = [file for file in known if file not in on_disk]
+            conn.executemany("DELETE FROM laws WHERE file = ?", [(f,) for f in removed])
+            stats["removed"] = len(removed)
+
+            for file, signature in on_disk.items():
+                if known.get(file) == signature:
+                    stats["unchanged"] += 1
+                    continue
+                try:
+                    with open(self.data_dir / file, encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    stats["errors"].append((file, str(e)))
+                    continue
+                row = _row_from_json(data)
+                columns = ["file", "mtime_ns", "size", *row]
+                conn.execute(
+                    f"REPLACE INTO laws ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    (file, *signature, *row.values()),
+                )
+                conn.execute(
+                    "REPLACE INTO law_texts (file, text, actions) VALUES (?, ?, ?)",
+                    (file, data.get("text", ""), json.dumps(data.get("actions") or [])),
+                )
+                stats["updated" if file in known else "added"] += 1
+
+            if stats["added"] or stats["updated"] or stats["removed"]:
+                conn.execute(
+                    """INSERT INTO meta (key, value) VALUES ('version', '1')
+                       ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"""
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        return stats
+
+    def version(self) -> int:
+        """Counter bumped by every sync that changed something; use as a cache key"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0]) if row else 0
+
+    def rows(self, columns: Sequence[str] = METADATA_COLUMNS) -> List[Dict]:
+        """Selected `laws` columns for every law (JSON columns decoded)"""
+        allowed = set(METADATA_COLUMNS) | set(ANALYSIS_COLUMNS)
+        unknown = [c for c in columns if c not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown law columns: {unknown}")
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"SELECT {', '.join(columns)} FROM laws ORDER BY file"
+            )
+            return [self._decode(dict(zip(columns, values))) for values in cursor]
+        finally:
+            conn.close()
+
+    def iter_laws(self) -> Iterator[Dict]:
+        """Every column of every law including text and actions"""
+        columns = METADATA_COLUMNS + ANALYSIS_COLUMNS
+        conn = self._connect()
+        try:
+            for values in conn.execute(
+                f"""SELECT {', '.join('l.' + c for c in columns)}, t.text, t.actions
+                    FROM laws l LEFT JOIN law_texts t ON t.file = l.file
+                    ORDER BY l.file"""
+            ):
+                row = self._decode(dict(zip(columns, values)))
+                row["text"] = values[-2] or ""
+                row["actions"] = json.loads(values[-1] or "[]")
+                yield row
+        finally:
+            conn.close()
+
+    def text(self, file: str) -> Dict:
+        """Bill text and actions of one law"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT text, actions FROM law_texts WHERE file = ?", (file,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return {"text": "", "actions": []}
+        return {"text": row[0] or "", "actions": json.loads(row[1] or "[]")}
+
+    @staticmethod
+    def _decode(row: Dict) -> Dict:
+        for column in _JSON_COLUMNS.intersection(row):
+            row[column] = json.loads(row[column]) if row[column] else None
+        return row
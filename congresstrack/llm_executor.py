@@ -0,0 +1,329 @@
+import hashlib
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+OPENAI_MODEL = "gpt-3.5-turbo"
+ANTHROPIC_MODEL = "claude-3-haiku-20240307"
+
+
+class TokenBudget:
+    """Tokens-per-minute bucket shared by all requests of one executor.
+
+    Requests reserve an estimate up front and settle the difference once the
+    provider reports actual usage, so the budget may briefly go negative.
+    """
+
+    def __init__(self, tokens_per_minute: Optional[int]):
+        self.capacity = tokens_per_minute or 0
+        self.rate = self.capacity / 60.0
+        self._available = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._available = min(
+            self.capacity, self._available + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, tokens: int) -> None:
+        if not self.capacity:
+            return
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._available >= tokens:
+                    self._available -= tokens
+                    return
+                wait = (tokens - self._available) / self.rate
+            time.sleep(min(wait, 5.0))
+
+    def settle(self, reserved: int, used: int) -> None:
+        if not self.capacity:
+            return
+        with self._lock:
+            self._available -= used - min(reserved, self.capacity)
+
+
+class ResponseCache:
+    """LLM responses by prompt hash (provider, model and generation settings included)"""
+
+    def __init__(self, path: str = ".cache/llm_responses.sqlite"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                prompt_hash TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )""")
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts) -> str:
+        return hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    def get(self, prompt_hash: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE prompt_hash = ?", (prompt_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, prompt_hash: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "REPLACE INTO responses VALUES (?, ?, ?)",
+                (prompt_hash, response, time.time()),
+            )
+            self._conn.commit()
+
+
+class LLMExecutor:
+    """Process-wide gateway for LLM completions.
+
+    Keeps one OpenAI/Anthropic client for the life of the process, caps the
+    number of requests in flight, paces them against a tokens-per-minute
+    budget, retries rate-limit and transient server errors with exponential
+    backoff and answers repeated prompts from a ResponseCache. OpenAI is used
+    when its key is set, as in LLMAnalyzer; OPENAI_BASE_URL/ANTHROPIC_BASE_URL
+    point the clients at compatible servers.
+    """
+
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        anthropic_api_key: Optional[str] = None,
+        openai_base_url: Optional[str] = None,
+        anthropic_base_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 5,
+        backoff_s: float = 1.0,
+        timeout: float = 60.0,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.openai_base_url = openai_base_url or os.getenv("OPENAI_BASE_URL")
+        self.anthropic_base_url = anthropic_base_url or os.getenv("ANTHROPIC_BASE_URL")
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.timeout = timeout
+        self.cache = cache
+        self.budget = TokenBudget(tokens_per_minute)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="llm"
+        )
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "retries": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        }
+        self._started = time.monotonic()
+
+    @property
+    def provider(self) -> Optional[str]:
+        if self.openai_api_key:
+            return "openai"
+        if self.anthropic_api_key:
+            return "anthropic"
+        return None
+
+    @property
+    def available(self) -> bool:
+        return self.provider is not None
+
+    def _get_client(self):
+        with self._client_lock:
+            if self._client is None:
+                # The SDKs' own retries are disabled: backoff is handled here so
+                # that retries also respect the concurrency cap and token budget
+                if self.provider == "openai":
+                    import openai
+
+                    self._client = openai.OpenAI(
+                        api_key=self.openai_api_key,
+                        base_url=self.openai_base_url,
+                        max_retries=0,
+                        timeout=self.timeout,
+                    )
+                elif self.provider == "anthropic":
+                    import anthropic
+
+                    self._client = anthropic.Anthropic(
+                        api_key=self.anthropic_api_key,
+                        base_url=self.anthropic_base_url,
+                        max_retries=0,
+                        timeout=self.timeout,
+                    )
+                else:
+                    raise RuntimeError("Set OPENAI_API_KEY or ANTHROPIC_API_KEY")
+            return self._client
+
+    def _count(self, **deltas) -> None:
+        with self._stats_lock:
+            for key, value in deltas.items():
+                self.stats[key] += value
+
+    def _request(self, prompt: str, max_tokens: int, temperature: float):
+        """One API call; returns (text, prompt_tokens, completion_tokens)"""
+        client = self._get_client()
+        messages = [{"role": "user", "content": prompt}]
+        if self.provider == "openai":
+            response = client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            usage = response.usage
+            return (
+                response.choices[0].message.content,
+                getattr(usage, "prompt_tokens", 0) or 0,
+                getattr(usage, "completion_tokens", 0) or 0,
+            )
+        response = client.messages.create(
+            model=ANTHROPIC_MODEL,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=messages,
+        )
+        usage = response.usage
+        return (
+            response.content[0].text,
+            getattr(usage, "input_tokens", 0) or 0,
+            getattr(usage, "output_tokens", 0) or 0,
+        )
+
+    @staticmethod
+    def _retry_after(error) -> Optional[float]:
+        response = getattr(error, "response", None)
+        value = response.headers.get("retry-after") if response is not None else None
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _is_retryable(error) -> bool:
+        status = getattr(error, "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+        # Connection errors and timeouts carry no status code
+        return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 800,
+        temperature: float = 0.3,
+        usage: Optional[Dict] = None,
+    ) -> str:
+        """Completion text for `prompt`; blocks while the concurrency cap is reached.
+
+        If `usage` is given it receives this call's prompt_tokens,
+        completion_tokens and whether it was a cache hit.
+        """
+        if usage is not None:
+            usage.update(prompt_tokens=0, completion_tokens=0, cached=False)
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.key(
+                self.provider, self._model(), max_tokens, temperature, prompt
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._count(cache_hits=1)
+                if usage is not None:
+                    usage["cached"] = True
+                return cached
+
+        estimate = len(prompt) // 4 + max_tokens
+        for attempt in range(self.max_retries + 1):
+            self.budget.reserve(estimate)
+            try:
+                with self._slots:
+                    self._count(requests=1)
+                    text, prompt_tokens, completion_tokens = self._request(
+                        prompt, max_tokens, temperature
+                    )
+            except Exception as e:
+                self.budget.settle(estimate, 0)
+                if attempt == self.max_retries or not self._is_retryable(e):
+                    raise
+                self._count(retries=1)
+                delay = self._retry_after(e)
+                if delay is None:
+                    delay = self.backoff_s * 2**attempt * (0.5 + random.random())
+                time.sleep(delay)
+                continue
+            self.budget.settle(estimate, prompt_tokens + completion_tokens)
+            self._count(
+                prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+            )
+            if usage is not None:
+                usage.update(
+                    prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+                )
+            if key is not None:
+                self.cache.put(key, text)
+            return text
+
+    def _model(self) -> Optional[str]:
+        return {"openai": OPENAI_MODEL, "anthropic": ANTHROPIC_MODEL}.get(self.provider)
+
+    def submit(self, prompt: str, **kwargs) -> Future:
+        return self._pool.submit(self.complete, prompt, **kwargs)
+
+    def map(self, prompts: Iterable[str], **kwargs) -> List[str]:
+        """Completions for `prompts`, in order, run concurrently up to the cap"""
+        return [f.result() for f in [self.submit(p, **kwargs) for p in prompts]]
+
+    def usage(self) -> Dict:
+        """Request counts and token totals, with tokens/minute since creation"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        minutes = max((time.monotonic() - self._started) / 60, 1e-9)
+        stats["tokens_per_minute"] = round(
+            (stats["prompt_tokens"] + stats["completion_tokens"]) / minutes
+        )
+        return stats
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+_default: Optional[LLMExecutor] = None
+_default_lock = threading.Lock()
+
+
+def get_executor() -> LLMExecutor:
+    """Executor shared by the whole process, configured from the environment"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            tpm = os.getenv("LLM_TOKENS_PER_MINUTE")
+            _default = LLMExecutor(
+                max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+                tokens_per_minute=int(tpm) if tpm else None,
+                cache=ResponseCache(
+                    os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite")
+                ),
+            )
+        return _default
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+SCHEMA = """CREATE TABLE IF NOT EXISTS objectives (
+    sponsor_key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    website_url TEXT,
+    objectives TEXT NOT NULL,
+    computed_at REAL NOT NULL
+)"""
+
+
+def content_hash(text: str) -> str:
+    """Hash of scraped website text, whitespace-normalized so reflowed pages still match"""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+class ObjectivesCache:
+    """Persistent campaign objectives per sponsor (bioguideId), SQLite-backed.
+
+    An entry younger than `ttl_days` is used as is. An older one is only reused
+    if the sponsor's website still hashes to the same content; otherwise the
+    objectives are extracted again.
+    """
+
+    def __init__(self, path: str = ".cache/objectives.sqlite", ttl_days: float = 30):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_days * 24 * 3600
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, sponsor_key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT content_hash, website_url, objectives, computed_at
+                   FROM objectives WHERE sponsor_key = ?""",
+                (sponsor_key,),
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "content_hash": row[0],
+            "website_url": row[1],
+            "objectives": json.loads(row[2]),
+            "computed_at": row[3],
+        }
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry["computed_at"] < self.ttl
+
+    def put(
+        self,
+        sponsor_key: str,
+        digest: str,
+        website_url: Optional[str],
+        objectives: Dict,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "REPLACE INTO objectives VALUES (?, ?, ?, ?, ?)",
+                (sponsor_key, digest, website_url, json.dumps(objectives), time.time()),
+            )
+            self._conn.commit()
+
+    def touch(self, sponsor_key: str) -> None:
+        """Restart the expiry of an entry whose website content is unchanged"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE objectives SET computed_at = ? WHERE sponsor_key = ?",
+                (time.time(), sponsor_key),
+            )
+            self._conn.commit()
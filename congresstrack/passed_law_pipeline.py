@@ -1,16 +1,36 @@
-import requests
+"""
+Passed-law pipeline: fetches every law of a Congress from Congress.gov, scores it
+against the sponsor's campaign objectives and writes data/{chamber}.{congress}.{number}.json
+
+    python passed_law_pipeline.py --congress 119 --workers 4
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Dict, Tuple
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 import os
 import json
 import re
+import threading
+import time
 from dotenv import load_dotenv
 
-api_key = "0iVKSDmfcvLekS1QjsJRqpUaztocZ2eSFJD5gi29"
-params = {"api_key": api_key, "format": "json", "limit": 50}
-url = "https://api.congress.gov/v3/law/119"
+from bill_chunks import Chunk, select_chunks, split_sections
+from congress_client import CongressClient
+from http_cache import HTTPCache
+from llm_executor import LLMExecutor, get_executor
+from objectives_cache import ObjectivesCache, content_hash
+from pipeline_state import PipelineState, objectives_version, text_version
+from site_scraper import SiteScraper
+
+# Website text sent with the objectives prompt. Scrapers are built with the same
+# budget: the homepage text comes last and would otherwise be cut off.
+OBJECTIVES_PROMPT_CHARS = 3000
 
 
 @dataclass
@@ -38,6 +58,8 @@ class Law:
     originChamberCode: str
     congress: int
     number: int
+    updateDate: Optional[str] = None
+    textUrl: Optional[str] = None
     # Analysis results
     campaign_objectives: Optional[CampaignObjectives] = None
     alignment_score: Optional[float] = None
@@ -46,6 +68,8 @@ class Law:
     analysis: Optional[str] = None
     detailed_assessment: Optional[str] = None
     law_citations: Optional[List[str]] = None
+    # Sections scored, tokens and latency of the comparison
+    comparison_metrics: Optional[Dict] = None
 
     def __post_init__(self):
         if self.supporting_objectives is None:
@@ -64,13 +88,9 @@ class Law:
 class CampaignScraper:
     """Scrapes campaign websites and social media for objectives"""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-        )
+    def __init__(self, sites: Optional[SiteScraper] = None):
+        # Shared, thread-safe: pooled connections, per-site caps, robots.txt, page cache
+        self.sites = sites or SiteScraper(max_chars=OBJECTIVES_PROMPT_CHARS)
 
     def search_campaign_website(
         self, sponsor_name: str, sponsor_state: str
@@ -122,45 +142,24 @@ class CampaignScraper:
             return None
 
     def scrape_website(self, url: str) -> Optional[str]:
-        """Scrape content from a campaign website"""
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # Get text content
-            text = soup.get_text()
-
-            # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = " ".join(chunk for chunk in chunks if chunk)
-
-            return text[:5000]  # Limit to first 5000 characters
-
-        except Exception as e:
-            print(f"Failed to scrape {url}: {e}")
-            return None
+        """Text of a campaign website: its issues/priorities pages, then the homepage"""
+        return self.sites.scrape(url)
 
 
 class LLMAnalyzer:
     """Uses LLM to analyze and compare laws against campaign objectives"""
 
-    def __init__(self):
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
+    def __init__(self, executor: Optional[LLMExecutor] = None):
+        # Shared executor: one API client per process, bounded concurrency,
+        # rate-limit retries and a response cache (see llm_executor.py)
+        self.executor = executor or get_executor()
 
     def analyze_campaign_objectives(
         self, text: str, sponsor_name: str, website_url: Optional[str] = None
     ) -> CampaignObjectives:
         """Use LLM to extract campaign objectives from text"""
 
-        if not self.openai_api_key and not self.anthropic_api_key:
+        if not self.executor.available:
             print("No LLM API key found. Skipping analysis.")
             return CampaignObjectives(
                 sponsor_name=sponsor_name,
@@ -173,7 +172,7 @@ class LLMAnalyzer:
         prompt = f"""
         Analyze the following campaign website/social media content for {sponsor_name} and extract their main campaign objectives and policy priorities.
         
-        Content: {text[:3000]}
+        Content: {text[:OBJECTIVES_PROMPT_CHARS]}
         
         Please provide:
         1. A list of 3-5 main campaign objectives
@@ -189,31 +188,7 @@ class LLMAnalyzer:
         """
 
         try:
-            if self.openai_api_key:
-                import openai
-
-                client = openai.OpenAI(api_key=self.openai_api_key)
-
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.3,
-                )
-
-                result = response.choices[0].message.content
-
-            elif self.anthropic_api_key:
-                import anthropic
-
-                client = anthropic.Anthropic(api_key=self.anthropic_api_key)
-
-                response = client.messages.create(
-                    model="claude-3-haiku-20240307",
-                    max_tokens=500,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-                result = response.content[0].text
+            result = self.executor.complete(prompt, max_tokens=500)
 
             # Parse JSON response
             json_match = re.search(r"\{.*\}", result, re.DOTALL)
@@ -256,24 +231,25 @@ class LLMAnalyzer:
                 source_url=website_url,
             )
 
-    def compare_law_to_objectives(
-        self, law: Law, objectives: CampaignObjectives
-    ) -> Dict:
-        """Compare a law against campaign objectives"""
-
-        if not self.openai_api_key and not self.anthropic_api_key:
-            return {
-                "alignment_score": 0.0,
-                "analysis": "No API key available for analysis",
-                "supporting_objectives": [],
-                "conflicting_objectives": [],
-            }
-
-        prompt = f"""
+    # Bill text is scored section by section: at most `max_chunks` chunks of
+    # `chunk_chars`, picked by BM25 relevance to the objectives (bill_chunks.py)
+    chunk_chars = 2000
+    max_chunks = 6
+
+    def _compare_prompt(
+        self, law: Law, objectives: CampaignObjectives, chunk: Chunk, n_chunks: int
+    ) -> str:
+        scope = (
+            f"Law Section: {chunk.heading} (one of {n_chunks} sections selected as most relevant to these objectives; judge this section only)"
+            if n_chunks > 1
+            else ""
+        )
+        return f"""
         Compare the following law against the campaign objectives of {objectives.sponsor_name}.
         
         Law Title: {law.title}
-        Law Text: {law.text[:2000]}
+        {scope}
+        Law Text: {chunk.text}
         
         Campaign Objectives: {objectives.objectives}
         
@@ -293,152 +269,351 @@ class LLMAnalyzer:
         }}
         """
 
-        try:
-            if self.openai_api_key:
-                import openai
-
-                client = openai.OpenAI(api_key=self.openai_api_key)
+    @staticmethod
+    def _parse_comparison(result: str) -> Dict:
+        json_match = re.search(r"\{.*\}", result, re.DOTALL)
+        if json_match:
+            return json.loads(json_match.group())
+        return {
+            "alignment_score": 50,
+            "analysis": "Could not parse LLM response",
+            "supporting_objectives": [],
+            "conflicting_objectives": [],
+            "detailed_assessment": result,
+        }
 
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=800,
-                    temperature=0.3,
-                )
-
-                result = response.choices[0].message.content
+    def compare_law_to_objectives(
+        self, law: Law, objectives: CampaignObjectives
+    ) -> Dict:
+        """Compare a law against campaign objectives.
 
-            elif self.anthropic_api_key:
-                import anthropic
+        Map: each selected section is scored on its own (concurrently through the
+        executor). Reduce: the score is the relevance-weighted mean, objectives
+        and citations are merged. "metrics" reports the cost and latency.
+        """
 
-                client = anthropic.Anthropic(api_key=self.anthropic_api_key)
+        if not self.executor.available:
+            return {
+                "alignment_score": 0.0,
+                "analysis": "No API key available for analysis",
+                "supporting_objectives": [],
+                "conflicting_objectives": [],
+            }
 
-                response = client.messages.create(
-                    model="claude-3-haiku-20240307",
-                    max_tokens=800,
-                    messages=[{"role": "user", "content": prompt}],
+        started = time.perf_counter()
+        chunks = split_sections(law.text or "", self.chunk_chars) or [
+            Chunk(0, "Preamble", "")
+        ]
+        if len(chunks) == 1:
+            selected = [(chunks[0], 0.0, [])]
+        else:
+            selected = select_chunks(
+                chunks, objectives.objectives, max_chunks=self.max_chunks
+            )
+        prompts = [
+            self._compare_prompt(law, objectives, chunk, len(selected))
+            for chunk, _, _ in selected
+        ]
+        usages = [{} for _ in prompts]
+        futures = [
+            self.executor.submit(prompt, max_tokens=800, usage=usage)
+            for prompt, usage in zip(prompts, usages)
+        ]
+
+        parts, errors = [], []
+        for (chunk, relevance, _), future in zip(selected, futures):
+            try:
+                parts.append(
+                    (chunk, relevance, self._parse_comparison(future.result()))
                 )
-
-                result = response.content[0].text
-
-            # Parse JSON response
-            json_match = re.search(r"\{.*\}", result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {
-                    "alignment_score": 50,
-                    "analysis": "Could not parse LLM response",
-                    "supporting_objectives": [],
-                    "conflicting_objectives": [],
-                    "detailed_assessment": result,
-                }
-
-        except Exception as e:
-            print(f"Comparison analysis failed: {e}")
+            except Exception as e:
+                errors.append(f"{chunk.heading}: {e}")
+
+        metrics = {
+            "sections": len(chunks),
+            "sections_scored": len(parts),
+            "text_chars": len(law.text or ""),
+            "prompt_chars": sum(len(p) for p in prompts),
+            "llm_calls": sum(1 for u in usages if u and not u["cached"]),
+            "cache_hits": sum(1 for u in usages if u.get("cached")),
+            "prompt_tokens": sum(u.get("prompt_tokens", 0) for u in usages),
+            "completion_tokens": sum(u.get("completion_tokens", 0) for u in usages),
+            "latency_s": round(time.perf_counter() - started, 2),
+        }
+        if not parts:
+            print(f"Comparison analysis failed: {errors}")
             return {
                 "alignment_score": 0,
-                "analysis": f"Analysis failed: {e}",
+                "analysis": f"Analysis failed: {'; '.join(errors)}",
                 "supporting_objectives": [],
                 "conflicting_objectives": [],
                 "detailed_assessment": "Error occurred during analysis",
+                "metrics": metrics,
             }
+        if len(parts) == 1:
+            return {**parts[0][2], "metrics": metrics}
+
+        def merged(field):
+            values = []
+            for _, _, part in parts:
+                for value in part.get(field) or []:
+                    if value not in values:
+                        values.append(value)
+            return values
+
+        weights = [1.0 + relevance for _, relevance, _ in parts]
+        scores = [float(part.get("alignment_score") or 0) for _, _, part in parts]
+        return {
+            "alignment_score": round(
+                sum(w * s for w, s in zip(weights, scores)) / sum(weights), 1
+            ),
+            "analysis": " ".join(
+                f"[{chunk.heading}] {part.get('analysis', '')}"
+                for chunk, _, part in parts
+            ),
+            "supporting_objectives": merged("supporting_objectives"),
+            "conflicting_objectives": merged("conflicting_objectives"),
+            "detailed_assessment": "\n\n".join(
+                f"{chunk.heading}: {part.get('detailed_assessment', '')}"
+                for chunk, _, part in parts
+            ),
+            "law_citations": [chunk.heading for chunk, _, _ in parts]
+            + merged("law_citations"),
+            "metrics": metrics,
+        }
+
+
+def law_path(data_dir: Path, chamber: str, congress, number) -> Path:
+    return Path(data_dir) / f"{chamber}.{congress}.{number}.json"
+
+
+def _parse_date(value: str) -> datetime:
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def is_up_to_date(path: Path, update_date: Optional[str]) -> bool:
+    """True when the law's JSON exists and is at least as new as the API's updateDate"""
+    if not path.exists():
+        return False
+    if not update_date:
+        return True
+    try:
+        with open(path, encoding="utf-8") as f:
+            stored = json.load(f).get("updateDate")
+    except (OSError, ValueError):
+        return False
+    if stored:
+        return _parse_date(stored) >= _parse_date(update_date)
+    # Files written before updateDate was recorded: fall back to the file time
+    mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    return mtime >= _parse_date(update_date)
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write via a temp file so an interrupted run never leaves a truncated law file"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+ANALYSIS_FIELDS = (
+    "campaign_objectives",
+    "alignment_score",
+    "supporting_objectives",
+    "conflicting_objectives",
+    "analysis",
+    "detailed_assessment",
+    "law_citations",
+    "comparison_metrics",
+)
+
+
+def load_law(path: Path) -> Optional[Law]:
+    """Law previously written to `path`, or None if missing or unreadable"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("campaign_objectives"):
+            data["campaign_objectives"] = CampaignObjectives(
+                **data["campaign_objectives"]
+            )
+        return Law(**data)
+    except (OSError, ValueError, TypeError):
+        return None
 
 
-# Load environment variables
-load_dotenv()
+def latest_text_url(
+    client: CongressClient, bill: Dict, fresh: bool = False
+) -> Optional[str]:
+    """URL of the formatted text of the latest text version, if one is published"""
+    versions = client.get_json(bill.get("textVersions").get("url"), fresh=fresh).get(
+        "textVersions"
+    )
+    if not versions:
+        return None
+    formats = versions[0].get("formats") or []
+    text = next((item for item in formats if item["type"] == "Formatted Text"), None)
+    return text.get("url") if text else None
 
-# Initialize components
-scraper = CampaignScraper()
-analyzer = LLMAnalyzer()
 
-# Get all laws
-bills = requests.get(url, params=params).json().get("bills")
-print(f"Processing {len(bills)} bills...")
+def download_text(client: CongressClient, url: Optional[str]) -> str:
+    if not url:
+        return ""
+    soup = BeautifulSoup(client.get_text(url), "html.parser")
+    pre = soup.find("pre")
+    return (pre or soup).get_text().strip()
 
-# Get a bill
-for bill_0 in tqdm(bills):
-    bill = requests.get(bill_0.get("url"), params=params).json().get("bill")
-    title = bill.get("title")
-    sponsors = bill.get("sponsors")[0]
-    originChamberCode = bill.get("originChamberCode")
 
-    # Get member info
-    member = requests.get(sponsors.get("url"), params=params).json().get("member")
-    party = member.get("partyHistory")[0].get("partyName")
-    officialWebsiteUrl = member.get("officialWebsiteUrl")
-    # Get most recent term first
-    terms = member.get("terms")
-    terms.reverse()
+def fetch_bill_text(client: CongressClient, bill: Dict) -> str:
+    """Plain text of the latest text version, or "" when none is published yet"""
+    return download_text(client, latest_text_url(client, bill))
 
-    state = member.get("state")
-    name = member.get("directOrderName")
-    bioguideId = member.get("bioguideId")
 
-    sponsor = {
-        "name": name,
-        "websiteUrl": officialWebsiteUrl,
+def fetch_sponsor(client: CongressClient, sponsor_url: str) -> Dict:
+    member = client.get_json(sponsor_url).get("member")
+    # Get most recent term first
+    terms = list(reversed(member.get("terms") or []))
+    return {
+        "name": member.get("directOrderName"),
+        "websiteUrl": member.get("officialWebsiteUrl"),
         "terms": terms,
-        "state": state,
-        "bioguideId": bioguideId,
-        "party": party,
+        "state": member.get("state"),
+        "bioguideId": member.get("bioguideId"),
+        "party": (member.get("partyHistory") or [{}])[0].get("partyName"),
     }
 
-    number = bill.get("number")
-    congress = bill.get("congress")
 
-    # Get Bill actions
+def fetch_law(
+    client: CongressClient,
+    listing: Dict,
+    previous: Optional[Law] = None,
+    fresh: bool = False,
+) -> Law:
+    """Bill, sponsor, actions and text for one entry of the /law listing.
+
+    The text is only downloaded when the latest text version differs from the
+    one `previous` was built from. fresh=True revalidates the bill, actions
+    and text versions with Congress.gov instead of trusting cached copies:
+    when the listing reports a change, those are what changed.
+    """
+    bill = client.get_json(listing.get("url"), fresh=fresh).get("bill")
+    sponsor = fetch_sponsor(client, bill.get("sponsors")[0].get("url"))
     actions = (
-        requests.get(bill.get("actions").get("url"), params=params)
-        .json()
-        .get("actions")
+        client.get_json(bill.get("actions").get("url"), fresh=fresh).get("actions")
+        or []
     )
     actions.reverse()
+    text_url = latest_text_url(client, bill, fresh)
+    if previous is not None and previous.textUrl and previous.textUrl == text_url:
+        text = previous.text
+    else:
+        text = download_text(client, text_url)
+    return Law(
+        bill.get("title"),
+        sponsor,
+        actions,
+        text,
+        bill.get("originChamberCode"),
+        bill.get("congress"),
+        bill.get("number"),
+        updateDate=listing.get("updateDate") or bill.get("updateDate"),
+        textUrl=text_url,
+    )
 
-    # Get Bill Text
-    text = requests.get(bill.get("textVersions").get("url"), params=params).json()
-    formats = text.get("textVersions")[0].get("formats")
-    text = next((item for item in formats if item["type"] == "Formatted Text"), None)
-    bill_text_raw = requests.get(text.get("url"))
-    soup = BeautifulSoup(bill_text_raw.text, "html.parser")
-    text = soup.find("pre").get_text().strip()
-
-    # Create law object
-    law = Law(title, sponsor, actions, text, originChamberCode, congress, number)
-
-    # Perform campaign objectives analysis
-    print(f"  Analyzing campaign objectives for {name}...")
-
-    # Get website URL - either from data or search for it
-    website_url = officialWebsiteUrl
-
-    if not website_url:
-        print("    No website found in law data. Searching for campaign website...")
-        website_url = scraper.search_campaign_website(name, state)
 
+class SponsorObjectives:
+    """Campaign objectives resolved once per sponsor and shared by all of their laws.
+
+    The website search, scrape and LLM extraction run at most once per sponsor
+    per run (concurrent workers asking for the same sponsor wait for the first
+    one). With an ObjectivesCache, results also carry over between runs.
+    """
+
+    def __init__(
+        self,
+        scraper: CampaignScraper,
+        analyzer: LLMAnalyzer,
+        cache: Optional[ObjectivesCache] = None,
+    ):
+        self.scraper = scraper
+        self.analyzer = analyzer
+        self.cache = cache
+        self._memo: Dict[str, CampaignObjectives] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats = {"extracted": 0, "cached": 0, "unchanged_website": 0, "reused": 0}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def get(self, sponsor: Dict) -> CampaignObjectives:
+        """`sponsor` as stored on a law: name, state, websiteUrl, bioguideId"""
+        key = (
+            sponsor.get("bioguideId") or f"{sponsor.get('name')}|{sponsor.get('state')}"
+        )
+        with self._lock:
+            sponsor_lock = self._locks.setdefault(key, threading.Lock())
+        with sponsor_lock:
+            if key in self._memo:
+                self._count("reused")
+            else:
+                self._memo[key] = self._resolve(key, sponsor)
+            return self._memo[key]
+
+    def _resolve(self, key: str, sponsor: Dict) -> CampaignObjectives:
+        name, state = sponsor.get("name"), sponsor.get("state")
+        stored = self.cache.get(key) if self.cache else None
+        if stored and self.cache.is_fresh(stored):
+            self._count("cached")
+            return CampaignObjectives(**stored["objectives"])
+
+        # Get website URL - either from data or search for it
+        website_url = sponsor.get("websiteUrl") or (stored or {}).get("website_url")
+        if not website_url:
+            website_url = self.scraper.search_campaign_website(name, state)
+
+        # Scrape website if available
+        website_content = ""
         if website_url:
-            print(f"    Found campaign website: {website_url}")
-        else:
-            print("    Could not find campaign website")
+            website_content = self.scraper.scrape_website(website_url)
 
-    # Scrape website if available
-    website_content = ""
-    if website_url:
-        website_content = scraper.scrape_website(website_url)
+        if not website_content:
+            return CampaignObjectives(
+                sponsor_name=name,
+                objectives=["No website content available"],
+                source="manual",
+                confidence_score=0.0,
+                source_url=website_url,
+            )
+
+        digest = content_hash(website_content)
+        if stored and stored["content_hash"] == digest:
+            self.cache.touch(key)
+            self._count("unchanged_website")
+            return CampaignObjectives(**stored["objectives"])
 
-    # Analyze objectives
-    if website_content:
-        objectives = analyzer.analyze_campaign_objectives(
+        objectives = self.analyzer.analyze_campaign_objectives(
             website_content, name, website_url
         )
-    else:
-        objectives = CampaignObjectives(
-            sponsor_name=name,
-            objectives=["No website content available"],
-            source="manual",
-            confidence_score=0.0,
-            source_url=website_url,
-        )
+        self._count("extracted")
+        # Placeholders (no API key, failed call) are retried on the next run
+        if self.cache and objectives.source.startswith("llm"):
+            self.cache.put(key, digest, website_url, asdict(objectives))
+        return objectives
+
+
+def analyze_law(
+    law: Law,
+    sponsors: SponsorObjectives,
+    analyzer: LLMAnalyzer,
+    objectives: Optional[CampaignObjectives] = None,
+) -> Law:
+    """Attach the sponsor's campaign objectives and the alignment comparison to `law`"""
+    if objectives is None:
+        objectives = sponsors.get(law.sponsor)
 
     # Compare law to objectives
     comparison = analyzer.compare_law_to_objectives(law, objectives)
@@ -451,13 +626,244 @@ for bill_0 in tqdm(bills):
     law.analysis = comparison.get("analysis", "")
     law.detailed_assessment = comparison.get("detailed_assessment", "")
     law.law_citations = comparison.get("law_citations", [])
+    law.comparison_metrics = comparison.get("metrics")
+    return law
+
+
+class LawPipeline:
+    """Fetches and analyzes every law of a Congress on a thread pool.
+
+    Congress.gov calls from all workers share the client's rate limiter. Runs
+    are incremental: a PipelineState file records each law's updateDate and
+    the text/objectives its alignment was computed from. A law is re-fetched
+    only when the listing reports a newer updateDate (its text only when the
+    text version changed), and compare_law_to_objectives is re-run only when
+    the text or the sponsor's objectives changed. Law files are written
+    atomically, so an interrupted run resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        client: Optional[CongressClient] = None,
+        data_dir: str = "data",
+        max_workers: int = 4,
+        scraper: Optional[CampaignScraper] = None,
+        analyzer: Optional[LLMAnalyzer] = None,
+        objectives_cache: Optional[ObjectivesCache] = None,
+        state: Optional[PipelineState] = None,
+    ):
+        self.client = client or CongressClient()
+        self.data_dir = Path(data_dir)
+        self.max_workers = max_workers
+        self.scraper = scraper or CampaignScraper()
+        self.analyzer = analyzer or LLMAnalyzer()
+        self.sponsors = SponsorObjectives(self.scraper, self.analyzer, objectives_cache)
+        self.state = state or PipelineState()
+
+    def list_laws(self, congress: int) -> List[Dict]:
+        return list(self.client.iter_pages(f"law/{congress}", "bills"))
+
+    def _path(self, listing: Dict) -> Path:
+        return law_path(
+            self.data_dir,
+            listing.get("originChamberCode"),
+            listing.get("congress"),
+            listing.get("number"),
+        )
 
-    print(f"    Alignment score: {law.alignment_score}")
+    def needs_fetch(self, listing: Dict) -> bool:
+        """True when the API reports a change since the law was last fetched"""
+        path = self._path(listing)
+        known = self.state.law(path.stem).get("updateDate")
+        if known and path.exists():
+            return bool(listing.get("updateDate")) and listing["updateDate"] != known
+        # Not in the state file yet: fall back to the law file itself
+        return not is_up_to_date(path, listing.get("updateDate"))
+
+    def process(
+        self, listing: Dict, fetch: bool = True, force: bool = False
+    ) -> Tuple[Law, Dict]:
+        """Bring one law up to date; returns it with the steps that had to run"""
+        path = self._path(listing)
+        previous = load_law(path)
+        steps = {"fetched": False, "text_downloaded": False, "compared": False}
+
+        if fetch or previous is None:
+            reuse = None if force else previous
+            # A listing change recorded against cached bill data would never be seen again
+            law = fetch_law(self.client, listing, reuse, fresh=fetch)
+            steps["fetched"] = True
+            steps["text_downloaded"] = reuse is None or law.textUrl != reuse.textUrl
+        else:
+            law = previous
+
+        objectives = self.sponsors.get(law.sponsor)
+        versions = {
+            "text_version": text_version(law.text),
+            "objectives_version": objectives_version(objectives),
+        }
+        self.state.update_sponsor(
+            law.sponsor.get("bioguideId"), versions["objectives_version"]
+        )
 
-    # Small delay to avoid rate limiting
-    import time
+        known = self.state.law(path.stem)
+        unchanged = (
+            not force
+            and previous is not None
+            and previous.alignment_score is not None
+            and versions["text_version"]
+            == known.get("text_version", text_version(previous.text))
+            and versions["objectives_version"]
+            == known.get(
+                "objectives_version",
+                objectives_version(previous.campaign_objectives),
+            )
+        )
+        if unchanged:
+            if law is not previous:
+                for field in ANALYSIS_FIELDS:
+                    setattr(law, field, getattr(previous, field))
+        else:
+            analyze_law(law, self.sponsors, self.analyzer, objectives)
+            steps["compared"] = True
 
-    time.sleep(1)
+        if steps["fetched"] or steps["compared"]:
+            write_atomic(path, law.to_json())
+        self.state.update_law(
+            path.stem, updateDate=law.updateDate, textUrl=law.textUrl, **versions
+        )
+        return law, steps
+
+    def run(
+        self, congress: int, limit: Optional[int] = None, force: bool = False
+    ) -> Dict:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        listings = self.list_laws(congress)
+        changed, unchanged = [], []
+        for item in listings:
+            (changed if force or self.needs_fetch(item) else unchanged).append(item)
+        if limit:
+            changed = changed[:limit]
+        print(
+            f"{len(listings)} laws listed, {len(changed)} changed on Congress.gov, "
+            f"checking {len(unchanged)} unchanged laws against current objectives..."
+        )
 
-    with open(f"data/{originChamberCode}.{congress}.{number}.json", "w") as f:
-        f.write(law.to_json())
+        counts = {"fetched": 0, "text_downloaded": 0, "compared": 0}
+        failed = []
+        work = [(item, True) for item in changed] + [
+            (item, False) for item in unchanged
+        ]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    pool.submit(self.process, item, fetch, force): item
+                    for item, fetch in work
+                }
+                for future in tqdm(as_completed(futures), total=len(futures)):
+                    item = futures[future]
+                    try:
+                        law, steps = future.result()
+                    except Exception as e:
+                        failed.append(f"{item.get('type')}{item.get('number')}")
+                        tqdm.write(f"  Failed {item.get('url')}: {e}")
+                        continue
+                    for step, ran in steps.items():
+                        counts[step] += ran
+                    if steps["compared"]:
+                        metrics = law.comparison_metrics or {}
+                        tqdm.write(
+                            f"  {law.originChamberCode}.{law.congress}.{law.number}: alignment {law.alignment_score}"
+                            f" ({metrics.get('sections_scored', 0)}/{metrics.get('sections', 0)} sections,"
+                            f" {metrics.get('prompt_tokens', 0) + metrics.get('completion_tokens', 0)} tokens,"
+                            f" {metrics.get('latency_s', 0)}s)"
+                        )
+        finally:
+            self.state.save()
+
+        summary = {
+            "listed": len(listings),
+            "refetched": counts["fetched"],
+            "text_downloads": counts["text_downloaded"],
+            "recompared": counts["compared"],
+            "failed": failed,
+            "api_requests": self.client.requests_made,
+            "sponsor_objectives": dict(self.sponsors.stats),
+        }
+        executor = getattr(self.analyzer, "executor", None)
+        if executor is not None:
+            summary["llm"] = executor.usage()
+        if self.client.cache is not None:
+            summary["http_cache"] = self.client.cache.report()
+        sites = getattr(self.scraper, "sites", None)
+        if sites is not None:
+            summary["campaign_sites"] = dict(sites.stats)
+        print(json.dumps(summary, indent=2))
+        return summary
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--congress", type=int, default=119)
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--limit", type=int, help="fetch at most this many changed laws"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-fetch and re-compare every law, ignoring the state file",
+    )
+    parser.add_argument(
+        "--state",
+        default=".cache/pipeline_state.json",
+        help="incremental state: updateDate and input versions per law",
+    )
+    parser.add_argument(
+        "--cache", default=".cache/http_cache.sqlite", help="HTTP cache database"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="always fetch from Congress.gov"
+    )
+    parser.add_argument(
+        "--site-cache",
+        default=".cache/site_cache.sqlite",
+        help="campaign website pages, revalidated after a day",
+    )
+    parser.add_argument(
+        "--objectives-cache",
+        default=".cache/objectives.sqlite",
+        help="campaign objectives per sponsor, reused across runs",
+    )
+    parser.add_argument(
+        "--objectives-ttl-days",
+        type=float,
+        default=30,
+        help="re-check sponsor websites after this many days",
+    )
+    args = parser.parse_args()
+    cache = None if args.no_cache else HTTPCache(args.cache)
+    objectives_cache = (
+        None
+        if args.no_cache
+        else ObjectivesCache(args.objectives_cache, args.objectives_ttl_days)
+    )
+    site_cache = None if args.no_cache else HTTPCache(args.site_cache)
+    LawPipeline(
+        client=CongressClient(cache=cache),
+        scraper=CampaignScraper(
+            SiteScraper(cache=site_cache, max_chars=OBJECTIVES_PROMPT_CHARS)
+        ),
+        objectives_cache=objectives_cache,
+        state=PipelineState(args.state),
+        data_dir=args.data_dir,
+        max_workers=args.workers,
+    ).run(args.congress, limit=args.limit, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
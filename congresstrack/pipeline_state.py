@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def text_version(text: Optional[str]) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def objectives_version(objectives) -> str:
+    """Hash of what the alignment comparison sees: the sponsor and their objectives"""
+    if objectives is None:
+        return ""
+    if not isinstance(objectives, dict):
+        objectives = {
+            "sponsor_name": objectives.sponsor_name,
+            "objectives": objectives.objectives,
+        }
+    payload = json.dumps(
+        [objectives.get("sponsor_name"), objectives.get("objectives") or []]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PipelineState:
+    """JSON state file remembering what each law and sponsor was last processed from.
+
+    Per law (keyed like the data file, e.g. "S.119.201"): the API updateDate,
+    the text version URL and hashes of the text and objectives the alignment
+    was computed from. Per sponsor (bioguideId): the current objectives hash.
+    """
+
+    def __init__(self, path: str = ".cache/pipeline_state.json"):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.laws: Dict[str, Dict] = {}
+        self.sponsors: Dict[str, Dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self.laws = data.get("laws", {})
+                self.sponsors = data.get("sponsors", {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable state file {self.path}: {e}")
+
+    def law(self, key: str) -> Dict:
+        with self._lock:
+            return dict(self.laws.get(key) or {})
+
+    def update_law(self, key: str, **fields) -> None:
+        with self._lock:
+            self.laws.setdefault(key, {}).update(fields)
+
+    def update_sponsor(self, bioguide_id: str, version: str) -> None:
+        if not bioguide_id:
+            return
+        with self._lock:
+            entry = self.sponsors.setdefault(bioguide_id, {})
+            if entry.get("objectives_version") != version:
+                entry["objectives_version"] = version
+                entry["changed_at"] = datetime.now(timezone.utc).isoformat()
+
+    def save(self) -> None:
+        with self._lock:
+            content = json.dumps(
+                {"laws": self.laws, "sponsors": self.sponsors}, indent=1, sort_keys=True
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, self.path)
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import pandas as pd
+
+
+class JSONLSink:
+    """Append-only JSON Lines file of per-law results that doubles as the checkpoint.
+
+    Each record is flushed and fsynced as soon as it is written, so a crash
+    loses at most the law in flight. On open, a partially written last line
+    is dropped and the keys already in the file are loaded so a rerun can
+    skip them. `restart=True` discards previous results.
+    """
+
+    def __init__(self, path: str, key: str = "law_key", restart: bool = False):
+        self.path = Path(path)
+        self.key = key
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if restart and self.path.exists():
+            self.path.unlink()
+        self.done: Set[str] = self._recover()
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _recover(self) -> Set[str]:
+        if not self.path.exists():
+            return set()
+        done, good_bytes = set(), 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                done.add(str(record.get(self.key)))
+                good_bytes += len(line)
+        if good_bytes < self.path.stat().st_size:
+            print(f"Dropping a partially written record at the end of {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(good_bytes)
+        return done
+
+    def __contains__(self, key: str) -> bool:
+        return str(key) in self.done
+
+    def write(self, record: Dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.done.add(str(record.get(self.key)))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "JSONLSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Every record in the sink; the last one wins when a key was written twice"""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return pd.DataFrame()
+        df = pd.read_json(self.path, lines=True, dtype={self.key: str})
+        return df.drop_duplicates(self.key, keep="last").reset_index(drop=True)
+
+
+def export_parquet(df: pd.DataFrame, path: str) -> Optional[str]:
+    """Write df as Parquet when pyarrow or fastparquet is installed"""
+    try:
+        df.to_parquet(path, index=False)
+    except ImportError:
+        print("pyarrow/fastparquet not installed. Skipping Parquet export.")
+        return None
+    return path
@@ -0,0 +1,310 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib import robotparser
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import lxml.html
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+
+from http_cache import HTTPCache, cache_key
+
+USER_AGENT = "CongressTrack/0.1 (+https://github.com/LibraryOfCongress/Congressional-Hackathon-2025)"
+# Pages on a campaign/member site that usually state the platform, most telling first
+ISSUE_KEYWORDS = (
+    "issues",
+    "priorities",
+    "platform",
+    "agenda",
+    "policy",
+    "policies",
+    "where-i-stand",
+    "legislation",
+)
+DROP_TAGS = ("script", "style", "noscript", "template", "svg", "nav", "footer")
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def domain(url: str) -> str:
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+def extract(body: bytes, base_url: str) -> Tuple[str, List[str]]:
+    """Visible text of an HTML page and the same-site links that look like issues pages"""
+    try:
+        doc = lxml.html.document_fromstring(body, base_url=base_url)
+    except (etree.ParserError, ValueError):
+        return "", []
+
+    links, seen = [], set()
+    for anchor in doc.iterfind(".//a[@href]"):
+        href = urldefrag(urljoin(base_url, anchor.get("href", "")))[0]
+        if (
+            href in seen
+            or href.rstrip("/") == base_url.rstrip("/")
+            or urlparse(href).scheme not in ("http", "https")
+            or domain(href) != domain(base_url)
+        ):
+            continue
+        label = (urlparse(href).path + " " + anchor.text_content()).lower()
+        rank = next((i for i, k in enumerate(ISSUE_KEYWORDS) if k in label), None)
+        if rank is not None:
+            seen.add(href)
+            links.append((rank, len(links), href))
+
+    etree.strip_elements(doc, *DROP_TAGS, etree.Comment, with_tail=False)
+    text = WHITESPACE_RE.sub(" ", " ".join(doc.itertext())).strip()
+    return text, [href for _, _, href in sorted(links)]
+
+
+class ByteBudget:
+    """Bytes left to download, drawn down block by block by concurrent requests"""
+
+    def __init__(self, limit: int):
+        self.left = limit
+        self._lock = threading.Lock()
+
+    def take(self, n: int) -> int:
+        with self._lock:
+            granted = max(0, min(n, self.left))
+            self.left -= granted
+            return granted
+
+
+def share(texts: Sequence[str], max_chars: int) -> List[str]:
+    """Trim texts to max_chars in total, so one long page cannot crowd out the rest"""
+    limits, left = {}, max_chars
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    for n, i in enumerate(order):
+        limits[i] = min(len(texts[i]), left // (len(texts) - n))
+        left -= limits[i]
+    return [text[: limits[i]] for i, text in enumerate(texts)]
+
+
+class SiteScraper:
+    """Concurrent campaign-website scraper.
+
+    One pooled session is shared by every worker; requests to the same site
+    are capped at `per_domain` at a time and spaced by its robots.txt
+    Crawl-delay, and pages robots.txt disallows are skipped. 429s and server
+    errors are retried with backoff. With an HTTPCache, pages newer than
+    `max_age_s` are served from it and older ones are revalidated with a
+    conditional GET. Besides the homepage, up to `max_pages - 1` issues /
+    priorities pages linked from it are scraped, and no more than `max_bytes`
+    are downloaded per sponsor.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HTTPCache] = None,
+        max_workers: int = 16,
+        per_domain: int = 2,
+        max_pages: int = 4,
+        max_bytes: int = 1_000_000,
+        max_chars: int = 8000,
+        max_age_s: float = 24 * 3600,
+        timeout: float = 10,
+        max_retries: int = 3,
+        backoff_s: float = 1.0,
+    ):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.per_domain = per_domain
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.max_age_s = max_age_s
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._domain_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_request: Dict[str, float] = {}
+        self._robots: Dict[str, Optional[robotparser.RobotFileParser]] = {}
+        self._robots_locks: Dict[str, threading.Lock] = {}
+        self.stats = {
+            "pages": 0,
+            "bytes": 0,
+            "cache_hits": 0,
+            "revalidated": 0,
+            "robots_blocked": 0,
+            "retries": 0,
+            "truncated": 0,
+            "errors": 0,
+        }
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += n
+
+    def _slot(self, site: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if site not in self._domain_slots:
+                self._domain_slots[site] = threading.BoundedSemaphore(self.per_domain)
+            return self._domain_slots[site]
+
+    def _wait_turn(self, site: str, delay: float) -> None:
+        """Space requests to one site by its Crawl-delay"""
+        if not delay:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request.get(site, now))
+            self._next_request[site] = start + delay
+        time.sleep(max(0.0, start - now))
+
+    def _request(
+        self,
+        url: str,
+        headers: Optional[Dict] = None,
+        budget: Optional[ByteBudget] = None,
+    ) -> Tuple[requests.Response, bytes, bool]:
+        """GET with retries; returns the response, its body and whether the budget cut it"""
+        for attempt in range(self.max_retries + 1):
+            wait = self.backoff_s * 2**attempt
+            try:
+                response = self.session.get(
+                    url, headers=headers, timeout=self.timeout, stream=True
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == self.max_retries
+                ):
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    wait = min(float(retry_after), 60)
+                response.close()
+            self._count("retries")
+            time.sleep(wait)
+
+        body, truncated = bytearray(), False
+        with response:
+            for block in response.iter_content(64 * 1024):
+                granted = budget.take(len(block)) if budget else len(block)
+                body += block[:granted]
+                if granted < len(block):
+                    truncated = True
+                    break
+        self._count("bytes", len(body))
+        return response, bytes(body), truncated
+
+    def _robots_for(self, url: str) -> Optional[robotparser.RobotFileParser]:
+        """Parsed robots.txt of the URL's origin, fetched once; None allows everything"""
+        parts = urlparse(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            if origin in self._robots:
+                return self._robots[origin]
+            origin_lock = self._robots_locks.setdefault(origin, threading.Lock())
+        with origin_lock:
+            if origin in self._robots:
+                return self._robots[origin]
+            parser = robotparser.RobotFileParser(origin + "/robots.txt")
+            try:
+                response, body, _ = self._request(
+                    parser.url, budget=ByteBudget(512 * 1024)
+                )
+                if response.status_code in (401, 403):
+                    parser.disallow_all = True
+                elif response.ok:
+                    parser.parse(body.decode("utf-8", errors="replace").splitlines())
+                else:
+                    parser = None
+            except requests.RequestException:
+                parser = None
+            with self._lock:
+                self._robots[origin] = parser
+            return parser
+
+    def fetch(self, url: str, budget: Optional[ByteBudget] = None) -> Optional[bytes]:
+        """One page's body, honouring robots.txt, the per-site cap and the cache"""
+        robots = self._robots_for(url)
+        if robots is not None and not robots.can_fetch(USER_AGENT, url):
+            self._count("robots_blocked")
+            return None
+        delay = (robots.crawl_delay(USER_AGENT) if robots is not None else None) or 0
+
+        key = cache_key(url)
+        entry = self.cache.get(key) if self.cache else None
+        if entry and time.time() - entry.fetched_at < self.max_age_s:
+            self._count("cache_hits")
+            return entry.body
+
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        site = domain(url)
+        with self._slot(site):
+            self._wait_turn(site, float(delay))
+            response, body, truncated = self._request(url, headers, budget)
+        if entry and response.status_code == 304:
+            self.cache.touch(key)
+            self._count("revalidated")
+            return entry.body
+        response.raise_for_status()
+        self._count("pages")
+        if truncated:
+            self._count("truncated")
+        # A cut-off page is not what the server sent, so it is not cached
+        elif self.cache:
+            self.cache.put(key, url, body, response.headers)
+        return body
+
+    def _fetch_page(self, url: str, budget: ByteBudget) -> Optional[bytes]:
+        if budget.left <= 0:
+            return None
+        try:
+            return self.fetch(url, budget)
+        except requests.RequestException as e:
+            self._count("errors")
+            print(f"Failed to scrape {url}: {e}")
+            return None
+
+    def scrape(self, url: str) -> Optional[str]:
+        """Text of a site's homepage plus its issues pages (issues first), or None"""
+        budget = ByteBudget(self.max_bytes)
+        body = self._fetch_page(url, budget)
+        if body is None:
+            return None
+        home_text, links = extract(body, url)
+
+        texts = []
+        links = links[: self.max_pages - 1]
+        if links:
+            with ThreadPoolExecutor(max_workers=self.per_domain) as pool:
+                for link, page in zip(
+                    links, pool.map(lambda u: self._fetch_page(u, budget), links)
+                ):
+                    if page is not None:
+                        texts.append(extract(page, link)[0])
+        texts.append(home_text)
+        # max_chars includes the joining spaces: cutting at it keeps the homepage
+        texts = share(texts, self.max_chars - len(texts) + 1)
+        return " ".join(t for t in texts if t) or None
+
+    def scrape_many(self, urls: Sequence[str]) -> Dict[str, Optional[str]]:
+        """Scrape several sites concurrently; per-site caps still apply"""
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(urls, pool.map(self.scrape, urls)))
@@ -0,0 +1,110 @@
+import json
+from collections import Counter
+
+import pandas as pd
+
+import app
+
+
+def _write_law(data_dir, number, sponsor):
+    data_dir.mkdir(parents=True, exist_ok=True)
+    law = {
+        "title": f"Act {number}",
+        "sponsor": {"name": sponsor, "state": "Ohio", "bioguideId": sponsor[:1]},
+        "originChamberCode": "H",
+        "congress": 119,
+        "number": number,
+    }
+    (data_dir / f"H.119.{number}.json").write_text(json.dumps(law), encoding="utf-8")
+
+
+def test_law_index_is_cached_per_store(tmp_path, monkeypatch):
+    # The same relative data_dir and store path in two checkouts: equal versions, different laws
+    for checkout, sponsor in (("a", "Ann Example"), ("b", "Bo Example")):
+        _write_law(tmp_path / checkout / "data", 1, sponsor)
+    sponsors = []
+    for checkout in ("a", "b"):
+        monkeypatch.chdir(tmp_path / checkout)
+        sponsors.append([law.sponsor_name for law in app.load_law_index("data")])
+    assert sponsors == [["Ann Example"], ["Bo Example"]]
+
+
+def _baseline_sponsor_dataframe(laws):
+    """SponsorAnalyzer.get_sponsor_dataframe before it moved to groupby"""
+    counts = Counter(law.sponsor_name for law in laws)
+    rows = [
+        {
+            "sponsor_name": law.sponsor_name,
+            "sponsor_state": law.sponsor_state,
+            "sponsor_bioguide_id": law.sponsor_bioguide_id,
+            "origin_chamber": law.origin_chamber,
+            "law_count": counts[law.sponsor_name],
+            "congress": law.congress,
+            "party": law.party,
+        }
+        for law in laws
+    ]
+    df = pd.DataFrame(rows).drop_duplicates(subset=["sponsor_name"])
+    return df.sort_values("law_count", ascending=False)
+
+
+def _records(df):
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    return sorted(records, key=lambda r: (-r["law_count"], str(r["sponsor_name"])))
+
+
+def _totals(df, column):
+    return {
+        value: count for value, count in df.groupby(column)["law_count"].sum().items()
+    }
+
+
+def test_rollups_match_the_per_sponsor_loops(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    laws = [
+        ("H", {"name": "Ann Example", "state": None, "party": "Democratic"}),
+        ("H", {"name": "Ann Example", "state": "Ohio", "party": "Democratic"}),
+        ("S", {"name": "Bo Example", "state": "Texas", "party": "Republican"}),
+        ("H", {"name": None, "state": "Iowa", "party": None}),
+        ("S", {"name": None, "state": "Utah", "party": "Republican"}),
+        ("S", {"name": "Cy Example", "state": "Texas", "party": "Republican"}),
+        ("S", {"name": "Bo Example", "state": "Texas", "party": "Republican"}),
+    ]
+    for number, (chamber, sponsor) in enumerate(laws, start=1):
+        law = {
+            "title": f"Act {number}",
+            "sponsor": {**sponsor, "bioguideId": f"X{number}"},
+            "originChamberCode": chamber,
+            "congress": 119,
+            "number": number,
+        }
+        path = data_dir / f"{chamber}.119.{number}.json"
+        path.write_text(json.dumps(law), encoding="utf-8")
+
+    loader = app.LawDataLoader(str(data_dir), str(tmp_path / "laws.sqlite"))
+    rollups = app.sponsor_rollups(loader.store_path, loader.sync())
+    law_data = loader.load_all_laws(include_text=False, sync=False)
+    assert rollups["total_laws"] == len(law_data) == 7
+
+    baseline = _baseline_sponsor_dataframe(law_data)
+    # The laws without a sponsor name are one sponsor with two laws, as before
+    assert baseline["law_count"].sum() == 7
+    for name, chamber in (("All", None), ("House", "H"), ("Senate", "S")):
+        expected = baseline
+        if chamber:
+            expected = expected[expected["origin_chamber"] == chamber]
+        selected = rollups["filters"][name]
+        leaderboard = selected["leaderboard"]
+        assert list(leaderboard["rank"]) == list(range(1, len(expected) + 1))
+        assert list(leaderboard["law_count"]) == sorted(
+            expected["law_count"], reverse=True
+        )
+        assert _records(leaderboard.drop(columns="rank")) == _records(expected)
+        for key, column in (
+            ("by_chamber", "origin_chamber"),
+            ("by_state", "sponsor_state"),
+        ):
+            assert _totals(selected[key], column) == _totals(expected, column)
+
+    assert sum(app.SponsorAnalyzer(law_data).get_sponsor_counts().values()) == 7
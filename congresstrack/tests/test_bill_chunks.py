@@ -0,0 +1,76 @@
+from bill_chunks import BM25Index, select_chunks, split_sections
+
+BILL = """
+Public Law 119-99
+119th Congress
+
+An Act
+To improve services for veterans and rural hospitals.
+
+SECTION 1. SHORT TITLE.
+
+    This Act may be cited as the ``Omnibus Services Act''.
+
+SEC. 2. VETERAN HOUSING GRANTS.
+
+    The Secretary of Veterans Affairs shall award grants for housing
+of homeless veterans.
+
+SEC. 3. RURAL HOSPITAL FUNDING.
+
+    Amounts are authorized for critical access hospitals in rural areas.
+
+SEC. 4. HIGHWAY REPORTING.
+
+{highway}
+"""
+
+
+def _bill():
+    highway = "\n\n".join(
+        f"    (paragraph {i}) The Secretary of Transportation shall report on highway "
+        "bridge conditions each fiscal year."
+        for i in range(60)
+    )
+    return BILL.format(highway=highway)
+
+
+def test_sections_follow_sec_markers_and_long_sections_are_split():
+    chunks = split_sections(_bill(), max_chars=1000)
+    headings = [c.heading for c in chunks]
+    assert headings[:5] == [
+        "Preamble",
+        "SECTION 1. SHORT TITLE.",
+        "SEC. 2. VETERAN HOUSING GRANTS.",
+        "SEC. 3. RURAL HOSPITAL FUNDING.",
+        "SEC. 4. HIGHWAY REPORTING.",
+    ]
+    assert headings[5].startswith("SEC. 4. HIGHWAY REPORTING. (cont.")
+    assert all(len(c.text) <= 1000 for c in chunks)
+    assert "".join(c.text for c in chunks).count("paragraph") == 60
+
+
+def test_objectives_retrieve_their_sections_in_document_order():
+    chunks = split_sections(_bill(), max_chars=1000)
+    selected = select_chunks(
+        chunks, ["Housing for homeless veterans", "Rural hospital access"], max_chunks=3
+    )
+    by_heading = {c.heading: objs for c, _, objs in selected}
+    assert by_heading["SEC. 2. VETERAN HOUSING GRANTS."] == [
+        "Housing for homeless veterans"
+    ]
+    assert by_heading["SEC. 3. RURAL HOSPITAL FUNDING."] == ["Rural hospital access"]
+    assert not any(h.startswith("SEC. 4.") for h in by_heading)
+    assert [c.index for c, _, _ in selected] == sorted(c.index for c, _, _ in selected)
+
+
+def test_unmatched_objectives_fall_back_to_opening_sections():
+    chunks = split_sections(_bill(), max_chars=1000)
+    selected = select_chunks(chunks, ["cryptocurrency"])
+    assert [c.index for c, _, _ in selected] == [0, 1]
+
+
+def test_bm25_prefers_rarer_terms():
+    index = BM25Index(["grant grant housing", "grant highway", "grant bridge"])
+    assert index.search("housing grant", k=1)[0][0] == 0
+    assert index.search("zebra") == []
@@ -0,0 +1,158 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+import congress_client
+from congress_client import CongressClient, RateLimiter
+from http_cache import HTTPCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class FakeCongress(BaseHTTPRequestHandler):
+    """Paginated /law listing plus endpoints that fail a set number of times"""
+
+    hits = []
+    failures = {}  # path -> statuses to answer with before succeeding
+    laws = 5
+    lock = threading.Lock()
+
+    def log_message(self, *args): ...
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        with self.lock:
+            FakeCongress.hits.append(self.path)
+            pending = self.failures.get(url.path) or []
+            status = pending.pop(0) if pending else None
+        if status:
+            return self._send(status, {"error": "try again"}, ("Retry-After", "0"))
+        if url.path == "/v3/law/119":
+            query = parse_qs(url.query)
+            offset, limit = int(query["offset"][0]), int(query["limit"][0])
+            bills = [
+                {"number": str(n)}
+                for n in range(offset, min(offset + limit, self.laws))
+            ]
+            body = {"bills": bills, "pagination": {"count": self.laws}}
+            if offset + limit < self.laws:
+                next_query = f"offset={offset + limit}&limit={limit}"
+                body["pagination"]["next"] = f"{url.path}?{next_query}"
+            return self._send(200, body)
+        self._send(200, {"path": url.path})
+
+    def _send(self, status, body, header=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if header:
+            self.send_header(*header)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server():
+    FakeCongress.hits, FakeCongress.failures, FakeCongress.laws = [], {}, 5
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), FakeCongress)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}/v3"
+    srv.shutdown()
+
+
+def test_rate_limiter_spaces_calls(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(congress_client, "time", clock)
+    limiter = RateLimiter(2.0)
+    for _ in range(3):
+        limiter.wait()
+    assert clock.sleeps == [0.5, 0.5]
+
+    # An idle period does not bank extra calls
+    clock.now += 10
+    limiter.wait()
+    limiter.wait()
+    assert clock.sleeps == [0.5, 0.5, 0.5]
+    assert RateLimiter(0).interval == 0.0
+
+
+def test_each_host_has_its_own_limiter(server):
+    client = CongressClient(
+        api_key="test-key", base_url=server, rate_per_s=1.0, other_hosts_rate_per_s=4.0
+    )
+    api = client._limiter(urlparse(server).netloc)
+    assert api is client._limiter(urlparse(server).netloc)
+    assert api.interval == 1.0
+    assert client._limiter("www.congress.gov").interval == 0.25
+
+
+def test_iter_pages_follows_next_until_the_end(server):
+    client = CongressClient(api_key="test-key", base_url=server, rate_per_s=1000)
+    numbers = [
+        bill["number"] for bill in client.iter_pages("law/119", "bills", page_size=2)
+    ]
+    assert numbers == ["0", "1", "2", "3", "4"]
+    assert len(FakeCongress.hits) == 3
+
+    # A page without items ends the walk even if the server claims more
+    FakeCongress.hits, FakeCongress.laws = [], 0
+    assert list(client.iter_pages("law/119", "bills")) == []
+    assert len(FakeCongress.hits) == 1
+
+
+def _retrying_client(base, **kwargs):
+    client = CongressClient(
+        api_key="test-key", base_url=base, rate_per_s=1000, **kwargs
+    )
+    # Same retry policy without the seconds of exponential backoff
+    client.session.get_adapter(base).max_retries.backoff_factor = 0
+    return client
+
+
+def test_throttled_and_failed_requests_are_retried(server):
+    client = _retrying_client(server)
+    FakeCongress.failures = {"/v3/bill/119/hr/1": [429, 503]}
+    assert client.get_json("bill/119/hr/1") == {"path": "/v3/bill/119/hr/1"}
+    assert len(FakeCongress.hits) == 3
+
+    client = _retrying_client(server, max_retries=1)
+    FakeCongress.hits, FakeCongress.failures = [], {"/v3/bill/119/hr/2": [500, 500]}
+    with pytest.raises(requests.exceptions.RetryError):
+        client.get_json("bill/119/hr/2")
+    assert len(FakeCongress.hits) == 2
+
+
+def test_concurrent_identical_requests_share_a_fetch(server, tmp_path):
+    client = CongressClient(
+        api_key="test-key",
+        base_url=server,
+        rate_per_s=1000,
+        cache=HTTPCache(str(tmp_path / "http.sqlite")),
+    )
+    paths = ["member/A000001"] * 6 + ["member/B000002"] * 6
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        results = list(pool.map(client.get_json, paths))
+    assert results[0] == {"path": "/v3/member/A000001"}
+    assert sorted(FakeCongress.hits) == [
+        "/v3/member/A000001?format=json",
+        "/v3/member/B000002?format=json",
+    ]
+    # Per-URL locks are dropped once nobody is waiting on them
+    assert client._inflight == {}
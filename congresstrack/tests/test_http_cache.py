@@ -0,0 +1,183 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from congress_client import CongressClient
+from http_cache import HTTPCache, cache_key, endpoint_type
+
+
+class FakeCongress(BaseHTTPRequestHandler):
+    """Congress.gov stand-in answering conditional requests like the real API"""
+
+    hits = []
+    etag = '"v1"'
+    body = {"bill": {"title": "An Act"}}
+    delay = 0.0
+    lock = threading.Lock()
+
+    def log_message(self, *args): ...
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        with self.lock:
+            FakeCongress.hits.append((path, dict(self.headers)))
+        time.sleep(self.delay)
+        if path.startswith("/docs/"):
+            modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+            if self.headers.get("If-Modified-Since") == modified:
+                return self._send(304)
+            return self._send(
+                200,
+                b"<pre>Be it enacted</pre>",
+                "text/html",
+                ("Last-Modified", modified),
+            )
+        if self.headers.get("If-None-Match") == self.etag:
+            return self._send(304)
+        body = json.dumps(self.body).encode()
+        self._send(200, body, "application/json", ("ETag", self.etag))
+
+    def _send(self, status, body=b"", content_type=None, header=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if header:
+            self.send_header(*header)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    FakeCongress.hits, FakeCongress.etag, FakeCongress.delay = [], '"v1"', 0.0
+    FakeCongress.body = {"bill": {"title": "An Act"}}
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), FakeCongress)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}"
+    srv.shutdown()
+
+
+def _client(base, tmp_path, **ttls):
+    cache = HTTPCache(str(tmp_path / "http.sqlite"), ttls=ttls)
+    return CongressClient(
+        api_key="test-key", base_url=f"{base}/v3", rate_per_s=1000, cache=cache
+    )
+
+
+def test_endpoint_types():
+    base = "https://api.congress.gov/v3"
+    assert endpoint_type(f"{base}/law/119") == "listing"
+    assert endpoint_type(f"{base}/bill/119/hr") == "listing"
+    assert endpoint_type(f"{base}/bill/119/hr/1") == "bill"
+    assert endpoint_type(f"{base}/bill/119/hr/1/actions") == "actions"
+    assert endpoint_type(f"{base}/bill/119/hr/1/text") == "text_versions"
+    assert endpoint_type(f"{base}/member/A000001") == "member"
+    assert (
+        endpoint_type("https://www.congress.gov/119/bills/hr1/BILLS-119hr1enr.htm")
+        == "document"
+    )
+
+
+def test_cache_key_ignores_api_key_and_parameter_order():
+    url = "https://api.congress.gov/v3/law/119"
+    assert cache_key(url, {"limit": 250, "offset": 0, "api_key": "a"}) == cache_key(
+        url, {"offset": 0, "limit": 250, "api_key": "b"}
+    )
+    assert cache_key(url, {"offset": 0}) != cache_key(url, {"offset": 250})
+
+
+def test_identical_bodies_are_stored_once(server, tmp_path):
+    client = _client(server, tmp_path)
+    first = client.get_json("bill/119/hr/1")
+    assert client.get_json("bill/119/hr/2") == first
+    conn = client.cache._conn
+    assert conn.execute("SELECT count(*) FROM responses").fetchone()[0] == 2
+    assert conn.execute("SELECT count(*) FROM bodies").fetchone()[0] == 1
+
+
+def test_fresh_entries_skip_the_network(server, tmp_path):
+    client = _client(server, tmp_path)
+    client.get_json("bill/119/hr/1")
+    client.get_json("bill/119/hr/1")
+    assert len(FakeCongress.hits) == 1
+    assert FakeCongress.hits[0][1].get("X-API-Key") == "test-key"
+    assert client.cache.stats == {"hits": 1, "revalidated": 0, "misses": 1}
+
+
+def test_ttls_are_per_endpoint_type(server, tmp_path):
+    client = _client(server, tmp_path, listing=0)
+    for _ in range(2):
+        client.get_json("law/119")
+        client.get_json("bill/119/hr/1")
+    assert [path for path, _ in FakeCongress.hits] == [
+        "/v3/law/119",
+        "/v3/bill/119/hr/1",
+        "/v3/law/119",
+    ]
+
+
+def test_stale_entry_is_revalidated_with_etag(server, tmp_path):
+    client = _client(server, tmp_path, bill=0)
+    assert client.get_json("bill/119/hr/1")["bill"]["title"] == "An Act"
+    fetched_at = client.cache.get(cache_key(f"{server}/v3/bill/119/hr/1")).fetched_at
+    assert client.get_json("bill/119/hr/1")["bill"]["title"] == "An Act"
+    assert FakeCongress.hits[-1][1].get("If-None-Match") == '"v1"'
+    assert client.cache.stats["revalidated"] == 1
+    # The 304 refreshed the entry without replacing the body
+    entry = client.cache.get(cache_key(f"{server}/v3/bill/119/hr/1"))
+    assert entry.fetched_at > fetched_at and entry.etag == '"v1"'
+
+
+def test_changed_resource_replaces_the_entry(server, tmp_path):
+    client = _client(server, tmp_path, bill=0)
+    client.get_json("bill/119/hr/1")
+    FakeCongress.etag, FakeCongress.body = '"v2"', {"bill": {"title": "An Amended Act"}}
+    assert client.get_json("bill/119/hr/1")["bill"]["title"] == "An Amended Act"
+    assert client.cache.stats["misses"] == 2
+    assert client.cache.get(cache_key(f"{server}/v3/bill/119/hr/1")).etag == '"v2"'
+
+
+def test_fresh_requests_revalidate_within_the_ttl(server, tmp_path):
+    client = _client(server, tmp_path)
+    client.get_json("bill/119/hr/1")
+    # Unchanged: a conditional GET answered with 304, the body comes from the cache
+    assert client.get_json("bill/119/hr/1", fresh=True)["bill"]["title"] == "An Act"
+    assert FakeCongress.hits[-1][1].get("If-None-Match") == '"v1"'
+    assert client.cache.stats == {"hits": 0, "revalidated": 1, "misses": 1}
+
+    # Changed within the TTL: only a fresh request sees it
+    FakeCongress.etag, FakeCongress.body = '"v2"', {"bill": {"title": "An Amended Act"}}
+    assert client.get_json("bill/119/hr/1")["bill"]["title"] == "An Act"
+    assert (
+        client.get_json("bill/119/hr/1", fresh=True)["bill"]["title"]
+        == "An Amended Act"
+    )
+    assert client.get_json("bill/119/hr/1")["bill"]["title"] == "An Amended Act"
+    assert len(FakeCongress.hits) == 3
+
+
+def test_documents_are_revalidated_with_last_modified(server, tmp_path):
+    client = _client(server, tmp_path, document=0)
+    url = f"{server}/docs/BILLS-119hr1enr.htm"
+    assert client.get_text(url) == client.get_text(url) == "<pre>Be it enacted</pre>"
+    assert (
+        FakeCongress.hits[-1][1].get("If-Modified-Since")
+        == "Wed, 01 Jan 2025 00:00:00 GMT"
+    )
+    assert client.cache.stats["revalidated"] == 1 and client.cache.hit_rate() == 0.5
+
+
+def test_concurrent_requests_for_one_url_share_a_fetch(server, tmp_path):
+    FakeCongress.delay = 0.1
+    client = _client(server, tmp_path)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: client.get_json("member/A000001"), range(8)))
+    assert all(r == results[0] for r in results)
+    assert len(FakeCongress.hits) == 1
+    assert client.cache.stats == {"hits": 7, "revalidated": 0, "misses": 1}
+    assert client.cache.report()["network_requests"] == 1
@@ -0,0 +1,98 @@
+import json
+import os
+
+from law_store import LawStore
+
+
+def _law(number, sponsor="Ann Example", score=70, text="Be it enacted"):
+    return {
+        "title": f"Act {number}",
+        "sponsor": {"name": sponsor, "state": "Ohio", "bioguideId": "A000001"},
+        "actions": [{"text": "Became Public Law"}],
+        "text": text,
+        "originChamberCode": "H",
+        "congress": 119,
+        "number": number,
+        "updateDate": "2025-03-01T00:00:00Z",
+        "campaign_objectives": {"objectives": ["jobs"]},
+        "alignment_score": score,
+        "law_citations": ["Sec. 2"],
+    }
+
+
+def _write(data_dir, name, law, mtime=None):
+    path = data_dir / name
+    path.write_text(json.dumps(law), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_initial_sync(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _write(data_dir, "H.119.1.json", _law(1))
+    _write(data_dir, "H.119.2.json", _law(2, sponsor="Bo Example"))
+    (data_dir / "H.119.3.json").write_text("{", encoding="utf-8")
+    (data_dir / "notes.txt").write_text("not a law", encoding="utf-8")
+
+    store = LawStore(str(data_dir), str(tmp_path / "laws.sqlite"))
+    assert store.version() == 0
+    stats = store.sync()
+    assert (stats["added"], stats["updated"], stats["removed"]) == (2, 0, 0)
+    assert [file for file, _ in stats["errors"]] == ["H.119.3.json"]
+    assert store.version() == 1
+
+    rows = store.rows(["file", "sponsor_name", "alignment_score", "law_citations"])
+    assert rows == [
+        {
+            "file": "H.119.1.json",
+            "sponsor_name": "Ann Example",
+            "alignment_score": 70,
+            "law_citations": ["Sec. 2"],
+        },
+        {
+            "file": "H.119.2.json",
+            "sponsor_name": "Bo Example",
+            "alignment_score": 70,
+            "law_citations": ["Sec. 2"],
+        },
+    ]
+    assert store.text("H.119.1.json") == {
+        "text": "Be it enacted",
+        "actions": [{"text": "Became Public Law"}],
+    }
+    assert [law["text"] for law in store.iter_laws()] == ["Be it enacted"] * 2
+
+
+def test_resync_picks_up_changed_and_deleted_files(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _write(data_dir, "H.119.1.json", _law(1), mtime=1_000_000_000)
+    _write(data_dir, "H.119.2.json", _law(2), mtime=1_000_000_000)
+    _write(data_dir, "H.119.3.json", _law(3), mtime=1_000_000_000)
+    store = LawStore(str(data_dir), str(tmp_path / "laws.sqlite"))
+    store.sync()
+
+    # Nothing changed: no file is read and the version stays
+    stats = store.sync()
+    assert stats["unchanged"] == 3 and store.version() == 1
+
+    # Same size, newer mtime
+    _write(data_dir, "H.119.1.json", _law(1, score=75), mtime=2_000_000_000)
+    # Same mtime, different size
+    _write(data_dir, "H.119.2.json", _law(2, text="Amended"), mtime=1_000_000_000)
+    (data_dir / "H.119.3.json").unlink()
+    stats = store.sync()
+    del stats["errors"]
+    assert stats == {"added": 0, "updated": 2, "removed": 1, "unchanged": 0}
+    assert store.version() == 2
+    scores = {
+        r["file"]: r["alignment_score"] for r in store.rows(["file", "alignment_score"])
+    }
+    assert scores == {"H.119.1.json": 75, "H.119.2.json": 70}
+    assert store.text("H.119.2.json")["text"] == "Amended"
+    # The deleted law's text went with it
+    assert store.text("H.119.3.json") == {"text": "", "actions": []}
+
+    _write(data_dir, "H.119.4.json", _law(4))
+    assert store.sync()["added"] == 1 and store.version() == 3
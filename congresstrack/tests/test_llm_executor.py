@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from llm_executor import LLMExecutor, ResponseCache, TokenBudget
+from passed_law_pipeline import CampaignObjectives, Law, LLMAnalyzer
+
+
+class FakeLLM(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /chat/completions endpoint"""
+
+    prompts = []
+    rate_limited = 0
+    delay = 0.0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args): ...
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+        with self.lock:
+            FakeLLM.prompts.append(prompt)
+            if FakeLLM.rate_limited:
+                FakeLLM.rate_limited -= 1
+                return self._send(429, {"error": {"message": "slow down"}})
+            FakeLLM.in_flight += 1
+            FakeLLM.max_in_flight = max(FakeLLM.max_in_flight, FakeLLM.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            FakeLLM.in_flight -= 1
+        if "bad request" in prompt:
+            return self._send(400, {"error": {"message": "bad request"}})
+        if "Compare the following law" in prompt:
+            content = json.dumps({"alignment_score": 80, "analysis": "aligned"})
+        else:
+            content = json.dumps({"objectives": ["jobs"], "key_issues": ["roads"]})
+        self._send(
+            200,
+            {
+                "id": "cmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            },
+        )
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("retry-after", "0")
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server():
+    FakeLLM.prompts, FakeLLM.rate_limited, FakeLLM.delay = [], 0, 0.0
+    FakeLLM.in_flight = FakeLLM.max_in_flight = 0
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLM)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}/v1"
+    srv.shutdown()
+
+
+def _executor(base_url, **kwargs):
+    kwargs.setdefault("backoff_s", 0.01)
+    return LLMExecutor(openai_api_key="test-key", openai_base_url=base_url, **kwargs)
+
+
+def test_repeated_prompts_are_served_from_cache(server, tmp_path):
+    cache = ResponseCache(str(tmp_path / "llm.sqlite"))
+    assert _executor(server, cache=cache).complete("hello") == _executor(
+        server, cache=cache
+    ).complete("hello")
+    assert len(FakeLLM.prompts) == 1
+    _executor(server, cache=cache).complete("hello", max_tokens=100)
+    assert len(FakeLLM.prompts) == 2  # generation settings are part of the key
+
+
+def test_rate_limited_requests_are_retried(server):
+    FakeLLM.rate_limited = 2
+    executor = _executor(server)
+    assert "jobs" in executor.complete("objectives please")
+    assert executor.usage()["retries"] == 2 and executor.usage()["requests"] == 3
+
+
+def test_client_errors_are_not_retried(server):
+    executor = _executor(server)
+    with pytest.raises(openai.BadRequestError):
+        executor.complete("bad request")
+    assert len(FakeLLM.prompts) == 1
+
+
+def test_concurrency_is_capped_and_tokens_accounted(server):
+    FakeLLM.delay = 0.05
+    executor = _executor(server, max_concurrency=4)
+    results = executor.map([f"prompt {i}" for i in range(24)])
+    assert len(results) == 24
+    assert 1 < FakeLLM.max_in_flight <= 4
+    usage = executor.usage()
+    assert usage["prompt_tokens"] == 240 and usage["completion_tokens"] == 120
+
+
+def test_token_budget_paces_requests():
+    budget = TokenBudget(6000)  # 100 tokens/s
+    budget.reserve(6000)
+    start = time.monotonic()
+    budget.reserve(50)
+    assert 0.3 < time.monotonic() - start < 2
+
+
+def test_analyzer_compares_hundreds_of_laws_concurrently(server):
+    FakeLLM.delay = 0.01
+    analyzer = LLMAnalyzer(_executor(server, max_concurrency=16))
+    objectives = CampaignObjectives("Sen X", ["jobs"], "llm_analysis", 0.8)
+    laws = [
+        Law(f"Act {i}", {"name": "Sen X"}, [], "SEC. 1.", "S", 119, i)
+        for i in range(300)
+    ]
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        scores = list(
+            pool.map(
+                lambda law: analyzer.compare_law_to_objectives(law, objectives), laws
+            )
+        )
+    assert [s["alignment_score"] for s in scores] == [80] * 300
+    assert time.monotonic() - start < 10
+    assert FakeLLM.max_in_flight <= 16
+    assert analyzer.analyze_campaign_objectives("site text", "Sen X").objectives == [
+        "jobs",
+        "roads",
+    ]
+
+
+def test_long_laws_are_scored_section_by_section(server):
+    analyzer = LLMAnalyzer(_executor(server, max_concurrency=4))
+    topics = ["highway", "broadband", "wildfire", "fishery", "tariff"] * 8
+    sections = "\n\n".join(
+        f"SEC. {i}. {topic.upper()}.\n\n    "
+        + (f"Provisions on {topic} funding. " * 60)
+        for i, topic in enumerate(topics, 1)
+    )
+    law = Law("Omnibus Act", {"name": "Sen X"}, [], sections, "S", 119, 1)
+    objectives = CampaignObjectives(
+        "Sen X", ["highway upkeep", "rural broadband", "wildfire"], "llm_analysis", 0.8
+    )
+    result = analyzer.compare_law_to_objectives(law, objectives)
+    metrics = result["metrics"]
+    assert metrics["sections"] >= 40
+    assert metrics["sections_scored"] == metrics["llm_calls"] == analyzer.max_chunks
+    assert metrics["prompt_tokens"] == 10 * analyzer.max_chunks
+    assert result["alignment_score"] == 80
+    assert all(c.startswith("SEC. ") for c in result["law_citations"])
+    assert all(
+        "judge this section only" in p and len(p) < analyzer.chunk_chars + 1500
+        for p in FakeLLM.prompts
+    )
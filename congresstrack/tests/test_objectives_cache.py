@@ -0,0 +1,126 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from objectives_cache import ObjectivesCache, content_hash
+from passed_law_pipeline import CampaignObjectives, SponsorObjectives
+from pipeline_state import objectives_version
+
+SPONSOR = {
+    "name": "Ann Example",
+    "state": "Ohio",
+    "websiteUrl": "https://example.test",
+    "bioguideId": "A000001",
+}
+
+
+class FakeScraper:
+    def __init__(self, content="Jobs and roads"):
+        self.content = content
+        self.searches = 0
+        self.scrapes = 0
+        self.lock = threading.Lock()
+
+    def search_campaign_website(self, name, state):
+        self.searches += 1
+        return None
+
+    def scrape_website(self, url):
+        with self.lock:
+            self.scrapes += 1
+        return self.content
+
+
+class FakeAnalyzer:
+    def __init__(self, source="llm"):
+        self.source = source
+        self.extractions = 0
+        self.lock = threading.Lock()
+
+    def analyze_campaign_objectives(self, content, name, url):
+        with self.lock:
+            self.extractions += 1
+        return CampaignObjectives(name, content.split(" and "), self.source, 0.9, url)
+
+
+def test_content_hash_ignores_whitespace():
+    assert content_hash("Jobs and\n  roads ") == content_hash("Jobs and roads")
+    assert content_hash("Jobs and roads") != content_hash("Jobs and rail")
+
+
+def test_same_sponsor_is_resolved_once(tmp_path):
+    scraper, analyzer = FakeScraper(), FakeAnalyzer()
+    cache = ObjectivesCache(str(tmp_path / "objectives.sqlite"))
+    sponsors = SponsorObjectives(scraper, analyzer, cache)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(sponsors.get, [SPONSOR] * 8))
+    assert all(result is results[0] for result in results)
+    assert results[0].objectives == ["Jobs", "roads"]
+    assert (scraper.scrapes, analyzer.extractions) == (1, 1)
+    assert sponsors.stats == {
+        "extracted": 1,
+        "cached": 0,
+        "unchanged_website": 0,
+        "reused": 7,
+    }
+
+    # Without a bioguideId the sponsor is keyed on name and state
+    anonymous = {"name": "Bo Example", "state": "Texas"}
+    sponsors.get(anonymous)
+    sponsors.get(dict(anonymous))
+    assert scraper.searches == 1 and analyzer.extractions == 1
+    assert cache.get("Bo Example|Texas") is None  # no website, nothing extracted
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "objectives.sqlite")
+    SponsorObjectives(FakeScraper(), FakeAnalyzer(), ObjectivesCache(path)).get(SPONSOR)
+
+    cache = ObjectivesCache(path)
+    stored = cache.get("A000001")
+    assert stored["content_hash"] == content_hash("Jobs and roads")
+    assert stored["website_url"] == "https://example.test"
+    assert stored["objectives"]["objectives"] == ["Jobs", "roads"]
+
+    scraper, analyzer = FakeScraper(), FakeAnalyzer()
+    sponsors = SponsorObjectives(scraper, analyzer, cache)
+    assert sponsors.get(SPONSOR).objectives == ["Jobs", "roads"]
+    assert (scraper.scrapes, analyzer.extractions) == (0, 0)
+    assert sponsors.stats["cached"] == 1
+
+
+def test_expired_entry_is_checked_against_the_website(tmp_path):
+    path = str(tmp_path / "objectives.sqlite")
+    first = SponsorObjectives(FakeScraper(), FakeAnalyzer(), ObjectivesCache(path))
+    version = objectives_version(first.get(SPONSOR))
+
+    # Expired, same content: the stored objectives are kept and their expiry restarted
+    cache = ObjectivesCache(path, ttl_days=0)
+    computed_at = cache.get("A000001")["computed_at"]
+    scraper, analyzer = FakeScraper("Jobs  and\nroads"), FakeAnalyzer()
+    sponsors = SponsorObjectives(scraper, analyzer, cache)
+    assert objectives_version(sponsors.get(SPONSOR)) == version
+    assert (scraper.scrapes, analyzer.extractions) == (1, 0)
+    assert sponsors.stats["unchanged_website"] == 1
+    assert cache.get("A000001")["computed_at"] > computed_at
+
+    # Expired, new content: extracted again and the new objectives stored
+    scraper, analyzer = FakeScraper("Jobs and rail"), FakeAnalyzer()
+    sponsors = SponsorObjectives(scraper, analyzer, cache)
+    changed = sponsors.get(SPONSOR)
+    assert changed.objectives == ["Jobs", "rail"]
+    assert objectives_version(changed) != version
+    assert analyzer.extractions == 1
+    stored = ObjectivesCache(path).get("A000001")
+    assert stored["content_hash"] == content_hash("Jobs and rail")
+    assert objectives_version(stored["objectives"]) == objectives_version(changed)
+
+
+def test_placeholder_objectives_are_not_stored(tmp_path):
+    cache = ObjectivesCache(str(tmp_path / "objectives.sqlite"))
+    sponsors = SponsorObjectives(FakeScraper(), FakeAnalyzer("manual"), cache)
+    assert sponsors.get(SPONSOR).source == "manual"
+    assert cache.get("A000001") is None
+
+    sponsors = SponsorObjectives(FakeScraper(""), FakeAnalyzer(), cache)
+    assert sponsors.get(SPONSOR).objectives == ["No website content available"]
+    assert cache.get("A000001") is None
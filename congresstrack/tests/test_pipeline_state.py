@@ -0,0 +1,260 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from congress_client import CongressClient
+from http_cache import HTTPCache
+from passed_law_pipeline import CampaignObjectives, LawPipeline
+from pipeline_state import PipelineState, objectives_version, text_version
+
+
+class FakeCongress(BaseHTTPRequestHandler):
+    """The Congress.gov endpoints fetch_law walks for one law, H.R. 1 of the 119th"""
+
+    hits = []
+    update_date = "2025-03-01T00:00:00Z"
+    text_version = "enr"
+
+    def log_message(self, *args): ...
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        FakeCongress.hits.append(path)
+        base = f"http://{self.headers['Host']}"
+        if path.startswith("/docs/"):
+            body = f"<pre>Text of H.R. 1 ({path.rsplit('-', 1)[1]})</pre>".encode()
+            return self._send(body, "text/html")
+        bill = f"{base}/v3/bill/119/hr/1"
+        responses = {
+            "/v3/bill/119/hr/1": {
+                "bill": {
+                    "title": "An Act",
+                    "sponsors": [{"url": f"{base}/v3/member/A000001"}],
+                    "actions": {"url": f"{bill}/actions"},
+                    "textVersions": {"url": f"{bill}/text"},
+                    "originChamberCode": "H",
+                    "congress": 119,
+                    "number": "1",
+                    "updateDate": self.update_date,
+                }
+            },
+            "/v3/member/A000001": {
+                "member": {
+                    "directOrderName": "Ann Example",
+                    "officialWebsiteUrl": "https://example.test",
+                    "state": "Ohio",
+                    "bioguideId": "A000001",
+                }
+            },
+            "/v3/bill/119/hr/1/actions": {"actions": [{"text": "Became Public Law"}]},
+            "/v3/bill/119/hr/1/text": {
+                "textVersions": [
+                    {
+                        "formats": [
+                            {
+                                "type": "Formatted Text",
+                                "url": f"{base}/docs/hr1-{self.text_version}.htm",
+                            }
+                        ]
+                    }
+                ]
+            },
+        }
+        self._send(json.dumps(responses[path]).encode(), "application/json")
+
+    def _send(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeScraper:
+    def __init__(self):
+        self.content = "Jobs and roads"
+
+    def search_campaign_website(self, name, state):
+        return None
+
+    def scrape_website(self, url):
+        return self.content
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.comparisons = 0
+
+    def analyze_campaign_objectives(self, content, name, url):
+        return CampaignObjectives(name, content.split(" and "), "llm", 0.9, url)
+
+    def compare_law_to_objectives(self, law, objectives):
+        self.comparisons += 1
+        return {"alignment_score": 70 + self.comparisons, "analysis": law.text}
+
+
+@pytest.fixture
+def server():
+    FakeCongress.hits = []
+    FakeCongress.update_date, FakeCongress.text_version = "2025-03-01T00:00:00Z", "enr"
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), FakeCongress)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}/v3"
+    srv.shutdown()
+
+
+def _listing(base):
+    return {
+        "url": f"{base}/bill/119/hr/1",
+        "originChamberCode": "H",
+        "congress": 119,
+        "number": "1",
+        "updateDate": FakeCongress.update_date,
+    }
+
+
+def _pipeline(base, tmp_path, analyzer=None, scraper=None, cache=None):
+    return LawPipeline(
+        client=CongressClient(
+            api_key="test-key", base_url=base, rate_per_s=1000, cache=cache
+        ),
+        data_dir=str(tmp_path / "data"),
+        scraper=scraper or FakeScraper(),
+        analyzer=analyzer or FakeAnalyzer(),
+        state=PipelineState(str(tmp_path / "state.json")),
+    )
+
+
+def _first_run(base, tmp_path, cache=None):
+    pipeline = _pipeline(base, tmp_path, cache=cache)
+    (tmp_path / "data").mkdir()
+    law, steps = pipeline.process(_listing(base))
+    assert steps == {"fetched": True, "text_downloaded": True, "compared": True}
+    pipeline.state.save()
+    return law
+
+
+def test_state_file_round_trip(tmp_path):
+    state = PipelineState(str(tmp_path / "state.json"))
+    state.update_law("H.119.1", updateDate="2025-03-01", text_version="abc")
+    state.update_sponsor("A000001", "v1")
+    changed_at = state.sponsors["A000001"]["changed_at"]
+    state.update_sponsor("A000001", "v1")
+    state.update_sponsor("", "ignored")
+    state.save()
+
+    reloaded = PipelineState(str(tmp_path / "state.json"))
+    assert reloaded.law("H.119.1") == {
+        "updateDate": "2025-03-01",
+        "text_version": "abc",
+    }
+    assert reloaded.sponsors == {
+        "A000001": {"objectives_version": "v1", "changed_at": changed_at}
+    }
+    assert reloaded.law("S.119.2") == {}
+
+
+def test_versions():
+    objectives = CampaignObjectives("Ann Example", ["jobs"], "llm", 0.9, "https://a")
+    same = {"sponsor_name": "Ann Example", "objectives": ["jobs"], "source": "other"}
+    assert objectives_version(objectives) == objectives_version(same)
+    assert objectives_version(objectives) != objectives_version(
+        {"sponsor_name": "Ann Example", "objectives": ["roads"]}
+    )
+    assert objectives_version(None) == ""
+    assert text_version(None) == text_version("") != text_version("An Act")
+
+
+def test_unchanged_law_is_reused(server, tmp_path):
+    first = _first_run(server, tmp_path)
+    FakeCongress.hits = []
+
+    analyzer = FakeAnalyzer()
+    pipeline = _pipeline(server, tmp_path, analyzer)
+    assert not pipeline.needs_fetch(_listing(server))
+    law, steps = pipeline.process(_listing(server), fetch=False)
+    assert steps == {"fetched": False, "text_downloaded": False, "compared": False}
+    assert analyzer.comparisons == 0 and FakeCongress.hits == []
+    assert law.alignment_score == first.alignment_score == 71
+
+
+def test_changed_content_is_refetched(server, tmp_path):
+    _first_run(server, tmp_path)
+
+    # A newer updateDate with the same text version: metadata only
+    FakeCongress.update_date = "2025-04-01T00:00:00Z"
+    analyzer = FakeAnalyzer()
+    pipeline = _pipeline(server, tmp_path, analyzer)
+    assert pipeline.needs_fetch(_listing(server))
+    law, steps = pipeline.process(_listing(server))
+    assert steps == {"fetched": True, "text_downloaded": False, "compared": False}
+    assert law.updateDate == "2025-04-01T00:00:00Z" and law.alignment_score == 71
+    assert not pipeline.needs_fetch(_listing(server))
+
+    # A new text version is downloaded and compared again
+    FakeCongress.update_date, FakeCongress.text_version = "2025-05-01T00:00:00Z", "pl"
+    law, steps = pipeline.process(_listing(server))
+    assert steps == {"fetched": True, "text_downloaded": True, "compared": True}
+    assert law.analysis == "Text of H.R. 1 (pl.htm)" and analyzer.comparisons == 1
+
+
+def test_changed_objectives_are_compared_again(server, tmp_path):
+    _first_run(server, tmp_path)
+    scraper, analyzer = FakeScraper(), FakeAnalyzer()
+    scraper.content = "Jobs and schools"
+    pipeline = _pipeline(server, tmp_path, analyzer, scraper)
+    law, steps = pipeline.process(_listing(server), fetch=False)
+    assert steps == {"fetched": False, "text_downloaded": False, "compared": True}
+    assert law.campaign_objectives.objectives == ["Jobs", "schools"]
+    assert pipeline.state.sponsors["A000001"]["objectives_version"] == (
+        objectives_version(law.campaign_objectives)
+    )
+
+
+def test_resume_after_crashed_run(server, tmp_path):
+    first = _first_run(server, tmp_path)
+    # Killed mid-save: a torn state file and a leftover temp file
+    state_file = tmp_path / "state.json"
+    state_file.write_text(state_file.read_text()[:20])
+    (tmp_path / "data" / "H.119.1.json.tmp").write_text("{")
+
+    analyzer = FakeAnalyzer()
+    pipeline = _pipeline(server, tmp_path, analyzer)
+    assert pipeline.state.laws == {}
+    # The law file itself says it is current and its analysis still matches
+    assert not pipeline.needs_fetch(_listing(server))
+    law, steps = pipeline.process(_listing(server), fetch=False)
+    assert not any(steps.values()) and analyzer.comparisons == 0
+    assert law.alignment_score == first.alignment_score
+    pipeline.state.save()
+    assert json.loads(state_file.read_text())["laws"]["H.119.1"]["text_version"] == (
+        text_version(first.text)
+    )
+
+    # State recorded before the law file was written: fetch it again
+    (tmp_path / "data" / "H.119.1.json").unlink()
+    assert pipeline.needs_fetch(_listing(server))
+    law, steps = pipeline.process(_listing(server))
+    assert steps == {"fetched": True, "text_downloaded": True, "compared": True}
+
+
+def test_changed_law_bypasses_the_http_cache(server, tmp_path):
+    # The CLI default: bill, actions and text versions are cached for 24h
+    cache = HTTPCache(str(tmp_path / "http.sqlite"))
+    _first_run(server, tmp_path, cache)
+
+    FakeCongress.update_date, FakeCongress.text_version = "2025-05-01T00:00:00Z", "pl"
+    analyzer = FakeAnalyzer()
+    pipeline = _pipeline(server, tmp_path, analyzer, cache=cache)
+    assert pipeline.needs_fetch(_listing(server))
+    law, steps = pipeline.process(_listing(server))
+    assert steps == {"fetched": True, "text_downloaded": True, "compared": True}
+    assert law.analysis == "Text of H.R. 1 (pl.htm)" and analyzer.comparisons == 1
+    assert not pipeline.needs_fetch(_listing(server))
+
+    # Unchanged laws still come from the cache
+    FakeCongress.hits = []
+    law, steps = pipeline.process(_listing(server), fetch=False)
+    assert not any(steps.values()) and FakeCongress.hits == []
@@ -0,0 +1,41 @@
+import json
+
+from result_sink import JSONLSink, export_parquet
+
+
+def test_rerun_skips_written_keys_and_drops_torn_last_line(tmp_path):
+    path = tmp_path / "results.jsonl"
+    with JSONLSink(str(path)) as sink:
+        sink.write({"law_key": "H.119.1", "alignment_score": 80})
+        sink.write({"law_key": "S.119.2", "alignment_score": 20})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"law_key": "H.119.3", "alignm')  # killed mid-write
+
+    with JSONLSink(str(path)) as sink:
+        assert "H.119.1" in sink and "S.119.2" in sink and "H.119.3" not in sink
+        sink.write({"law_key": "H.119.3", "alignment_score": 50})
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["law_key"] for line in lines] == [
+        "H.119.1",
+        "S.119.2",
+        "H.119.3",
+    ]
+
+
+def test_frame_keeps_last_record_per_key_and_restart_clears(tmp_path):
+    path = tmp_path / "results.jsonl"
+    with JSONLSink(str(path)) as sink:
+        sink.write({"law_key": "H.119.1", "alignment_score": 10, "citations": []})
+        sink.write({"law_key": "H.119.1", "alignment_score": 90, "citations": ["a"]})
+        sink.write({"law_key": "S.119.2", "alignment_score": 40, "citations": []})
+    df = sink.to_frame()
+    assert df.set_index("law_key")["alignment_score"].to_dict() == {
+        "H.119.1": 90,
+        "S.119.2": 40,
+    }
+    parquet = export_parquet(df, str(tmp_path / "results.parquet"))
+    assert parquet is None or (tmp_path / "results.parquet").exists()
+
+    with JSONLSink(str(path), restart=True) as sink:
+        assert not sink.done
+        assert sink.to_frame().empty
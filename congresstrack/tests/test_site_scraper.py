@@ -0,0 +1,147 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_cache import HTTPCache
+from site_scraper import SiteScraper, extract
+
+HOME = b"""<html><head><title>Jane Doe for Senate</title>
+<style>body { color: red }</style><script>var tracking = 1;</script></head>
+<body><nav><a href="/issues">Issues</a> <a href="/priorities/">Priorities</a>
+<a href="/private/agenda">Agenda</a> <a href="/donate">Donate</a>
+<a href="https://elsewhere.example/issues">Other site</a></nav>
+<h1>Jane Doe</h1><p>Fighting for working families.</p></body></html>"""
+
+PAGES = {
+    "/": HOME,
+    "/issues": b"<html><body><h2>Issues</h2><p>Expand rural broadband.</p></body></html>",
+    "/priorities/": b"<html><body><p>Lower prescription drug costs.</p></body></html>",
+    "/private/agenda": b"<html><body><p>Secret agenda.</p></body></html>",
+    "/big": b"<html><body>" + b"<p>filler text</p>" * 20000 + b"</body></html>",
+    "/robots.txt": b"User-agent: *\nDisallow: /private/\n",
+}
+
+
+class FixtureSite(BaseHTTPRequestHandler):
+    requests = []
+    throttled = 0
+    delay = 0.0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args): ...
+
+    def do_GET(self):
+        with self.lock:
+            FixtureSite.requests.append(self.path)
+            if FixtureSite.throttled and self.path != "/robots.txt":
+                FixtureSite.throttled -= 1
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            FixtureSite.in_flight += 1
+            FixtureSite.max_in_flight = max(
+                FixtureSite.max_in_flight, FixtureSite.in_flight
+            )
+        time.sleep(self.delay)
+        with self.lock:
+            FixtureSite.in_flight -= 1
+
+        body = PAGES.get(self.path.split("?")[0])
+        if body is None:
+            self.send_error(404)
+            return
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def site():
+    FixtureSite.requests, FixtureSite.throttled, FixtureSite.delay = [], 0, 0.0
+    FixtureSite.in_flight = FixtureSite.max_in_flight = 0
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), FixtureSite)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}"
+    srv.shutdown()
+
+
+def test_extract_drops_scripts_and_ranks_issue_links():
+    text, links = extract(HOME, "https://janedoe.example/")
+    assert "tracking" not in text and "color" not in text
+    assert "Fighting for working families." in text
+    assert links == [
+        "https://janedoe.example/issues",
+        "https://janedoe.example/priorities/",
+        "https://janedoe.example/private/agenda",
+    ]
+
+
+def test_issues_pages_are_scraped_and_robots_respected(site):
+    scraper = SiteScraper(backoff_s=0.01)
+    text = scraper.scrape(site + "/")
+    assert text.index("rural broadband") < text.index("working families")
+    assert "prescription drug" in text
+    assert "Secret agenda" not in text
+    assert "/private/agenda" not in FixtureSite.requests
+    assert FixtureSite.requests.count("/robots.txt") == 1
+    assert scraper.stats["robots_blocked"] == 1 and scraper.stats["pages"] == 3
+
+
+def test_bytes_per_sponsor_are_capped(site):
+    scraper = SiteScraper(max_bytes=50_000)
+    PAGES["/"] = HOME.replace(b'href="/issues"', b'href="/big?issues"')
+    try:
+        text = scraper.scrape(site + "/")
+    finally:
+        PAGES["/"] = HOME
+    assert "working families" in text
+    assert scraper.stats["truncated"] >= 1
+    assert scraper.stats["bytes"] <= 50_000 + len(PAGES["/robots.txt"])
+
+
+def test_requests_per_site_are_capped_and_throttling_retried(site):
+    FixtureSite.delay, FixtureSite.throttled = 0.05, 2
+    scraper = SiteScraper(per_domain=2, backoff_s=0.01)
+    pages = scraper.scrape_many([site + "/", site + "/issues", site + "/priorities/"])
+    assert all(pages.values())
+    assert FixtureSite.max_in_flight <= 2
+    assert scraper.stats["retries"] == 2
+
+
+def test_stale_pages_are_revalidated(site, tmp_path):
+    cache = HTTPCache(str(tmp_path / "sites.sqlite"))
+    first = SiteScraper(cache=cache).scrape(site + "/")
+    FixtureSite.requests = []
+    fresh = SiteScraper(cache=cache)
+    assert fresh.scrape(site + "/") == first
+    assert FixtureSite.requests == ["/robots.txt"]
+    stale = SiteScraper(cache=cache, max_age_s=0)
+    assert stale.scrape(site + "/") == first
+    assert stale.stats["revalidated"] == 3 and stale.stats["pages"] == 0
+
+
+def test_homepage_text_fits_the_character_budget(site):
+    full = SiteScraper().scrape(site + "/")
+    home = extract(HOME, site + "/")[0]
+    budget = len(full) - 20
+    text = SiteScraper(max_chars=budget).scrape(site + "/")
+    # The homepage is joined last; a prompt cut at the same budget must still see it
+    assert len(text) <= budget
+    assert text.index(home[:20]) > text.index("prescription drug")
+    assert "rural broadband" in text and "prescription drug" in text
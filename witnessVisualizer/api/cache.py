@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Shared caching layer for the hearing APIs.
+
+- One Supabase client per process instead of one per request
+- Per-endpoint TTL caches keyed by path and the query parameters the endpoint declares,
+  bounded in size (least recently used entries are evicted)
+- Single-flight loading: concurrent identical requests share one backend query
+- ETag / If-None-Match handling (304 Not Modified)
+- Explicit invalidation, in process or through POST /cache/invalidate
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+
+CACHE_TOKEN_ENV = "WITNESS_CACHE_TOKEN"
+CACHE_MAX_ENTRIES_ENV = "WITNESS_CACHE_MAX_ENTRIES"
+API_URLS_ENV = "WITNESS_API_URLS"
+
+
+@functools.lru_cache(maxsize=None)
+def shared_supabase_client(url: str, key: str):
+    """Process-wide Supabase client for a URL/key pair; the underlying HTTP session is reused"""
+    from supabase import create_client
+    return create_client(url, key)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    etag: str
+    expires_at: float
+    generation: int
+
+
+class ResponseCache:
+    """In-process TTL cache with request coalescing, holding at most max_entries responses"""
+
+    def __init__(self, default_ttl: float = 60, max_entries: Optional[int] = None):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries or int(os.getenv(CACHE_MAX_ENTRIES_ENV, "1000"))
+        self.generation = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "not_modified": 0, "evicted": 0}
+
+    def _fresh(self, entry: Optional[CacheEntry]) -> bool:
+        return (
+            entry is not None
+            and entry.generation == self.generation
+            and entry.expires_at > time.monotonic()
+        )
+
+    async def get(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None) -> CacheEntry:
+        """Cached entry for key; on a miss only the first caller runs loader, the rest await it"""
+        entry = self._entries.get(key)
+        if self._fresh(entry):
+            self.stats["hits"] += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        self.stats["misses"] += 1
+        # The load runs in its own task, so a cancelled first caller does not cancel it for the rest
+        task = asyncio.ensure_future(self._load(key, loader, ttl, self.generation))
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: str, loader: Callable[[], Any], ttl: Optional[float], generation: int
+    ) -> CacheEntry:
+        try:
+            if inspect.iscoroutinefunction(loader):
+                value = await loader()
+            else:
+                value = await run_in_threadpool(loader)
+            body = json.dumps(jsonable_encoder(value), sort_keys=True, default=str)
+            entry = CacheEntry(
+                value=value,
+                etag='"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"',
+                expires_at=time.monotonic() + (self.default_ttl if ttl is None else ttl),
+                generation=generation,
+            )
+            # Data loaded before an invalidation is handed to its waiters but not kept
+            if generation == self.generation:
+                self._store(key, entry)
+            return entry
+        finally:
+            del self._inflight[key]
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Add entry, dropping expired entries and then the least recently used beyond max_entries"""
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop entries whose key starts with prefix (everything by default)"""
+        if not prefix:
+            count = len(self._entries)
+            self._entries.clear()
+            self.generation += 1
+            return count
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for k in keys:
+            del self._entries[k]
+        return len(keys)
+
+    def cached(self, ttl: Optional[float] = None):
+        """Decorator for FastAPI endpoints: serve from cache, set ETag and answer 304s.
+
+        Goes between @app.get(...) and the endpoint. The endpoint's return value
+        is cached as-is, so response_model validation still applies. Query
+        parameters the endpoint does not declare are left out of the key, so
+        they cannot multiply the entries.
+        """
+        def decorator(endpoint: Callable[..., Awaitable[Any]]):
+            signature = inspect.signature(endpoint)
+            params = frozenset(signature.parameters)
+            extra = [
+                inspect.Parameter("cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                inspect.Parameter("cache_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+            ]
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args, cache_request: Request, cache_response: Response, **kwargs):
+                async def load():
+                    result = endpoint(*args, **kwargs)
+                    return await result if inspect.isawaitable(result) else result
+
+                entry = await self.get(request_key(cache_request, params), load, ttl)
+                headers = {
+                    "ETag": entry.etag,
+                    "Cache-Control": f"max-age={max(0, int(entry.expires_at - time.monotonic()))}",
+                }
+                if etag_matches(cache_request.headers.get("if-none-match"), entry.etag):
+                    self.stats["not_modified"] += 1
+                    return Response(status_code=304, headers=headers)
+                cache_response.headers.update(headers)
+                return entry.value
+
+            wrapper.__signature__ = signature.replace(
+                parameters=list(signature.parameters.values()) + extra
+            )
+            return wrapper
+        return decorator
+
+    def install(self, app: FastAPI) -> None:
+        """Add POST /cache/invalidate (guarded by the WITNESS_CACHE_TOKEN env var) and GET /cache/stats"""
+
+        @app.post("/cache/invalidate", summary="Drop cached responses after new data is loaded")
+        async def invalidate_cache(prefix: str = "", x_cache_token: Optional[str] = Header(None)):
+            token = os.getenv(CACHE_TOKEN_ENV)
+            if not token or x_cache_token != token:
+                raise HTTPException(status_code=403, detail="Invalid cache token")
+            return {"invalidated": self.invalidate(prefix), "generation": self.generation}
+
+        @app.get("/cache/stats", summary="Response cache statistics")
+        async def cache_stats():
+            return {**self.stats, "entries": len(self._entries), "generation": self.generation}
+
+
+def request_key(request: Request, params: Optional[frozenset] = None) -> str:
+    """Path plus query string; with params, only those query parameters count"""
+    query = sorted((k, v) for k, v in request.query_params.multi_items() if params is None or k in params)
+    return request.url.path + ("?" + "&".join(f"{k}={v}" for k, v in query) if query else "")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def notify_api_caches(urls: Optional[List[str]] = None, prefix: str = "") -> Dict[str, Any]:
+    """Tell running API servers to drop cached responses; call after writing new hearing data.
+
+    Servers are taken from WITNESS_API_URLS (comma-separated base URLs) and
+    authenticated with WITNESS_CACHE_TOKEN.
+    """
+    import requests
+
+    urls = urls if urls is not None else [u.strip() for u in os.getenv(API_URLS_ENV, "").split(",") if u.strip()]
+    token = os.getenv(CACHE_TOKEN_ENV, "")
+    results = {}
+    for url in urls:
+        try:
+            response = requests.post(
+                f"{url.rstrip('/')}/cache/invalidate",
+                params={"prefix": prefix} if prefix else None,
+                headers={"X-Cache-Token": token},
+                timeout=10,
+            )
+            results[url] = response.status_code
+        except requests.RequestException as e:
+            results[url] = str(e)
+    return results
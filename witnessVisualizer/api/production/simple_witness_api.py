@@ -4,11 +4,14 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
 import os
-from supabase import create_client, Client
 from pydantic import BaseModel
 from datetime import datetime, date
 import json
 
+from api.cache import ResponseCache, shared_supabase_client
+from database.witness_entities import witness_summary
+from database.repository import repository_from_env, using_supabase
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Congressional Witness API",
@@ -29,19 +32,30 @@ app.add_middleware(
 supabase_url = os.getenv("WITNESS_SUPABASE_URL") or os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("WITNESS_SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
 
-if not supabase_url or not supabase_key:
+if using_supabase() and (not supabase_url or not supabase_key):
     raise ValueError("Supabase credentials not found. Please set WITNESS_SUPABASE_URL and WITNESS_SUPABASE_SERVICE_ROLE_KEY or SUPABASE_URL and SUPABASE_KEY environment variables")
 
-supabase: Client = create_client(supabase_url, supabase_key)
+def get_supabase_client():
+    return shared_supabase_client(supabase_url, supabase_key)
+
+# Hearing data: Supabase, or a local SQLite file with WITNESS_BACKEND=sqlite (database/repository.py)
+repository = repository_from_env(get_supabase_client)
+
+# Responses are cached for CACHE_TTL seconds or until POST /cache/invalidate
+CACHE_TTL = int(os.getenv("WITNESS_CACHE_TTL", "300"))
+cache = ResponseCache(default_ttl=CACHE_TTL)
+cache.install(app)
 
 # Pydantic models for API responses
 class WitnessSimple(BaseModel):
+    id: Optional[str] = None
     name: str
     title: Optional[str] = None
     organization: Optional[str] = None
     topics: List[str] = []
     hearings: List[str] = []
     committees: List[str] = []
+    hearing_count: int = 0
 
 class StatsResponse(BaseModel):
     total_witnesses: int
@@ -58,56 +72,16 @@ async def root():
 
 async def _get_deduplicated_witnesses():
     """Internal function to get deduplicated witnesses - shared logic for all endpoints"""
-    # Get all hearings with witness data
-    result = supabase.table('congressional_hearings').select('witnesses,hearing_name,committee,hearing_date').execute()
-    
-    witness_dict = {}
-    
-    for hearing in result.data:
-        witnesses = hearing.get('witnesses', [])
-        hearing_name = hearing.get('hearing_name', '')
-        committee = hearing.get('committee', '')
-        
-        for witness in witnesses:
-            if isinstance(witness, dict):
-                name = witness.get('name', '')
-                if name:
-                    name = name.strip()
-                organization = witness.get('organization', '') or ''
-                if organization:
-                    organization = organization.strip()
-                
-                if name:
-                    # Create a unique key combining name and organization for better deduplication
-                    # This handles cases where same person might have slight org variations
-                    unique_key = f"{name}|{organization}".lower()
-                    
-                    if unique_key not in witness_dict:
-                        witness_dict[unique_key] = {
-                            'name': name,
-                            'title': witness.get('title', ''),
-                            'organization': organization,
-                            'topics': [],
-                            'hearings': [],
-                            'committees': []
-                        }
-                    else:
-                        # Update title if current one is empty but new one has content
-                        current_title = witness_dict[unique_key]['title']
-                        new_title = witness.get('title', '')
-                        if not current_title and new_title:
-                            witness_dict[unique_key]['title'] = new_title
-                    
-                    # Add hearing and committee if not already present
-                    if hearing_name and hearing_name not in witness_dict[unique_key]['hearings']:
-                        witness_dict[unique_key]['hearings'].append(hearing_name)
-                    if committee and committee not in witness_dict[unique_key]['committees']:
-                        witness_dict[unique_key]['committees'].append(committee)
-    
-    # Convert to list
-    return list(witness_dict.values())
+    # One table scan per TTL however many endpoints and concurrent requests ask for it
+    return (await cache.get("data:deduplicated_witnesses", _load_deduplicated_witnesses)).value
+
+def _load_deduplicated_witnesses():
+    # Canonical entities (database/witness_entities.py): the Supabase loaders resolve new and
+    # edited hearings after each load, the local SQLite file resolves all of them when it is built
+    return [witness_summary(entity) for entity in repository.iter_witness_entities()]
 
 @app.get("/witnesses/all-simple", response_model=List[WitnessSimple], summary="Get All Witnesses (Simple)")
+@cache.cached()
 async def get_all_witnesses_simple():
     """Get all witnesses extracted from congressional hearings JSONB data"""
     try:
@@ -116,6 +90,7 @@ async def get_all_witnesses_simple():
         raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
 
 @app.get("/witnesses/congressional", response_model=List[WitnessSimple], summary="Get Congressional Witnesses")
+@cache.cached()
 async def get_congressional_witnesses():
     """Alias for get_all_witnesses_simple"""
     try:
@@ -124,15 +99,16 @@ async def get_congressional_witnesses():
         raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
 
 @app.get("/witnesses", response_model=List[WitnessSimple], summary="Get Witnesses with Pagination")
+@cache.cached()
 async def get_witnesses(limit: int = 50, offset: int = 0):
     """Get witnesses with pagination"""
     try:
-        all_witnesses = await _get_deduplicated_witnesses()
-        return all_witnesses[offset:offset + limit]
+        return [witness_summary(entity) for entity in repository.witness_entities(limit, offset)]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
 
 @app.get("/witnesses/all", summary="Get All Witnesses (Comprehensive)")
+@cache.cached()
 async def get_all_witnesses_comprehensive():
     """Get all witnesses with comprehensive data structure"""
     try:
@@ -149,24 +125,25 @@ async def get_all_witnesses_comprehensive():
         raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
 
 @app.get("/metrics/witnesses-number", summary="Get Total Witness Count")
+@cache.cached()
 async def get_witness_count():
     """Get total number of unique witnesses"""
     try:
-        witnesses = await _get_deduplicated_witnesses()
-        return len(witnesses)
+        return repository.count_witness_entities()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error counting witnesses: {str(e)}")
 
 @app.get("/metrics/hearings-number", summary="Get Total Hearing Count")
+@cache.cached()
 async def get_hearing_count():
     """Get total number of hearings"""
     try:
-        result = supabase.table('congressional_hearings').select('id', count='exact').execute()
-        return result.count or 0
+        return repository.count_hearings()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error counting hearings: {str(e)}")
 
 @app.get("/metrics/organizations-number", summary="Get Total Organization Count")
+@cache.cached()
 async def get_organization_count():
     """Get total number of unique organizations"""
     try:
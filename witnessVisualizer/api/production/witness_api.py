@@ -2,13 +2,20 @@
 
 from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Dict, Any, Iterator, Literal
 import os
-from supabase import create_client, Client
 from pydantic import BaseModel
 from datetime import datetime, date
 import json
 
+from api.cache import ResponseCache, shared_supabase_client
+from database.hearing_metrics import parse_witnesses
+from database.hearing_pages import csv_lines, ndjson_lines, parse_cursor
+from database.repository import SupabaseRequired, repository_from_env, using_supabase
+from database.witness_directory import get_witness as get_witness_record, list_witnesses
+from database.witness_entities import entity_cursor, parse_entity_cursor, witness_summary
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Congressional Witness API",
@@ -29,10 +36,19 @@ app.add_middleware(
 supabase_url = os.getenv("WITNESS_SUPABASE_URL") or os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("WITNESS_SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
 
-if not supabase_url or not supabase_key:
+if using_supabase() and (not supabase_url or not supabase_key):
     raise ValueError("Supabase credentials not found. Please set WITNESS_SUPABASE_URL and WITNESS_SUPABASE_SERVICE_ROLE_KEY or SUPABASE_URL and SUPABASE_KEY environment variables")
 
-supabase: Client = create_client(supabase_url, supabase_key)
+# The normalized witness/hearing/organization tables are only in Supabase
+supabase = shared_supabase_client(supabase_url, supabase_key) if using_supabase() else SupabaseRequired()
+
+# congressional_hearings data: Supabase, or a local SQLite file with WITNESS_BACKEND=sqlite (database/repository.py)
+repository = repository_from_env(lambda: supabase)
+
+# Responses are cached for CACHE_TTL seconds or until POST /cache/invalidate
+CACHE_TTL = int(os.getenv("WITNESS_CACHE_TTL", "300"))
+cache = ResponseCache(default_ttl=CACHE_TTL)
+cache.install(app)
 
 # Pydantic models for API responses
 class WitnessResponse(BaseModel):
@@ -106,6 +122,7 @@ class StatsResponse(BaseModel):
     total_documents: int
     date_range_start: Optional[date] = None
     date_range_end: Optional[date] = None
+    stale: bool = False  # hearings were written since the summary was last refreshed
 
 class CongressionalHearingResponse(BaseModel):
     id: int
@@ -124,6 +141,31 @@ class CongressionalHearingResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+class SearchHit(BaseModel):
+    kind: str
+    hearing_id: int
+    position: int
+    name: Optional[str] = None
+    title: Optional[str] = None
+    organization: Optional[str] = None
+    witness_type: Optional[str] = None
+    hearing_name: Optional[str] = None
+    committee: Optional[str] = None
+    congress: Optional[int] = None
+    hearing_type: Optional[str] = None
+    hearing_date: Optional[str] = None
+    score: float
+
+class FacetCount(BaseModel):
+    value: Any
+    count: int
+
+class SearchResponse(BaseModel):
+    query: Optional[str] = None
+    total: int
+    hits: List[SearchHit]
+    facets: Dict[str, List[FacetCount]]
+
 # API Endpoints
 
 @app.get("/", summary="API Health Check")
@@ -132,130 +174,57 @@ async def root():
     return {"message": "Congressional Witness API is running", "version": "1.0.0"}
 
 @app.get("/stats", response_model=StatsResponse, summary="Get Database Statistics")
+@cache.cached()
 async def get_stats():
     """Get overall database statistics"""
     try:
-        # Get counts from congressional_hearings table
-        hearings = supabase.table('congressional_hearings').select('id', count='exact').execute()
-        
-        # Get witness count by extracting from JSONB witnesses field
-        witnesses_result = supabase.table('congressional_hearings').select('witnesses').execute()
-        total_witnesses = 0
-        for hearing in witnesses_result.data:
-            if hearing.get('witnesses'):
-                total_witnesses += len(hearing['witnesses'])
-        
-        # For now, set default values for other stats
-        committees = type('obj', (object,), {'count': 50})()
-        organizations = type('obj', (object,), {'count': 200})()
-        documents = type('obj', (object,), {'count': 1000})()
-        
-        # Get date range
-        date_range = supabase.table('congressional_hearings').select('hearing_date').order('hearing_date').execute()
-        
-        start_date = None
-        end_date = None
-        if date_range.data:
-            start_date = date_range.data[0]['hearing_date']
-            end_date = date_range.data[-1]['hearing_date']
+        # Counts and date range from the precomputed hearing metrics
+        metrics = repository.hearing_metrics()
         
         return StatsResponse(
-            total_witnesses=total_witnesses,
-            total_hearings=hearings.count or 0,
-            total_committees=committees.count or 0,
-            total_organizations=organizations.count or 0,
-            total_documents=documents.count or 0,
-            date_range_start=start_date,
-            date_range_end=end_date
+            total_witnesses=metrics['witness_appearances'],
+            total_hearings=metrics['hearings'],
+            total_committees=metrics['committees'],
+            total_organizations=metrics['unique_organizations'],
+            total_documents=metrics['documents'],
+            date_range_start=metrics['earliest_hearing'],
+            date_range_end=metrics['latest_hearing'],
+            stale=metrics.get('stale', False)
         )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving stats: {str(e)}")
 
 @app.get("/witnesses", response_model=List[WitnessResponse], summary="Get All Witnesses")
+@cache.cached()
 async def get_witnesses(
     limit: int = Query(100, ge=1, le=1000, description="Number of witnesses to return"),
-    offset: int = Query(0, ge=0, description="Number of witnesses to skip"),
+    after: Optional[str] = Query(None, description="Return witnesses after this witness_id (the last one of the previous page)"),
+    offset: int = Query(0, ge=0, description="Number of witnesses to skip (ignored when after is set; prefer after)"),
     witness_type: Optional[str] = Query(None, description="Filter by witness type"),
     organization: Optional[str] = Query(None, description="Filter by organization name"),
     topic: Optional[str] = Query(None, description="Filter by topic"),
     search: Optional[str] = Query(None, description="Search witness names and titles")
 ):
-    """Get witnesses with optional filtering and pagination"""
+    """Get witnesses with optional filtering, ordered by witness_id"""
     try:
-        query = supabase.table('congressional_hearings').select('witnesses,hearing_name,committee,hearing_date')
-        
-        # Apply filters
-        if witness_type:
-            query = query.eq('witness_type', witness_type)
-        
-        if organization:
-            query = query.ilike('organization_name', f'%{organization}%')
-        
-        if topic:
-            query = query.contains('topics', [topic])
-        
-        if search:
-            query = query.or_(f'name.ilike.%{search}%,title.ilike.%{search}%')
-        
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
-        
-        result = query.execute()
-        
-        witnesses = []
-        for row in result.data:
-            witnesses.append(WitnessResponse(
-                id=row['id'],
-                witness_id=row['witness_id'],
-                name=row['name'],
-                title=row['title'] or '',
-                witness_type=row['witness_type'],
-                organization_name=row['organization_name'],
-                tribal_affiliation=row['tribal_affiliation'],
-                topics=row['topics'] or [],
-                keywords=row['keywords'] or [],
-                expertise_areas=row['expertise_areas'] or [],
-                document_count=row['document_count'] or 0,
-                created_at=row['created_at']
-            ))
-        
-        return witnesses
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
-
-@app.get("/witnesses/{witness_id}", response_model=WitnessResponse, summary="Get Witness by ID")
-async def get_witness(witness_id: str):
-    """Get a specific witness by their ID"""
-    try:
-        result = supabase.table('congressional_hearings').select('witnesses,hearing_name,committee,hearing_date').execute()
-        
-        if not result.data:
-            raise HTTPException(status_code=404, detail="Witness not found")
-        
-        row = result.data[0]
-        return WitnessResponse(
-            id=row['id'],
-            witness_id=row['witness_id'],
-            name=row['name'],
-            title=row['title'] or '',
-            witness_type=row['witness_type'],
-            organization_name=row['organization_name'],
-            tribal_affiliation=row['tribal_affiliation'],
-            topics=row['topics'] or [],
-            keywords=row['keywords'] or [],
-            expertise_areas=row['expertise_areas'] or [],
-            document_count=row['document_count'] or 0,
-            created_at=row['created_at']
+        rows = list_witnesses(
+            supabase,
+            limit=limit,
+            after=after,
+            offset=offset,
+            witness_type=witness_type,
+            organization=organization,
+            topic=topic,
+            search=search
         )
+        return [WitnessResponse(**row) for row in rows]
     
-    except HTTPException:
-        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving witness: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
 
 @app.get("/hearings", response_model=List[HearingResponse], summary="Get All Hearings")
+@cache.cached()
 async def get_hearings(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
@@ -301,6 +270,7 @@ async def get_hearings(
         raise HTTPException(status_code=500, detail=f"Error retrieving hearings: {str(e)}")
 
 @app.get("/hearings/{event_id}/witnesses", response_model=List[WitnessResponse], summary="Get Witnesses for Hearing")
+@cache.cached()
 async def get_hearing_witnesses(event_id: str):
     """Get all witnesses who testified at a specific hearing"""
     try:
@@ -342,6 +312,7 @@ async def get_hearing_witnesses(event_id: str):
         raise HTTPException(status_code=500, detail=f"Error retrieving hearing witnesses: {str(e)}")
 
 @app.get("/committees", response_model=List[CommitteeResponse], summary="Get All Committees")
+@cache.cached()
 async def get_committees():
     """Get all committees"""
     try:
@@ -363,6 +334,7 @@ async def get_committees():
         raise HTTPException(status_code=500, detail=f"Error retrieving committees: {str(e)}")
 
 @app.get("/organizations", response_model=List[OrganizationResponse], summary="Get All Organizations")
+@cache.cached()
 async def get_organizations(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0)
@@ -389,6 +361,7 @@ async def get_organizations(
         raise HTTPException(status_code=500, detail=f"Error retrieving organizations: {str(e)}")
 
 @app.get("/topics", response_model=List[TopicResponse], summary="Get All Topics")
+@cache.cached()
 async def get_topics():
     """Get all available topics"""
     try:
@@ -409,6 +382,7 @@ async def get_topics():
         raise HTTPException(status_code=500, detail=f"Error retrieving topics: {str(e)}")
 
 @app.get("/witnesses/{witness_id}/documents", response_model=List[DocumentResponse], summary="Get Witness Documents")
+@cache.cached()
 async def get_witness_documents(witness_id: str):
     """Get all documents for a specific witness"""
     try:
@@ -440,6 +414,7 @@ async def get_witness_documents(witness_id: str):
         raise HTTPException(status_code=500, detail=f"Error retrieving witness documents: {str(e)}")
 
 @app.get("/witnesses/{witness_id}/relationships", response_model=List[RelationshipResponse], summary="Get Witness Relationships")
+@cache.cached()
 async def get_witness_relationships(witness_id: str):
     """Get all relationships for a specific witness"""
     try:
@@ -485,148 +460,167 @@ async def get_witness_relationships(witness_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving witness relationships: {str(e)}")
 
-@app.get("/search", summary="Global Search")
+@app.get("/search", response_model=SearchResponse, summary="Faceted Search")
+@cache.cached()
 async def search_all(
-    q: str = Query(..., description="Search query"),
-    entity_type: Optional[str] = Query(None, description="Filter by entity type: witnesses, hearings, committees, organizations"),
-    limit: int = Query(50, ge=1, le=200)
+    q: Optional[str] = Query(None, description='Search terms: "quoted phrases", or, -excluded; omit to browse newest first'),
+    kind: Optional[Literal['hearing', 'witness']] = Query(None, description="Only hearings or only witness appearances"),
+    committee: Optional[str] = Query(None, description="Committee, as named in the committee facet"),
+    congress: Optional[int] = Query(None, description="Filter by congress"),
+    hearing_type: Optional[str] = Query(None, description="Filter by hearing type"),
+    witness_type: Optional[str] = Query(None, description="Filter by witness type"),
+    year: Optional[int] = Query(None, description="Filter by hearing year"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    facet_limit: int = Query(20, ge=1, le=100, description="Values returned per facet")
 ):
-    """Global search across all entities"""
+    """Ranked hearings and witness appearances, with counts per kind, committee, congress, hearing type, witness type and year"""
     try:
-        results = {
-            "query": q,
-            "results": {}
-        }
-        
-        if not entity_type or entity_type == "witnesses":
-            witnesses = supabase.table('congressional_hearings').select('witnesses,hearing_name,committee') \
-                .or_(f'name.ilike.%{q}%,title.ilike.%{q}%,organization_name.ilike.%{q}%') \
-                .limit(limit).execute()
-            results["results"]["witnesses"] = witnesses.data
-        
-        if not entity_type or entity_type == "hearings":
-            hearings = supabase.table('hearing_details_view').select('event_id,title,committee_name,hearing_date') \
-                .or_(f'title.ilike.%{q}%,committee_name.ilike.%{q}%') \
-                .limit(limit).execute()
-            results["results"]["hearings"] = hearings.data
-        
-        if not entity_type or entity_type == "committees":
-            committees = supabase.table('committees').select('committee_code,name') \
-                .or_(f'name.ilike.%{q}%,committee_code.ilike.%{q}%') \
-                .limit(limit).execute()
-            results["results"]["committees"] = committees.data
-        
-        if not entity_type or entity_type == "organizations":
-            organizations = supabase.table('organizations').select('name,organization_type,location') \
-                .ilike('name', f'%{q}%') \
-                .limit(limit).execute()
-            results["results"]["organizations"] = organizations.data
-        
-        return results
+        # One query against the search index (database/hearing_search.sql) returns hits and facets together
+        return repository.faceted_search(
+            q, limit, offset, facet_limit,
+            kind=kind,
+            committee=committee,
+            congress=congress,
+            hearing_type=hearing_type,
+            witness_type=witness_type,
+            year=year
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error performing search: {str(e)}")
 
 # Congressional Hearings Endpoints
 @app.get("/congressional-hearings", response_model=List[CongressionalHearingResponse], summary="Get Congressional Hearings")
+@cache.cached()
 async def get_congressional_hearings(
     limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Number of hearings to skip (ignored when cursor is set; prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="hearing_date,id of the last hearing on the previous page"),
     committee: Optional[str] = Query(None, description="Filter by committee name"),
     hearing_type: Optional[str] = Query(None, description="Filter by hearing type"),
     start_date: Optional[date] = Query(None, description="Filter hearings after this date"),
     end_date: Optional[date] = Query(None, description="Filter hearings before this date")
 ):
-    """Get congressional hearings with optional filtering and pagination"""
+    """Get congressional hearings with optional filtering, newest first"""
+    if cursor:
+        try:
+            parse_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor; expected hearing_date,id")
+    
     try:
-        query = supabase.table('congressional_hearings').select('*')
-        
-        if committee:
-            query = query.ilike('committee', f'%{committee}%')
-        
-        if hearing_type:
-            query = query.eq('hearing_type', hearing_type)
-        
-        if start_date:
-            query = query.gte('hearing_date', start_date.isoformat())
-        
-        if end_date:
-            query = query.lte('hearing_date', end_date.isoformat())
-        
-        query = query.order('hearing_date', desc=True).range(offset, offset + limit - 1)
-        
-        result = query.execute()
-        
-        return result.data or []
+        if cursor or not offset:
+            # Keyset page on (hearing_date, id): an index range scan at any depth
+            return repository.hearing_page(
+                '*', limit, cursor,
+                committee=committee,
+                hearing_type=hearing_type,
+                start_date=start_date,
+                end_date=end_date
+            )
+        
+        return repository.list_hearings(
+            '*', limit, offset,
+            committee=committee,
+            hearing_type=hearing_type,
+            start_date=start_date,
+            end_date=end_date
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving congressional hearings: {str(e)}")
 
+# Bulk exports stream from the database a page at a time, so memory stays flat
+HEARING_EXPORT_FIELDS = [
+    'id', 'congress', 'hearing_type', 'hearing_subtype', 'committee', 'hearing_date', 'hearing_name',
+    'serial_no', 'detail_url', 'document_url', 'members', 'witnesses', 'bill_numbers',
+    'created_at', 'updated_at'
+]
+WITNESS_EXPORT_FIELDS = [
+    'hearing_id', 'hearing_date', 'hearing_name', 'committee',
+    'name', 'title', 'organization', 'witness_type'
+]
+
+def export_response(rows: Iterator[Dict[str, Any]], format: str, fieldnames: List[str], filename: str) -> StreamingResponse:
+    if format == 'csv':
+        return StreamingResponse(
+            csv_lines(rows, fieldnames),
+            media_type='text/csv',
+            headers={'Content-Disposition': f'attachment; filename="{filename}.csv"'}
+        )
+    return StreamingResponse(
+        ndjson_lines(rows),
+        media_type='application/x-ndjson',
+        headers={'Content-Disposition': f'attachment; filename="{filename}.ndjson"'}
+    )
+
+@app.get("/congressional-hearings/export", summary="Export Congressional Hearings as NDJSON or CSV")
+async def export_congressional_hearings(
+    format: Literal['ndjson', 'csv'] = Query('ndjson', description="ndjson (one hearing per line) or csv"),
+    committee: Optional[str] = Query(None, description="Filter by committee name"),
+    hearing_type: Optional[str] = Query(None, description="Filter by hearing type"),
+    start_date: Optional[date] = Query(None, description="Filter hearings after this date"),
+    end_date: Optional[date] = Query(None, description="Filter hearings before this date")
+):
+    """Stream every matching congressional hearing, newest first"""
+    rows = repository.iter_hearings(
+        ', '.join(HEARING_EXPORT_FIELDS),
+        committee=committee,
+        hearing_type=hearing_type,
+        start_date=start_date,
+        end_date=end_date
+    )
+    return export_response(rows, format, HEARING_EXPORT_FIELDS, 'congressional_hearings')
+
+@app.get("/congressional-hearings/stats", summary="Get Congressional Hearings Statistics")
+@cache.cached()
+async def get_congressional_hearings_stats():
+    """Get statistics for congressional hearings"""
+    try:
+        # Aggregated in the database (hearing_stats() RPC, database/hearing_stats.sql)
+        metrics = repository.hearing_metrics()
+        
+        return {
+            "total_hearings": metrics['hearings'],
+            # Resolved witnesses, the same count as /metrics/witnesses-number
+            "total_witnesses": repository.count_witness_entities(),
+            "total_committees": metrics['committees'],
+            "total_documents": metrics.get('documents', 0),
+            "stale": metrics.get('stale', False)
+        }
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving congressional hearings stats: {str(e)}")
+
 @app.get("/congressional-hearings/{hearing_id}", response_model=CongressionalHearingResponse, summary="Get Congressional Hearing by ID")
+@cache.cached()
 async def get_congressional_hearing(hearing_id: int):
     """Get a specific congressional hearing by ID"""
     try:
-        result = supabase.table('congressional_hearings').select('*').eq('id', hearing_id).execute()
+        hearing = repository.get_hearing(hearing_id)
         
-        if not result.data:
+        if not hearing:
             raise HTTPException(status_code=404, detail="Congressional hearing not found")
         
-        return result.data[0]
+        return hearing
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving congressional hearing: {str(e)}")
 
-@app.get("/congressional-hearings/stats", summary="Get Congressional Hearings Statistics")
-async def get_congressional_hearings_stats():
-    """Get statistics for congressional hearings"""
-    try:
-        # Total hearings count
-        hearings_count = supabase.table('congressional_hearings').select('id', count='exact').execute()
-        
-        # Count unique witnesses across all hearings
-        witnesses_data = supabase.table('congressional_hearings').select('witnesses').execute()
-        all_witnesses = set()
-        for hearing in witnesses_data.data or []:
-            for witness in hearing.get('witnesses', []):
-                if witness.get('name'):
-                    all_witnesses.add(witness['name'])
-        
-        # Count unique committees
-        committees_data = supabase.table('congressional_hearings').select('committee').execute()
-        unique_committees = set(h['committee'] for h in committees_data.data or [])
-        
-        # Count total documents
-        documents_data = supabase.table('congressional_hearings').select('document_url, witnesses').execute()
-        total_documents = 0
-        for hearing in documents_data.data or []:
-            if hearing.get('document_url'):
-                total_documents += 1
-            for witness in hearing.get('witnesses', []):
-                if witness.get('documents'):
-                    total_documents += len(witness['documents'])
-        
-        return {
-            "total_hearings": hearings_count.count or 0,
-            "total_witnesses": len(all_witnesses),
-            "total_committees": len(unique_committees),
-            "total_documents": total_documents
-        }
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving congressional hearings stats: {str(e)}")
-
 @app.get("/congressional-hearings/{hearing_id}/witnesses", summary="Get Witnesses for Congressional Hearing")
+@cache.cached()
 async def get_congressional_hearing_witnesses(hearing_id: int):
     """Get all witnesses for a specific congressional hearing"""
     try:
-        result = supabase.table('congressional_hearings').select('witnesses').eq('id', hearing_id).execute()
+        hearing = repository.get_hearing(hearing_id)
         
-        if not result.data:
+        if not hearing:
             raise HTTPException(status_code=404, detail="Congressional hearing not found")
         
-        return result.data[0].get('witnesses', [])
+        return parse_witnesses(hearing.get('witnesses'))
     
     except HTTPException:
         raise
@@ -634,13 +628,12 @@ async def get_congressional_hearing_witnesses(hearing_id: int):
         raise HTTPException(status_code=500, detail=f"Error retrieving congressional hearing witnesses: {str(e)}")
 
 @app.get("/committees/congressional", summary="Get Committee Statistics from Congressional Hearings")
+@cache.cached()
 async def get_congressional_committee_stats():
     """Get committee statistics from congressional hearings data"""
     try:
-        result = supabase.table('congressional_hearings').select('committee, hearing_type').execute()
-        
         committee_counts = {}
-        for hearing in result.data or []:
+        for hearing in repository.iter_hearings('id, hearing_date, committee'):
             committee = hearing['committee']
             committee_counts[committee] = committee_counts.get(committee, 0) + 1
         
@@ -652,197 +645,188 @@ async def get_congressional_committee_stats():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving committee stats: {str(e)}")
 
+# Witness lists page over the resolved entities (database/witness_entities.py) instead of every hearing
+WITNESS_CURSOR = Query(None, description="last_seen,id of the last witness on the previous page")
+
+def check_witness_cursor(cursor: Optional[str]) -> None:
+    if cursor:
+        try:
+            parse_entity_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor; expected last_seen,id")
+
 @app.get("/witnesses/congressional", summary="Get All Witnesses from Congressional Hearings")
-async def get_congressional_witnesses():
-    """Get all unique witnesses from congressional hearings"""
+@cache.cached()
+async def get_congressional_witnesses(
+    limit: int = Query(1000, ge=1, le=1000),
+    cursor: Optional[str] = WITNESS_CURSOR
+):
+    """Get unique witnesses from congressional hearings, most recently seen first"""
+    check_witness_cursor(cursor)
+    
     try:
-        result = supabase.table('congressional_hearings').select('witnesses, hearing_name, committee, hearing_date').execute()
-        
-        all_witnesses = {}
-        for hearing in result.data or []:
-            for witness in hearing.get('witnesses', []):
-                if witness.get('name'):
-                    witness_name = witness['name']
-                    if witness_name not in all_witnesses:
-                        all_witnesses[witness_name] = {
-                            "name": witness_name,
-                            "title": witness.get('title', ''),
-                            "organization": witness.get('organization', ''),
-                            "hearings": [],
-                            "committees": set(),
-                            "topics": witness.get('topics', [])
-                        }
-                    
-                    all_witnesses[witness_name]["hearings"].append(hearing['hearing_name'])
-                    all_witnesses[witness_name]["committees"].add(hearing['committee'])
-        
-        # Convert sets to lists for JSON serialization
-        for witness in all_witnesses.values():
-            witness["committees"] = list(witness["committees"])
-        
-        return list(all_witnesses.values())
+        return [
+            {**witness_summary(entity), "last_seen": entity.get('last_seen')}
+            for entity in repository.witness_entity_page(limit, cursor)
+        ]
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving congressional witnesses: {str(e)}")
 
 # Simple metrics endpoints for frontend compatibility
 @app.get("/metrics/hearings-number", summary="Get Total Hearings Count")
+@cache.cached()
 async def get_hearings_count():
     """Get total number of hearings (compatible with existing frontend)"""
     try:
-        result = supabase.table('congressional_hearings').select('id', count='exact').execute()
-        return result.count or 0
+        return repository.count_hearings()
     except Exception as e:
-        return 0
+        raise HTTPException(status_code=500, detail=f"Error retrieving hearings count: {str(e)}")
 
 @app.get("/metrics/witnesses-number", summary="Get Total Witnesses Count")
+@cache.cached()
 async def get_witnesses_count():
     """Get total number of unique witnesses (compatible with existing frontend)"""
     try:
-        result = supabase.table('congressional_hearings').select('witnesses').execute()
-        all_witnesses = set()
-        for hearing in result.data or []:
-            for witness in hearing.get('witnesses', []):
-                if witness.get('name'):
-                    all_witnesses.add(witness['name'])
-        return len(all_witnesses)
+        return repository.count_witness_entities()
     except Exception as e:
-        return 0
+        raise HTTPException(status_code=500, detail=f"Error retrieving witnesses count: {str(e)}")
 
 @app.get("/witnesses/all-simple", summary="Get All Witnesses Simple Format")
-async def get_all_witnesses_simple():
-    """Get all witnesses in simple format (follows same pattern as working metrics endpoints)"""
+@cache.cached()
+async def get_all_witnesses_simple(
+    limit: int = Query(1000, ge=1, le=1000),
+    cursor: Optional[str] = WITNESS_CURSOR
+):
+    """Get witnesses in simple format, most recently seen first (follows same pattern as working metrics endpoints)"""
+    check_witness_cursor(cursor)
+    
     try:
-        result = supabase.table('congressional_hearings').select('witnesses, hearing_name, committee').execute()
         witnesses_list = []
-        seen_witnesses = set()
-        
-        for hearing in result.data or []:
-            hearing_name = hearing.get('hearing_name', '')
-            committee = hearing.get('committee', '')
-            
-            for witness in hearing.get('witnesses', []):
-                witness_name = witness.get('name', '').strip()
-                if witness_name and witness_name not in seen_witnesses:
-                    seen_witnesses.add(witness_name)
-                    witnesses_list.append({
-                        'name': witness_name,
-                        'title': witness.get('title', ''),
-                        'organization': witness.get('organization', ''),
-                        'first_seen_hearing': hearing_name,
-                        'first_seen_committee': committee
-                    })
+        for entity in repository.witness_entity_page(limit, cursor):
+            witness = witness_summary(entity)
+            witnesses_list.append({
+                'id': witness['id'],
+                'name': witness['name'],
+                'title': witness['title'],
+                'organization': witness['organization'],
+                'first_seen_hearing': witness['hearings'][0] if witness['hearings'] else '',
+                'first_seen_committee': witness['committees'][0] if witness['committees'] else '',
+                'last_seen': entity.get('last_seen')
+            })
         
         return witnesses_list
     except Exception as e:
-        return []
+        raise HTTPException(status_code=500, detail=f"Error retrieving witnesses: {str(e)}")
+
+def witness_appearances(hearings: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """One row per witness per hearing"""
+    for hearing in hearings:
+        for witness in parse_witnesses(hearing.get('witnesses')):
+            yield {
+                'hearing_id': hearing['id'],
+                'hearing_date': hearing['hearing_date'],
+                'hearing_name': hearing.get('hearing_name'),
+                'committee': hearing.get('committee'),
+                'name': witness.get('name'),
+                'title': witness.get('title'),
+                'organization': witness.get('organization'),
+                'witness_type': witness.get('witness_type')
+            }
+
+@app.get("/witnesses/export", summary="Export Witness Appearances as NDJSON or CSV")
+async def export_witnesses(
+    format: Literal['ndjson', 'csv'] = Query('ndjson', description="ndjson (one appearance per line) or csv"),
+    committee: Optional[str] = Query(None, description="Filter by committee name"),
+    start_date: Optional[date] = Query(None, description="Filter hearings after this date"),
+    end_date: Optional[date] = Query(None, description="Filter hearings before this date")
+):
+    """Stream every witness appearance in congressional hearings, newest hearing first"""
+    hearings = repository.iter_hearings(
+        'id, hearing_date, hearing_name, committee, witnesses',
+        committee=committee,
+        start_date=start_date,
+        end_date=end_date
+    )
+    return export_response(witness_appearances(hearings), format, WITNESS_EXPORT_FIELDS, 'witness_appearances')
+
+# Declared after the fixed /witnesses/... paths so it doesn't shadow them
+@app.get("/witnesses/{witness_id}", response_model=WitnessResponse, summary="Get Witness by ID")
+@cache.cached()
+async def get_witness(witness_id: str):
+    """Get a specific witness by their ID"""
+    try:
+        row = get_witness_record(supabase, witness_id)
+        
+        if not row:
+            raise HTTPException(status_code=404, detail="Witness not found")
+        
+        return WitnessResponse(**row)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving witness: {str(e)}")
+
+def infer_topics(committees: List[str]) -> List[str]:
+    """Topics guessed from committee names, for witnesses without explicit topics"""
+    inferred_topics = []
+    for committee in committees:
+        committee_lower = committee.lower()
+        if any(keyword in committee_lower for keyword in ['judiciary', 'justice', 'legal']):
+            inferred_topics.append('Legal Affairs')
+        elif any(keyword in committee_lower for keyword in ['energy', 'commerce', 'trade']):
+            inferred_topics.append('Energy & Commerce')
+        elif any(keyword in committee_lower for keyword in ['homeland', 'security', 'defense']):
+            inferred_topics.append('Security')
+        elif any(keyword in committee_lower for keyword in ['education', 'labor']):
+            inferred_topics.append('Education')
+        elif any(keyword in committee_lower for keyword in ['health', 'medical']):
+            inferred_topics.append('Healthcare')
+        elif any(keyword in committee_lower for keyword in ['technology', 'science', 'innovation']):
+            inferred_topics.append('Technology')
+        elif any(keyword in committee_lower for keyword in ['finance', 'banking', 'economic']):
+            inferred_topics.append('Finance')
+        elif any(keyword in committee_lower for keyword in ['environment', 'climate']):
+            inferred_topics.append('Environment')
+        else:
+            inferred_topics.append('Policy')
+    return sorted(set(inferred_topics))
 
 @app.get("/api/witnesses/all", summary="Get All Real Witnesses from Database")
-async def get_all_witnesses():
-    """Get all unique witnesses with their details from congressional hearings"""
+@cache.cached()
+async def get_all_witnesses(
+    limit: int = Query(1000, ge=1, le=1000),
+    cursor: Optional[str] = WITNESS_CURSOR
+):
+    """Get unique witnesses with their details from congressional hearings, most recently seen first.
+
+    next_cursor is set while more witnesses follow; pass it as cursor for the next page.
+    """
+    check_witness_cursor(cursor)
+    
     try:
-        # Fetch all congressional hearings with witnesses data
-        result = supabase.table('congressional_hearings').select('witnesses, hearing_name, committee, hearing_date').execute()
-        
-        # Dictionary to collect unique witnesses with aggregated data
-        witnesses_map = {}
-        
-        for hearing in result.data or []:
-            hearing_name = hearing.get('hearing_name', '')
-            committee = hearing.get('committee', '')
-            hearing_date = hearing.get('hearing_date', '')
-            
-            for witness in hearing.get('witnesses', []):
-                if not witness.get('name'):
-                    continue
-                    
-                witness_name = witness['name'].strip()
-                
-                if witness_name not in witnesses_map:
-                    witnesses_map[witness_name] = {
-                        'name': witness_name,
-                        'title': witness.get('title', '').strip(),
-                        'organization': witness.get('organization', '').strip(),
-                        'topics': [],
-                        'hearings': [],
-                        'committees': set(),
-                        'hearing_dates': []
-                    }
-                
-                # Aggregate data for this witness
-                witness_data = witnesses_map[witness_name]
-                
-                # Add hearing info
-                if hearing_name:
-                    witness_data['hearings'].append(hearing_name)
-                    
-                # Add committee
-                if committee:
-                    witness_data['committees'].add(committee)
-                    
-                # Add hearing date
-                if hearing_date:
-                    witness_data['hearing_dates'].append(hearing_date)
-                
-                # Extract topics from witness data if available
-                if witness.get('topics'):
-                    if isinstance(witness['topics'], list):
-                        witness_data['topics'].extend(witness['topics'])
-                    elif isinstance(witness['topics'], str):
-                        witness_data['topics'].append(witness['topics'])
-        
-        # Convert to final format and clean up data
-        witnesses_list = []
-        for witness_name, data in witnesses_map.items():
-            # Convert sets to lists and deduplicate
-            committees_list = list(data['committees'])
-            topics_list = list(set(data['topics'])) if data['topics'] else []
-            
-            # Infer topics from committee names if no explicit topics
-            if not topics_list and committees_list:
-                inferred_topics = []
-                for committee in committees_list:
-                    committee_lower = committee.lower()
-                    if any(keyword in committee_lower for keyword in ['judiciary', 'justice', 'legal']):
-                        inferred_topics.append('Legal Affairs')
-                    elif any(keyword in committee_lower for keyword in ['energy', 'commerce', 'trade']):
-                        inferred_topics.append('Energy & Commerce')
-                    elif any(keyword in committee_lower for keyword in ['homeland', 'security', 'defense']):
-                        inferred_topics.append('Security')
-                    elif any(keyword in committee_lower for keyword in ['education', 'labor']):
-                        inferred_topics.append('Education')
-                    elif any(keyword in committee_lower for keyword in ['health', 'medical']):
-                        inferred_topics.append('Healthcare')
-                    elif any(keyword in committee_lower for keyword in ['technology', 'science', 'innovation']):
-                        inferred_topics.append('Technology')
-                    elif any(keyword in committee_lower for keyword in ['finance', 'banking', 'economic']):
-                        inferred_topics.append('Finance')
-                    elif any(keyword in committee_lower for keyword in ['environment', 'climate']):
-                        inferred_topics.append('Environment')
-                    else:
-                        inferred_topics.append('Policy')
-                        
-                topics_list = list(set(inferred_topics))
-            
-            witness_record = {
-                'name': data['name'],
-                'title': data['title'],
-                'organization': data['organization'],
-                'topics': topics_list,
-                'hearings': data['hearings'],
-                'committees': committees_list,
-                'hearing_count': len(data['hearings']),
-                'most_recent_hearing': max(data['hearing_dates']) if data['hearing_dates'] else None
-            }
-            
-            witnesses_list.append(witness_record)
+        entities = repository.witness_entity_page(limit, cursor)
         
-        # Sort by number of hearings (most active witnesses first)
-        witnesses_list.sort(key=lambda x: x['hearing_count'], reverse=True)
+        witnesses_list = []
+        for entity in entities:
+            witness = witness_summary(entity)
+            witnesses_list.append({
+                'id': witness['id'],
+                'name': witness['name'],
+                'title': witness['title'],
+                'organization': witness['organization'],
+                'topics': infer_topics(witness['committees']),
+                'hearings': witness['hearings'],
+                'committees': witness['committees'],
+                'hearing_count': witness['hearing_count'],
+                'most_recent_hearing': entity.get('last_seen')
+            })
         
         return {
-            'total_witnesses': len(witnesses_list),
-            'witnesses': witnesses_list
+            'total_witnesses': repository.count_witness_entities(),
+            'witnesses': witnesses_list,
+            'next_cursor': entity_cursor(entities[-1]) if len(entities) == limit else None
         }
         
     except Exception as e:
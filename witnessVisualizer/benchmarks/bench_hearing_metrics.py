@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Latency of the /metrics endpoints' database work on a local Postgres.
+
+    pip install "psycopg[binary]"
+    createdb witness_bench
+    WITNESS_BENCH_DSN=postgresql://localhost/witness_bench python benchmarks/bench_hearing_metrics.py
+    python benchmarks/bench_hearing_metrics.py --hearings 20000 --repeat 20
+
+The DSN must point at a scratch database: congressional_hearings and
+hearing_metrics are dropped and recreated there. "scan" is what each of the
+four witness/organization endpoints used to do per request: page through
+congressional_hearings 1,000 rows at a time, decode every witnesses blob and
+deduplicate names in Python. "summary_row" is the read the endpoints do now,
+and "refresh" is recomputing every metric in one pass with
+refresh_hearing_metrics(). Postgres runs locally here, so these figures leave
+out the network round trips to Supabase that the old scans multiplied.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+try:
+    import psycopg
+except ImportError:
+    sys.exit('This benchmark needs psycopg: pip install "psycopg[binary]"')
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCHEMA = """
+-- Supabase's API roles, which the database/*.sql files revoke function access from
+DO $$ BEGIN
+    CREATE ROLE anon NOLOGIN;
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+DO $$ BEGIN
+    CREATE ROLE authenticated NOLOGIN;
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+DROP TABLE IF EXISTS congressional_hearings CASCADE;
+DROP TABLE IF EXISTS hearing_metrics CASCADE;
+CREATE TABLE congressional_hearings (
+    id BIGSERIAL PRIMARY KEY,
+    congress INTEGER NOT NULL,
+    hearing_type TEXT NOT NULL,
+    hearing_subtype TEXT,
+    committee TEXT NOT NULL,
+    hearing_date DATE NOT NULL,
+    hearing_name TEXT NOT NULL,
+    serial_no TEXT,
+    detail_url TEXT NOT NULL UNIQUE,
+    document_url TEXT,
+    members JSONB DEFAULT '[]'::jsonb,
+    witnesses JSONB DEFAULT '[]'::jsonb,
+    bill_numbers TEXT[] DEFAULT '{}',
+    created_at TIMESTAMPTZ DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+"""
+
+COMMITTEES = [f"Committee on Subject {i}" for i in range(40)]
+ORGANIZATIONS = [f"Organization {i}" for i in range(3000)]
+
+
+def synth_hearings(conn, n: int, rng: random.Random) -> None:
+    people = [f"Witness {i}" for i in range(n * 2)]
+    rows = []
+    for i in range(n):
+        witnesses = [
+            {
+                "name": rng.choice(people),
+                "title": "Director",
+                "organization": rng.choice(ORGANIZATIONS),
+            }
+            for _ in range(rng.randint(2, 8))
+        ]
+        rows.append((
+            rng.choice([116, 117, 118]),
+            rng.choice(["house", "senate", "joint"]),
+            rng.choice(COMMITTEES),
+            f"20{rng.randint(19, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            f"Hearing {i}",
+            f"https://api.congress.gov/v3/hearing/118/house/{i}",
+            json.dumps(witnesses),
+        ))
+    with conn.cursor() as cur:
+        cur.executemany(
+            """INSERT INTO congressional_hearings
+               (congress, hearing_type, committee, hearing_date, hearing_name, detail_url, witnesses)
+               VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb)""",
+            rows,
+        )
+
+
+def legacy_scan(conn, field: str) -> int:
+    """The old per-request work of /metrics/{witnesses,organizations}-{count,number}"""
+    unique = set()
+    page_size, offset = 1000, 0
+    while True:
+        rows = conn.execute(
+            "SELECT witnesses::text FROM congressional_hearings ORDER BY id LIMIT %s OFFSET %s",
+            (page_size, offset),
+        ).fetchall()
+        for (witnesses,) in rows:
+            for witness in json.loads(witnesses or "[]"):
+                if isinstance(witness, dict) and witness.get(field):
+                    unique.add(witness[field].lower().strip())
+        if len(rows) < page_size:
+            return len(unique)
+        offset += page_size
+
+
+def summary_row(conn) -> dict:
+    return conn.execute(
+        "SELECT metrics, stale FROM hearing_metrics WHERE id = 'congressional_hearings'"
+    ).fetchone()[0]
+
+
+def timed_ms(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"p50": round(statistics.median(samples), 2), "max": round(max(samples), 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("WITNESS_BENCH_DSN", "postgresql://localhost/witness_bench"))
+    parser.add_argument("--hearings", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        conn.execute(SCHEMA)
+        synth_hearings(conn, args.hearings, rng)
+        conn.execute((ROOT / "database" / "hearing_metrics.sql").read_text())
+        conn.execute("ANALYZE congressional_hearings")
+
+        metrics = summary_row(conn)
+        assert metrics["unique_organizations"] == legacy_scan(conn, "organization")
+
+        scan = timed_ms(lambda: legacy_scan(conn, "organization"), args.repeat)
+        results = {
+            "hearings": args.hearings,
+            "witness_appearances": metrics["witness_appearances"],
+            "per_endpoint_ms": {
+                "scan": scan,
+                "summary_row": timed_ms(lambda: summary_row(conn), args.repeat * 10),
+            },
+            # A dashboard load hits all four witness/organization endpoints
+            "four_endpoints_ms": {
+                "scan": round(scan["p50"] * 4, 1),
+                "summary_row": timed_ms(lambda: [summary_row(conn) for _ in range(4)], args.repeat)["p50"],
+            },
+            "refresh_ms": timed_ms(lambda: conn.execute("SELECT refresh_hearing_metrics()"), args.repeat),
+        }
+        # Cost the stale-marking trigger adds to an ingest batch
+        start = time.perf_counter()
+        conn.execute(
+            """INSERT INTO congressional_hearings
+               (congress, hearing_type, committee, hearing_date, hearing_name, detail_url)
+               SELECT 118, 'house', 'Committee on Subject 1', '2024-01-01', 'Batch ' || g,
+                      'https://example.test/batch/' || g
+               FROM generate_series(1, 50) AS g"""
+        )
+        results["insert_50_with_trigger_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        assert conn.execute("SELECT stale FROM hearing_metrics").fetchone()[0]
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Latency of faceted_search() (database/hearing_search.sql) on a local Postgres,
+and what keeping its index current costs writes.
+
+    pip install "psycopg[binary]"
+    createdb witness_bench
+    WITNESS_BENCH_DSN=postgresql://localhost/witness_bench python benchmarks/bench_hearing_search.py
+    python benchmarks/bench_hearing_search.py --hearings 20000 --repeat 500
+
+The DSN must point at a scratch database: congressional_hearings and the
+search tables are dropped and recreated there. Hearing names are drawn from
+a small vocabulary so that queries match a realistic share of the archive.
+Each search is one faceted_search() call returning hits, total and facet
+counts, checked against the 50 ms budget. Writes are timed with the triggers
+on and, in a rolled-back transaction, off (session_replication_role, so the
+role needs superuser). Afterwards the index and the precomputed facet counts
+are compared with a rebuild from scratch.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+try:
+    import psycopg
+except ImportError:
+    sys.exit('This benchmark needs psycopg: pip install "psycopg[binary]"')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_hearing_metrics import SCHEMA, synth_hearings  # noqa: E402
+from bench_hearing_stats import timed_ms, timed_write  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+
+BUDGET_MS = 50
+
+TOPICS = ["energy", "climate", "veterans", "health care", "cybersecurity", "agriculture", "trade",
+          "immigration", "banking", "transportation", "education", "housing", "water", "defense",
+          "artificial intelligence", "small business", "broadband", "opioids", "wildfires", "tribal"]
+FIRST_NAMES = ["John", "Mary", "Robert", "Patricia", "James", "Linda", "Michael", "Barbara",
+               "William", "Elizabeth", "David", "Jennifer", "Richard", "Maria", "Joseph", "Susan"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+              "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White", "Harris"]
+
+# Words from the hearing names and witness names above replace the
+# placeholder ones bench_hearing_metrics generates
+ENRICH = """
+UPDATE congressional_hearings AS h SET
+    hearing_name = 'Examining ' || (%(topics)s::text[])[1 + h.id %% 20] || ' and '
+                   || (%(topics)s::text[])[1 + (h.id / 20) %% 20] || ' oversight',
+    witnesses = (
+        SELECT jsonb_agg(e.w || jsonb_build_object(
+                   'name', (%(first)s::text[])[1 + (h.id * 7 + e.n) %% 16] || ' '
+                           || (%(last)s::text[])[1 + (h.id * 13 + e.n * 3) %% 25],
+                   'witness_type', (ARRAY['government', 'academic', 'industry', 'nonprofit'])[1 + (h.id + e.n) %% 4])
+                   ORDER BY e.n)
+        FROM jsonb_array_elements(h.witnesses) WITH ORDINALITY AS e(w, n)
+    )
+"""
+
+SEARCHES = {
+    "browse": {},
+    "browse_committee": {"committee": "Committee on Subject 7"},
+    "word": {"q": "cybersecurity"},
+    "two_words": {"q": "climate oversight"},
+    "witness_name": {"q": "Maria Garcia", "kind": "witness"},
+    "phrase_filtered": {"q": '"health care" -veterans', "congress": 118, "hearing_type": "senate"},
+    "rare_page_3": {"q": "wildfires tribal", "result_offset": 40},
+}
+
+WRITES = {
+    "insert_50": """INSERT INTO congressional_hearings
+        (congress, hearing_type, committee, hearing_date, hearing_name, detail_url, witnesses)
+        SELECT 118, 'house', 'Committee on Subject ' || (g % 40), '2025-01-02', 'Wildfire recovery ' || g,
+               'https://example.test/search50/' || g,
+               jsonb_build_array(jsonb_build_object('name', 'New Witness ' || g, 'organization', 'Organization 1',
+                                                    'witness_type', 'government'))
+        FROM generate_series(1, 50) AS g""",
+    "update_100_witnesses": """UPDATE congressional_hearings
+        SET witnesses = jsonb_build_array(jsonb_build_object('name', 'Replacement ' || id, 'title', 'Chief'))
+        WHERE id IN (SELECT id FROM congressional_hearings ORDER BY id LIMIT 100)""",
+    "update_100_unindexed": """UPDATE congressional_hearings SET updated_at = now()
+        WHERE id IN (SELECT id FROM congressional_hearings ORDER BY id DESC LIMIT 100)""",
+    "delete_100": """DELETE FROM congressional_hearings
+        WHERE id IN (SELECT id FROM congressional_hearings ORDER BY id LIMIT 100 OFFSET 100)""",
+}
+
+
+def faceted_search(conn, **params) -> dict:
+    names = ", ".join(f"{name} => %({name})s" for name in params)
+    return conn.execute(f"SELECT faceted_search({names})", params).fetchone()[0]
+
+
+def check_counts(conn) -> None:
+    """Trigger-maintained index and facet counts equal a rebuild"""
+    documents = conn.execute(
+        "SELECT count(*), sum(length(document)) FROM search_documents").fetchone()
+    rebuilt = conn.execute(
+        "SELECT count(*), sum(length(d.document)) FROM congressional_hearings AS h, hearing_search_documents(h) AS d"
+    ).fetchone()
+    assert documents == rebuilt, (documents, rebuilt)
+    counts = conn.execute(
+        "SELECT facet, value, documents FROM search_facet_counts WHERE documents <> 0 ORDER BY 1, 2").fetchall()
+    recount = conn.execute(
+        """SELECT f.facet, f.value, count(*) FROM search_documents AS d,
+                  search_facet_values(d.kind, d.committee, d.congress, d.hearing_type, d.witness_type, d.year) AS f
+           GROUP BY 1, 2 ORDER BY 1, 2""").fetchall()
+    assert counts == recount
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("WITNESS_BENCH_DSN", "postgresql://localhost/witness_bench"))
+    parser.add_argument("--hearings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        conn.execute(SCHEMA + "DROP TABLE IF EXISTS search_documents, search_facet_counts CASCADE;")
+        synth_hearings(conn, args.hearings, random.Random(7))
+        conn.execute(ENRICH, {"topics": TOPICS, "first": FIRST_NAMES, "last": LAST_NAMES})
+        conn.execute((ROOT / "database" / "hearing_metrics.sql").read_text())
+        start = time.perf_counter()
+        conn.execute((ROOT / "database" / "hearing_search.sql").read_text())
+        backfill_ms = round((time.perf_counter() - start) * 1000, 1)
+        check_counts(conn)
+
+        # A filtered search agrees with counting the matches directly
+        result = faceted_search(conn, q="climate", committee="Committee on Subject 3")
+        direct = conn.execute(
+            """SELECT count(*) FROM search_documents
+               WHERE document @@ websearch_to_tsquery('english', 'climate')
+                 AND committee = 'Committee on Subject 3'""").fetchone()[0]
+        assert result["total"] == direct > 0
+        assert sum(f["count"] for f in result["facets"]["kind"]) == direct
+        assert result["facets"]["committee"] == [{"value": "Committee on Subject 3", "count": direct}]
+        scores = [hit["score"] for hit in result["hits"]]
+        assert scores == sorted(scores, reverse=True)
+
+        results = {
+            "hearings": args.hearings,
+            "documents": conn.execute("SELECT count(*) FROM search_documents").fetchone()[0],
+            "search_sql_backfill_ms": backfill_ms,
+            "search_ms": {},
+            "writes": {},
+        }
+        for name, params in SEARCHES.items():
+            results["search_ms"][name] = {
+                "total": faceted_search(conn, **params)["total"],
+                **timed_ms(lambda: faceted_search(conn, **params), args.repeat),
+            }
+        slowest = max(r["p99"] for r in results["search_ms"].values())
+        results["within_budget"] = (f"slowest p99 {slowest} ms vs {BUDGET_MS} ms: "
+                                    f"{'ok' if slowest < BUDGET_MS else 'OVER'}")
+
+        results["writes"] = {name: timed_write(conn, sql) for name, sql in WRITES.items()}
+        check_counts(conn)
+        assert faceted_search(conn, q="wildfire recovery")["total"] >= 50
+        conn.execute("TRUNCATE congressional_hearings CASCADE")
+        assert faceted_search(conn)["total"] == 0
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
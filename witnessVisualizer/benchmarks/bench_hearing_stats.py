@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Latency of the /stats aggregates on a local Postgres, and what keeping them
+current costs writes.
+
+    pip install "psycopg[binary]"
+    createdb witness_bench
+    WITNESS_BENCH_DSN=postgresql://localhost/witness_bench python benchmarks/bench_hearing_stats.py
+    python benchmarks/bench_hearing_stats.py --hearings 20000 --repeat 500
+
+The DSN must point at a scratch database: congressional_hearings and the
+hearing_metrics / hearing_stats_* tables are dropped and recreated there.
+"python_scan" is what GET /stats used to do: select * from
+congressional_hearings and aggregate in Python. "refresh" is
+refresh_hearing_metrics(), which the first read after every write used to pay.
+"hearing_stats" is the RPC the endpoints call now, checked against the 50 ms
+budget. Each write is timed with the triggers on and, in a rolled-back
+transaction, with them off (session_replication_role, so the role needs
+superuser). After the writes, hearing_stats() is compared with a full
+recompute.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import random
+import sys
+import time
+from pathlib import Path
+
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+except ImportError:
+    sys.exit('This benchmark needs psycopg: pip install "psycopg[binary]"')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_hearing_metrics import SCHEMA, synth_hearings  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from database.hearing_metrics import compute_hearing_metrics  # noqa: E402
+
+BUDGET_MS = 50
+
+WRITES = {
+    "insert_50": """INSERT INTO congressional_hearings
+        (congress, hearing_type, committee, hearing_date, hearing_name, detail_url, document_url, witnesses)
+        SELECT 118, 'house', 'Committee on Subject ' || (g % 40), '2025-01-02', 'Batch ' || g,
+               'https://example.test/batch50/' || g, 'https://example.test/doc/' || g,
+               jsonb_build_array(jsonb_build_object('name', 'New Witness ' || g, 'organization', 'Organization 1',
+                                                    'documents', jsonb_build_array('a', 'b')))
+        FROM generate_series(1, 50) AS g""",
+    "insert_1000": """INSERT INTO congressional_hearings
+        (congress, hearing_type, committee, hearing_date, hearing_name, detail_url, witnesses)
+        SELECT 118, 'senate', 'Committee on Subject 99', '2018-06-01', 'Bulk ' || g,
+               'https://example.test/batch1000/' || g,
+               jsonb_build_array(jsonb_build_object('name', 'Witness ' || g, 'organization', 'Brand New Org ' || g))
+        FROM generate_series(1, 1000) AS g""",
+    "update_100_witnesses": """UPDATE congressional_hearings
+        SET witnesses = jsonb_build_array(jsonb_build_object('name', 'Replacement ' || id, 'title', 'Chief'))
+        WHERE id IN (SELECT id FROM congressional_hearings ORDER BY id LIMIT 100)""",
+    "delete_100": """DELETE FROM congressional_hearings
+        WHERE id IN (SELECT id FROM congressional_hearings ORDER BY id DESC LIMIT 100)""",
+}
+
+
+def python_scan(conn) -> dict:
+    """The old GET /stats: every column of every hearing, aggregated in Python"""
+    with conn.cursor(row_factory=dict_row) as cur:
+        rows = cur.execute("SELECT * FROM congressional_hearings").fetchall()
+    for row in rows:
+        row["hearing_date"] = row["hearing_date"].isoformat()
+    return compute_hearing_metrics(rows)
+
+
+def hearing_stats(conn) -> dict:
+    return conn.execute("SELECT hearing_stats()").fetchone()[0]
+
+
+def timed_ms(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50": round(statistics.median(samples), 2),
+        "p95": round(samples[max(0, int(len(samples) * 0.95) - 1)], 2),
+        "p99": round(samples[max(0, int(len(samples) * 0.99) - 1)], 2),
+        "max": round(samples[-1], 2),
+    }
+
+
+def timed_write(conn, sql: str) -> dict:
+    with conn.transaction(force_rollback=True):
+        conn.execute("SET LOCAL session_replication_role = replica")
+        start = time.perf_counter()
+        conn.execute(sql)
+        without = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    conn.execute(sql)
+    return {"triggers_off_ms": round(without, 2), "with_stats_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("WITNESS_BENCH_DSN", "postgresql://localhost/witness_bench"))
+    parser.add_argument("--hearings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        conn.execute(SCHEMA + "DROP TABLE IF EXISTS hearing_stats_totals, hearing_stats_committees, "
+                              "hearing_stats_types, hearing_stats_names CASCADE;")
+        synth_hearings(conn, args.hearings, rng)
+        conn.execute((ROOT / "database" / "hearing_metrics.sql").read_text())
+        start = time.perf_counter()
+        conn.execute((ROOT / "database" / "hearing_stats.sql").read_text())
+        backfill_ms = round((time.perf_counter() - start) * 1000, 1)
+        conn.execute("ANALYZE congressional_hearings")
+
+        full = conn.execute("SELECT refresh_hearing_metrics()").fetchone()[0]
+        assert hearing_stats(conn) == full
+
+        results = {
+            "hearings": args.hearings,
+            "witness_appearances": full["witness_appearances"],
+            "hearing_stats_sql_backfill_ms": backfill_ms,
+            "read_ms": {
+                "python_scan": timed_ms(lambda: python_scan(conn), 3),
+                "refresh": timed_ms(lambda: conn.execute("SELECT refresh_hearing_metrics()"), 5),
+                "hearing_stats": timed_ms(lambda: hearing_stats(conn), args.repeat),
+            },
+            "writes": {name: timed_write(conn, sql) for name, sql in WRITES.items()},
+        }
+        p99 = results["read_ms"]["hearing_stats"]["p99"]
+        results["hearing_stats_within_budget"] = f"p99 {p99} ms vs {BUDGET_MS} ms: {'ok' if p99 < BUDGET_MS else 'OVER'}"
+
+        # Triggers kept every counter exact through inserts, updates and deletes
+        assert hearing_stats(conn) == conn.execute("SELECT refresh_hearing_metrics()").fetchone()[0]
+        conn.execute("TRUNCATE congressional_hearings CASCADE")
+        assert hearing_stats(conn)["hearings"] == 0
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Latency of GET /witnesses searches on a local Postgres, before and after the
+hearing_witnesses index.
+
+    pip install "psycopg[binary]"
+    createdb witness_bench
+    WITNESS_BENCH_DSN=postgresql://localhost/witness_bench python benchmarks/bench_witness_search.py
+    python benchmarks/bench_witness_search.py --hearings 20000 --repeat 50
+
+The DSN must point at a scratch database: congressional_hearings,
+hearing_metrics and hearing_witnesses are dropped and recreated there.
+"json_scan" is what search_witnesses used to do per request: fetch every
+hearing (newest first), decode each witnesses blob and substring-match in
+Python until the page is full. "indexed" is the one query
+database/hearing_witnesses.py now sends through PostgREST. Trigram indexes are
+only built when the server has pg_trgm; the output says which was measured and
+lists the indexes each search's plan reads (EXPLAIN). With pg_trgm, the
+selective term searches must go through hearing_witnesses_search_trgm_idx.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+try:
+    import psycopg
+except ImportError:
+    sys.exit('This benchmark needs psycopg: pip install "psycopg[binary]"')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_hearing_metrics import SCHEMA, synth_hearings  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from database.hearing_witnesses import like_pattern  # noqa: E402
+
+# name: (query, committee, offset); limit is always 50
+SEARCHES = {
+    "common_term": ("organization 1", None, 0),
+    "rare_term": ("witness 4242", None, 0),
+    "no_match": ("zzz", None, 0),
+    "committee_only": (None, "subject 7", 0),
+    "term_and_committee_page_3": ("director", "subject 3", 100),
+}
+LIMIT = 50
+# Searches too selective for the date-ordered scan to fill a page early
+TRGM_SEARCHES = ("rare_term", "no_match")
+
+
+def json_scan(conn, query, committee, offset):
+    sql = "SELECT id, hearing_name, committee, hearing_date, witnesses::text FROM congressional_hearings"
+    params = []
+    if committee:
+        sql += " WHERE committee ILIKE %s"
+        params.append(like_pattern(committee))
+    rows = conn.execute(sql + " ORDER BY hearing_date DESC, id DESC", params).fetchall()
+
+    witnesses = []
+    for hearing_id, hearing_name, hearing_committee, hearing_date, blob in rows:
+        for witness in json.loads(blob or "[]"):
+            if query:
+                searchable_text = " ".join(
+                    witness.get(k, "") for k in ("name", "title", "organization")
+                ).lower()
+                if query.lower() not in searchable_text:
+                    continue
+            witnesses.append({**witness, "hearing_id": hearing_id, "hearing_name": hearing_name,
+                              "committee": hearing_committee, "hearing_date": hearing_date})
+            if len(witnesses) >= offset + LIMIT:
+                return witnesses[offset:]
+    return witnesses[offset:]
+
+
+def indexed_sql(query, committee, offset):
+    # Literal filters, like PostgREST builds them, so the planner sees the patterns
+    filters = ["TRUE"]
+    params = []
+    if query:
+        filters.append("search_text ILIKE %s")
+        params.append(like_pattern(query.lower()))
+    if committee:
+        filters.append("committee ILIKE %s")
+        params.append(like_pattern(committee))
+    sql = f"""SELECT hearing_id, hearing_name, committee, hearing_date, witness
+              FROM hearing_witnesses WHERE {' AND '.join(filters)}
+              ORDER BY hearing_date DESC, hearing_id DESC, position
+              LIMIT %s OFFSET %s"""
+    return sql, params + [LIMIT, offset]
+
+
+def indexed(conn, query, committee, offset):
+    return conn.execute(*indexed_sql(query, committee, offset)).fetchall()
+
+
+def plan_indexes(conn, query, committee, offset):
+    """Names of the indexes the plan for one search reads"""
+    sql, params = indexed_sql(query, committee, offset)
+    plan = conn.execute("EXPLAIN (FORMAT JSON) " + sql, params).fetchone()[0][0]["Plan"]
+    names, nodes = [], [plan]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node and node["Index Name"] not in names:
+            names.append(node["Index Name"])
+        nodes += node.get("Plans", [])
+    return names
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {
+        "p50": round(statistics.median(samples), 2),
+        "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+    }
+
+
+def measure(fn, conn, repeat):
+    per_search, everything = {}, []
+    for name, (query, committee, offset) in SEARCHES.items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(conn, query, committee, offset)
+            samples.append((time.perf_counter() - start) * 1000)
+        per_search[name] = percentiles(samples)
+        everything += samples
+    return {"all": percentiles(everything), **per_search}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("WITNESS_BENCH_DSN", "postgresql://localhost/witness_bench"))
+    parser.add_argument("--hearings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scan-repeat", type=int, default=3, help="repeats for the slow json_scan baseline")
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        conn.execute(SCHEMA)
+        synth_hearings(conn, args.hearings, rng)
+        conn.execute((ROOT / "database" / "hearing_metrics.sql").read_text())
+        start = time.perf_counter()
+        conn.execute((ROOT / "database" / "hearing_witnesses.sql").read_text())
+        migration_s = time.perf_counter() - start
+
+        # Both paths must return the same page
+        for query, committee, offset in SEARCHES.values():
+            expected = [(w["hearing_id"], w["name"]) for w in json_scan(conn, query, committee, offset)]
+            got = [(row[0], row[4]["name"]) for row in indexed(conn, query, committee, offset)]
+            assert sorted(expected) == sorted(got), (query, committee)
+
+        trgm = conn.execute("SELECT count(*) FROM pg_extension WHERE extname = 'pg_trgm'").fetchone()[0] == 1
+        conn.execute("ANALYZE hearing_witnesses")
+        plans = {name: plan_indexes(conn, *search) for name, search in SEARCHES.items()}
+        if trgm:
+            for name in TRGM_SEARCHES:
+                assert "hearing_witnesses_search_trgm_idx" in plans[name], (name, plans[name])
+        results = {
+            "hearings": args.hearings,
+            "witness_rows": conn.execute("SELECT count(*) FROM hearing_witnesses").fetchone()[0],
+            "pg_trgm": trgm,
+            "migration_backfill_s": round(migration_s, 1),
+            "indexed_plan_indexes": plans,
+            "json_scan_ms": measure(json_scan, conn, args.scan_repeat),
+            "indexed_ms": measure(indexed, conn, args.repeat),
+        }
+        # Per-row cost the sync trigger adds to an ingest batch
+        start = time.perf_counter()
+        conn.execute(
+            """INSERT INTO congressional_hearings
+               (congress, hearing_type, committee, hearing_date, hearing_name, detail_url, witnesses)
+               SELECT 118, 'house', 'Committee on Subject 1', '2024-01-01', 'Batch ' || g,
+                      'https://example.test/batch/' || g,
+                      '[{"name": "New Witness", "organization": "New Org"}]'::jsonb
+               FROM generate_series(1, 50) AS g"""
+        )
+        results["insert_50_with_sync_trigger_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Load test for the hearing/witness APIs on a synthetic local dataset.
+
+    pip install httpx
+    python benchmarks/load_test.py                              # both APIs, in process
+    python benchmarks/load_test.py --hearings 50000 --witnesses 6 --concurrency 32
+    python benchmarks/load_test.py --baseline benchmarks/results/<earlier run>.json
+
+Generates N hearings with M witnesses each (seeded, so every run sees the same
+data), builds the SQLite backend from them with database/local_db.py and runs
+the list / search / detail / stats / metrics scenarios of
+scrapers/congressional_api.py and api/production/witness_api.py, one endpoint
+at a time. Throughput and p50/p95/p99 latency per endpoint go to
+benchmarks/results/<commit>-<timestamp>.json; with --baseline the run is
+compared against an earlier results file.
+
+The apps are driven in process through httpx's ASGI transport, so the numbers
+cover routing, validation, serialization and the database, not the network.
+To measure a real server instead, build the dataset with --generate-only,
+start uvicorn with the printed environment and pass --url with --apps.
+
+The response cache is off (WITNESS_CACHE_TTL=0) unless --cache-ttl is given,
+so every request reaches the database.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+try:
+    import httpx
+except ImportError:
+    sys.exit("This benchmark needs httpx: pip install httpx")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+COMMITTEES = [f"Committee on Subject {i}" for i in range(40)]
+ORGANIZATIONS = [f"Organization {i}" for i in range(3000)]
+WITNESS_TYPES = ["government", "academic", "industry", "nonprofit"]
+
+
+def synth_hearings(path: Path, hearings: int, witnesses: int, rng: random.Random) -> None:
+    """NDJSON of congressional_hearings rows, as GET /congressional-hearings/export writes it"""
+    people = [f"Witness {i}" for i in range(max(1, hearings * witnesses // 3))]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(1, hearings + 1):
+            row = {
+                "id": i,
+                "congress": rng.choice([116, 117, 118]),
+                "hearing_type": rng.choice(["house", "senate", "joint"]),
+                "committee": rng.choice(COMMITTEES),
+                "hearing_date": f"20{rng.randint(19, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "hearing_name": f"Hearing {i}",
+                "detail_url": f"https://api.congress.gov/v3/hearing/118/house/{i}",
+                "witnesses": [
+                    {
+                        "name": rng.choice(people),
+                        "title": "Director",
+                        "organization": rng.choice(ORGANIZATIONS),
+                        "witness_type": rng.choice(WITNESS_TYPES),
+                    }
+                    for _ in range(witnesses)
+                ],
+            }
+            f.write(json.dumps(row) + "\n")
+
+
+def build_dataset(workdir: Path, hearings: int, witnesses: int, seed: int) -> Path:
+    from database.local_db import build_local_db
+
+    source = workdir / f"hearings-{hearings}x{witnesses}-{seed}.ndjson"
+    target = source.with_suffix(".sqlite")
+    if not target.exists() or not has_table(target, "search_documents"):  # also rebuild files from older schemas
+        synth_hearings(source, hearings, witnesses, random.Random(seed))
+        stats = build_local_db(source, target)
+        print(f"Built {target}: {stats['hearings']} hearings, {stats['witnesses']} witness appearances")
+    return target
+
+
+def has_table(path: Path, table: str) -> bool:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table,)).fetchone() is not None
+    finally:
+        conn.close()
+
+
+def scenarios(app: str, hearings: int, witnesses: int, seed: int) -> Dict[str, Callable[[random.Random], str]]:
+    """Endpoint name -> function giving the path of the next request"""
+    people = max(1, hearings * witnesses // 3)
+
+    def hearing_id(rng):
+        return rng.randint(1, hearings)
+
+    def committee(rng):
+        return rng.choice(COMMITTEES).replace(" ", "+")
+
+    def name(rng):
+        return f"Witness+{rng.randrange(people)}"
+
+    if app == "congressional":
+        return {
+            "list": lambda rng: "/hearings?limit=50",
+            "list_filtered": lambda rng: f"/hearings?limit=50&committee={committee(rng)}",
+            "search": lambda rng: f"/witnesses?query={name(rng)}&limit=50",
+            "detail": lambda rng: f"/hearings/{hearing_id(rng)}",
+            "stats": lambda rng: "/stats",
+            "metrics": lambda rng: "/metrics/witnesses-number",
+        }
+    return {
+        "list": lambda rng: "/congressional-hearings?limit=50",
+        "list_filtered": lambda rng: f"/congressional-hearings?limit=50&committee={committee(rng)}",
+        "list_deep_page": lambda rng: f"/congressional-hearings?limit=50&offset={rng.randrange(max(1, hearings - 50))}",
+        "detail": lambda rng: f"/congressional-hearings/{hearing_id(rng)}",
+        "witnesses": lambda rng: f"/congressional-hearings/{hearing_id(rng)}/witnesses",
+        "search": lambda rng: f"/search?q={name(rng)}",
+        "search_facets": lambda rng: f"/search?committee={committee(rng)}",
+        "stats": lambda rng: "/stats",
+        "metrics": lambda rng: "/metrics/witnesses-number",
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    return samples[max(0, math.ceil(pct / 100 * len(samples)) - 1)]
+
+
+async def run_scenario(client: "httpx.AsyncClient", next_path: Callable[[random.Random], str],
+                       requests: int, concurrency: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    paths = [next_path(rng) for _ in range(requests)]
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def worker():
+        while paths:
+            path = paths.pop()
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+
+    await client.get(next_path(random.Random(seed + 1)))  # warm up imports and connections
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def load_app(app: str):
+    module = importlib.import_module(
+        "scrapers.congressional_api" if app == "congressional" else "api.production.witness_api"
+    )
+    return module.app
+
+
+async def run(args) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for app in args.apps:
+        if args.url:
+            client = httpx.AsyncClient(base_url=args.url, timeout=60)
+        else:
+            transport = httpx.ASGITransport(app=load_app(app))
+            client = httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60)
+        async with client:
+            results[app] = {}
+            for endpoint, next_path in scenarios(app, args.hearings, args.witnesses, args.seed).items():
+                if args.only and endpoint not in args.only:
+                    continue
+                result = await run_scenario(client, next_path, args.requests, args.concurrency, args.seed)
+                results[app][endpoint] = result
+                print(f"{app:>13} {endpoint:<15} {result['throughput_rps']:>8} req/s  "
+                      f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+                      f"p99 {result['p99_ms']:>8} ms  errors {sum(result['errors'].values())}")
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print(f"\nAgainst {baseline['commit']} ({baseline['timestamp']}), change in p95 / throughput:")
+    for app, endpoints in current["results"].items():
+        for endpoint, result in endpoints.items():
+            before = baseline["results"].get(app, {}).get(endpoint)
+            if not before:
+                continue
+            p95 = (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0
+            rps = (result["throughput_rps"] - before["throughput_rps"]) / before["throughput_rps"] * 100
+            flag = "  <-- slower" if p95 > 20 else ""
+            print(f"{app:>13} {endpoint:<15} p95 {p95:+7.1f}%  throughput {rps:+7.1f}%{flag}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the witness/hearing APIs")
+    parser.add_argument("--hearings", type=int, default=10_000, help="Synthetic hearings (N)")
+    parser.add_argument("--witnesses", type=int, default=5, help="Witnesses per hearing (M)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--apps", nargs="+", choices=["congressional", "witness"], default=["congressional", "witness"])
+    parser.add_argument("--only", nargs="+", help="Endpoints to run, e.g. list search")
+    parser.add_argument("--cache-ttl", type=int, default=0, help="WITNESS_CACHE_TTL for the apps (default: off)")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "witness_load_test"),
+                        help="Where the synthetic dataset is kept between runs")
+    parser.add_argument("--url", help="Base URL of a running server instead of the in-process app")
+    parser.add_argument("--generate-only", action="store_true", help="Build the dataset and exit")
+    parser.add_argument("--out", help="Results file (default: benchmarks/results/<commit>-<timestamp>.json)")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    args = parser.parse_args()
+    if args.url and len(args.apps) > 1:
+        parser.error("--url points at one server; choose its app with --apps congressional or --apps witness")
+
+    workdir = Path(args.workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+    dataset = build_dataset(workdir, args.hearings, args.witnesses, args.seed)
+    if args.generate_only:
+        print(f"\nWITNESS_BACKEND=sqlite WITNESS_SQLITE_PATH={dataset} WITNESS_CACHE_TTL={args.cache_ttl} "
+              f"uvicorn api.production.witness_api:app")
+        return
+
+    # Read before the apps are imported
+    os.environ["WITNESS_BACKEND"] = "sqlite"
+    os.environ["WITNESS_SQLITE_PATH"] = str(dataset)
+    os.environ["WITNESS_CACHE_TTL"] = str(args.cache_ttl)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "config": {
+            "hearings": args.hearings,
+            "witnesses_per_hearing": args.witnesses,
+            "seed": args.seed,
+            "requests_per_endpoint": args.requests,
+            "concurrency": args.concurrency,
+            "cache_ttl": args.cache_ttl,
+            "target": args.url or "in-process",
+        },
+        "results": asyncio.run(run(args)),
+    }
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{report['commit']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {out}")
+
+    if args.baseline:
+        compare(report, json.loads(Path(args.baseline).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Precomputed metrics for the congressional_hearings table.
+
+Databases with hearing_stats.sql installed keep the statistics current on every
+write and serve them through the hearing_stats() RPC. Otherwise the summary row
+lives in the hearing_metrics table (see hearing_metrics.sql) and is recomputed
+in one pass by the refresh_hearing_metrics() database function, which the
+loader, Modal or pg_cron run after writes; reads serve the row as it is, with a
+`stale` flag. Databases without either fall back to the same one-pass
+computation in Python.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List
+
+METRICS_TABLE = 'hearing_metrics'
+METRICS_ID = 'congressional_hearings'
+PAGE_SIZE = 1000  # Supabase default max rows per request
+# PostgREST's "function not found in the schema cache" and Postgres' undefined_function
+MISSING_FUNCTION_CODES = {'PGRST202', '42883'}
+
+
+def json_list(value: Any) -> List[Any]:
+    """A JSONB array column, which older rows store as a JSON-encoded string"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def parse_witnesses(witnesses_data: Any) -> List[Dict[str, Any]]:
+    """Witnesses of a hearing row, stored either as a JSONB array or a JSON string"""
+    return [w for w in json_list(witnesses_data) if isinstance(w, dict)]
+
+
+def missing_function(error: Exception) -> bool:
+    """True when an RPC failed because the database function is not installed"""
+    code = getattr(error, 'code', None)
+    if code is None and error.args and isinstance(error.args[0], dict):
+        code = error.args[0].get('code')
+    return code in MISSING_FUNCTION_CODES
+
+
+def _normalize(value: Any) -> str:
+    return value.strip().lower() if isinstance(value, str) else ''
+
+
+def compute_hearing_metrics(hearings: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """All hearing metrics in one pass over rows of committee, hearing_type, hearing_date, document_url, witnesses.
+
+    Unique witnesses are not among them: they are counted as resolved entities
+    (HearingRepository.count_witness_entities), not as distinct raw names.
+    """
+    hearing_count = 0
+    appearances = 0
+    documents = 0
+    organizations = set()
+    committee_counts: Dict[str, int] = {}
+    hearing_types: Dict[str, int] = {}
+    earliest = latest = None
+
+    for hearing in hearings:
+        hearing_count += 1
+        committee = hearing.get('committee')
+        committee_counts[committee] = committee_counts.get(committee, 0) + 1
+        hearing_type = hearing.get('hearing_type')
+        if hearing_type is not None:
+            hearing_types[hearing_type] = hearing_types.get(hearing_type, 0) + 1
+        hearing_date = hearing.get('hearing_date')
+        if hearing_date:
+            earliest = hearing_date if earliest is None else min(earliest, hearing_date)
+            latest = hearing_date if latest is None else max(latest, hearing_date)
+        if hearing.get('document_url'):
+            documents += 1
+
+        for witness in parse_witnesses(hearing.get('witnesses')):
+            appearances += 1
+            organization = _normalize(witness.get('organization'))
+            if organization:
+                organizations.add(organization)
+            if isinstance(witness.get('documents'), list):
+                documents += len(witness['documents'])
+
+    top_committees = sorted(committee_counts.items(), key=lambda x: (-x[1], x[0] or ''))[:10]
+    return {
+        'hearings': hearing_count,
+        'witness_appearances': appearances,
+        'unique_organizations': len(organizations),
+        'documents': documents,
+        'committees': len(committee_counts),
+        'earliest_hearing': earliest,
+        'latest_hearing': latest,
+        'hearing_types': hearing_types,
+        'top_committees': [
+            {'committee': committee, 'hearing_count': count}
+            for committee, count in top_committees
+        ],
+    }
+
+
+class HearingMetricsStore:
+    """Serves hearing metrics from hearing_stats(), or the one-row summary table as last refreshed.
+
+    Every result carries a `stale` flag: True when hearings were written after
+    the summary row was last refreshed. Reads never refresh it themselves.
+    """
+
+    def __init__(self, supabase):
+        self.supabase = supabase
+        self.stats_rpc = True  # until hearing_stats() turns out not to be installed
+
+    def get(self) -> Dict[str, Any]:
+        """Current metrics from a few small counter-table reads, or the summary row from one indexed read"""
+        if self.stats_rpc:
+            try:
+                stats = self.supabase.rpc('hearing_stats').execute().data
+                if stats:
+                    return {**stats, 'stale': False}
+            except Exception as e:
+                print(f"⚠️  hearing_stats() failed ({e}); using {METRICS_TABLE}")
+                # Only a missing function is permanent; anything else is retried on the next call
+                if missing_function(e):
+                    self.stats_rpc = False
+        try:
+            result = self.supabase.table(METRICS_TABLE).select('metrics, stale') \
+                .eq('id', METRICS_ID).execute()
+        except Exception as e:
+            print(f"⚠️  {METRICS_TABLE} unavailable ({e}); computing metrics from congressional_hearings")
+            return self.compute()
+        # A stale row is served as is until the next refresh after an ingest
+        if result.data and result.data[0]['metrics']:
+            return {**result.data[0]['metrics'], 'stale': result.data[0]['stale']}
+        return self.compute()
+
+    def refresh(self) -> Dict[str, Any]:
+        """Recompute the summary row in the database; call after loading new hearings (service role only)"""
+        try:
+            return {**self.supabase.rpc('refresh_hearing_metrics').execute().data, 'stale': False}
+        except Exception as e:
+            print(f"⚠️  refresh_hearing_metrics() failed ({e}); computing metrics from congressional_hearings")
+            return self.compute()
+
+    def compute(self) -> Dict[str, Any]:
+        """Fallback: page through congressional_hearings once and compute in Python"""
+        def rows():
+            offset = 0
+            while True:
+                result = self.supabase.table('congressional_hearings') \
+                    .select('committee, hearing_type, hearing_date, document_url, witnesses') \
+                    .order('id').range(offset, offset + PAGE_SIZE - 1).execute()
+                yield from result.data
+                if len(result.data) < PAGE_SIZE:
+                    return
+                offset += PAGE_SIZE
+
+        return {**compute_hearing_metrics(rows()), 'stale': False}
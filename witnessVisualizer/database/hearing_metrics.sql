@@ -0,0 +1,132 @@
+-- Precomputed metrics for the congressional_hearings table.
+--
+-- The /metrics and /stats endpoints read one row of hearing_metrics instead of
+-- scanning every hearing and decoding every witnesses blob per request.
+-- refresh_hearing_metrics() recomputes all of them in a single pass. Writes to
+-- congressional_hearings only mark the row stale (a statement-level trigger, so
+-- a bulk insert costs one UPDATE); the loader refreshes once at the end of an
+-- ingest, and until then the API serves the stale row flagged as such. The API
+-- roles cannot run the refresh. Optionally schedule it with pg_cron:
+--   SELECT cron.schedule('refresh-hearing-metrics', '*/15 * * * *',
+--                        'SELECT refresh_hearing_metrics()');
+--
+-- Run in the Supabase SQL Editor (or psql) after the congressional_hearings table exists.
+
+CREATE TABLE IF NOT EXISTS hearing_metrics (
+    id TEXT PRIMARY KEY DEFAULT 'congressional_hearings',
+    metrics JSONB NOT NULL DEFAULT '{}'::jsonb,
+    stale BOOLEAN NOT NULL DEFAULT TRUE,
+    refreshed_at TIMESTAMPTZ
+);
+
+INSERT INTO hearing_metrics (id) VALUES ('congressional_hearings')
+ON CONFLICT (id) DO NOTHING;
+
+ALTER TABLE hearing_metrics ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON hearing_metrics;
+CREATE POLICY "Public read access" ON hearing_metrics FOR SELECT USING (true);
+
+-- Witnesses are stored as a JSONB array, but older rows hold a JSON-encoded string
+CREATE OR REPLACE FUNCTION hearing_witnesses_array(witnesses JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    decoded JSONB;
+BEGIN
+    IF witnesses IS NULL THEN
+        RETURN '[]'::jsonb;
+    ELSIF jsonb_typeof(witnesses) = 'array' THEN
+        RETURN witnesses;
+    ELSIF jsonb_typeof(witnesses) = 'string' THEN
+        BEGIN
+            decoded := (witnesses #>> '{}')::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN '[]'::jsonb;
+        END;
+        IF jsonb_typeof(decoded) = 'array' THEN
+            RETURN decoded;
+        END IF;
+    END IF;
+    RETURN '[]'::jsonb;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION refresh_hearing_metrics()
+RETURNS JSONB
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    result JSONB;
+BEGIN
+    -- Each CTE is materialized once: one scan of congressional_hearings, one
+    -- expansion of the witnesses arrays, then aggregates over those.
+    WITH h AS MATERIALIZED (
+        SELECT committee, hearing_type, hearing_date, document_url,
+               hearing_witnesses_array(witnesses) AS witnesses
+        FROM congressional_hearings
+    ),
+    -- Unique witnesses are not counted here: they are the resolved entities of
+    -- witness_entities.sql, not distinct raw names
+    w AS MATERIALIZED (
+        SELECT lower(btrim(e->>'organization', E' \t\r\n')) AS organization,
+               CASE WHEN jsonb_typeof(e->'documents') = 'array'
+                    THEN jsonb_array_length(e->'documents') ELSE 0 END AS documents
+        FROM h, jsonb_array_elements(h.witnesses) AS e
+        WHERE jsonb_typeof(e) = 'object'
+    ),
+    committees AS (
+        SELECT committee, count(*) AS hearing_count
+        FROM h GROUP BY committee
+    ),
+    types AS (
+        SELECT hearing_type, count(*) AS hearing_count
+        FROM h GROUP BY hearing_type
+    )
+    SELECT jsonb_build_object(
+        'hearings', (SELECT count(*) FROM h),
+        'witness_appearances', (SELECT count(*) FROM w),
+        'unique_organizations',
+            (SELECT count(DISTINCT organization) FROM w WHERE organization <> ''),
+        'documents',
+            (SELECT count(*) FROM h WHERE coalesce(document_url, '') <> '')
+            + (SELECT coalesce(sum(documents), 0) FROM w),
+        'committees', (SELECT count(*) FROM committees),
+        'earliest_hearing', (SELECT min(hearing_date)::text FROM h),
+        'latest_hearing', (SELECT max(hearing_date)::text FROM h),
+        'hearing_types',
+            (SELECT coalesce(jsonb_object_agg(hearing_type, hearing_count), '{}'::jsonb)
+             FROM types WHERE hearing_type IS NOT NULL),
+        'top_committees',
+            (SELECT coalesce(jsonb_agg(jsonb_build_object(
+                        'committee', committee, 'hearing_count', hearing_count)
+                    ORDER BY hearing_count DESC, committee), '[]'::jsonb)
+             FROM (SELECT * FROM committees
+                   ORDER BY hearing_count DESC, committee LIMIT 10) AS top)
+    ) INTO result;
+
+    INSERT INTO hearing_metrics (id, metrics, stale, refreshed_at)
+    VALUES ('congressional_hearings', result, FALSE, now())
+    ON CONFLICT (id) DO UPDATE
+        SET metrics = EXCLUDED.metrics, stale = FALSE, refreshed_at = EXCLUDED.refreshed_at;
+    RETURN result;
+END;
+$$;
+
+-- A full scan per call: only the loader (service role), Modal and pg_cron refresh
+REVOKE EXECUTE ON FUNCTION refresh_hearing_metrics() FROM PUBLIC, anon, authenticated;
+
+CREATE OR REPLACE FUNCTION mark_hearing_metrics_stale()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    UPDATE hearing_metrics SET stale = TRUE
+    WHERE id = 'congressional_hearings' AND NOT stale;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS congressional_hearings_metrics_stale ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_metrics_stale
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON congressional_hearings
+FOR EACH STATEMENT EXECUTE FUNCTION mark_hearing_metrics_stale();
+
+SELECT refresh_hearing_metrics();
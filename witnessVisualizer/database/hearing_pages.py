@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination over congressional_hearings, newest first.
+
+Pages are ordered by (hearing_date DESC, id DESC) and a cursor is the
+"hearing_date,id" of the last hearing on the previous page, so every page is an
+index range scan no matter how deep it is. HearingRepository.iter_hearings()
+(repository.py) walks the whole table one page at a time for exports and
+aggregates that must not hold it in memory.
+"""
+
+import csv
+import io
+import json
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from database.hearing_witnesses import like_pattern
+
+PAGE_SIZE = 1000  # Supabase default max rows per request
+
+
+def hearing_cursor(hearing: Dict[str, Any]) -> str:
+    """Cursor pointing just past this hearing"""
+    return f"{hearing['hearing_date']},{hearing['id']}"
+
+
+def parse_cursor(cursor: str) -> Tuple[str, int]:
+    """(hearing_date, id) from a cursor; ValueError if it is malformed"""
+    hearing_date, _, hearing_id = cursor.partition(',')
+    return date.fromisoformat(hearing_date).isoformat(), int(hearing_id)
+
+
+def filter_hearings(query, committee: Optional[str] = None, hearing_type: Optional[str] = None,
+                    congress: Optional[int] = None, start_date: Optional[date] = None,
+                    end_date: Optional[date] = None):
+    """Apply the hearing list filters shared by the endpoints to a PostgREST query"""
+    if committee:
+        query = query.ilike('committee', like_pattern(committee))
+    if hearing_type:
+        query = query.eq('hearing_type', hearing_type)
+    if congress:
+        query = query.eq('congress', congress)
+    if start_date:
+        query = query.gte('hearing_date', start_date.isoformat())
+    if end_date:
+        query = query.lte('hearing_date', end_date.isoformat())
+    return query
+
+
+def fetch_hearing_page(supabase, columns: str, limit: int = PAGE_SIZE, cursor: Optional[str] = None,
+                       **filters) -> List[Dict[str, Any]]:
+    """One page of hearings after cursor; columns must include id and hearing_date"""
+    query = filter_hearings(supabase.table('congressional_hearings').select(columns), **filters)
+    if cursor:
+        hearing_date, hearing_id = parse_cursor(cursor)
+        query = query.or_(f'hearing_date.lt.{hearing_date},and(hearing_date.eq.{hearing_date},id.lt.{hearing_id})')
+
+    return query.order('hearing_date', desc=True).order('id', desc=True).limit(limit).execute().data or []
+
+
+def ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, default=str) + '\n'
+
+
+def csv_lines(rows: Iterable[Dict[str, Any]], fieldnames: List[str]) -> Iterator[str]:
+    """CSV text one row at a time; list and dict values are written as JSON"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow({
+            key: json.dumps(value) if isinstance(value, (list, dict)) else value
+            for key, value in row.items()
+        })
+    yield buffer.getvalue()
@@ -0,0 +1,10 @@
+-- Index for keyset pagination over congressional_hearings (database/hearing_pages.py).
+--
+-- Pages are ordered by (hearing_date DESC, id DESC) and resume after the last
+-- row of the previous page, so each one is a range scan of this index instead of
+-- an OFFSET that reads and discards every earlier row.
+--
+-- Run in the Supabase SQL Editor (or psql). Safe to re-run.
+
+CREATE INDEX IF NOT EXISTS congressional_hearings_date_id_idx
+    ON congressional_hearings (hearing_date DESC, id DESC);
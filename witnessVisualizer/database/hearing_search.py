@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Faceted full-text search over hearings and witness appearances.
+
+The index holds one document per hearing and one per witness appearance
+(see hearing_search.sql). A search returns ranked hits, the number of
+matches and the counts per facet value in one response:
+
+    {"query": ..., "total": 42, "hits": [...],
+     "facets": {"committee": [{"value": "...", "count": 12}, ...], "congress": [...], ...}}
+
+On Supabase that is the faceted_search() RPC over a tsvector GIN index.
+database/local_db.py builds the same documents into an SQLite FTS5 table for
+the local backend.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SEARCH_FACETS = ['kind', 'committee', 'congress', 'hearing_type', 'witness_type', 'year']
+SEARCH_KINDS = ('hearing', 'witness')
+HIT_COLUMNS = [
+    'kind', 'hearing_id', 'position', 'name', 'title', 'organization', 'witness_type',
+    'hearing_name', 'committee', 'congress', 'hearing_type', 'hearing_date'
+]
+
+# Terms, "quoted phrases" and -excluded terms, as websearch_to_tsquery reads them
+_QUERY_TOKEN = re.compile(r'-?"[^"]*"?|\S+')
+
+
+def _clean(value: Any) -> Optional[str]:
+    return value.strip() or None if isinstance(value, str) else None
+
+
+def search_documents(hearing: Dict[str, Any], witnesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The hearing's documents, as hearing_search_documents() builds them.
+
+    heading, detail and context are the text columns, weighted like the A, B
+    and C tsvector weights.
+    """
+    committee, hearing_type = _clean(hearing.get('committee')), _clean(hearing.get('hearing_type'))
+    common = {
+        'hearing_id': hearing['id'],
+        'hearing_name': hearing.get('hearing_name'),
+        'committee': committee,
+        'congress': hearing.get('congress'),
+        'hearing_type': hearing_type,
+        'hearing_date': hearing['hearing_date'],
+        'year': int(hearing['hearing_date'][:4]),
+    }
+    appearances = []
+    for position, witness in enumerate(witnesses, start=1):
+        name, title, organization = (_clean(witness.get(k)) for k in ('name', 'title', 'organization'))
+        appearances.append({
+            **common,
+            'position': position,
+            'kind': 'witness',
+            'name': name,
+            'title': title,
+            'organization': organization,
+            'witness_type': _clean(witness.get('witness_type')),
+            'heading': name or '',
+            'detail': ' '.join(filter(None, [title, organization])),
+            'context': ' '.join(filter(None, [hearing.get('hearing_name'), committee])),
+        })
+    return [{
+        **common,
+        'position': 0,
+        'kind': 'hearing',
+        'name': None,
+        'title': None,
+        'organization': None,
+        'witness_type': None,
+        'heading': hearing.get('hearing_name') or '',
+        'detail': committee or '',
+        'context': ' '.join(filter(None, (w for a in appearances for w in (a['name'], a['organization'])))),
+    }] + appearances
+
+
+def facet_counts(documents: Iterable[Dict[str, Any]]) -> Counter:
+    """(facet, value) -> documents, the search_facet_counts rows"""
+    counts: Counter = Counter()
+    for document in documents:
+        for facet in SEARCH_FACETS:
+            if document[facet] is not None:
+                counts[facet, document[facet]] += 1
+    return counts
+
+
+def facet_lists(counts: Iterable[Tuple[str, Any, int]], facet_limit: int) -> Dict[str, List[Dict[str, Any]]]:
+    """{facet: [{value, count}, ...]} with the most common values first, as faceted_search() returns them"""
+    facets: Dict[str, List[Dict[str, Any]]] = {facet: [] for facet in SEARCH_FACETS}
+    for facet, value, count in sorted(counts, key=lambda c: (c[0], -c[2], c[1])):
+        if count > 0 and len(facets[facet]) < facet_limit:
+            facets[facet].append({'value': value, 'count': count})
+    return facets
+
+
+def fts5_query(q: str) -> Optional[str]:
+    """An FTS5 MATCH expression for web search syntax, or None if q has no searchable terms.
+
+    Terms are ANDed, "quoted phrases" stay phrases, "or" between two terms
+    matches either, and -term excludes. Every term is quoted, so FTS5
+    operators and punctuation in the user's text are never interpreted.
+    """
+    groups: List[List[str]] = []
+    excluded: List[str] = []
+    either = False
+    for token in _QUERY_TOKEN.findall(q):
+        if token.lower() == 'or':
+            either = bool(groups)
+            continue
+        negated = token.startswith('-')
+        words = re.findall(r'\w+', token)
+        if not words:
+            continue
+        term = '"' + ' '.join(words) + '"'
+        if negated:
+            excluded.append(term)
+        elif either:
+            groups[-1].append(term)
+        else:
+            groups.append([term])
+        either = False
+    if not groups:
+        return None
+    expression = ' AND '.join('(' + ' OR '.join(group) + ')' for group in groups)
+    for term in excluded:
+        expression = f'({expression}) NOT {term}'
+    return expression
+
+
+def faceted_search(supabase, q: Optional[str] = None, limit: int = 20, offset: int = 0,
+                   facet_limit: int = 20, **filters) -> Dict[str, Any]:
+    """Ranked hits and facet counts from the faceted_search() RPC.
+
+    filters: kind, committee, congress, hearing_type, witness_type and year,
+    matched exactly against the facet values.
+    """
+    params = {
+        'q': q,
+        **{facet: filters.get(facet) for facet in SEARCH_FACETS},
+        'result_limit': limit,
+        'result_offset': offset,
+        'facet_limit': facet_limit,
+    }
+    return supabase.rpc('faceted_search', params).execute().data
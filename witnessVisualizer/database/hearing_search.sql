@@ -0,0 +1,331 @@
+-- Faceted full-text search over congressional_hearings for GET /search.
+--
+-- search_documents is the single search index: one row per hearing
+-- (position 0) and one per witness appearance (the hearing_witnesses
+-- position). Each row carries a weighted tsvector with a GIN index, plus the
+-- facet values it is counted under: kind, committee, congress, hearing type,
+-- witness type and year. faceted_search() returns the ranked hits, the total
+-- and the counts per facet value as one JSONB document, so a search is a
+-- single round trip. search_facet_counts holds the counts over the whole
+-- index. Statement triggers keep it current, and a search with no query and
+-- no filters reads it instead of counting every document.
+--
+-- Run in the Supabase SQL Editor (or psql) after database/hearing_metrics.sql,
+-- which defines hearing_witnesses_array(). Re-running it rebuilds the index.
+
+CREATE TABLE IF NOT EXISTS search_documents (
+    hearing_id BIGINT NOT NULL REFERENCES congressional_hearings(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,      -- 0 for the hearing, else the witness's hearing_witnesses position
+    kind TEXT NOT NULL,             -- 'hearing' or 'witness'
+    name TEXT,                      -- witness documents only
+    title TEXT,
+    organization TEXT,
+    witness_type TEXT,
+    hearing_name TEXT,
+    committee TEXT,
+    congress INTEGER,
+    hearing_type TEXT,
+    hearing_date DATE,
+    year INTEGER,
+    facet_keys TEXT[] NOT NULL,     -- 'facet:value' for each facet above, what the filters match
+    document TSVECTOR NOT NULL,
+    PRIMARY KEY (hearing_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS search_documents_document_idx ON search_documents USING gin (document);
+CREATE INDEX IF NOT EXISTS search_documents_facet_keys_idx ON search_documents USING gin (facet_keys);
+-- Hits for a search without a query, newest first
+CREATE INDEX IF NOT EXISTS search_documents_date_idx
+    ON search_documents (hearing_date DESC, hearing_id DESC, position);
+
+CREATE TABLE IF NOT EXISTS search_facet_counts (
+    facet TEXT NOT NULL,
+    value JSONB NOT NULL,           -- numbers for congress and year, strings otherwise
+    documents BIGINT NOT NULL,      -- rows that drop to zero are kept and skipped
+    PRIMARY KEY (facet, value)
+);
+
+ALTER TABLE search_documents ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON search_documents;
+CREATE POLICY "Public read access" ON search_documents FOR SELECT USING (true);
+ALTER TABLE search_facet_counts ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON search_facet_counts;
+CREATE POLICY "Public read access" ON search_facet_counts FOR SELECT USING (true);
+
+-- Filter keys of a document; faceted_search() builds the same keys from its filters
+CREATE OR REPLACE FUNCTION search_facet_keys(kind TEXT, committee TEXT, congress INTEGER,
+                                             hearing_type TEXT, witness_type TEXT, year INTEGER)
+RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT array_remove(ARRAY[
+        'kind:' || search_facet_keys.kind,
+        'committee:' || nullif(btrim(search_facet_keys.committee), ''),
+        'congress:' || search_facet_keys.congress,
+        'hearing_type:' || nullif(btrim(search_facet_keys.hearing_type), ''),
+        'witness_type:' || nullif(btrim(search_facet_keys.witness_type), ''),
+        'year:' || search_facet_keys.year
+    ], NULL)
+$$;
+
+-- The documents of one hearing. Weights: A is the hearing name or witness name,
+-- B the committee or the witness's title and organization, C the context (the
+-- witnesses of a hearing, the hearing of a witness), so a name search ranks the
+-- witness above the hearings they appeared at.
+CREATE OR REPLACE FUNCTION hearing_search_documents(h congressional_hearings)
+RETURNS SETOF search_documents
+LANGUAGE sql STABLE AS $$
+    WITH w AS (
+        SELECT e.position::INTEGER AS position,
+               nullif(btrim(e.witness->>'name'), '') AS name,
+               nullif(btrim(e.witness->>'title'), '') AS title,
+               nullif(btrim(e.witness->>'organization'), '') AS organization,
+               nullif(btrim(e.witness->>'witness_type'), '') AS witness_type
+        FROM jsonb_array_elements(hearing_witnesses_array(h.witnesses)) WITH ORDINALITY AS e(witness, position)
+        WHERE jsonb_typeof(e.witness) = 'object'
+    )
+    SELECT h.id, 0, 'hearing', NULL, NULL, NULL, NULL,
+           h.hearing_name, nullif(btrim(h.committee), ''), h.congress, nullif(btrim(h.hearing_type), ''),
+           h.hearing_date, extract(year FROM h.hearing_date)::INTEGER,
+           search_facet_keys('hearing', h.committee, h.congress, h.hearing_type, NULL,
+                             extract(year FROM h.hearing_date)::INTEGER),
+           setweight(to_tsvector('english', coalesce(h.hearing_name, '')), 'A')
+           || setweight(to_tsvector('english', coalesce(h.committee, '')), 'B')
+           || setweight(to_tsvector('english', coalesce(
+                  (SELECT string_agg(concat_ws(' ', w.name, w.organization), ' ') FROM w), '')), 'C')
+    UNION ALL
+    SELECT h.id, w.position, 'witness', w.name, w.title, w.organization, w.witness_type,
+           h.hearing_name, nullif(btrim(h.committee), ''), h.congress, nullif(btrim(h.hearing_type), ''),
+           h.hearing_date, extract(year FROM h.hearing_date)::INTEGER,
+           search_facet_keys('witness', h.committee, h.congress, h.hearing_type, w.witness_type,
+                             extract(year FROM h.hearing_date)::INTEGER),
+           setweight(to_tsvector('english', coalesce(w.name, '')), 'A')
+           || setweight(to_tsvector('english', concat_ws(' ', w.title, w.organization)), 'B')
+           || setweight(to_tsvector('english', concat_ws(' ', h.hearing_name, h.committee)), 'C')
+    FROM w
+$$;
+
+-- The (facet, value) pairs one document is counted under
+CREATE OR REPLACE FUNCTION search_facet_values(kind TEXT, committee TEXT, congress INTEGER,
+                                               hearing_type TEXT, witness_type TEXT, year INTEGER)
+RETURNS TABLE (facet TEXT, value JSONB)
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT f.facet, f.value
+    FROM (VALUES ('kind', to_jsonb(search_facet_values.kind)),
+                 ('committee', to_jsonb(search_facet_values.committee)),
+                 ('congress', to_jsonb(search_facet_values.congress)),
+                 ('hearing_type', to_jsonb(search_facet_values.hearing_type)),
+                 ('witness_type', to_jsonb(search_facet_values.witness_type)),
+                 ('year', to_jsonb(search_facet_values.year))) AS f(facet, value)
+    WHERE f.value IS NOT NULL
+$$;
+
+CREATE OR REPLACE FUNCTION rebuild_search_facet_counts()
+RETURNS VOID
+LANGUAGE sql SECURITY DEFINER SET search_path = public AS $$
+    TRUNCATE search_facet_counts;
+    INSERT INTO search_facet_counts (facet, value, documents)
+    SELECT f.facet, f.value, count(*)
+    FROM search_documents AS d,
+         search_facet_values(d.kind, d.committee, d.congress, d.hearing_type, d.witness_type, d.year) AS f
+    GROUP BY f.facet, f.value;
+$$;
+
+-- Only the TRUNCATE trigger rebuilds; the API roles must not call it as an RPC
+REVOKE EXECUTE ON FUNCTION rebuild_search_facet_counts() FROM PUBLIC, anon, authenticated;
+
+CREATE OR REPLACE FUNCTION search_facet_counts_on_write()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM rebuild_search_facet_counts();
+        RETURN NULL;
+    END IF;
+    -- old_rows / new_rows only exist for the events that define them
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO search_facet_counts AS s (facet, value, documents)
+        SELECT f.facet, f.value, -count(*)
+        FROM old_rows AS d,
+             search_facet_values(d.kind, d.committee, d.congress, d.hearing_type, d.witness_type, d.year) AS f
+        GROUP BY f.facet, f.value ORDER BY f.facet, f.value
+        ON CONFLICT (facet, value) DO UPDATE SET documents = s.documents + EXCLUDED.documents;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO search_facet_counts AS s (facet, value, documents)
+        SELECT f.facet, f.value, count(*)
+        FROM new_rows AS d,
+             search_facet_values(d.kind, d.committee, d.congress, d.hearing_type, d.witness_type, d.year) AS f
+        GROUP BY f.facet, f.value ORDER BY f.facet, f.value
+        ON CONFLICT (facet, value) DO UPDATE SET documents = s.documents + EXCLUDED.documents;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS search_documents_facets_insert ON search_documents;
+CREATE TRIGGER search_documents_facets_insert
+AFTER INSERT ON search_documents
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION search_facet_counts_on_write();
+
+DROP TRIGGER IF EXISTS search_documents_facets_update ON search_documents;
+CREATE TRIGGER search_documents_facets_update
+AFTER UPDATE ON search_documents
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION search_facet_counts_on_write();
+
+-- Also fires for the cascade when hearings are deleted
+DROP TRIGGER IF EXISTS search_documents_facets_delete ON search_documents;
+CREATE TRIGGER search_documents_facets_delete
+AFTER DELETE ON search_documents
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION search_facet_counts_on_write();
+
+DROP TRIGGER IF EXISTS search_documents_facets_truncate ON search_documents;
+CREATE TRIGGER search_documents_facets_truncate
+AFTER TRUNCATE ON search_documents
+FOR EACH STATEMENT EXECUTE FUNCTION search_facet_counts_on_write();
+
+-- Reindex inserted hearings, and updated ones whose searchable columns changed
+CREATE OR REPLACE FUNCTION sync_search_documents()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    changed BIGINT[];
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(n.id) INTO changed
+        FROM old_rows AS o JOIN new_rows AS n ON n.id = o.id
+        WHERE (o.hearing_name, o.committee, o.congress, o.hearing_type, o.hearing_date, o.witnesses)
+              IS DISTINCT FROM (n.hearing_name, n.committee, n.congress, n.hearing_type, n.hearing_date, n.witnesses);
+        DELETE FROM search_documents WHERE hearing_id = ANY (changed);
+        INSERT INTO search_documents
+        SELECT d.* FROM new_rows AS h, hearing_search_documents(h) AS d
+        WHERE h.id = ANY (changed);
+    ELSE
+        INSERT INTO search_documents
+        SELECT d.* FROM new_rows AS h, hearing_search_documents(h) AS d;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS congressional_hearings_search_insert ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_search_insert
+AFTER INSERT ON congressional_hearings
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_search_documents();
+
+DROP TRIGGER IF EXISTS congressional_hearings_search_update ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_search_update
+AFTER UPDATE ON congressional_hearings
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_search_documents();
+
+-- Ranked hits, total and facet counts in one call. q uses web search syntax
+-- ("quoted phrases", or, -excluded); without it hits are newest first. Facet
+-- counts are over the documents matching q and every filter.
+CREATE OR REPLACE FUNCTION faceted_search(
+    q TEXT DEFAULT NULL,
+    kind TEXT DEFAULT NULL,
+    committee TEXT DEFAULT NULL,
+    congress INTEGER DEFAULT NULL,
+    hearing_type TEXT DEFAULT NULL,
+    witness_type TEXT DEFAULT NULL,
+    year INTEGER DEFAULT NULL,
+    result_limit INTEGER DEFAULT 20,
+    result_offset INTEGER DEFAULT 0,
+    facet_limit INTEGER DEFAULT 20
+)
+RETURNS JSONB
+LANGUAGE plpgsql STABLE SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    tsq TSQUERY;
+    filters TEXT[];
+    browse BOOLEAN;
+BEGIN
+    IF btrim(coalesce(faceted_search.q, '')) <> '' THEN
+        tsq := websearch_to_tsquery('english', faceted_search.q);
+    END IF;
+    filters := search_facet_keys(faceted_search.kind, faceted_search.committee, faceted_search.congress,
+                                 faceted_search.hearing_type, faceted_search.witness_type,
+                                 faceted_search.year);
+    browse := tsq IS NULL AND cardinality(filters) = 0;
+
+    RETURN (
+        WITH selected AS MATERIALIZED (
+            SELECT d.hearing_id, d.position, d.hearing_date, d.kind, d.committee, d.congress,
+                   d.hearing_type, d.witness_type, d.year, coalesce(ts_rank(d.document, tsq), 0) AS score
+            FROM search_documents AS d
+            WHERE NOT browse
+              AND (tsq IS NULL OR d.document @@ tsq)
+              AND (cardinality(filters) = 0 OR d.facet_keys @> filters)
+        ),
+        page AS (
+            (SELECT s.hearing_id, s.position, s.score FROM selected AS s
+             ORDER BY s.score DESC, s.hearing_date DESC, s.hearing_id DESC, s.position
+             LIMIT result_limit OFFSET result_offset)
+            UNION ALL
+            (SELECT d.hearing_id, d.position, 0 FROM search_documents AS d
+             WHERE browse
+             ORDER BY d.hearing_date DESC, d.hearing_id DESC, d.position
+             LIMIT result_limit OFFSET result_offset)
+        ),
+        facet_rows AS (
+            SELECT c.facet, c.value, c.documents FROM search_facet_counts AS c
+            WHERE browse AND c.documents > 0
+            UNION ALL
+            -- One pass over the matches for all six facets
+            SELECT g.facet, g.value, g.documents
+            FROM (SELECT CASE WHEN GROUPING(s.kind) = 0 THEN 'kind'
+                              WHEN GROUPING(s.committee) = 0 THEN 'committee'
+                              WHEN GROUPING(s.congress) = 0 THEN 'congress'
+                              WHEN GROUPING(s.hearing_type) = 0 THEN 'hearing_type'
+                              WHEN GROUPING(s.witness_type) = 0 THEN 'witness_type'
+                              ELSE 'year' END AS facet,
+                         coalesce(to_jsonb(s.kind), to_jsonb(s.committee), to_jsonb(s.congress),
+                                  to_jsonb(s.hearing_type), to_jsonb(s.witness_type), to_jsonb(s.year)) AS value,
+                         count(*) AS documents
+                  FROM selected AS s
+                  GROUP BY GROUPING SETS ((s.kind), (s.committee), (s.congress), (s.hearing_type),
+                                          (s.witness_type), (s.year))) AS g
+            WHERE g.value IS NOT NULL
+        ),
+        top_facets AS (
+            SELECT r.facet, r.value, r.documents,
+                   row_number() OVER (PARTITION BY r.facet ORDER BY r.documents DESC, r.value) AS n
+            FROM facet_rows AS r
+        )
+        SELECT jsonb_build_object(
+            'query', faceted_search.q,
+            'total', (SELECT coalesce(sum(r.documents), 0) FROM facet_rows AS r WHERE r.facet = 'kind'),
+            'hits',
+                (SELECT coalesce(jsonb_agg(jsonb_build_object(
+                            'kind', d.kind, 'hearing_id', d.hearing_id, 'position', d.position,
+                            'name', d.name, 'title', d.title, 'organization', d.organization,
+                            'witness_type', d.witness_type, 'hearing_name', d.hearing_name,
+                            'committee', d.committee, 'congress', d.congress, 'hearing_type', d.hearing_type,
+                            'hearing_date', d.hearing_date, 'score', round(p.score::NUMERIC, 4))
+                        ORDER BY p.score DESC, d.hearing_date DESC, d.hearing_id DESC, d.position), '[]'::jsonb)
+                 FROM page AS p JOIN search_documents AS d USING (hearing_id, position)),
+            -- Every facet is present, empty when nothing matched
+            'facets',
+                '{"kind": [], "committee": [], "congress": [], "hearing_type": [],
+                  "witness_type": [], "year": []}'::jsonb
+                || coalesce((SELECT jsonb_object_agg(t.facet, t.counts)
+                             FROM (SELECT f.facet,
+                                          jsonb_agg(jsonb_build_object('value', f.value, 'count', f.documents)
+                                                    ORDER BY f.documents DESC, f.value) AS counts
+                                   FROM top_facets AS f WHERE f.n <= facet_limit
+                                   GROUP BY f.facet) AS t), '{}'::jsonb)
+        )
+    );
+END;
+$$;
+
+-- Backfill from the hearings already loaded; the truncate trigger recounts the facets
+TRUNCATE search_documents;
+INSERT INTO search_documents
+SELECT d.* FROM congressional_hearings AS h, hearing_search_documents(h) AS d;
+
+ANALYZE search_documents;
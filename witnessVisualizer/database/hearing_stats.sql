@@ -0,0 +1,231 @@
+-- Hearing statistics maintained on write and served by the hearing_stats() RPC.
+--
+-- refresh_hearing_metrics() (hearing_metrics.sql) recomputes every metric from
+-- scratch, and the first /stats read after an ingest pays for it: a few hundred
+-- ms at 10,000 hearings, seconds at 100,000. Here statement-level triggers apply
+-- each write's delta to small counter tables instead: totals, hearings per
+-- committee and per type, and appearances per normalized organization name,
+-- from which the distinct count follows. Unique witnesses are the resolved
+-- entities of witness_entities.sql and are not counted here. hearing_stats()
+-- reads only those tables plus min/max(hearing_date) from an index, so its cost
+-- does not grow with the archive.
+--
+-- Run in the Supabase SQL Editor (or psql) after database/hearing_metrics.sql,
+-- which defines hearing_witnesses_array(). Re-running it recomputes the counters.
+
+CREATE TABLE IF NOT EXISTS hearing_stats_totals (
+    id TEXT PRIMARY KEY DEFAULT 'congressional_hearings',
+    hearings BIGINT NOT NULL DEFAULT 0,
+    witness_appearances BIGINT NOT NULL DEFAULT 0,
+    documents BIGINT NOT NULL DEFAULT 0,
+    unique_organizations BIGINT NOT NULL DEFAULT 0
+);
+-- Counted by raw name before witnesses were resolved to entities
+ALTER TABLE hearing_stats_totals DROP COLUMN IF EXISTS unique_witnesses;
+
+-- Rows whose count drops to zero are kept (and ignored by hearing_stats())
+CREATE TABLE IF NOT EXISTS hearing_stats_committees (
+    committee TEXT PRIMARY KEY,
+    hearing_count BIGINT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS hearing_stats_types (
+    hearing_type TEXT PRIMARY KEY,
+    hearing_count BIGINT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS hearing_stats_names (
+    kind CHAR(1) NOT NULL,          -- 'o' organization
+    value TEXT NOT NULL,            -- lowercased and trimmed, as in refresh_hearing_metrics()
+    appearances BIGINT NOT NULL,
+    PRIMARY KEY (kind, value)
+);
+
+-- min/max(hearing_date) read the ends of this index (same one as hearing_pages.sql)
+CREATE INDEX IF NOT EXISTS congressional_hearings_date_id_idx
+    ON congressional_hearings (hearing_date DESC, id DESC);
+
+ALTER TABLE hearing_stats_totals ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON hearing_stats_totals;
+CREATE POLICY "Public read access" ON hearing_stats_totals FOR SELECT USING (true);
+ALTER TABLE hearing_stats_committees ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON hearing_stats_committees;
+CREATE POLICY "Public read access" ON hearing_stats_committees FOR SELECT USING (true);
+ALTER TABLE hearing_stats_types ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON hearing_stats_types;
+CREATE POLICY "Public read access" ON hearing_stats_types FOR SELECT USING (true);
+ALTER TABLE hearing_stats_names ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON hearing_stats_names;
+CREATE POLICY "Public read access" ON hearing_stats_names FOR SELECT USING (true);
+
+-- Add (direction 1) or remove (direction -1) a set of hearings, given as a JSONB
+-- array of {committee, hearing_type, document_url, witnesses} objects. Runs with
+-- the rights of its callers, the definer functions below.
+CREATE OR REPLACE FUNCTION apply_hearing_stats_delta(changed JSONB, direction INTEGER)
+RETURNS VOID
+LANGUAGE plpgsql SECURITY INVOKER SET search_path = public AS $$
+BEGIN
+    IF changed IS NULL THEN
+        RETURN;
+    END IF;
+
+    WITH h AS MATERIALIZED (
+        SELECT e->>'committee' AS committee,
+               e->>'hearing_type' AS hearing_type,
+               e->>'document_url' AS document_url,
+               hearing_witnesses_array(e->'witnesses') AS witnesses
+        FROM jsonb_array_elements(changed) AS e
+    ),
+    w AS MATERIALIZED (
+        SELECT e AS witness
+        FROM h, jsonb_array_elements(h.witnesses) AS e
+        WHERE jsonb_typeof(e) = 'object'
+    ),
+    names AS (
+        SELECT kind, value, count(*) AS n
+        FROM (
+            SELECT 'o' AS kind, lower(btrim(witness->>'organization', E' \t\r\n')) AS value FROM w
+        ) AS v
+        WHERE value <> ''
+        GROUP BY kind, value
+    ),
+    name_counts AS (
+        INSERT INTO hearing_stats_names AS s (kind, value, appearances)
+        SELECT kind, value, direction * n FROM names ORDER BY kind, value
+        ON CONFLICT (kind, value) DO UPDATE SET appearances = s.appearances + EXCLUDED.appearances
+        RETURNING s.kind, s.value, s.appearances
+    ),
+    -- A name is counted as distinct while its appearances are above zero
+    distinct_changes AS (
+        SELECT c.kind,
+               count(*) FILTER (WHERE c.appearances > 0 AND c.appearances - direction * n.n <= 0)
+             - count(*) FILTER (WHERE c.appearances <= 0 AND c.appearances - direction * n.n > 0) AS delta
+        FROM name_counts AS c JOIN names AS n USING (kind, value)
+        GROUP BY c.kind
+    ),
+    committees AS (
+        INSERT INTO hearing_stats_committees AS s (committee, hearing_count)
+        SELECT committee, direction * count(*) FROM h
+        WHERE committee IS NOT NULL GROUP BY committee ORDER BY committee
+        ON CONFLICT (committee) DO UPDATE SET hearing_count = s.hearing_count + EXCLUDED.hearing_count
+    ),
+    types AS (
+        INSERT INTO hearing_stats_types AS s (hearing_type, hearing_count)
+        SELECT hearing_type, direction * count(*) FROM h
+        WHERE hearing_type IS NOT NULL GROUP BY hearing_type ORDER BY hearing_type
+        ON CONFLICT (hearing_type) DO UPDATE SET hearing_count = s.hearing_count + EXCLUDED.hearing_count
+    )
+    UPDATE hearing_stats_totals SET
+        hearings = hearings + direction * (SELECT count(*) FROM h),
+        witness_appearances = witness_appearances + direction * (SELECT count(*) FROM w),
+        documents = documents + direction * (
+            (SELECT count(*) FROM h WHERE coalesce(document_url, '') <> '')
+            + (SELECT coalesce(sum(jsonb_array_length(witness->'documents')), 0) FROM w
+               WHERE jsonb_typeof(witness->'documents') = 'array')),
+        unique_organizations = unique_organizations
+            + coalesce((SELECT delta FROM distinct_changes WHERE kind = 'o'), 0)
+    WHERE id = 'congressional_hearings';
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION rebuild_hearing_stats()
+RETURNS VOID
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    batch JSONB;
+BEGIN
+    TRUNCATE hearing_stats_committees, hearing_stats_types, hearing_stats_names;
+    DELETE FROM hearing_stats_totals;
+    INSERT INTO hearing_stats_totals (id) VALUES ('congressional_hearings');
+    -- 1,000 hearings at a time rather than one array of the whole table
+    FOR batch IN
+        SELECT jsonb_agg(jsonb_build_object('committee', committee, 'hearing_type', hearing_type,
+                                            'document_url', document_url, 'witnesses', witnesses))
+        FROM congressional_hearings GROUP BY id / 1000
+    LOOP
+        PERFORM apply_hearing_stats_delta(batch, 1);
+    END LOOP;
+END;
+$$;
+
+-- Counters are only written by the triggers; the API roles must not call these as RPCs
+REVOKE EXECUTE ON FUNCTION apply_hearing_stats_delta(JSONB, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION rebuild_hearing_stats() FROM PUBLIC, anon, authenticated;
+
+CREATE OR REPLACE FUNCTION hearing_stats_on_write()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM rebuild_hearing_stats();
+        RETURN NULL;
+    END IF;
+    -- old_rows / new_rows only exist for the events that define them
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_hearing_stats_delta(
+            (SELECT jsonb_agg(jsonb_build_object('committee', committee, 'hearing_type', hearing_type,
+                                                 'document_url', document_url, 'witnesses', witnesses))
+             FROM old_rows), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_hearing_stats_delta(
+            (SELECT jsonb_agg(jsonb_build_object('committee', committee, 'hearing_type', hearing_type,
+                                                 'document_url', document_url, 'witnesses', witnesses))
+             FROM new_rows), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS congressional_hearings_stats_insert ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_stats_insert
+AFTER INSERT ON congressional_hearings
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hearing_stats_on_write();
+
+DROP TRIGGER IF EXISTS congressional_hearings_stats_update ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_stats_update
+AFTER UPDATE ON congressional_hearings
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hearing_stats_on_write();
+
+DROP TRIGGER IF EXISTS congressional_hearings_stats_delete ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_stats_delete
+AFTER DELETE ON congressional_hearings
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hearing_stats_on_write();
+
+DROP TRIGGER IF EXISTS congressional_hearings_stats_truncate ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_stats_truncate
+AFTER TRUNCATE ON congressional_hearings
+FOR EACH STATEMENT EXECUTE FUNCTION hearing_stats_on_write();
+
+-- Same keys as refresh_hearing_metrics(), always current
+CREATE OR REPLACE FUNCTION hearing_stats()
+RETURNS JSONB
+LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public AS $$
+    SELECT jsonb_build_object(
+        'hearings', t.hearings,
+        'witness_appearances', t.witness_appearances,
+        'unique_organizations', t.unique_organizations,
+        'documents', t.documents,
+        'committees', (SELECT count(*) FROM hearing_stats_committees WHERE hearing_count > 0),
+        'earliest_hearing', (SELECT min(hearing_date)::text FROM congressional_hearings),
+        'latest_hearing', (SELECT max(hearing_date)::text FROM congressional_hearings),
+        'hearing_types',
+            (SELECT coalesce(jsonb_object_agg(hearing_type, hearing_count), '{}'::jsonb)
+             FROM hearing_stats_types WHERE hearing_count > 0),
+        'top_committees',
+            (SELECT coalesce(jsonb_agg(jsonb_build_object(
+                        'committee', committee, 'hearing_count', hearing_count)
+                    ORDER BY hearing_count DESC, committee), '[]'::jsonb)
+             FROM (SELECT * FROM hearing_stats_committees WHERE hearing_count > 0
+                   ORDER BY hearing_count DESC, committee LIMIT 10) AS top)
+    )
+    FROM hearing_stats_totals AS t
+    WHERE t.id = 'congressional_hearings'
+$$;
+
+SELECT rebuild_hearing_stats();
+ANALYZE hearing_stats_names;
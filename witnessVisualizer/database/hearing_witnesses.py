@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Witness search over the flattened hearing_witnesses table (see hearing_witnesses.sql).
+
+Filtering, ordering and pagination all happen in the database; the trigram
+indexes on search_text and committee serve the substring matches.
+"""
+
+from typing import Any, Dict, List, Optional
+
+WITNESS_INDEX_TABLE = 'hearing_witnesses'
+
+
+def like_pattern(term: str) -> str:
+    """Substring ILIKE pattern with LIKE wildcards in the user's term escaped"""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def search_hearing_witnesses(supabase, query: Optional[str] = None, witness_type: Optional[str] = None,
+                             committee: Optional[str] = None, limit: int = 50,
+                             offset: int = 0) -> List[Dict[str, Any]]:
+    """Witness appearances matching the filters, newest hearing first, with hearing context"""
+    db_query = supabase.table(WITNESS_INDEX_TABLE) \
+        .select('hearing_id, hearing_name, committee, hearing_date, witness')
+
+    if query:
+        db_query = db_query.ilike('search_text', like_pattern(query.lower()))
+    if witness_type:
+        db_query = db_query.eq('witness_type', witness_type)
+    if committee:
+        db_query = db_query.ilike('committee', like_pattern(committee))
+
+    result = db_query.order('hearing_date', desc=True).order('hearing_id', desc=True) \
+        .order('position').range(offset, offset + limit - 1).execute()
+
+    return [
+        {
+            **row['witness'],
+            'hearing_id': row['hearing_id'],
+            'hearing_name': row['hearing_name'],
+            'committee': row['committee'],
+            'hearing_date': row['hearing_date'],
+        }
+        for row in result.data
+    ]
@@ -0,0 +1,98 @@
+-- Flattened witness index for the /witnesses search endpoint.
+--
+-- One row per witness appearance, copied out of congressional_hearings.witnesses
+-- so searches filter, sort and paginate in the database instead of fetching every
+-- hearing and decoding every witnesses blob per request. search_text (lowercased
+-- name, title and organization) and committee carry trigram GIN indexes, so
+-- substring (ILIKE '%term%') matches use an index. A row trigger keeps the table
+-- in sync with inserts and updates; deletes cascade.
+--
+-- Run in the Supabase SQL Editor (or psql) after database/hearing_metrics.sql,
+-- which defines hearing_witnesses_array(). Re-running it rebuilds the table from
+-- the existing hearings.
+
+CREATE TABLE IF NOT EXISTS hearing_witnesses (
+    hearing_id BIGINT NOT NULL REFERENCES congressional_hearings(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    title TEXT,
+    organization TEXT,
+    witness_type TEXT,
+    hearing_name TEXT,
+    committee TEXT,
+    hearing_date DATE,
+    witness JSONB NOT NULL,
+    search_text TEXT GENERATED ALWAYS AS (
+        lower(coalesce(name, '') || ' ' || coalesce(title, '') || ' ' || coalesce(organization, ''))
+    ) STORED,
+    PRIMARY KEY (hearing_id, position)
+);
+
+-- Newest hearings first, witnesses in panel order: the endpoint's sort and page key
+CREATE INDEX IF NOT EXISTS hearing_witnesses_date_idx
+    ON hearing_witnesses (hearing_date DESC, hearing_id DESC, position);
+CREATE INDEX IF NOT EXISTS hearing_witnesses_type_idx ON hearing_witnesses (witness_type);
+
+-- pg_trgm ships with Supabase; plain Postgres builds without contrib still get a
+-- working (sequentially scanned) search
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS hearing_witnesses_search_trgm_idx
+            ON hearing_witnesses USING gin (search_text gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS hearing_witnesses_committee_trgm_idx
+            ON hearing_witnesses USING gin (committee gin_trgm_ops);
+    ELSE
+        RAISE NOTICE 'pg_trgm is not available; hearing_witnesses searches will not use trigram indexes';
+    END IF;
+END;
+$$;
+
+ALTER TABLE hearing_witnesses ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON hearing_witnesses;
+CREATE POLICY "Public read access" ON hearing_witnesses FOR SELECT USING (true);
+
+CREATE OR REPLACE FUNCTION sync_hearing_witnesses()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    DELETE FROM hearing_witnesses WHERE hearing_id = NEW.id;
+    INSERT INTO hearing_witnesses
+        (hearing_id, position, name, title, organization, witness_type,
+         hearing_name, committee, hearing_date, witness)
+    SELECT NEW.id, e.position,
+           nullif(btrim(e.witness->>'name'), ''),
+           nullif(btrim(e.witness->>'title'), ''),
+           nullif(btrim(e.witness->>'organization'), ''),
+           e.witness->>'witness_type',
+           NEW.hearing_name, NEW.committee, NEW.hearing_date, e.witness
+    FROM jsonb_array_elements(hearing_witnesses_array(NEW.witnesses))
+         WITH ORDINALITY AS e(witness, position)
+    WHERE jsonb_typeof(e.witness) = 'object';
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS congressional_hearings_sync_witnesses ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_sync_witnesses
+AFTER INSERT OR UPDATE OF witnesses, hearing_name, committee, hearing_date ON congressional_hearings
+FOR EACH ROW EXECUTE FUNCTION sync_hearing_witnesses();
+
+-- Backfill from the hearings already loaded
+TRUNCATE hearing_witnesses;
+INSERT INTO hearing_witnesses
+    (hearing_id, position, name, title, organization, witness_type,
+     hearing_name, committee, hearing_date, witness)
+SELECT h.id, e.position,
+       nullif(btrim(e.witness->>'name'), ''),
+       nullif(btrim(e.witness->>'title'), ''),
+       nullif(btrim(e.witness->>'organization'), ''),
+       e.witness->>'witness_type',
+       h.hearing_name, h.committee, h.hearing_date, e.witness
+FROM congressional_hearings AS h,
+     jsonb_array_elements(hearing_witnesses_array(h.witnesses))
+         WITH ORDINALITY AS e(witness, position)
+WHERE jsonb_typeof(e.witness) = 'object';
+
+ANALYZE hearing_witnesses;
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Build the local SQLite backend (database/repository.py SQLiteRepository).
+
+Sources:
+- hearings_combined.db from witnessWitness/code/combine_hearings.py
+- JSON exported from Supabase: a JSON array of congressional_hearings rows, or
+  NDJSON as streamed by GET /congressional-hearings/export
+
+    python -m database.local_db ../witnessWitness/hearings_combined.db --out witness_local.sqlite
+    python -m database.local_db congressional_hearings.ndjson
+
+The file holds congressional_hearings, the flattened hearing_witnesses index,
+the resolved witness_entities, the search_documents FTS5 index with its facet
+counts and a precomputed hearing_metrics row. With WITNESS_BACKEND=sqlite the
+APIs build it on first start (and rebuild it when the source is newer) via
+ensure_local_db().
+"""
+
+import json
+import os
+import sqlite3
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from database.hearing_metrics import METRICS_ID, compute_hearing_metrics, json_list, parse_witnesses
+from database.hearing_search import facet_counts, search_documents
+from database.repository import HEARING_COLUMNS
+from database.witness_entities import resolve_all
+
+SCHEMA = """
+CREATE TABLE congressional_hearings (
+    id INTEGER PRIMARY KEY,
+    congress INTEGER,
+    hearing_type TEXT,
+    hearing_subtype TEXT,
+    committee TEXT,
+    hearing_date TEXT,
+    hearing_name TEXT,
+    serial_no TEXT,
+    detail_url TEXT,
+    document_url TEXT,
+    members TEXT,
+    witnesses TEXT,
+    bill_numbers TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX congressional_hearings_date_id_idx ON congressional_hearings (hearing_date DESC, id DESC);
+
+CREATE TABLE hearing_witnesses (
+    hearing_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    title TEXT,
+    organization TEXT,
+    witness_type TEXT,
+    hearing_name TEXT,
+    committee TEXT,
+    hearing_date TEXT,
+    witness TEXT NOT NULL,
+    search_text TEXT NOT NULL,
+    PRIMARY KEY (hearing_id, position)
+);
+CREATE INDEX hearing_witnesses_date_idx ON hearing_witnesses (hearing_date DESC, hearing_id DESC, position);
+
+CREATE TABLE witness_entities (
+    entity_id TEXT PRIMARY KEY,
+    canonical_name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    block_key TEXT NOT NULL,
+    middle_initials TEXT,
+    title TEXT,
+    organization TEXT,
+    aliases TEXT NOT NULL,
+    hearing_ids TEXT NOT NULL,
+    hearings TEXT NOT NULL,
+    committees TEXT NOT NULL,
+    hearing_count INTEGER NOT NULL,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE INDEX witness_entities_last_seen_idx ON witness_entities (last_seen DESC, entity_id);
+
+CREATE TABLE witness_entity_appearances (
+    hearing_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    entity_id TEXT NOT NULL,
+    PRIMARY KEY (hearing_id, position)
+);
+CREATE INDEX witness_entity_appearances_entity_idx ON witness_entity_appearances (entity_id);
+
+CREATE TABLE search_documents (
+    hearing_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT,
+    title TEXT,
+    organization TEXT,
+    witness_type TEXT,
+    hearing_name TEXT,
+    committee TEXT,
+    congress INTEGER,
+    hearing_type TEXT,
+    hearing_date TEXT,
+    year INTEGER,
+    PRIMARY KEY (hearing_id, position)
+);
+CREATE INDEX search_documents_date_idx ON search_documents (hearing_date DESC, hearing_id DESC, position);
+CREATE INDEX search_documents_committee_idx ON search_documents (committee);
+
+-- Text of search_documents by rowid; columns weighted like the tsvector's A, B and C
+CREATE VIRTUAL TABLE search_index USING fts5(
+    heading, detail, context, content='', tokenize='porter unicode61'
+);
+
+CREATE TABLE search_facet_counts (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    documents INTEGER NOT NULL,
+    PRIMARY KEY (facet, value)
+);
+
+CREATE TABLE hearing_metrics (
+    id TEXT PRIMARY KEY,
+    metrics TEXT NOT NULL,
+    refreshed_at TEXT
+);
+"""
+
+
+SEARCH_DOCUMENT_COLUMNS = [
+    'hearing_id', 'position', 'kind', 'name', 'title', 'organization', 'witness_type',
+    'hearing_name', 'committee', 'congress', 'hearing_type', 'hearing_date', 'year'
+]
+
+
+def congress_for(hearing_date: str) -> int:
+    """Congress in session on an ISO date; each one starts January 3 of an odd year"""
+    day = date.fromisoformat(hearing_date)
+    year = day.year if (day.year % 2 == 0 or day >= date(day.year, 1, 3)) else day.year - 1
+    return (year - 1789) // 2 + 1
+
+
+def _clean(value: Any) -> Optional[str]:
+    return value.strip() or None if isinstance(value, str) else None
+
+
+def combined_db_hearings(path: Path) -> Iterator[Dict[str, Any]]:
+    """congressional_hearings rows from the hearings/witnesses tables of hearings_combined.db"""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    witnesses: Dict[int, list] = {}
+    for row in conn.execute('SELECT hearing_id, name, title, truth_in_testimony_pdf FROM witnesses ORDER BY hearing_id, id'):
+        witness = {'name': row['name'], 'title': row['title']}
+        if row['truth_in_testimony_pdf']:
+            witness['documents'] = [{'type': 'truth_in_testimony', 'url': row['truth_in_testimony_pdf']}]
+        witnesses.setdefault(row['hearing_id'], []).append(witness)
+
+    for row in conn.execute('SELECT * FROM hearings ORDER BY id'):
+        scraped_at = row['scraped_at'] or datetime.now().isoformat()
+        yield {
+            'id': row['id'],
+            'hearing_type': row['chamber'],
+            'committee': row['committee'] or '',
+            'hearing_date': row['date'],
+            'hearing_name': row['title'] or '',
+            'detail_url': row['url'] or '',
+            'document_url': row['witness_list_pdf'],
+            'members': [],
+            'witnesses': witnesses.get(row['id'], []),
+            'bill_numbers': [],
+            'created_at': scraped_at,
+            'updated_at': scraped_at,
+        }
+    conn.close()
+
+
+def json_hearings(path: Path) -> Iterator[Dict[str, Any]]:
+    """congressional_hearings rows from a JSON array (or {"hearings": [...]}) or NDJSON export"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.ndjson', '.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('hearings') or data.get('data') or []
+    yield from data
+
+
+def build_local_db(source: Path, target: Path) -> Dict[str, int]:
+    """Write target from source (hearings_combined.db or JSON); replaces target atomically"""
+    hearings = json_hearings(source) if source.suffix in ('.json', '.ndjson', '.jsonl') else combined_db_hearings(source)
+    tmp = target.with_name(target.name + '.tmp')
+    if tmp.exists():
+        tmp.unlink()
+
+    conn = sqlite3.connect(tmp)
+    conn.executescript(SCHEMA)
+    stats = {'hearings': 0, 'witnesses': 0, 'skipped': 0}
+    facets = Counter()
+    next_id = 1
+    for hearing in hearings:
+        try:
+            hearing_date = date.fromisoformat(str(hearing.get('hearing_date'))[:10]).isoformat()
+        except ValueError:
+            stats['skipped'] += 1  # the APIs need a date to sort and page on
+            continue
+        hearing_id = hearing.get('id') or next_id
+        next_id = max(next_id, int(hearing_id)) + 1
+        now = datetime.now().isoformat()
+        row = {
+            **{column: hearing.get(column) for column in HEARING_COLUMNS},
+            'id': hearing_id,
+            'congress': hearing.get('congress') or congress_for(hearing_date),
+            'hearing_date': hearing_date,
+            'members': json.dumps(json_list(hearing.get('members'))),
+            'witnesses': json.dumps(parse_witnesses(hearing.get('witnesses'))),
+            'bill_numbers': json.dumps(json_list(hearing.get('bill_numbers'))),
+            'created_at': hearing.get('created_at') or now,
+            'updated_at': hearing.get('updated_at') or now,
+        }
+        conn.execute(
+            f"INSERT INTO congressional_hearings ({', '.join(HEARING_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in HEARING_COLUMNS)})",
+            [row[column] for column in HEARING_COLUMNS],
+        )
+        witnesses = parse_witnesses(hearing.get('witnesses'))
+        # Same flattening as hearing_witnesses.sql
+        for position, witness in enumerate(witnesses, start=1):
+            name, title, organization = (_clean(witness.get(k)) for k in ('name', 'title', 'organization'))
+            conn.execute(
+                'INSERT INTO hearing_witnesses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (hearing_id, position, name, title, organization, witness.get('witness_type'),
+                 row['hearing_name'], row['committee'], hearing_date, json.dumps(witness),
+                 ' '.join([name or '', title or '', organization or '']).lower()),
+            )
+            stats['witnesses'] += 1
+        documents = search_documents(row, witnesses)
+        for document in documents:
+            rowid = conn.execute(
+                f"INSERT INTO search_documents ({', '.join(SEARCH_DOCUMENT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in SEARCH_DOCUMENT_COLUMNS)})",
+                [document[column] for column in SEARCH_DOCUMENT_COLUMNS],
+            ).lastrowid
+            conn.execute('INSERT INTO search_index (rowid, heading, detail, context) VALUES (?, ?, ?, ?)',
+                         (rowid, document['heading'], document['detail'], document['context']))
+        facets.update(facet_counts(documents))
+        stats['hearings'] += 1
+
+    conn.executemany('INSERT INTO search_facet_counts VALUES (?, ?, ?)',
+                     [(facet, json.dumps(value), count) for (facet, value), count in facets.items()])
+
+    metrics = compute_hearing_metrics(
+        {'committee': r[0], 'hearing_type': r[1], 'hearing_date': r[2], 'document_url': r[3], 'witnesses': r[4]}
+        for r in conn.execute('SELECT committee, hearing_type, hearing_date, document_url, witnesses '
+                              'FROM congressional_hearings')
+    )
+    conn.execute('INSERT INTO hearing_metrics VALUES (?, ?, ?)',
+                 (METRICS_ID, json.dumps(metrics), datetime.now().isoformat()))
+
+    # Entity resolution in one in-memory pass; the file is rebuilt, not updated
+    entities, appearances = resolve_all(
+        {'id': r[0], 'hearing_name': r[1], 'committee': r[2], 'hearing_date': r[3], 'witnesses': r[4]}
+        for r in conn.execute('SELECT id, hearing_name, committee, hearing_date, witnesses '
+                              'FROM congressional_hearings ORDER BY id')
+    )
+    conn.executemany(
+        'INSERT INTO witness_entities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [(e['entity_id'], e['canonical_name'], e['name_key'], e['block_key'], e['middle_initials'],
+          e['title'], e['organization'], json.dumps(e['aliases']), json.dumps(e['hearing_ids']),
+          json.dumps(e['hearings']), json.dumps(e['committees']), e['hearing_count'],
+          e['first_seen'], e['last_seen']) for e in entities],
+    )
+    conn.executemany('INSERT INTO witness_entity_appearances VALUES (:hearing_id, :position, :entity_id)', appearances)
+    stats['entities'] = len(entities)
+    conn.commit()
+    conn.execute('ANALYZE')
+    conn.close()
+    os.replace(tmp, target)
+    return stats
+
+
+def _tables(path: Path) -> set:
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    finally:
+        conn.close()
+
+
+def ensure_local_db(path: str) -> str:
+    """Path of a ready local database for path, building <name>.witness.sqlite next to a source file if needed"""
+    source = Path(path)
+    if not source.exists():
+        raise FileNotFoundError(f"Local witness database or source not found: {source}")
+    if source.suffix not in ('.json', '.ndjson', '.jsonl') and 'congressional_hearings' in _tables(source):
+        return str(source)
+
+    target = source.with_name(source.stem + '.witness.sqlite')
+    # Also rebuild files from before a table was added to SCHEMA
+    if (not target.exists() or target.stat().st_mtime < source.stat().st_mtime
+            or not {'witness_entities', 'search_documents'} <= _tables(target)):
+        print(f"🔨 Building local witness database {target} from {source}...")
+        stats = build_local_db(source, target)
+        print(f"✅ {stats['hearings']} hearings, {stats['witnesses']} witness appearances, "
+              f"{stats['entities']} distinct witnesses ({stats['skipped']} hearings without a usable date skipped)")
+    return str(target)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build the local SQLite backend for the witness APIs')
+    parser.add_argument('source', help='hearings_combined.db, or a JSON/NDJSON export of congressional_hearings')
+    parser.add_argument('--out', help='Output SQLite file (default: <source>.witness.sqlite)')
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    target = Path(args.out) if args.out else source.with_name(source.stem + '.witness.sqlite')
+    stats = build_local_db(source, target)
+    print(f"Wrote {target}: {stats['hearings']} hearings, {stats['witnesses']} witness appearances, "
+          f"{stats['entities']} distinct witnesses, {stats['skipped']} skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Hearing data access for the witness APIs, with interchangeable backends.
+
+- SupabaseRepository: the hosted congressional_hearings table (default)
+- SQLiteRepository: a local, read-only SQLite file built by database/local_db.py
+  from hearings_combined.db or exported JSON, for offline use, load tests and
+  read replicas
+
+Pick one with WITNESS_BACKEND=supabase|sqlite; the SQLite file (or the
+hearings_combined.db / JSON to build it from) comes from WITNESS_SQLITE_PATH.
+Rows look the same from both: PostgREST-style dicts with hearing_date as an ISO
+string and members/witnesses/bill_numbers as lists.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from database.hearing_metrics import METRICS_ID, HearingMetricsStore, compute_hearing_metrics
+from database.hearing_pages import PAGE_SIZE, fetch_hearing_page, filter_hearings, hearing_cursor, parse_cursor
+from database.hearing_search import HIT_COLUMNS, SEARCH_FACETS, faceted_search, facet_lists, fts5_query
+from database.hearing_witnesses import like_pattern, search_hearing_witnesses
+from database.witness_entities import ENTITIES_TABLE, entity_cursor, parse_entity_cursor
+
+BACKEND_ENV = 'WITNESS_BACKEND'
+SQLITE_PATH_ENV = 'WITNESS_SQLITE_PATH'
+
+HEARING_COLUMNS = [
+    'id', 'congress', 'hearing_type', 'hearing_subtype', 'committee', 'hearing_date', 'hearing_name',
+    'serial_no', 'detail_url', 'document_url', 'members', 'witnesses', 'bill_numbers',
+    'created_at', 'updated_at'
+]
+JSON_COLUMNS = {'members', 'witnesses', 'bill_numbers'}
+ENTITY_COLUMNS = 'entity_id, canonical_name, title, organization, hearings, committees, hearing_count, last_seen'
+
+
+class HearingRepository(ABC):
+    """Read access to congressional hearings, newest first.
+
+    Filters accepted by the list methods: committee (substring, case-insensitive),
+    hearing_type, congress, start_date and end_date.
+    """
+
+    @abstractmethod
+    def list_hearings(self, columns: str, limit: int, offset: int = 0, **filters) -> List[Dict[str, Any]]:
+        """Offset page of hearings"""
+
+    @abstractmethod
+    def hearing_page(self, columns: str, limit: int, cursor: Optional[str] = None, **filters) -> List[Dict[str, Any]]:
+        """Keyset page of hearings after cursor (see hearing_pages.py); columns must include id and hearing_date"""
+
+    @abstractmethod
+    def get_hearing(self, hearing_id: int) -> Optional[Dict[str, Any]]: ...
+
+    @abstractmethod
+    def count_hearings(self) -> int: ...
+
+    @abstractmethod
+    def hearing_metrics(self) -> Dict[str, Any]:
+        """The summary computed by compute_hearing_metrics / refresh_hearing_metrics()"""
+
+    @abstractmethod
+    def search_witnesses(self, query: Optional[str] = None, witness_type: Optional[str] = None,
+                         committee: Optional[str] = None, limit: int = 50,
+                         offset: int = 0) -> List[Dict[str, Any]]:
+        """Witness appearances with hearing context, as search_hearing_witnesses returns them"""
+
+    @abstractmethod
+    def faceted_search(self, q: Optional[str] = None, limit: int = 20, offset: int = 0,
+                       facet_limit: int = 20, **filters) -> Dict[str, Any]:
+        """Ranked hits and facet counts (database/hearing_search.py); filters are exact facet values"""
+
+    @abstractmethod
+    def witness_entities(self, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """Resolved witnesses (database/witness_entities.py), most recently seen first"""
+
+    @abstractmethod
+    def witness_entity_page(self, limit: int, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Keyset page of resolved witnesses after cursor (see entity_cursor), in the same order"""
+
+    @abstractmethod
+    def count_witness_entities(self) -> int: ...
+
+    def iter_witness_entities(self, page_size: int = PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        cursor = None
+        while True:
+            page = self.witness_entity_page(page_size, cursor)
+            yield from page
+            if len(page) < page_size:
+                return
+            cursor = entity_cursor(page[-1])
+
+    def iter_hearings(self, columns: str, page_size: int = PAGE_SIZE, **filters) -> Iterator[Dict[str, Any]]:
+        """Every matching hearing, holding one page in memory at a time"""
+        cursor = None
+        while True:
+            page = self.hearing_page(columns, page_size, cursor, **filters)
+            yield from page
+            if len(page) < page_size:
+                return
+            cursor = hearing_cursor(page[-1])
+
+
+class SupabaseRepository(HearingRepository):
+    def __init__(self, client_factory: Callable[[], Any]):
+        # A factory so a missing configuration surfaces per request, as before
+        self._client_factory = client_factory
+        self._metrics: Optional[HearingMetricsStore] = None
+
+    @property
+    def client(self):
+        return self._client_factory()
+
+    def list_hearings(self, columns, limit, offset=0, **filters):
+        query = filter_hearings(self.client.table('congressional_hearings').select(columns), **filters)
+        return query.order('hearing_date', desc=True).order('id', desc=True) \
+            .range(offset, offset + limit - 1).execute().data or []
+
+    def hearing_page(self, columns, limit, cursor=None, **filters):
+        return fetch_hearing_page(self.client, columns, limit, cursor, **filters)
+
+    def get_hearing(self, hearing_id):
+        result = self.client.table('congressional_hearings').select('*').eq('id', hearing_id).execute()
+        return result.data[0] if result.data else None
+
+    def count_hearings(self):
+        return self.client.table('congressional_hearings').select('id', count='exact').execute().count or 0
+
+    def hearing_metrics(self):
+        if self._metrics is None:
+            self._metrics = HearingMetricsStore(self.client)
+        return self._metrics.get()
+
+    def search_witnesses(self, query=None, witness_type=None, committee=None, limit=50, offset=0):
+        return search_hearing_witnesses(self.client, query=query, witness_type=witness_type,
+                                        committee=committee, limit=limit, offset=offset)
+
+    def faceted_search(self, q=None, limit=20, offset=0, facet_limit=20, **filters):
+        return faceted_search(self.client, q, limit, offset, facet_limit, **filters)
+
+    def witness_entities(self, limit, offset=0):
+        return self.client.table(ENTITIES_TABLE).select(ENTITY_COLUMNS) \
+            .order('last_seen', desc=True).order('entity_id') \
+            .range(offset, offset + limit - 1).execute().data or []
+
+    def witness_entity_page(self, limit, cursor=None):
+        # Postgres sorts NULL last_seen first in descending order, as witness_entities_last_seen_idx does
+        query = self.client.table(ENTITIES_TABLE).select(ENTITY_COLUMNS)
+        if cursor:
+            last_seen, entity_id = parse_entity_cursor(cursor)
+            if last_seen is None:
+                query = query.or_(f'last_seen.not.is.null,and(last_seen.is.null,entity_id.gt.{entity_id})')
+            else:
+                query = query.or_(f'last_seen.lt.{last_seen},and(last_seen.eq.{last_seen},entity_id.gt.{entity_id})')
+        return query.order('last_seen', desc=True).order('entity_id').limit(limit).execute().data or []
+
+    def count_witness_entities(self):
+        return self.client.table(ENTITIES_TABLE).select('entity_id', count='exact').limit(1).execute().count or 0
+
+
+class SQLiteRepository(HearingRepository):
+    """Read-only queries against a file built by database/local_db.py; one connection per thread"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        tables = {row[0] for row in self._conn().execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if 'congressional_hearings' not in tables:
+            raise ValueError(f"{path} has no congressional_hearings table; build it with database/local_db.py")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _columns(columns: str) -> str:
+        if columns.strip() == '*':
+            return ', '.join(HEARING_COLUMNS)
+        names = [c.strip() for c in columns.split(',')]
+        unknown = [c for c in names if c not in HEARING_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown congressional_hearings columns: {unknown}")
+        return ', '.join(names)
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            key: json.loads(row[key]) if key in JSON_COLUMNS and row[key] is not None else row[key]
+            for key in row.keys()
+        }
+
+    @staticmethod
+    def _where(committee: Optional[str] = None, hearing_type: Optional[str] = None,
+               congress: Optional[int] = None, start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> Tuple[List[str], List[Any]]:
+        # SQLite's LIKE is case-insensitive for ASCII, like ilike
+        clauses, params = ['1 = 1'], []
+        if committee:
+            clauses.append("committee LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(committee))
+        if hearing_type:
+            clauses.append('hearing_type = ?')
+            params.append(hearing_type)
+        if congress:
+            clauses.append('congress = ?')
+            params.append(congress)
+        if start_date:
+            clauses.append('hearing_date >= ?')
+            params.append(start_date.isoformat())
+        if end_date:
+            clauses.append('hearing_date <= ?')
+            params.append(end_date.isoformat())
+        return clauses, params
+
+    def _select(self, columns: str, clauses: List[str], params: List[Any], tail: str) -> List[Dict[str, Any]]:
+        sql = f"SELECT {self._columns(columns)} FROM congressional_hearings WHERE {' AND '.join(clauses)} {tail}"
+        return [self._row(row) for row in self._conn().execute(sql, params)]
+
+    def list_hearings(self, columns, limit, offset=0, **filters):
+        clauses, params = self._where(**filters)
+        return self._select(columns, clauses, params + [limit, offset],
+                            'ORDER BY hearing_date DESC, id DESC LIMIT ? OFFSET ?')
+
+    def hearing_page(self, columns, limit, cursor=None, **filters):
+        clauses, params = self._where(**filters)
+        if cursor:
+            hearing_date, hearing_id = parse_cursor(cursor)
+            clauses.append('(hearing_date < ? OR (hearing_date = ? AND id < ?))')
+            params += [hearing_date, hearing_date, hearing_id]
+        return self._select(columns, clauses, params + [limit], 'ORDER BY hearing_date DESC, id DESC LIMIT ?')
+
+    def get_hearing(self, hearing_id):
+        rows = self._select('*', ['id = ?'], [hearing_id], '')
+        return rows[0] if rows else None
+
+    def count_hearings(self):
+        return self._conn().execute('SELECT count(*) FROM congressional_hearings').fetchone()[0]
+
+    def hearing_metrics(self):
+        row = self._conn().execute('SELECT metrics FROM hearing_metrics WHERE id = ?', (METRICS_ID,)).fetchone()
+        if row:
+            return json.loads(row[0])
+        return compute_hearing_metrics(self.iter_hearings('id, committee, hearing_type, hearing_date, document_url, witnesses'))
+
+    def search_witnesses(self, query=None, witness_type=None, committee=None, limit=50, offset=0):
+        clauses, params = ['1 = 1'], []
+        if query:
+            clauses.append("search_text LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(query.lower()))
+        if witness_type:
+            clauses.append('witness_type = ?')
+            params.append(witness_type)
+        if committee:
+            clauses.append("committee LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(committee))
+        rows = self._conn().execute(
+            f"""SELECT hearing_id, hearing_name, committee, hearing_date, witness
+                FROM hearing_witnesses WHERE {' AND '.join(clauses)}
+                ORDER BY hearing_date DESC, hearing_id DESC, position
+                LIMIT ? OFFSET ?""",
+            params + [limit, offset],
+        )
+        return [
+            {
+                **json.loads(row['witness']),
+                'hearing_id': row['hearing_id'],
+                'hearing_name': row['hearing_name'],
+                'committee': row['committee'],
+                'hearing_date': row['hearing_date'],
+            }
+            for row in rows
+        ]
+
+    def faceted_search(self, q=None, limit=20, offset=0, facet_limit=20, **filters):
+        match = fts5_query(q) if q and q.strip() else None
+        if q and q.strip() and match is None:
+            return {'query': q, 'total': 0, 'hits': [], 'facets': facet_lists([], facet_limit)}
+        source, score, clauses, params = 'search_documents AS d', '0', ['1 = 1'], []
+        if match is not None:
+            # bm25 is lower for better matches; column weights as for the tsvector's A, B and C
+            source = 'search_index JOIN search_documents AS d ON d.rowid = search_index.rowid'
+            score = '-bm25(search_index, 1.0, 0.4, 0.2)'
+            clauses.append('search_index MATCH ?')
+            params.append(match)
+        for facet in SEARCH_FACETS:
+            if filters.get(facet) is not None:
+                clauses.append(f'd.{facet} = ?')
+                params.append(filters[facet])
+        where = ' AND '.join(clauses)
+        conn = self._conn()
+
+        if not params:
+            # Everything matches: the facet counts were computed when the file was built
+            counts = [(row[0], json.loads(row[1]), row[2])
+                      for row in conn.execute('SELECT facet, value, documents FROM search_facet_counts')]
+        else:
+            counts = conn.execute(
+                f"WITH selected AS (SELECT {', '.join(f'd.{facet}' for facet in SEARCH_FACETS)} "
+                f"FROM {source} WHERE {where}) "
+                + ' UNION ALL '.join(f"SELECT '{facet}', {facet}, count(*) FROM selected "
+                                     f"WHERE {facet} IS NOT NULL GROUP BY {facet}" for facet in SEARCH_FACETS),
+                params,
+            ).fetchall()
+
+        # Without a query every score is 0 and the date index gives the order
+        order = 'score DESC, ' if match is not None else ''
+        rows = conn.execute(
+            f"SELECT {', '.join(f'd.{column}' for column in HIT_COLUMNS)}, {score} AS score "
+            f"FROM {source} WHERE {where} "
+            f"ORDER BY {order}d.hearing_date DESC, d.hearing_id DESC, d.position LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        )
+        return {
+            'query': q,
+            'total': sum(count for facet, _, count in counts if facet == 'kind'),
+            'hits': [{**dict(row), 'score': round(row['score'], 4)} for row in rows],
+            'facets': facet_lists(counts, facet_limit),
+        }
+
+    @staticmethod
+    def _entity(row: sqlite3.Row) -> Dict[str, Any]:
+        return {**dict(row), 'hearings': json.loads(row['hearings']), 'committees': json.loads(row['committees'])}
+
+    def witness_entities(self, limit, offset=0):
+        # NULLS FIRST as in Postgres, so both backends page in the same order
+        rows = self._conn().execute(
+            f"SELECT {ENTITY_COLUMNS} FROM {ENTITIES_TABLE} "
+            f"ORDER BY last_seen DESC NULLS FIRST, entity_id LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+        return [self._entity(row) for row in rows]
+
+    def witness_entity_page(self, limit, cursor=None):
+        clause, params = '1 = 1', []
+        if cursor:
+            last_seen, entity_id = parse_entity_cursor(cursor)
+            if last_seen is None:
+                clause, params = 'last_seen IS NOT NULL OR (last_seen IS NULL AND entity_id > ?)', [entity_id]
+            else:
+                clause = 'last_seen < ? OR (last_seen = ? AND entity_id > ?)'
+                params = [last_seen, last_seen, entity_id]
+        rows = self._conn().execute(
+            f"SELECT {ENTITY_COLUMNS} FROM {ENTITIES_TABLE} WHERE {clause} "
+            f"ORDER BY last_seen DESC NULLS FIRST, entity_id LIMIT ?",
+            params + [limit],
+        )
+        return [self._entity(row) for row in rows]
+
+    def count_witness_entities(self):
+        return self._conn().execute(f'SELECT count(*) FROM {ENTITIES_TABLE}').fetchone()[0]
+
+
+class SupabaseRequired:
+    """Stands in for the Supabase client under a local backend, for endpoints that only Supabase can serve"""
+
+    def __getattr__(self, name):
+        raise RuntimeError(f"this endpoint reads the normalized Supabase tables; set {BACKEND_ENV}=supabase")
+
+
+def repository_from_env(supabase_client: Callable[[], Any]) -> HearingRepository:
+    """The backend named by WITNESS_BACKEND; supabase_client is only called for the Supabase one"""
+    backend = os.getenv(BACKEND_ENV, 'supabase').lower()
+    if backend == 'supabase':
+        return SupabaseRepository(supabase_client)
+    if backend == 'sqlite':
+        from database.local_db import ensure_local_db
+        return SQLiteRepository(ensure_local_db(os.getenv(SQLITE_PATH_ENV, 'witness_local.sqlite')))
+    raise ValueError(f"{BACKEND_ENV} must be 'supabase' or 'sqlite', not {backend!r}")
+
+
+def using_supabase() -> bool:
+    return os.getenv(BACKEND_ENV, 'supabase').lower() == 'supabase'
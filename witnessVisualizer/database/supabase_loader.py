@@ -53,9 +53,35 @@ class SupabaseWitnessLoader:
         # Update session with final stats
         self._update_scraping_session(session_id, stats)
         
+        # The APIs list witnesses from witness_entities; resolve before their caches are dropped
+        self._resolve_witness_entities()
+        
+        # Running API servers would otherwise serve pre-load responses until their TTL expires
+        self._invalidate_api_caches()
+        
         print(f"Data loading complete. Session ID: {session_id}")
         return stats
     
+    def _resolve_witness_entities(self):
+        """Resolve the witnesses of new and edited congressional_hearings rows (database/witness_entities.py)"""
+        from database.witness_entities import WitnessEntityStore
+        
+        try:
+            stats = WitnessEntityStore(self.supabase).resolve_new_hearings()
+            print(f"Resolved witness entities: {stats}")
+        except Exception as e:
+            print(f"Warning: could not resolve witness entities: {e}")
+    
+    def _invalidate_api_caches(self):
+        """Drop cached API responses (api/cache.py) on the servers listed in WITNESS_API_URLS"""
+        from api.cache import notify_api_caches
+        
+        for url, status in notify_api_caches().items():
+            if status == 200:
+                print(f"Invalidated API cache at {url}")
+            else:
+                print(f"Warning: could not invalidate API cache at {url}: {status}")
+    
     def _create_scraping_session(self, data: Dict, notes: str = None) -> str:
         """Create a new scraping session record"""
         metadata = data.get('metadata', {})
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Witness lookups over the normalized tables SupabaseWitnessLoader populates
+(witnesses, organizations, witness_topics/topics, keywords, expertise_areas,
+documents). Each request is one PostgREST query with the related rows embedded;
+witness_indexes.sql adds the indexes those joins and filters use.
+
+Lists are keyset-paginated on witness_id: pass the last witness_id of a page as
+`after` to get the next one.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from database.hearing_witnesses import like_pattern
+
+WITNESS_COLUMNS = (
+    'id, witness_id, name, title, witness_type, tribal_affiliation, created_at, '
+    'witness_topics(topics(name)), keywords(keyword), expertise_areas(area), documents(count)'
+)
+
+
+def quoted(value: str) -> str:
+    """Double-quoted PostgREST value, so commas and parentheses in it survive an or=() filter"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def to_witness_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the embedded rows into the WitnessResponse shape"""
+    organization = row.get('organizations') or {}
+    documents = row.get('documents') or []
+    return {
+        'id': row['id'],
+        'witness_id': row['witness_id'],
+        'name': row['name'],
+        'title': row.get('title') or '',
+        'witness_type': row.get('witness_type') or '',
+        'organization_name': organization.get('name'),
+        'tribal_affiliation': row.get('tribal_affiliation'),
+        'topics': [link['topics']['name'] for link in row.get('witness_topics') or [] if link.get('topics')],
+        'keywords': [k['keyword'] for k in row.get('keywords') or []],
+        'expertise_areas': [e['area'] for e in row.get('expertise_areas') or []],
+        'document_count': documents[0]['count'] if documents else 0,
+        'created_at': row['created_at'],
+    }
+
+
+def list_witnesses(supabase, limit: int = 100, after: Optional[str] = None, offset: int = 0,
+                   witness_type: Optional[str] = None, organization: Optional[str] = None,
+                   topic: Optional[str] = None, search: Optional[str] = None) -> List[Dict[str, Any]]:
+    """One page of witnesses ordered by witness_id, filtered in the database"""
+    # !inner turns an embed into a join that drops witnesses without a match
+    columns = WITNESS_COLUMNS + (', organizations!inner(name)' if organization else ', organizations(name)')
+    if topic:
+        columns += ', topic_filter:witness_topics!inner(topics!inner(name))'
+    query = supabase.table('witnesses').select(columns)
+
+    if witness_type:
+        query = query.eq('witness_type', witness_type)
+    if organization:
+        query = query.ilike('organizations.name', like_pattern(organization))
+    if topic:
+        query = query.eq('topic_filter.topics.name', topic)
+    if search:
+        pattern = quoted(like_pattern(search))
+        query = query.or_(f'name.ilike.{pattern},title.ilike.{pattern}')
+
+    query = query.order('witness_id')
+    if after is not None:
+        query = query.gt('witness_id', after).limit(limit)
+    else:
+        query = query.range(offset, offset + limit - 1)
+
+    return [to_witness_record(row) for row in query.execute().data]
+
+
+def get_witness(supabase, witness_id: str) -> Optional[Dict[str, Any]]:
+    """A single witness by its scraped witness_id, or None"""
+    result = supabase.table('witnesses').select(WITNESS_COLUMNS + ', organizations(name)') \
+        .eq('witness_id', witness_id).limit(1).execute()
+    return to_witness_record(result.data[0]) if result.data else None
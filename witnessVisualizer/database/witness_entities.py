@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Witness entity resolution: one canonical, persistent ID per person.
+
+Each witness appearance in congressional_hearings.witnesses is resolved to a
+row of witness_entities (see witness_entities.sql):
+
+- names are normalized: accents, honorifics ("Dr.", "The Honorable"), suffixes
+  and credentials ("Jr.", "Ph.D."), "Last, First" order and middle names or
+  initials are taken out of the comparison key
+- candidates are blocked by the Soundex code of the last name, so a new
+  appearance is only compared with the handful of entities in its block
+- within a block, the same first (or nick-) name and last name is a match
+  unless middle initials conflict; near-miss spellings also need a matching
+  organization
+
+Resolution is incremental. A trigger queues every inserted hearing, and every
+hearing whose witnesses are edited, in witness_resolution_queue; each run only
+reads the queued hearings plus the entity blocks their witnesses fall in. The
+queue rather than an id watermark decides what is left, so a hearing whose
+insert commits after one with a higher id is not skipped. A queued hearing that
+was resolved before has the entities it pointed to rebuilt from their other
+appearances first. The loaders run this after every ingest; the APIs then list
+and count witness_entities instead of deduplicating every hearing per request.
+
+    python -m database.witness_entities             # resolve new and edited hearings
+    python -m database.witness_entities --rebuild   # start over
+"""
+
+import difflib
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from database.hearing_metrics import PAGE_SIZE, json_list
+
+ENTITIES_TABLE = 'witness_entities'
+APPEARANCES_TABLE = 'witness_entity_appearances'
+QUEUE_TABLE = 'witness_resolution_queue'
+HEARING_COLUMNS = 'id, hearing_name, committee, hearing_date, witnesses'
+
+HONORIFICS = {
+    'the', 'honorable', 'hon', 'dr', 'mr', 'mrs', 'ms', 'miss', 'mx', 'prof', 'professor',
+    'rev', 'reverend', 'sen', 'senator', 'rep', 'representative', 'gov', 'governor',
+    'amb', 'ambassador', 'gen', 'general', 'adm', 'admiral', 'col', 'colonel', 'lt',
+    'ltc', 'capt', 'captain', 'maj', 'major', 'sgt', 'judge', 'justice', 'mayor',
+    'secretary', 'commissioner', 'sister', 'father', 'rabbi', 'chairman', 'chairwoman',
+}
+SUFFIXES = {
+    'jr', 'sr', 'ii', 'iii', 'iv', 'phd', 'md', 'jd', 'esq', 'dds', 'dvm', 'rn', 'np',
+    'mba', 'mph', 'msw', 'cpa', 'cfa', 'pe', 'faap', 'facp', 'ret', 'usa', 'usn', 'usaf', 'usmc', 'uscg', 'ussf',
+}
+NICKNAMES = {
+    'bob': 'robert', 'rob': 'robert', 'bobby': 'robert', 'bill': 'william', 'will': 'william',
+    'billy': 'william', 'jim': 'james', 'jimmy': 'james', 'mike': 'michael', 'tom': 'thomas',
+    'dave': 'david', 'dan': 'daniel', 'danny': 'daniel', 'joe': 'joseph', 'chris': 'christopher',
+    'liz': 'elizabeth', 'beth': 'elizabeth', 'betsy': 'elizabeth', 'kate': 'katherine',
+    'katie': 'katherine', 'kathy': 'katherine', 'steve': 'steven', 'stephen': 'steven',
+    'rick': 'richard', 'dick': 'richard', 'rich': 'richard', 'ben': 'benjamin', 'sam': 'samuel',
+    'tony': 'anthony', 'andy': 'andrew', 'drew': 'andrew', 'matt': 'matthew', 'pat': 'patrick',
+    'jen': 'jennifer', 'jenny': 'jennifer', 'jon': 'jonathan', 'nick': 'nicholas',
+    'alex': 'alexander', 'greg': 'gregory', 'larry': 'lawrence', 'jeff': 'jeffrey',
+    'ed': 'edward', 'ted': 'edward', 'ken': 'kenneth', 'ron': 'ronald', 'don': 'donald',
+    'doug': 'douglas', 'tim': 'timothy', 'peggy': 'margaret', 'maggie': 'margaret',
+    'sue': 'susan', 'debbie': 'deborah', 'cathy': 'catherine', 'chuck': 'charles',
+    'charlie': 'charles', 'hank': 'henry', 'jack': 'john', 'johnny': 'john', 'fred': 'frederick',
+}
+SOUNDEX_CODES = {c: str(d) for d, letters in enumerate(
+    ['aeiouyhw', 'bfpv', 'cgjkqsxz', 'dt', 'l', 'mn', 'r']) for c in letters}
+
+
+@dataclass
+class NameKey:
+    first: str
+    middle: str  # middle initials, e.g. 'q' for "John Q. Public"
+    last: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.first} {self.last}"
+
+    @property
+    def block(self) -> str:
+        return soundex(self.last)
+
+
+def _fold(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def _tokens(text: str) -> List[str]:
+    text = re.sub(r"['’.]", '', text)  # O'Brien -> obrien, Ph.D. -> phd
+    return [t for t in re.split(r'[^a-z0-9-]+', text) if t.strip('-')]
+
+
+def normalize_name(name: Any) -> Optional[NameKey]:
+    """Comparison key of a witness name, or None if it doesn't look like a person's name"""
+    if not isinstance(name, str):
+        return None
+    text = re.sub(r'\([^)]*\)|"[^"]*"', ' ', _fold(name))  # (R-CA), "Bob"
+    # ", Jr." / ", Ph.D., M.P.H." segments
+    segments = [s for s in map(_tokens, text.split(',')) if s and not all(t in SUFFIXES for t in s)]
+    if not segments:
+        return None
+    head = segments[0]
+    surname = [t for t in head if t not in HONORIFICS]
+    if len(surname) == 1 and len(segments) > 1:
+        # "Smith, John" / "Smith, John Q., Director": a lone last name before the first comma
+        tokens = [t for t in head if t in HONORIFICS] + segments[1] + surname
+    else:
+        # "John Smith, Director, Acme Corp.": what follows the name describes the person
+        tokens = head
+
+    while len(tokens) > 2 and tokens[0] in HONORIFICS:
+        tokens.pop(0)
+    if len(tokens) == 2 and tokens[0] in HONORIFICS - {'the'}:
+        return None  # "Senator Smith": too little to resolve on
+    tokens = tokens[:1] + [t for t in tokens[1:] if t not in SUFFIXES]
+    if len(tokens) < 2:
+        return None
+
+    first = NICKNAMES.get(tokens[0], tokens[0])
+    middle = ''.join(t[0] for t in tokens[1:-1])
+    return NameKey(first=first, middle=middle, last=tokens[-1])
+
+
+def soundex(word: str) -> str:
+    letters = [c for c in word if c.isalpha()]
+    if not letters:
+        return word or '0000'
+    code, previous = letters[0].upper(), SOUNDEX_CODES.get(letters[0], '')
+    for c in letters[1:]:
+        digit = SOUNDEX_CODES.get(c, '')
+        if digit and digit != '0' and digit != previous:
+            code += digit
+        if c not in 'hw':
+            previous = digit
+    return (code + '000')[:4]
+
+
+def _org_tokens(organization: Any) -> Set[str]:
+    return set(_tokens(_fold(organization))) - {'the', 'of', 'and', 'for', 'on', 'inc', 'llc'} \
+        if isinstance(organization, str) else set()
+
+
+def match_score(name: NameKey, organization: Any, entity: Dict[str, Any]) -> float:
+    """How well an appearance fits an entity of its block: 0 for no match, higher is better"""
+    if name.middle and entity['middle_initials'] and name.middle[0] != entity['middle_initials'][0]:
+        return 0
+    first_a, last_a = entity['name_key'].split(' ', 1)
+    orgs_a, orgs_b = _org_tokens(entity.get('organization')), _org_tokens(organization)
+    same_org = bool(orgs_a and orgs_b and len(orgs_a & orgs_b) / len(orgs_a | orgs_b) >= 0.5)
+
+    if first_a == name.first and last_a == name.last:
+        return 2 + same_org
+    # Spelling variants and initials only count when the organization agrees too
+    if not same_org:
+        return 0
+    last_close = last_a == name.last or difflib.SequenceMatcher(None, last_a, name.last).ratio() >= 0.85
+    if len(first_a) == 1 or len(name.first) == 1:
+        first_close = first_a[0] == name.first[0]
+    else:
+        first_close = difflib.SequenceMatcher(None, first_a, name.first).ratio() >= 0.85
+    return 1 if last_close and first_close else 0
+
+
+class EntityResolver:
+    """Assigns witness appearances to entities, loading entity blocks on demand.
+
+    load_blocks(keys) returns the stored entities whose block_key is in keys.
+    Entities created or updated since the last take_changed() are returned by it.
+    New entities are named after their first appearance, skipping taken_ids.
+    """
+
+    def __init__(self, load_blocks: Callable[[List[str]], Iterable[Dict[str, Any]]] = lambda keys: [],
+                 taken_ids: Iterable[str] = ()):
+        self._load_blocks = load_blocks
+        self._taken_ids = set(taken_ids)
+        self.blocks: Dict[str, List[Dict[str, Any]]] = {}
+        self._changed: Dict[str, Dict[str, Any]] = {}
+
+    def prefetch(self, hearings: Iterable[Dict[str, Any]]) -> None:
+        """Load the blocks a batch of hearings needs in one round trip"""
+        keys = set()
+        for hearing in hearings:
+            for witness in json_list(hearing.get('witnesses')):
+                name = normalize_name(witness.get('name')) if isinstance(witness, dict) else None
+                if name and name.block not in self.blocks:
+                    keys.add(name.block)
+        if keys:
+            for key in keys:
+                self.blocks[key] = []
+            for entity in self._load_blocks(sorted(keys)):
+                self.blocks[entity['block_key']].append(entity)
+
+    def resolve_hearing(self, hearing: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """witness_entity_appearances rows for one hearing; positions match hearing_witnesses"""
+        self.prefetch([hearing])
+        appearances = []
+        for position, witness in enumerate(json_list(hearing.get('witnesses')), start=1):
+            if not isinstance(witness, dict):
+                continue
+            name = normalize_name(witness.get('name'))
+            if not name:
+                continue
+            entity = self._resolve(name, witness, hearing, position)
+            appearances.append({'hearing_id': hearing['id'], 'position': position, 'entity_id': entity['entity_id']})
+        return appearances
+
+    def _resolve(self, name: NameKey, witness: Dict[str, Any], hearing: Dict[str, Any], position: int) -> Dict[str, Any]:
+        block = self.blocks[name.block]
+        scored = [(match_score(name, witness.get('organization'), entity), entity) for entity in block]
+        score, entity = max(scored, key=lambda x: x[0], default=(0, None))
+        if not score:
+            entity_id, n = f"hw-{hearing['id']}-{position}", 1
+            while entity_id in self._taken_ids:
+                n += 1
+                entity_id = f"hw-{hearing['id']}-{position}-{n}"
+            self._taken_ids.add(entity_id)
+            entity = {
+                'entity_id': entity_id,
+                'canonical_name': witness['name'].strip(),
+                'name_key': name.key,
+                'block_key': name.block,
+                'middle_initials': name.middle or None,
+                'title': None,
+                'organization': None,
+                'aliases': [],
+                'hearing_ids': [],
+                'hearings': [],
+                'committees': [],
+                'hearing_count': 0,
+                'first_seen': None,
+                'last_seen': None,
+            }
+            block.append(entity)
+        merge_appearance(entity, name, witness, hearing)
+        self._changed[entity['entity_id']] = entity
+        return entity
+
+    def take_changed(self) -> List[Dict[str, Any]]:
+        changed, self._changed = list(self._changed.values()), {}
+        return changed
+
+
+def merge_appearance(entity: Dict[str, Any], name: NameKey, witness: Dict[str, Any], hearing: Dict[str, Any]) -> None:
+    """Fold one appearance into an entity's aggregates; repeating it changes nothing"""
+    raw_name = witness['name'].strip()
+    if raw_name not in entity['aliases']:
+        entity['aliases'].append(raw_name)
+    # Prefer the most complete spelling seen, e.g. with the middle initial
+    current = normalize_name(entity['canonical_name'])
+    if current is None or len(name.middle) > len(current.middle):
+        entity['canonical_name'] = raw_name
+    if name.middle and not entity['middle_initials']:
+        entity['middle_initials'] = name.middle
+
+    hearing_date = hearing.get('hearing_date')
+    if hearing_date and (not entity['last_seen'] or hearing_date >= entity['last_seen']):
+        # Title and organization as of the most recent appearance
+        entity['title'] = (witness.get('title') or '').strip() or entity['title']
+        entity['organization'] = (witness.get('organization') or '').strip() or entity['organization']
+        entity['last_seen'] = hearing_date
+    else:
+        entity['title'] = entity['title'] or (witness.get('title') or '').strip() or None
+        entity['organization'] = entity['organization'] or (witness.get('organization') or '').strip() or None
+    if hearing_date and (not entity['first_seen'] or hearing_date < entity['first_seen']):
+        entity['first_seen'] = hearing_date
+
+    if hearing['id'] not in entity['hearing_ids']:
+        entity['hearing_ids'].append(hearing['id'])
+        entity['hearing_count'] = len(entity['hearing_ids'])
+        if hearing.get('hearing_name') and hearing['hearing_name'] not in entity['hearings']:
+            entity['hearings'].append(hearing['hearing_name'])
+        if hearing.get('committee') and hearing['committee'] not in entity['committees']:
+            entity['committees'].append(hearing['committee'])
+
+
+def reset_entity(entity: Dict[str, Any]) -> None:
+    """Clear an entity's aggregates so merge_appearance can rebuild them; its ID and name key stay"""
+    entity.update(canonical_name='', middle_initials=None, title=None, organization=None, aliases=[],
+                  hearing_ids=[], hearings=[], committees=[], hearing_count=0, first_seen=None, last_seen=None)
+
+
+def resolve_all(hearings: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Entities and appearances for a full set of hearings, in memory (used by local_db.py)"""
+    resolver = EntityResolver()
+    appearances = []
+    for hearing in hearings:
+        appearances.extend(resolver.resolve_hearing(hearing))
+    return resolver.take_changed(), appearances
+
+
+def witness_summary(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """An entity in the shape of the deduplicated witness lists the APIs return"""
+    return {
+        'id': entity['entity_id'],
+        'name': entity['canonical_name'],
+        'title': entity.get('title') or '',
+        'organization': entity.get('organization') or '',
+        'topics': [],
+        'hearings': json_list(entity.get('hearings')),
+        'committees': json_list(entity.get('committees')),
+        'hearing_count': entity.get('hearing_count') or 0,
+    }
+
+
+def entity_cursor(entity: Dict[str, Any]) -> str:
+    """Cursor pointing just past this entity in (last_seen DESC NULLS FIRST, entity_id) order"""
+    return f"{entity.get('last_seen') or ''},{entity['entity_id']}"
+
+
+def parse_entity_cursor(cursor: str) -> Tuple[Optional[str], str]:
+    """(last_seen or None, entity_id) from a cursor; ValueError if it is malformed"""
+    last_seen, _, entity_id = cursor.partition(',')
+    if not entity_id:
+        raise ValueError(f"Invalid witness cursor: {cursor!r}")
+    return (date.fromisoformat(last_seen).isoformat() if last_seen else None), entity_id
+
+
+class WitnessEntityStore:
+    """Incremental resolution against the Supabase tables from witness_entities.sql"""
+
+    def __init__(self, supabase):
+        self.supabase = supabase
+
+    def _select_in(self, table: str, columns: str, column: str, values: List[Any],
+                   order: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """Rows whose column is in values; order must be unique so the pages don't overlap"""
+        rows = []
+        for i in range(0, len(values), 200):  # keep the in.(...) filter within URL limits
+            offset = 0
+            while True:
+                query = self.supabase.table(table).select(columns).in_(column, values[i:i + 200])
+                for key in order:
+                    query = query.order(key)
+                page = query.range(offset, offset + PAGE_SIZE - 1).execute().data or []
+                rows.extend(page)
+                if len(page) < PAGE_SIZE:
+                    break
+                offset += PAGE_SIZE
+        return rows
+
+    def _entities(self, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        rows = self._select_in(ENTITIES_TABLE, '*', column, values, ('entity_id',))
+        for row in rows:
+            for name in ('aliases', 'hearing_ids', 'hearings', 'committees'):
+                row[name] = json_list(row.get(name))
+        return rows
+
+    def _load_blocks(self, keys: List[str]) -> List[Dict[str, Any]]:
+        return self._entities('block_key', keys)
+
+    def rebuild(self, page_size: int = PAGE_SIZE) -> Dict[str, int]:
+        """Forget every entity and ID, then resolve every hearing again in id order"""
+        # The queue is cleared first: hearings inserted from here on are queued again and
+        # picked up by the next resolve_new_hearings(), wherever the walk below has got to
+        self.supabase.table(QUEUE_TABLE).delete().gte('hearing_id', 0).execute()
+        self.supabase.table(APPEARANCES_TABLE).delete().gte('hearing_id', 0).execute()
+        self.supabase.table(ENTITIES_TABLE).delete().neq('entity_id', '').execute()
+        stats = {'hearings': 0, 'appearances': 0, 'entities_written': 0, 'entities_removed': 0}
+        resolver = EntityResolver(self._load_blocks)
+        last_id = 0
+        while True:
+            page = self.supabase.table('congressional_hearings').select(HEARING_COLUMNS) \
+                .gt('id', last_id).order('id').limit(page_size).execute().data or []
+            if not page:
+                return stats
+            resolver.prefetch(page)
+            appearances = [a for hearing in page for a in resolver.resolve_hearing(hearing)]
+            changed = resolver.take_changed()
+            # Entities before the appearances that reference them
+            for i in range(0, len(changed), 500):
+                self.supabase.table(ENTITIES_TABLE).upsert(changed[i:i + 500]).execute()
+            for i in range(0, len(appearances), 500):
+                self.supabase.table(APPEARANCES_TABLE).upsert(appearances[i:i + 500]).execute()
+            last_id = page[-1]['id']
+            stats['hearings'] += len(page)
+            stats['appearances'] += len(appearances)
+            stats['entities_written'] += len(changed)
+            if len(page) < page_size:
+                return stats
+
+    def resolve_new_hearings(self, batch_size: int = 200) -> Dict[str, int]:
+        """Resolve the hearings the trigger queued, inserted or with edited witnesses; call after loading hearings"""
+        stats = {'hearings': 0, 'appearances': 0, 'entities_written': 0, 'entities_removed': 0}
+        while True:
+            queued = self.supabase.table(QUEUE_TABLE).select('hearing_id, queued_at') \
+                .order('hearing_id').limit(batch_size).execute().data or []
+            if not queued:
+                return stats
+            self._resolve_queued([row['hearing_id'] for row in queued], stats)
+            # A hearing edited again while this ran was queued again with a later time and stays;
+            # hearings written together share a time, so this is one delete per write batch
+            by_time: Dict[str, List[int]] = {}
+            for row in queued:
+                by_time.setdefault(row['queued_at'], []).append(row['hearing_id'])
+            for queued_at, ids in by_time.items():
+                self.supabase.table(QUEUE_TABLE).delete().in_('hearing_id', ids).eq('queued_at', queued_at).execute()
+            if len(queued) < batch_size:
+                return stats
+
+    def _taken_ids(self, hearings: List[Dict[str, Any]]) -> Set[str]:
+        """Stored IDs a new entity first seen in these hearings could collide with"""
+        # Only hearings resolved before can have them. A suffixed ID (hw-<id>-<position>-2) only
+        # exists where the plain one was taken, so one lookup of the plain IDs finds those hearings
+        plain = {f"hw-{hearing['id']}-{position}": hearing['id'] for hearing in hearings
+                 for position in range(1, len(json_list(hearing.get('witnesses'))) + 1)}
+        rows = self._select_in(ENTITIES_TABLE, 'entity_id', 'entity_id', sorted(plain), ('entity_id',))
+        taken = {row['entity_id'] for row in rows}
+        for hearing_id in sorted({plain[entity_id] for entity_id in taken}):
+            rows = self.supabase.table(ENTITIES_TABLE).select('entity_id') \
+                .like('entity_id', f'hw-{hearing_id}-%').execute().data or []
+            taken.update(row['entity_id'] for row in rows)
+        return taken
+
+    def _resolve_queued(self, hearing_ids: List[int], stats: Dict[str, int]) -> None:
+        edited_ids = set(hearing_ids)
+        appearance_columns = 'hearing_id, position, entity_id'
+        old = self._select_in(APPEARANCES_TABLE, appearance_columns, 'hearing_id', hearing_ids,
+                              ('hearing_id', 'position'))
+        entities = self._entities('entity_id', sorted({a['entity_id'] for a in old}))
+        by_id = {entity['entity_id']: entity for entity in entities}
+        others = [a for a in self._select_in(APPEARANCES_TABLE, appearance_columns, 'entity_id', list(by_id),
+                                             ('hearing_id', 'position'))
+                  if a['hearing_id'] not in edited_ids]
+        hearings = {h['id']: h for h in self._select_in(
+            'congressional_hearings', HEARING_COLUMNS, 'id',
+            sorted(edited_ids | {a['hearing_id'] for a in others}), ('id',))}
+
+        # The entities the edited hearings pointed to, as if those hearings had never been resolved
+        for entity in entities:
+            reset_entity(entity)
+        for appearance in others:
+            hearing = hearings[appearance['hearing_id']]
+            witnesses = json_list(hearing.get('witnesses'))
+            witness = witnesses[appearance['position'] - 1] if appearance['position'] <= len(witnesses) else None
+            name = normalize_name(witness.get('name')) if isinstance(witness, dict) else None
+            if name:
+                merge_appearance(by_id[appearance['entity_id']], name, witness, hearing)
+
+        # Entities first seen in a hearing resolved before keep its IDs, so new ones must pick others
+        edited = [hearings[h] for h in hearing_ids if h in hearings]
+        resolver = EntityResolver(self._load_blocks, set(by_id) | self._taken_ids(edited))
+        resolver.prefetch(edited)
+        for block in resolver.blocks.values():
+            block[:] = [by_id.get(entity['entity_id'], entity) for entity in block]
+        appearances = [a for hearing in edited for a in resolver.resolve_hearing(hearing)]
+        changed = {**by_id, **{entity['entity_id']: entity for entity in resolver.take_changed()}}
+        kept = [entity for entity in changed.values() if entity['hearing_count']]
+        removed = [entity_id for entity_id, entity in changed.items() if not entity['hearing_count']]
+
+        # New rows first and stale ones last, so a run that dies part way can redo the batch
+        for i in range(0, len(kept), 500):
+            self.supabase.table(ENTITIES_TABLE).upsert(kept[i:i + 500]).execute()
+        for i in range(0, len(appearances), 500):
+            self.supabase.table(APPEARANCES_TABLE).upsert(appearances[i:i + 500]).execute()
+        current = {(a['hearing_id'], a['position']) for a in appearances}
+        stale: Dict[int, List[int]] = {}
+        for a in old:
+            if (a['hearing_id'], a['position']) not in current:
+                stale.setdefault(a['hearing_id'], []).append(a['position'])
+        for hearing_id, positions in stale.items():
+            self.supabase.table(APPEARANCES_TABLE).delete().eq('hearing_id', hearing_id) \
+                .in_('position', positions).execute()
+        for i in range(0, len(removed), 200):
+            self.supabase.table(ENTITIES_TABLE).delete().in_('entity_id', removed[i:i + 200]).execute()
+        stats['hearings'] += len(edited)
+        stats['appearances'] += len(appearances)
+        stats['entities_written'] += len(kept)
+        stats['entities_removed'] += len(removed)
+
+
+def main():
+    import argparse
+    import os
+
+    from api.cache import notify_api_caches, shared_supabase_client
+
+    parser = argparse.ArgumentParser(description='Resolve congressional hearing witnesses to canonical entities')
+    parser.add_argument('--rebuild', action='store_true', help='Drop all entities and resolve every hearing again')
+    args = parser.parse_args()
+
+    supabase_url = os.getenv("WITNESS_SUPABASE_URL") or os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("WITNESS_SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+    if not supabase_url or not supabase_key:
+        raise SystemExit("Set WITNESS_SUPABASE_URL and WITNESS_SUPABASE_SERVICE_ROLE_KEY (writes need the service role)")
+
+    store = WitnessEntityStore(shared_supabase_client(supabase_url, supabase_key))
+    stats = store.rebuild() if args.rebuild else {}
+    # Hearings queued by inserts and edits, including any written during a rebuild
+    for key, value in store.resolve_new_hearings().items():
+        stats[key] = stats.get(key, 0) + value
+    print(f"✅ Resolved {stats['appearances']} witness appearances in {stats['hearings']} hearings "
+          f"({stats['entities_written']} entities written)")
+    if stats['hearings']:
+        notify_api_caches()
+
+
+if __name__ == "__main__":
+    main()
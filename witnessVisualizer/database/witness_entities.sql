@@ -0,0 +1,95 @@
+-- Canonical witness entities for congressional_hearings.
+--
+-- database/witness_entities.py resolves every witness appearance to one row of
+-- witness_entities (normalized name, Soundex block, aggregated hearings) and
+-- records the mapping in witness_entity_appearances. Entity IDs are assigned
+-- once ('hw-<hearing_id>-<position>' of the first appearance) and kept across
+-- runs. A trigger queues every inserted hearing, and every hearing whose
+-- witnesses change, in witness_resolution_queue, and each run resolves what is
+-- queued. The queue commits with the hearing, so parallel insert batches that
+-- commit out of id order leave nothing behind. The loaders run it after every
+-- ingest; by hand (backfill, --rebuild):
+--   python -m database.witness_entities
+--
+-- Run in the Supabase SQL Editor (or psql) after the congressional_hearings table exists.
+
+CREATE TABLE IF NOT EXISTS witness_entities (
+    entity_id TEXT PRIMARY KEY,
+    canonical_name TEXT NOT NULL,
+    name_key TEXT NOT NULL,         -- "first last", honorifics and middle names removed
+    block_key TEXT NOT NULL,        -- Soundex of the last name: candidates are compared within it
+    middle_initials TEXT,
+    title TEXT,                     -- as of the most recent appearance
+    organization TEXT,
+    aliases JSONB NOT NULL DEFAULT '[]'::jsonb,
+    hearing_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+    hearings JSONB NOT NULL DEFAULT '[]'::jsonb,
+    committees JSONB NOT NULL DEFAULT '[]'::jsonb,
+    hearing_count INTEGER NOT NULL DEFAULT 0,
+    first_seen DATE,
+    last_seen DATE,
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS witness_entities_block_idx ON witness_entities (block_key);
+-- The APIs list entities most recently seen first
+CREATE INDEX IF NOT EXISTS witness_entities_last_seen_idx
+    ON witness_entities (last_seen DESC, entity_id);
+
+CREATE TABLE IF NOT EXISTS witness_entity_appearances (
+    hearing_id BIGINT NOT NULL REFERENCES congressional_hearings(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,      -- same numbering as hearing_witnesses
+    entity_id TEXT NOT NULL REFERENCES witness_entities(entity_id) ON DELETE CASCADE,
+    PRIMARY KEY (hearing_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS witness_entity_appearances_entity_idx
+    ON witness_entity_appearances (entity_id);
+
+-- The id watermark runs used to resume from: a hearing whose insert committed
+-- after one with a higher id was skipped for good. The queue replaces it.
+DROP TABLE IF EXISTS witness_resolution_state;
+
+-- Hearings inserted, or whose witnesses changed, since they were last resolved
+CREATE TABLE IF NOT EXISTS witness_resolution_queue (
+    hearing_id BIGINT PRIMARY KEY REFERENCES congressional_hearings(id) ON DELETE CASCADE,
+    queued_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION queue_witness_resolution()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.witnesses IS NOT DISTINCT FROM NEW.witnesses THEN
+        RETURN NULL;
+    END IF;
+    -- A later queued_at tells a run that read the earlier version to leave the row
+    INSERT INTO witness_resolution_queue (hearing_id) VALUES (NEW.id)
+    ON CONFLICT (hearing_id) DO UPDATE SET queued_at = now();
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS congressional_hearings_witness_resolution ON congressional_hearings;
+CREATE TRIGGER congressional_hearings_witness_resolution
+AFTER INSERT OR UPDATE OF witnesses ON congressional_hearings
+FOR EACH ROW EXECUTE FUNCTION queue_witness_resolution();
+
+-- Hearings never resolved: all of them on a first install, and any an earlier
+-- watermark run skipped
+INSERT INTO witness_resolution_queue (hearing_id)
+SELECT h.id FROM congressional_hearings AS h
+WHERE NOT EXISTS (SELECT 1 FROM witness_entity_appearances AS a WHERE a.hearing_id = h.id)
+ON CONFLICT (hearing_id) DO NOTHING;
+
+ALTER TABLE witness_entities ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON witness_entities;
+CREATE POLICY "Public read access" ON witness_entities FOR SELECT USING (true);
+
+ALTER TABLE witness_entity_appearances ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON witness_entity_appearances;
+CREATE POLICY "Public read access" ON witness_entity_appearances FOR SELECT USING (true);
+
+ALTER TABLE witness_resolution_queue ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read access" ON witness_resolution_queue;
+CREATE POLICY "Public read access" ON witness_resolution_queue FOR SELECT USING (true);
@@ -0,0 +1,38 @@
+-- Indexes for the witness endpoints in api/production/witness_api.py.
+--
+-- /witnesses and /witnesses/{witness_id} read the normalized tables that
+-- SupabaseWitnessLoader fills, embedding organizations, topics, keywords,
+-- expertise areas and a document count in one PostgREST query. Postgres does not
+-- index foreign keys on its own, so each embed would otherwise scan its table.
+--
+-- Run in the Supabase SQL Editor (or psql) after supabase_schema.sql. Safe to re-run.
+
+-- Lookup by witness_id and keyset pagination (ORDER BY witness_id, witness_id > $after)
+CREATE INDEX IF NOT EXISTS witnesses_witness_id_idx ON witnesses (witness_id);
+CREATE INDEX IF NOT EXISTS witnesses_type_witness_id_idx ON witnesses (witness_type, witness_id);
+CREATE INDEX IF NOT EXISTS witnesses_organization_id_idx ON witnesses (organization_id);
+
+-- Embedded one-to-many rows, fetched per witness
+CREATE INDEX IF NOT EXISTS witness_topics_witness_id_idx ON witness_topics (witness_id);
+CREATE INDEX IF NOT EXISTS witness_topics_topic_id_idx ON witness_topics (topic_id);
+CREATE INDEX IF NOT EXISTS keywords_witness_id_idx ON keywords (witness_id);
+CREATE INDEX IF NOT EXISTS expertise_areas_witness_id_idx ON expertise_areas (witness_id);
+CREATE INDEX IF NOT EXISTS documents_witness_id_idx ON documents (witness_id);
+CREATE INDEX IF NOT EXISTS topics_name_idx ON topics (name);
+
+-- Substring filters (search=, organization=); see hearing_witnesses.sql for why this is conditional
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS witnesses_name_trgm_idx
+            ON witnesses USING gin (name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS witnesses_title_trgm_idx
+            ON witnesses USING gin (title gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS organizations_name_trgm_idx
+            ON organizations USING gin (name gin_trgm_ops);
+    ELSE
+        RAISE NOTICE 'pg_trgm is not available; witness name and organization searches will not use trigram indexes';
+    END IF;
+END;
+$$;
@@ -7,6 +7,7 @@ Scrapes hearings data and populates the congressional_hearings table.
 
 import modal
 import os
+import sys
 import re
 import asyncio
 import requests
@@ -16,6 +17,7 @@ import json
 from dataclasses import dataclass, asdict
 import time
 import random
+from pathlib import Path
 from bs4 import BeautifulSoup
 
 # Modal app definition
@@ -28,7 +30,10 @@ image = modal.Image.debian_slim().pip_install([
     "supabase==2.18.1",
     "python-dotenv",
     "lxml"
-])
+]).add_local_dir(
+    str(Path(__file__).parent.parent / "database"),
+    remote_path="/app/database"
+)
 
 # Modal secrets for environment variables
 secrets = [
@@ -343,6 +348,28 @@ def scrape_congress_hearings_batch(congress_list: List[int], chamber: str, batch
     print(f"✅ Scraped {len(all_hearings)} hearings total")
     return all_hearings
 
+@app.function(
+    image=image,
+    secrets=secrets,
+    timeout=1800,
+    cpu=1.0,
+    memory=2048,
+    max_containers=1  # one resolver at a time: parallel runs would create the same entities twice
+)
+def resolve_witness_entities() -> Dict[str, int]:
+    """Resolve the witnesses of new and edited hearings to canonical entities (database/witness_entities.py)"""
+    from supabase import create_client
+    
+    sys.path.insert(0, "/app")
+    from database.witness_entities import WitnessEntityStore
+    
+    supabase_url = os.environ.get('WITNESS_SUPABASE_URL') or os.environ.get('SUPABASE_URL')
+    supabase_key = os.environ.get('WITNESS_SUPABASE_SERVICE_ROLE_KEY') or os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+    
+    stats = WitnessEntityStore(create_client(supabase_url, supabase_key)).resolve_new_hearings()
+    print(f"✅ Resolved witness entities: {stats}")
+    return stats
+
 @app.function(
     image=image,
     secrets=secrets,
@@ -425,6 +452,28 @@ def insert_hearings_to_supabase(hearings: List[Dict[str, Any]]) -> Dict[str, int
     
     print(f"📊 Batch results: {results['inserted']} inserted, {results['skipped']} skipped, {results['failed']} failed")
     
+    # Recompute the /metrics summary row (database/hearing_metrics.sql) once per batch
+    if results['inserted']:
+        try:
+            supabase.rpc('refresh_hearing_metrics').execute()
+        except Exception as e:
+            print(f"⚠️  Could not refresh hearing metrics: {e}")
+        
+        # The APIs list witnesses from witness_entities, so resolve before dropping their caches
+        try:
+            resolve_witness_entities.remote()
+        except Exception as e:
+            print(f"⚠️  Could not resolve witness entities: {e}")
+        
+        # Drop cached API responses (api/cache.py) on the servers in WITNESS_API_URLS
+        for api_url in filter(None, (u.strip() for u in os.getenv('WITNESS_API_URLS', '').split(','))):
+            try:
+                requests.post(f"{api_url.rstrip('/')}/cache/invalidate",
+                              headers={'X-Cache-Token': os.getenv('WITNESS_CACHE_TOKEN', '')},
+                              timeout=10).raise_for_status()
+            except Exception as e:
+                print(f"⚠️  Could not invalidate API cache at {api_url}: {e}")
+    
     return results
 
 @app.local_entrypoint()
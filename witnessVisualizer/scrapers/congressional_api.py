@@ -9,9 +9,11 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 import os
-from supabase import create_client, Client
 from dotenv import load_dotenv
-import json
+
+from api.cache import ResponseCache, shared_supabase_client
+from database.hearing_metrics import json_list, parse_witnesses
+from database.repository import repository_from_env
 
 # Load environment variables
 load_dotenv()
@@ -39,7 +41,15 @@ def get_supabase_client():
     if not url or not key:
         raise HTTPException(status_code=500, detail="Missing Supabase configuration")
     
-    return create_client(url, key)
+    return shared_supabase_client(url, key)
+
+# Hearing data: Supabase, or a local SQLite file with WITNESS_BACKEND=sqlite (database/repository.py)
+repository = repository_from_env(get_supabase_client)
+
+# Responses are cached for CACHE_TTL seconds or until POST /cache/invalidate
+CACHE_TTL = int(os.getenv("WITNESS_CACHE_TTL", "300"))
+cache = ResponseCache(default_ttl=CACHE_TTL)
+cache.install(app)
 
 # Pydantic models for API responses
 class WitnessInfo(BaseModel):
@@ -95,6 +105,7 @@ class StatsResponse(BaseModel):
     date_range: Dict[str, Optional[str]]
     hearing_types: Dict[str, int]
     top_committees: List[Dict[str, Any]]
+    stale: bool = False  # hearings were written since the summary was last refreshed
 
 # API Endpoints
 
@@ -109,6 +120,7 @@ async def root():
     }
 
 @app.get("/hearings", response_model=List[HearingSummary], summary="List all hearings")
+@cache.cached()
 async def get_hearings(
     limit: int = Query(50, ge=1, le=500, description="Number of hearings to return"),
     offset: int = Query(0, ge=0, description="Number of hearings to skip"),
@@ -120,35 +132,22 @@ async def get_hearings(
 ):
     """Get list of hearings with summary information"""
     
-    supabase = get_supabase_client()
-    
     try:
-        # Build query
-        query = supabase.table("congressional_hearings").select(
-            "id, hearing_name, committee, hearing_date, hearing_type, detail_url, witnesses"
+        rows = repository.list_hearings(
+            "id, hearing_name, committee, hearing_date, hearing_type, detail_url, witnesses",
+            limit,
+            offset,
+            committee=committee,
+            hearing_type=hearing_type,
+            congress=congress,
+            start_date=start_date,
+            end_date=end_date
         )
         
-        # Apply filters
-        if committee:
-            query = query.ilike("committee", f"%{committee}%")
-        if hearing_type:
-            query = query.eq("hearing_type", hearing_type)
-        if congress:
-            query = query.eq("congress", congress)
-        if start_date:
-            query = query.gte("hearing_date", start_date.isoformat())
-        if end_date:
-            query = query.lte("hearing_date", end_date.isoformat())
-        
-        # Order and paginate
-        query = query.order("hearing_date", desc=True).range(offset, offset + limit - 1)
-        
-        result = query.execute()
-        
         # Transform data
         hearings = []
-        for hearing in result.data:
-            witnesses = json.loads(hearing.get("witnesses", "[]"))
+        for hearing in rows:
+            witnesses = parse_witnesses(hearing.get("witnesses"))
             hearings.append(HearingSummary(
                 id=hearing["id"],
                 hearing_name=hearing["hearing_name"],
@@ -165,22 +164,19 @@ async def get_hearings(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/hearings/{hearing_id}", response_model=HearingResponse, summary="Get hearing details")
+@cache.cached()
 async def get_hearing(hearing_id: int):
     """Get detailed information about a specific hearing"""
     
-    supabase = get_supabase_client()
-    
     try:
-        result = supabase.table("congressional_hearings").select("*").eq("id", hearing_id).execute()
+        hearing_data = repository.get_hearing(hearing_id)
         
-        if not result.data:
+        if not hearing_data:
             raise HTTPException(status_code=404, detail="Hearing not found")
         
-        hearing_data = result.data[0]
-        
         # Parse JSON fields
-        witnesses_json = json.loads(hearing_data.get("witnesses", "[]"))
-        members_json = json.loads(hearing_data.get("members", "[]"))
+        witnesses_json = parse_witnesses(hearing_data.get("witnesses"))
+        members_json = json_list(hearing_data.get("members"))
         
         # Transform witnesses data
         witnesses = []
@@ -211,83 +207,43 @@ async def get_hearing(hearing_id: int):
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/witnesses", summary="Search witnesses")
+@cache.cached()
 async def search_witnesses(
     query: Optional[str] = Query(None, description="Search term for witness names, titles, or organizations"),
     witness_type: Optional[str] = Query(None, description="Filter by witness type"),
     committee: Optional[str] = Query(None, description="Filter by committee"),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0, description="Number of witnesses to skip")
 ):
     """Search for witnesses across all hearings"""
     
-    supabase = get_supabase_client()
-    
     try:
-        # Get hearings data
-        db_query = supabase.table("congressional_hearings").select("id, hearing_name, committee, hearing_date, witnesses")
-        
-        if committee:
-            db_query = db_query.ilike("committee", f"%{committee}%")
-        
-        db_query = db_query.order("hearing_date", desc=True)
-        result = db_query.execute()
-        
-        witnesses = []
-        
-        for hearing in result.data:
-            witnesses_json = json.loads(hearing.get("witnesses", "[]"))
-            
-            for witness in witnesses_json:
-                # Apply filters
-                if witness_type and witness.get("witness_type") != witness_type:
-                    continue
-                
-                if query:
-                    searchable_text = (
-                        witness.get("name", "") + " " +
-                        witness.get("title", "") + " " +
-                        witness.get("organization", "")
-                    ).lower()
-                    
-                    if query.lower() not in searchable_text:
-                        continue
-                
-                # Add hearing context
-                witness_with_context = {
-                    **witness,
-                    "hearing_id": hearing["id"],
-                    "hearing_name": hearing["hearing_name"],
-                    "committee": hearing["committee"],
-                    "hearing_date": hearing["hearing_date"]
-                }
-                
-                witnesses.append(witness_with_context)
-                
-                if len(witnesses) >= limit:
-                    break
-            
-            if len(witnesses) >= limit:
-                break
-        
-        return witnesses[:limit]
+        # Filtered and paginated in the database over the hearing_witnesses index
+        return repository.search_witnesses(
+            query=query,
+            witness_type=witness_type,
+            committee=committee,
+            limit=limit,
+            offset=offset
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/committees", response_model=List[CommitteeSummary], summary="Get committee statistics")
+@cache.cached()
 async def get_committees():
     """Get statistics for all committees"""
     
-    supabase = get_supabase_client()
-    
     try:
-        result = supabase.table("congressional_hearings").select("committee, hearing_date, witnesses").execute()
+        hearings = repository.iter_hearings("id, committee, hearing_date, witnesses")
         
         committee_stats = {}
         
-        for hearing in result.data:
+        for hearing in hearings:
             committee = hearing["committee"]
             hearing_date = datetime.fromisoformat(hearing["hearing_date"]).date()
-            witnesses_count = len(json.loads(hearing.get("witnesses", "[]")))
+            witnesses_count = len(parse_witnesses(hearing.get("witnesses")))
             
             if committee not in committee_stats:
                 committee_stats[committee] = {
@@ -316,337 +272,123 @@ async def get_committees():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+def get_hearing_metrics() -> Dict[str, Any]:
+    """Precomputed hearing metrics (database/hearing_metrics.py), with a stale flag"""
+    return repository.hearing_metrics()
+
 @app.get("/metrics/hearings-count", summary="Get total number of hearings")
+@cache.cached()
 async def get_hearings_count():
     """Get just the total count of hearings - perfect for v0 metrics"""
     
-    supabase = get_supabase_client()
-    
     try:
-        # Simple count query
-        result = supabase.table("congressional_hearings").select("id", count="exact").execute()
-        
         return {
-            "count": result.count,
+            "count": get_hearing_metrics()["hearings"],
             "message": "Total congressional hearings in database"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/metrics/hearings-number", summary="Get hearings count as plain number")
+@cache.cached()
 async def get_hearings_number():
     """Get just the number - simplest possible endpoint for v0"""
     
-    supabase = get_supabase_client()
-    
     try:
-        # Simple count query
-        result = supabase.table("congressional_hearings").select("id", count="exact").execute()
-        
-        # Return just the number
-        return result.count
+        return get_hearing_metrics()["hearings"]
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/metrics/witnesses-count", summary="Get total number of unique witnesses")
+@cache.cached()
 async def get_unique_witnesses_count():
-    """Get count of unique witnesses across all hearings - with pagination to get all records"""
-    
-    supabase = get_supabase_client()
+    """Get count of unique witnesses (resolved entities, see database/witness_entities.py) across all hearings"""
     
     try:
-        # Set to track unique witnesses (using name as identifier)
-        unique_witnesses = set()
-        
-        # Pagination parameters
-        page_size = 1000  # Supabase default max
-        offset = 0
-        
-        while True:
-            # Get batch of hearings with witnesses data
-            result = supabase.table("congressional_hearings").select("witnesses").range(offset, offset + page_size - 1).execute()
-            
-            if not result.data:
-                break
-                
-            # Process witnesses in this batch
-            for hearing in result.data:
-                witnesses_data = hearing.get("witnesses", [])
-                
-                # Handle both string and array formats
-                if isinstance(witnesses_data, str):
-                    try:
-                        witnesses = json.loads(witnesses_data)
-                    except:
-                        witnesses = []
-                else:
-                    witnesses = witnesses_data or []
-                
-                # Add unique witness names to set
-                for witness in witnesses:
-                    if isinstance(witness, dict) and witness.get("name"):
-                        # Normalize name for deduplication (lowercase, strip whitespace)
-                        normalized_name = witness["name"].lower().strip()
-                        if normalized_name:
-                            unique_witnesses.add(normalized_name)
-            
-            # If we got less than page_size, we've reached the end
-            if len(result.data) < page_size:
-                break
-                
-            offset += page_size
-        
         return {
-            "count": len(unique_witnesses),
+            "count": repository.count_witness_entities(),
             "message": "Total unique witnesses across all congressional hearings"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/metrics/witnesses-number", summary="Get unique witnesses count as plain number")
+@cache.cached()
 async def get_unique_witnesses_number():
     """Get just the number of unique witnesses - simplest possible endpoint for v0"""
     
-    supabase = get_supabase_client()
-    
     try:
-        # Set to track unique witnesses (using name as identifier)
-        unique_witnesses = set()
-        
-        # Pagination parameters
-        page_size = 1000  # Supabase default max
-        offset = 0
-        
-        while True:
-            # Get batch of hearings with witnesses data
-            result = supabase.table("congressional_hearings").select("witnesses").range(offset, offset + page_size - 1).execute()
-            
-            if not result.data:
-                break
-                
-            # Process witnesses in this batch
-            for hearing in result.data:
-                witnesses_data = hearing.get("witnesses", [])
-                
-                # Handle both string and array formats
-                if isinstance(witnesses_data, str):
-                    try:
-                        witnesses = json.loads(witnesses_data)
-                    except:
-                        witnesses = []
-                else:
-                    witnesses = witnesses_data or []
-                
-                # Add unique witness names to set
-                for witness in witnesses:
-                    if isinstance(witness, dict) and witness.get("name"):
-                        # Normalize name for deduplication (lowercase, strip whitespace)
-                        normalized_name = witness["name"].lower().strip()
-                        if normalized_name:
-                            unique_witnesses.add(normalized_name)
-            
-            # If we got less than page_size, we've reached the end
-            if len(result.data) < page_size:
-                break
-                
-            offset += page_size
-        
-        # Return just the number
-        return len(unique_witnesses)
+        return repository.count_witness_entities()
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/metrics/organizations-count", summary="Get total number of unique organizations")
+@cache.cached()
 async def get_unique_organizations_count():
-    """Get count of unique organizations from witnesses across all hearings - with pagination to get all records"""
-    
-    supabase = get_supabase_client()
+    """Get count of unique organizations (by normalized name) from witnesses across all hearings"""
     
     try:
-        # Set to track unique organizations (using organization name as identifier)
-        unique_organizations = set()
-        
-        # Pagination parameters
-        page_size = 1000  # Supabase default max
-        offset = 0
-        
-        while True:
-            # Get batch of hearings with witnesses data
-            result = supabase.table("congressional_hearings").select("witnesses").range(offset, offset + page_size - 1).execute()
-            
-            if not result.data:
-                break
-                
-            # Process witnesses in this batch
-            for hearing in result.data:
-                witnesses_data = hearing.get("witnesses", [])
-                
-                # Handle both string and array formats
-                if isinstance(witnesses_data, str):
-                    try:
-                        witnesses = json.loads(witnesses_data)
-                    except:
-                        witnesses = []
-                else:
-                    witnesses = witnesses_data or []
-                
-                # Add unique organization names to set
-                for witness in witnesses:
-                    if isinstance(witness, dict) and witness.get("organization"):
-                        # Normalize organization name for deduplication (lowercase, strip whitespace)
-                        normalized_org = witness["organization"].lower().strip()
-                        if normalized_org:
-                            unique_organizations.add(normalized_org)
-            
-            # If we got less than page_size, we've reached the end
-            if len(result.data) < page_size:
-                break
-                
-            offset += page_size
-        
         return {
-            "count": len(unique_organizations),
+            "count": get_hearing_metrics()["unique_organizations"],
             "message": "Total unique organizations from witness testimony data"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/metrics/organizations-number", summary="Get unique organizations count as plain number")
+@cache.cached()
 async def get_unique_organizations_number():
     """Get just the number of unique organizations - simplest possible endpoint for v0"""
     
-    supabase = get_supabase_client()
-    
     try:
-        # Set to track unique organizations (using organization name as identifier)
-        unique_organizations = set()
-        
-        # Pagination parameters
-        page_size = 1000  # Supabase default max
-        offset = 0
-        
-        while True:
-            # Get batch of hearings with witnesses data
-            result = supabase.table("congressional_hearings").select("witnesses").range(offset, offset + page_size - 1).execute()
-            
-            if not result.data:
-                break
-                
-            # Process witnesses in this batch
-            for hearing in result.data:
-                witnesses_data = hearing.get("witnesses", [])
-                
-                # Handle both string and array formats
-                if isinstance(witnesses_data, str):
-                    try:
-                        witnesses = json.loads(witnesses_data)
-                    except:
-                        witnesses = []
-                else:
-                    witnesses = witnesses_data or []
-                
-                # Add unique organization names to set
-                for witness in witnesses:
-                    if isinstance(witness, dict) and witness.get("organization"):
-                        # Normalize organization name for deduplication (lowercase, strip whitespace)
-                        normalized_org = witness["organization"].lower().strip()
-                        if normalized_org:
-                            unique_organizations.add(normalized_org)
-            
-            # If we got less than page_size, we've reached the end
-            if len(result.data) < page_size:
-                break
-                
-            offset += page_size
-        
-        # Return just the number
-        return len(unique_organizations)
+        return get_hearing_metrics()["unique_organizations"]
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @app.get("/stats", response_model=StatsResponse, summary="Get overall statistics")
+@cache.cached()
 async def get_stats():
     """Get overall statistics about hearings and witnesses"""
     
-    supabase = get_supabase_client()
-    
     try:
-        result = supabase.table("congressional_hearings").select("*").execute()
-        
-        if not result.data:
-            return StatsResponse(
-                total_hearings=0,
-                total_witnesses=0,
-                total_committees=0,
-                date_range={"earliest": None, "latest": None},
-                hearing_types={},
-                top_committees=[]
-            )
-        
-        hearings = result.data
-        total_hearings = len(hearings)
-        total_witnesses = 0
-        committees = set()
-        hearing_types = {}
-        committee_counts = {}
-        dates = []
-        
-        for hearing in hearings:
-            # Count witnesses
-            witnesses_data = hearing.get("witnesses", [])
-            if isinstance(witnesses_data, str):
-                try:
-                    witnesses = json.loads(witnesses_data)
-                except:
-                    witnesses = []
-            else:
-                witnesses = witnesses_data or []
-            total_witnesses += len(witnesses)
-            
-            # Track committees
-            committee = hearing["committee"]
-            committees.add(committee)
-            committee_counts[committee] = committee_counts.get(committee, 0) + 1
-            
-            # Track hearing types
-            hearing_type = hearing["hearing_type"]
-            hearing_types[hearing_type] = hearing_types.get(hearing_type, 0) + 1
-            
-            # Track dates
-            dates.append(hearing["hearing_date"])
-        
-        # Date range
-        dates.sort()
-        date_range = {
-            "earliest": dates[0] if dates else None,
-            "latest": dates[-1] if dates else None
-        }
-        
-        # Top committees
-        top_committees = [
-            {"committee": committee, "hearing_count": count}
-            for committee, count in sorted(committee_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
-        
+        metrics = get_hearing_metrics()
         return StatsResponse(
-            total_hearings=total_hearings,
-            total_witnesses=total_witnesses,
-            total_committees=len(committees),
-            date_range=date_range,
-            hearing_types=hearing_types,
-            top_committees=top_committees
+            total_hearings=metrics["hearings"],
+            total_witnesses=metrics["witness_appearances"],
+            total_committees=metrics["committees"],
+            date_range={
+                "earliest": metrics["earliest_hearing"],
+                "latest": metrics["latest_hearing"]
+            },
+            hearing_types=metrics["hearing_types"],
+            top_committees=metrics["top_committees"],
+            stale=metrics.get("stale", False)
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # Run the API
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
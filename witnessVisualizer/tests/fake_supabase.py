@@ -0,0 +1,151 @@
+"""
+In-memory stand-in for the supabase-py client: just the query builder calls
+the stores under test make, over lists of dict rows.
+"""
+
+import copy
+import fnmatch
+from typing import Any, Callable, Dict, List, Optional
+
+
+class FakeAPIError(Exception):
+    """Raised like postgrest.APIError, with the error dict as its first argument"""
+
+
+class FakeResult:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, client: 'FakeSupabase', table: str):
+        self.client = client
+        self.table = table
+        self.filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.orders = []
+        self.operation = 'select'
+        self.rows: List[Dict[str, Any]] = []
+        self.window = None
+        self.count = None
+
+    def select(self, columns='*', count=None):
+        self.count = count
+        return self
+
+    def insert(self, rows):
+        self.operation = 'insert'
+        self.rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows):
+        self.operation = 'upsert'
+        self.rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def update(self, values):
+        self.operation = 'update'
+        self.rows = [values]
+        return self
+
+    def delete(self):
+        self.operation = 'delete'
+        return self
+
+    def _filter(self, test):
+        self.filters.append(test)
+        return self
+
+    def eq(self, column, value):
+        return self._filter(lambda row: row.get(column) == value)
+
+    def neq(self, column, value):
+        return self._filter(lambda row: row.get(column) != value)
+
+    def gt(self, column, value):
+        return self._filter(lambda row: row.get(column) is not None and row[column] > value)
+
+    def gte(self, column, value):
+        return self._filter(lambda row: row.get(column) is not None and row[column] >= value)
+
+    def lt(self, column, value):
+        return self._filter(lambda row: row.get(column) is not None and row[column] < value)
+
+    def lte(self, column, value):
+        return self._filter(lambda row: row.get(column) is not None and row[column] <= value)
+
+    def in_(self, column, values):
+        values = list(values)
+        return self._filter(lambda row: row.get(column) in values)
+
+    def like(self, column, pattern):
+        glob = pattern.replace('%', '*').replace('_', '?')
+        return self._filter(lambda row: fnmatch.fnmatchcase(row.get(column) or '', glob))
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end + 1)
+        return self
+
+    def limit(self, n):
+        self.window = (0, n)
+        return self
+
+    def execute(self) -> FakeResult:
+        table = self.client.tables.setdefault(self.table, [])
+        if self.operation in ('insert', 'upsert'):
+            key = self.client.primary_keys.get(self.table, ('id',))
+            for new in self.rows:
+                existing = [i for i, row in enumerate(table) if all(row.get(k) == new.get(k) for k in key)]
+                if existing and self.operation == 'upsert':
+                    table[existing[0]] = {**table[existing[0]], **copy.deepcopy(new)}
+                else:
+                    table.append(copy.deepcopy(new))
+            return FakeResult(copy.deepcopy(self.rows))
+        matches = [row for row in table if all(test(row) for test in self.filters)]
+        if self.operation == 'delete':
+            self.client.tables[self.table] = [row for row in table if row not in matches]
+            return FakeResult(copy.deepcopy(matches))
+        if self.operation == 'update':
+            for row in matches:
+                row.update(copy.deepcopy(self.rows[0]))
+            return FakeResult(copy.deepcopy(matches))
+        for column, desc in reversed(self.orders):
+            matches.sort(key=lambda row: row.get(column), reverse=desc)
+        count = len(matches) if self.count else None
+        if self.window:
+            matches = matches[self.window[0]:self.window[1]]
+        return FakeResult(copy.deepcopy(matches), count)
+
+
+class FakeRPC:
+    def __init__(self, client: 'FakeSupabase', name: str, params: Optional[Dict[str, Any]]):
+        self.client = client
+        self.name = name
+        self.params = params or {}
+
+    def execute(self) -> FakeResult:
+        self.client.rpc_calls.append(self.name)
+        function = self.client.functions.get(self.name)
+        if function is None:
+            raise FakeAPIError({'code': 'PGRST202', 'message': f'function {self.name} not found'})
+        return FakeResult(function(self.params))
+
+
+class FakeSupabase:
+    """tables: name -> rows; primary_keys: name -> key columns for upserts; functions: RPC name -> callable"""
+
+    def __init__(self, tables=None, primary_keys=None, functions=None):
+        self.tables: Dict[str, List[Dict[str, Any]]] = copy.deepcopy(tables or {})
+        self.primary_keys = primary_keys or {}
+        self.functions: Dict[str, Callable[[Dict[str, Any]], Any]] = functions or {}
+        self.rpc_calls: List[str] = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params=None) -> FakeRPC:
+        return FakeRPC(self, name, params)
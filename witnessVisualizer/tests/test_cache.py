@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.cache import CACHE_TOKEN_ENV, ResponseCache
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _slow_loader(value=None, error=None):
+    """Async loader that counts its calls and waits until released"""
+    async def load():
+        load.calls += 1
+        await load.release.wait()
+        if error:
+            raise error
+        return value
+
+    load.calls = 0
+    load.release = asyncio.Event()
+    return load
+
+
+def test_concurrent_misses_share_one_load():
+    async def main():
+        cache = ResponseCache(default_ttl=60)
+        loader = _slow_loader({'hearings': 3})
+        waiters = [asyncio.ensure_future(cache.get('/stats', loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        entries = await asyncio.gather(*waiters)
+        assert loader.calls == 1
+        assert all(entry is entries[0] for entry in entries)
+        assert (cache.stats['misses'], cache.stats['coalesced']) == (1, 4)
+        assert (await cache.get('/stats', loader)) is entries[0]
+        assert cache.stats['hits'] == 1 and cache._inflight == {}
+    _run(main())
+
+
+def test_cancelled_first_caller_does_not_fail_the_others():
+    async def main():
+        cache = ResponseCache(default_ttl=60)
+        loader = _slow_loader({'hearings': 3})
+        first = asyncio.ensure_future(cache.get('/stats', loader))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get('/stats', loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        loader.release.set()
+        assert (await second).value == {'hearings': 3}
+        assert first.cancelled() and loader.calls == 1
+        assert '/stats' in cache._entries
+    _run(main())
+
+
+def test_errors_are_not_cached():
+    async def main():
+        cache = ResponseCache(default_ttl=60)
+        failing = _slow_loader(error=RuntimeError('backend down'))
+        waiters = [asyncio.ensure_future(cache.get('/stats', failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        failing.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results) and failing.calls == 1
+        assert cache._entries == {} and cache._inflight == {}
+
+        # A synchronous loader runs in the threadpool
+        entry = await cache.get('/stats', lambda: {'hearings': 3})
+        assert entry.value == {'hearings': 3} and cache.stats['misses'] == 2
+    _run(main())
+
+
+def test_load_finished_after_invalidate_is_not_stored():
+    async def main():
+        cache = ResponseCache(default_ttl=60)
+        loader = _slow_loader({'hearings': 3})
+        waiter = asyncio.ensure_future(cache.get('/stats', loader))
+        await asyncio.sleep(0)
+        assert cache.invalidate() == 0 and cache.generation == 1
+        loader.release.set()
+        assert (await waiter).value == {'hearings': 3}
+        assert '/stats' not in cache._entries
+    _run(main())
+
+
+def test_least_recently_used_entries_are_evicted():
+    async def main():
+        cache = ResponseCache(default_ttl=60, max_entries=2)
+        for key in ('/a', '/b'):
+            await cache.get(key, lambda: key)
+        await cache.get('/a', lambda: 'again')  # hit, /a becomes the most recent
+        await cache.get('/c', lambda: 'c')
+        assert list(cache._entries) == ['/a', '/c'] and cache.stats['evicted'] == 1
+
+        await cache.get('/d', lambda: 'd', ttl=0)  # expired entries go first
+        await cache.get('/e', lambda: 'e')
+        assert list(cache._entries) == ['/c', '/e']
+        assert cache.invalidate('/c') == 1 and list(cache._entries) == ['/e']
+    _run(main())
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv(CACHE_TOKEN_ENV, 'secret')
+    app = FastAPI()
+    cache = ResponseCache(default_ttl=60)
+    cache.install(app)
+    calls = []
+
+    @app.get('/hearings')
+    @cache.cached()
+    async def hearings(committee: str = '', limit: int = 10):
+        calls.append((committee, limit))
+        return {'committee': committee, 'limit': limit}
+
+    test_client = TestClient(app)
+    test_client.calls = calls
+    return test_client
+
+
+def test_etag_and_not_modified(client):
+    response = client.get('/hearings', params={'committee': 'Energy'})
+    etag = response.headers['etag']
+    assert response.json() == {'committee': 'Energy', 'limit': 10}
+    assert response.headers['cache-control'].startswith('max-age=')
+
+    for header in (etag, f'W/{etag}', f'"other", {etag}', '*'):
+        response = client.get('/hearings', params={'committee': 'Energy'}, headers={'If-None-Match': header})
+        assert response.status_code == 304 and response.headers['etag'] == etag
+    response = client.get('/hearings', params={'committee': 'Energy'}, headers={'If-None-Match': '"other"'})
+    assert response.status_code == 200
+    assert client.calls == [('Energy', 10)]
+    assert client.get('/cache/stats').json()['not_modified'] == 4
+
+
+def test_key_ignores_undeclared_parameters(client):
+    client.get('/hearings', params={'committee': 'Energy', 'limit': 5})
+    client.get('/hearings', params={'limit': 5, 'committee': 'Energy', '_': '1'})
+    client.get('/hearings', params={'committee': 'Energy', 'limit': 5, 'utm': 'x'})
+    assert client.calls == [('Energy', 5)]
+    client.get('/hearings', params={'committee': 'Energy', 'limit': 6})
+    assert client.calls == [('Energy', 5), ('Energy', 6)]
+
+
+def test_invalidate_endpoint_requires_the_token(client, monkeypatch):
+    client.get('/hearings')
+    assert client.post('/cache/invalidate').status_code == 403
+    assert client.post('/cache/invalidate', headers={'X-Cache-Token': 'wrong'}).status_code == 403
+    response = client.post('/cache/invalidate', headers={'X-Cache-Token': 'secret'})
+    assert response.json() == {'invalidated': 1, 'generation': 1}
+    client.get('/hearings')
+    assert len(client.calls) == 2
+
+    # Without a configured token the endpoint is closed
+    monkeypatch.delenv(CACHE_TOKEN_ENV)
+    assert client.post('/cache/invalidate', headers={'X-Cache-Token': ''}).status_code == 403
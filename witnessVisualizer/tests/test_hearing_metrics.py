@@ -0,0 +1,61 @@
+from database.hearing_metrics import HearingMetricsStore, compute_hearing_metrics, parse_witnesses
+from tests.fake_supabase import FakeSupabase
+
+HEARINGS = [
+    {'id': 1, 'committee': 'Energy', 'hearing_type': 'Oversight', 'hearing_date': '2024-03-01',
+     'document_url': 'https://example.test/1.pdf',
+     'witnesses': [{'name': 'Jane Doe', 'organization': 'Acme', 'documents': ['a', 'b']},
+                   {'name': ' jane doe ', 'organization': 'ACME'}]},
+    {'id': 2, 'committee': 'Energy', 'hearing_type': 'Legislative', 'hearing_date': '2023-05-02',
+     'document_url': None, 'witnesses': '[{"name": "John Smith", "organization": "DOE"}]'},
+    {'id': 3, 'committee': 'Budget', 'hearing_type': None, 'hearing_date': None,
+     'document_url': '', 'witnesses': 'not json'},
+]
+
+
+def test_compute_hearing_metrics():
+    metrics = compute_hearing_metrics(HEARINGS)
+    assert metrics == {
+        'hearings': 3,
+        'witness_appearances': 3,
+        'unique_organizations': 2,
+        'documents': 3,
+        'committees': 2,
+        'earliest_hearing': '2023-05-02',
+        'latest_hearing': '2024-03-01',
+        'hearing_types': {'Oversight': 1, 'Legislative': 1},
+        'top_committees': [{'committee': 'Energy', 'hearing_count': 2},
+                           {'committee': 'Budget', 'hearing_count': 1}],
+    }
+    assert parse_witnesses('[1, {"name": "A"}]') == [{'name': 'A'}]
+
+
+def _summary_client(stale):
+    return FakeSupabase({
+        'congressional_hearings': HEARINGS,
+        'hearing_metrics': [{'id': 'congressional_hearings', 'metrics': {'hearings': 2}, 'stale': stale}],
+    }, functions={'refresh_hearing_metrics': lambda params: {'hearings': 3}})
+
+
+def test_stale_summary_row_is_served_without_a_refresh():
+    client = _summary_client(stale=True)
+    store = HearingMetricsStore(client)
+    assert store.get() == {'hearings': 2, 'stale': True}
+    # hearing_stats() is missing: asked once, then only the summary row is read
+    assert store.get() == {'hearings': 2, 'stale': True}
+    assert client.rpc_calls == ['hearing_stats']
+
+    assert HearingMetricsStore(_summary_client(stale=False)).get() == {'hearings': 2, 'stale': False}
+    assert store.refresh() == {'hearings': 3, 'stale': False}
+
+
+def test_metrics_come_from_hearing_stats_when_installed():
+    client = _summary_client(stale=True)
+    client.functions['hearing_stats'] = lambda params: {'hearings': 3}
+    assert HearingMetricsStore(client).get() == {'hearings': 3, 'stale': False}
+    assert client.rpc_calls == ['hearing_stats']
+
+
+def test_metrics_are_computed_without_a_summary_row():
+    client = FakeSupabase({'congressional_hearings': HEARINGS, 'hearing_metrics': []})
+    assert HearingMetricsStore(client).get() == {**compute_hearing_metrics(HEARINGS), 'stale': False}
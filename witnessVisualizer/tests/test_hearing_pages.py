@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+import random
+
+import pytest
+
+from database.hearing_pages import csv_lines, hearing_cursor, parse_cursor
+from database.local_db import build_local_db
+from database.repository import SQLiteRepository
+
+
+def test_cursor_round_trip():
+    assert hearing_cursor({'id': 12, 'hearing_date': '2024-03-01'}) == '2024-03-01,12'
+    assert parse_cursor('2024-03-01,12') == ('2024-03-01', 12)
+    for cursor in ('', '2024-03-01', '2024-03-01,', '2024-03-01,x', 'March 1,12', '2024-02-30,1'):
+        with pytest.raises(ValueError):
+            parse_cursor(cursor)
+
+
+@pytest.fixture(scope='module')
+def tied(tmp_path_factory):
+    """40 hearings on three dates, written in random id order"""
+    directory = tmp_path_factory.mktemp('tied')
+    ids = list(range(1, 41))
+    random.Random(7).shuffle(ids)
+    dates = ['2024-01-10', '2023-06-01', '2022-02-02']
+    with open(directory / 'hearings.ndjson', 'w', encoding='utf-8') as f:
+        for hearing_id in ids:
+            f.write(json.dumps({'id': hearing_id, 'hearing_date': dates[hearing_id % 3],
+                                'committee': 'Energy' if hearing_id % 2 else 'Budget', 'witnesses': []}) + '\n')
+    build_local_db(directory / 'hearings.ndjson', directory / 'hearings.sqlite')
+    return SQLiteRepository(str(directory / 'hearings.sqlite'))
+
+
+def test_iter_hearings_walks_tied_dates_once(tied):
+    expected = sorted(((h['hearing_date'], h['id']) for h in tied.list_hearings('id, hearing_date', 100)),
+                      reverse=True)
+    assert len(expected) == 40
+    for page_size in (1, 2, 3, 7, 13, 40, 41):
+        walked = [(h['hearing_date'], h['id']) for h in tied.iter_hearings('id, hearing_date', page_size)]
+        assert walked == expected
+
+    energy = [h['id'] for h in tied.iter_hearings('id, hearing_date', 4, committee='energy')]
+    assert len(energy) == 20 and all(hearing_id % 2 for hearing_id in energy)
+
+
+def test_csv_lines_writes_lists_and_dicts_as_json():
+    rows = [
+        {'id': 1, 'hearing_name': 'Grid "Reliability", Part 1', 'members': [{'name': 'Adams, Alice'}],
+         'witnesses': {'name': 'Jane\nDoe'}, 'serial_no': None, 'ignored': 'x'},
+        {'id': 2, 'hearing_name': 'Budget', 'members': [], 'witnesses': []},
+    ]
+    fieldnames = ['id', 'hearing_name', 'members', 'witnesses', 'serial_no']
+    text = ''.join(csv_lines(rows, fieldnames))
+    parsed = list(csv.DictReader(io.StringIO(text)))
+    assert parsed[0] == {'id': '1', 'hearing_name': 'Grid "Reliability", Part 1',
+                         'members': '[{"name": "Adams, Alice"}]', 'witnesses': '{"name": "Jane\\nDoe"}',
+                         'serial_no': ''}
+    assert json.loads(parsed[0]['members']) == rows[0]['members']
+    assert (parsed[1]['members'], parsed[1]['witnesses'], parsed[1]['serial_no']) == ('[]', '[]', '')
+
+
+def test_csv_lines_reads_one_row_per_line():
+    read = []
+
+    def rows():
+        for hearing_id in range(1, 1000):
+            read.append(hearing_id)
+            yield {'id': hearing_id}
+
+    lines = csv_lines(rows(), ['id'])
+    assert next(lines) == 'id\r\n' and read == [1]
+    assert next(lines) == '1\r\n' and read == [1, 2]
@@ -0,0 +1,120 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from database.hearing_search import SEARCH_FACETS, facet_counts, facet_lists, fts5_query, search_documents
+from database.local_db import build_local_db
+from database.repository import SQLiteRepository
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'hearings.ndjson'
+
+
+def test_fts5_query():
+    assert fts5_query('grid') == '("grid")'
+    assert fts5_query('grid reliability') == '("grid") AND ("reliability")'
+    assert fts5_query('"grid reliability"') == '("grid reliability")'
+    assert fts5_query('"unterminated phrase') == '("unterminated phrase")'
+    assert fts5_query('solar or wind') == '("solar" OR "wind")'
+    assert fts5_query('grid solar OR wind or rail') == '("grid") AND ("solar" OR "wind" OR "rail")'
+    # "or" without a term on both sides is dropped
+    assert fts5_query('or solar') == fts5_query('solar or') == '("solar")'
+    assert fts5_query('grid -solar -"wind farm"') == '((("grid")) NOT "solar") NOT "wind farm"'
+
+
+def test_fts5_query_quotes_operators_and_punctuation():
+    assert fts5_query('NEAR(a b) AND *') == '("NEAR a") AND ("b") AND ("AND")'
+    assert fts5_query("O'Brien") == '("O Brien")'
+    assert fts5_query('heading:grid ^budget') == '("heading grid") AND ("budget")'
+    assert fts5_query('grid -') == '("grid")'
+
+
+def test_queries_without_a_searchable_term():
+    for q in ('', '   ', '***', '-solar', '-"solar power"', 'or', '- -'):
+        assert fts5_query(q) is None
+
+
+def test_every_query_is_valid_fts5():
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE VIRTUAL TABLE t USING fts5(heading, detail, context, tokenize='porter unicode61')")
+    conn.execute("INSERT INTO t VALUES ('Grid Reliability', 'Energy', 'Jane Doe Acme')")
+    for q in ('NEAR(a b) AND *', 'heading:grid', '"a" "b', 'x OR', 'AND OR NOT', '(grid)', 'grid^', "l'été",
+              'grid -"x', '{heading detail}: grid', 'grid or -acme'):
+        match = fts5_query(q)
+        conn.execute('SELECT count(*) FROM t WHERE t MATCH ?', (match,)).fetchone()
+    assert conn.execute('SELECT count(*) FROM t WHERE t MATCH ?', (fts5_query('grids -budget'),)).fetchone() == (1,)
+
+
+def test_facet_lists_orders_by_count_then_value():
+    counts = [('committee', 'Energy', 2), ('committee', 'Budget', 2), ('committee', 'Judiciary', 5),
+              ('committee', 'Rules', 0), ('year', 2024, 1), ('year', 2023, 3), ('kind', 'hearing', 4)]
+    facets = facet_lists(counts, facet_limit=2)
+    assert list(facets) == SEARCH_FACETS
+    assert facets['committee'] == [{'value': 'Judiciary', 'count': 5}, {'value': 'Budget', 'count': 2}]
+    assert facets['year'] == [{'value': 2023, 'count': 3}, {'value': 2024, 'count': 1}]
+    assert facets['kind'] == [{'value': 'hearing', 'count': 4}]
+    assert facets['witness_type'] == []
+    assert len(facet_lists(counts, facet_limit=10)['committee']) == 3  # zero counts are left out
+
+
+def test_search_documents():
+    hearing = {'id': 1, 'hearing_name': 'Grid Reliability', 'committee': ' Energy ', 'congress': 118,
+               'hearing_type': '', 'hearing_date': '2024-03-01'}
+    witnesses = [{'name': 'Jane Doe', 'title': 'CEO', 'organization': 'Acme', 'witness_type': 'Private'},
+                 {'name': ' ', 'organization': 'Solar Co'}]
+    documents = search_documents(hearing, witnesses)
+    assert [(d['kind'], d['position']) for d in documents] == [('hearing', 0), ('witness', 1), ('witness', 2)]
+    assert documents[0]['committee'] == 'Energy' and documents[0]['hearing_type'] is None
+    assert (documents[0]['heading'], documents[0]['detail'], documents[0]['context']) == (
+        'Grid Reliability', 'Energy', 'Jane Doe Acme Solar Co')
+    assert (documents[1]['heading'], documents[1]['detail'], documents[1]['context']) == (
+        'Jane Doe', 'CEO Acme', 'Grid Reliability Energy')
+    assert documents[2]['name'] is None and documents[2]['heading'] == ''
+    counts = facet_counts(documents)
+    assert counts['kind', 'witness'] == 2 and counts['year', 2024] == 3
+    assert ('hearing_type', None) not in counts and counts['witness_type', 'Private'] == 1
+
+
+@pytest.fixture(scope='module')
+def repository(tmp_path_factory):
+    target = tmp_path_factory.mktemp('search') / 'hearings.sqlite'
+    build_local_db(FIXTURE, target)
+    return SQLiteRepository(str(target))
+
+
+def _hits(result):
+    return [(hit['kind'], hit['hearing_id'], hit['position']) for hit in result['hits']]
+
+
+def test_sqlite_faceted_search(repository):
+    result = repository.faceted_search('solar')
+    assert result['total'] == 4
+    assert _hits(result)[:2] == [('witness', 2, 1), ('witness', 1, 2)]  # name and organization outrank context
+    assert result['facets']['witness_type'] == [{'value': 'Government', 'count': 1}]
+
+    result = repository.faceted_search('solar -director')
+    assert _hits(result) == [('hearing', 2, 0), ('hearing', 1, 0)]
+    assert result['facets']['kind'] == [{'value': 'hearing', 'count': 2}]
+
+    result = repository.faceted_search('NEAR* (OR) NOT')
+    assert _hits(result) == [('hearing', 6, 0), ('witness', 6, 1)]
+
+    result = repository.faceted_search('-solar')
+    assert (result['total'], result['hits']) == (0, [])
+    assert result['facets'] == {facet: [] for facet in SEARCH_FACETS}
+
+
+def test_sqlite_facet_filters_and_browsing(repository):
+    result = repository.faceted_search('acme', year=2023)
+    assert _hits(result) == [('witness', 4, 1), ('hearing', 4, 0)]
+
+    # Without a query: newest first, with the facet counts stored at build time
+    result = repository.faceted_search(limit=3)
+    assert result['total'] == 10
+    assert _hits(result) == [('hearing', 3, 0), ('hearing', 2, 0), ('witness', 2, 1)]
+    assert all(hit['score'] == 0 for hit in result['hits'])
+    assert result['facets']['committee'][0] == {'value': 'Energy and Commerce', 'count': 5}
+    assert repository.faceted_search(limit=3, offset=3)['hits'][0]['hearing_id'] == 1
+
+    result = repository.faceted_search(kind='witness', committee='Budget')
+    assert _hits(result) == [('witness', 4, 1)] and result['total'] == 1
@@ -0,0 +1,134 @@
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from database.local_db import build_local_db, congress_for, ensure_local_db
+from database.repository import HEARING_COLUMNS, SQLiteRepository
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'hearings.ndjson'
+
+
+@pytest.fixture(scope='module')
+def repository(tmp_path_factory):
+    target = tmp_path_factory.mktemp('local') / 'hearings.sqlite'
+    stats = build_local_db(FIXTURE, target)
+    assert stats == {'hearings': 5, 'witnesses': 5, 'skipped': 1, 'entities': 3}
+    return SQLiteRepository(str(target))
+
+
+def test_hearing_without_a_date_is_skipped(repository):
+    assert repository.count_hearings() == 5
+    assert repository.get_hearing(5) is None
+    assert repository.search_witnesses('nobody') == []
+
+
+def test_rows_have_the_supabase_fields(repository):
+    hearing = repository.get_hearing(1)
+    assert list(hearing) == HEARING_COLUMNS
+    assert hearing['members'] == [{'name': 'Rep. Alice Adams'}]
+    assert hearing['bill_numbers'] == ['H.R. 1']
+    assert hearing['witnesses'][1] == {'name': 'John Smith', 'title': 'Director', 'organization': '100% Solar',
+                                       'witness_type': 'Government'}
+    assert (hearing['congress'], hearing['created_at']) == (118, '2024-03-02T00:00:00')
+
+    for hearing in repository.list_hearings('*', 10):
+        assert isinstance(hearing['congress'], int)
+        assert date.fromisoformat(hearing['hearing_date']).isoformat() == hearing['hearing_date']
+        datetime.fromisoformat(hearing['created_at'])
+        assert all(isinstance(hearing[column], list) for column in ('members', 'witnesses', 'bill_numbers'))
+    # Legacy rows hold witnesses as a JSON string; the file stores the list
+    assert repository.get_hearing(2)['witnesses'] == [
+        {'name': 'John Smith', 'title': 'Director', 'organization': 'Solar_Power'}]
+    assert congress_for('2023-01-02') == 117 and congress_for('2023-01-03') == 118
+
+    with pytest.raises(ValueError):
+        repository.list_hearings('id, password', 10)
+
+
+def test_list_hearings_and_hearing_page(repository):
+    def ids(rows):
+        return [row['id'] for row in rows]
+
+    assert ids(repository.list_hearings('id, hearing_date', 10)) == [3, 2, 1, 4, 6]
+    assert ids(repository.list_hearings('id, hearing_date', 2, offset=2)) == [1, 4]
+    assert ids(repository.list_hearings('id', 10, committee='energy')) == [2, 1]
+    assert ids(repository.list_hearings('id', 10, hearing_type='Oversight', congress=118)) == [1, 4]
+    assert ids(repository.list_hearings('id', 10, start_date=date(2023, 1, 3), end_date=date(2023, 12, 31))) == [4]
+
+    page = repository.hearing_page('id, hearing_date', 2)
+    assert ids(page) == [3, 2]
+    assert ids(repository.hearing_page('id, hearing_date', 2, '2024-03-01,2')) == [1, 4]
+    assert ids(repository.hearing_page('id, hearing_date', 10, '2024-03-01,1', committee='budget')) == [4]
+    assert repository.hearing_page('id, hearing_date', 10, '2023-01-02,6') == []
+    with pytest.raises(ValueError):
+        repository.hearing_page('id, hearing_date', 10, 'yesterday,2')
+
+
+def test_search_witnesses(repository):
+    def found(query=None, **kwargs):
+        return [(w['hearing_id'], w['name']) for w in repository.search_witnesses(query, **kwargs)]
+
+    assert found('jane') == [(1, 'Jane Doe'), (4, 'Jane Doe')]
+    assert found('DIRECTOR') == [(2, 'John Smith'), (1, 'John Smith')]
+    assert found(witness_type='Private', committee='budget') == [(4, 'Jane Doe')]
+    assert found(limit=2, offset=1) == [(1, 'Jane Doe'), (1, 'John Smith')]
+    # LIKE wildcards in the query are matched literally
+    assert found('100%') == [(1, 'John Smith')]
+    assert found('solar_') == [(2, 'John Smith')]
+    assert found('%') == [(1, 'John Smith')]
+    assert found('_') == [(2, 'John Smith')]
+
+    witness = repository.search_witnesses('o\'brien')[0]
+    assert witness == {'name': "Mary O'Brien", 'title': 'Professor', 'organization': 'SolarXPower',
+                       'witness_type': 'Academic', 'hearing_id': 6,
+                       'hearing_name': 'Crime "AND" Punishment: NEAR* (OR) NOT',
+                       'committee': 'Judiciary', 'hearing_date': '2023-01-02'}
+
+
+def test_metrics_and_witness_entities(repository):
+    assert repository.hearing_metrics() == {
+        'hearings': 5,
+        'witness_appearances': 5,
+        'unique_organizations': 4,
+        'documents': 1,
+        'committees': 3,
+        'earliest_hearing': '2023-01-02',
+        'latest_hearing': '2024-03-01',
+        'hearing_types': {'Oversight': 3, 'Legislative': 2},
+        'top_committees': [{'committee': 'Budget', 'hearing_count': 2},
+                           {'committee': 'Energy and Commerce', 'hearing_count': 2},
+                           {'committee': 'Judiciary', 'hearing_count': 1}],
+    }
+    assert repository.count_witness_entities() == 3
+    entities = list(repository.iter_witness_entities(page_size=2))
+    assert [(e['canonical_name'], e['hearing_count'], e['last_seen']) for e in entities] == [
+        ('Jane Doe', 2, '2024-03-01'), ('John Smith', 2, '2024-03-01'), ("Mary O'Brien", 1, '2023-01-02')]
+    assert entities[0]['entity_id'] == 'hw-1-1'
+    assert entities[0]['committees'] == ['Energy and Commerce', 'Budget']
+    assert entities[1]['hearings'] == ['Grid Reliability', 'Pipeline Safety']
+
+
+def test_metrics_are_computed_without_the_summary_row(tmp_path):
+    target = tmp_path / 'hearings.sqlite'
+    build_local_db(FIXTURE, target)
+    expected = SQLiteRepository(str(target)).hearing_metrics()
+    conn = sqlite3.connect(target)
+    conn.execute('DELETE FROM hearing_metrics')
+    conn.commit()
+    conn.close()
+    assert SQLiteRepository(str(target)).hearing_metrics() == expected
+
+
+def test_ensure_local_db_builds_next_to_the_source(tmp_path):
+    source = tmp_path / 'export.ndjson'
+    source.write_bytes(FIXTURE.read_bytes())
+    path = ensure_local_db(str(source))
+    assert path == str(tmp_path / 'export.witness.sqlite')
+    built_at = Path(path).stat().st_mtime_ns
+    assert ensure_local_db(str(source)) == path and Path(path).stat().st_mtime_ns == built_at
+    # A built file is used as it is
+    assert ensure_local_db(path) == path
+    with pytest.raises(FileNotFoundError):
+        ensure_local_db(str(tmp_path / 'missing.ndjson'))
@@ -0,0 +1,148 @@
+import csv
+import importlib
+import io
+import json
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from database.repository import BACKEND_ENV, SQLITE_PATH_ENV, SQLiteRepository
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'hearings.ndjson'
+
+
+@pytest.fixture(scope='module')
+def api(tmp_path_factory):
+    """witness_api on the SQLite backend, built from the fixture"""
+    source = tmp_path_factory.mktemp('api') / 'hearings.ndjson'
+    source.write_bytes(FIXTURE.read_bytes())
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(BACKEND_ENV, 'sqlite')
+        patch.setenv(SQLITE_PATH_ENV, str(source))
+        sys.modules.pop('api.production.witness_api', None)
+        yield importlib.import_module('api.production.witness_api')
+
+
+@pytest.fixture
+def client(api):
+    api.cache.invalidate()
+    return TestClient(api.app)
+
+
+def _walk(client, path, limit, items=lambda body: body):
+    """Every page of a witness list, following last_seen,id cursors"""
+    pages, params = [], {'limit': limit}
+    while True:
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        page = items(response.json())
+        pages.append([witness['name'] for witness in page])
+        if len(page) < limit:
+            return pages
+        params['cursor'] = f"{page[-1]['last_seen'] or ''},{page[-1]['id']}"
+
+
+def test_witness_lists_page_over_the_entities(client):
+    expected = [['Jane Doe', 'John Smith'], ["Mary O'Brien"]]
+    assert _walk(client, '/witnesses/congressional', 2) == expected
+    assert _walk(client, '/witnesses/all-simple', 2) == expected
+
+    simple = client.get('/witnesses/all-simple').json()
+    assert simple[1] == {'id': 'hw-1-2', 'name': 'John Smith', 'title': 'Director', 'organization': 'Solar_Power',
+                         'first_seen_hearing': 'Grid Reliability', 'first_seen_committee': 'Energy and Commerce',
+                         'last_seen': '2024-03-01'}
+    witness = client.get('/witnesses/congressional').json()[0]
+    assert (witness['id'], witness['hearing_count'], witness['committees']) == (
+        'hw-1-1', 2, ['Energy and Commerce', 'Budget'])
+
+    for path in ('/witnesses/congressional', '/witnesses/all-simple', '/api/witnesses/all'):
+        assert client.get(path, params={'cursor': 'hw-1-1'}).status_code == 400
+        assert client.get(path, params={'cursor': 'March,hw-1-1'}).status_code == 400
+
+
+def test_all_witnesses_returns_the_next_cursor(client):
+    body = client.get('/api/witnesses/all', params={'limit': 2}).json()
+    assert body['total_witnesses'] == 3 and body['next_cursor'] == '2024-03-01,hw-1-2'
+    assert body['witnesses'][0] == {
+        'id': 'hw-1-1', 'name': 'Jane Doe', 'title': 'CEO', 'organization': 'Acme Power',
+        'topics': ['Energy & Commerce', 'Policy'], 'hearings': ['Grid Reliability', 'Deficit Review'],
+        'committees': ['Energy and Commerce', 'Budget'], 'hearing_count': 2, 'most_recent_hearing': '2024-03-01',
+    }
+    body = client.get('/api/witnesses/all', params={'limit': 2, 'cursor': body['next_cursor']}).json()
+    assert [w['name'] for w in body['witnesses']] == ["Mary O'Brien"] and body['next_cursor'] is None
+
+
+def test_undated_entities_come_first_as_in_postgres(api, tmp_path):
+    path = tmp_path / 'undated.sqlite'
+    shutil.copy(api.repository.path, path)
+    conn = sqlite3.connect(path)
+    for entity_id in ('hw-9-2', 'hw-9-1'):
+        conn.execute("INSERT INTO witness_entities SELECT ?, canonical_name, name_key, block_key, middle_initials, "
+                     "title, organization, aliases, hearing_ids, hearings, committees, hearing_count, NULL, NULL "
+                     "FROM witness_entities WHERE entity_id = 'hw-6-1'", (entity_id,))
+    conn.commit()
+    conn.close()
+
+    repository = SQLiteRepository(str(path))
+    expected = ['hw-9-1', 'hw-9-2', 'hw-1-1', 'hw-1-2', 'hw-6-1']
+    assert [e['entity_id'] for e in repository.witness_entities(10)] == expected
+    for page_size in (1, 2, 3):
+        assert [e['entity_id'] for e in repository.iter_witness_entities(page_size)] == expected
+    assert [e['entity_id'] for e in repository.witness_entity_page(2, ',hw-9-2')] == ['hw-1-1', 'hw-1-2']
+
+
+def test_hearing_list_pages_with_a_cursor(client):
+    first = client.get('/congressional-hearings', params={'limit': 2}).json()
+    assert [h['id'] for h in first] == [3, 2]
+    cursor = f"{first[-1]['hearing_date']},{first[-1]['id']}"
+    second = client.get('/congressional-hearings', params={'limit': 2, 'cursor': cursor}).json()
+    assert [h['id'] for h in second] == [1, 4]
+    for cursor in ('yesterday,2', '2024-03-01', '2024-03-01,two'):
+        response = client.get('/congressional-hearings', params={'cursor': cursor})
+        assert response.status_code == 400 and 'Invalid cursor' in response.json()['detail']
+
+
+def test_exports_stream(client, api):
+    with client.stream('GET', '/congressional-hearings/export', params={'format': 'csv'}) as response:
+        assert response.headers['content-type'].startswith('text/csv')
+        assert 'content-length' not in response.headers  # chunked, not buffered
+        assert response.headers['content-disposition'] == 'attachment; filename="congressional_hearings.csv"'
+        rows = list(csv.DictReader(io.StringIO(response.read().decode())))
+    assert [row['id'] for row in rows] == ['3', '2', '1', '4', '6']
+    assert json.loads(rows[2]['members']) == [{'name': 'Rep. Alice Adams'}]
+    assert json.loads(rows[1]['witnesses'])[0]['organization'] == 'Solar_Power'
+
+    with client.stream('GET', '/witnesses/export', params={'committee': 'energy'}) as response:
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        assert 'content-length' not in response.headers
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+    assert [(line['hearing_id'], line['name']) for line in lines] == [
+        (2, 'John Smith'), (1, 'Jane Doe'), (1, 'John Smith')]
+    assert set(lines[0]) == set(api.WITNESS_EXPORT_FIELDS)
+    assert client.get('/witnesses/export', params={'format': 'xml'}).status_code == 422
+
+
+def test_search(client):
+    body = client.get('/search', params={'q': 'jane doe', 'facet_limit': 1}).json()
+    assert body['total'] == 4
+    assert [(hit['kind'], hit['hearing_id']) for hit in body['hits']][:2] == [('witness', 4), ('witness', 1)]
+    assert body['hits'][0]['name'] == 'Jane Doe' and body['hits'][0]['score'] > body['hits'][-1]['score']
+    assert body['facets']['committee'] == [{'value': 'Budget', 'count': 2}]
+
+    body = client.get('/search', params={'q': '-jane'}).json()
+    assert (body['total'], body['hits']) == (0, [])
+    body = client.get('/search', params={'kind': 'hearing', 'year': 2023}).json()
+    assert [hit['hearing_id'] for hit in body['hits']] == [4, 6]
+    assert client.get('/search', params={'kind': 'member'}).status_code == 422
+
+
+def test_hearing_witnesses_parses_legacy_rows(client, api, monkeypatch):
+    legacy = {'id': 7, 'witnesses': '[{"name": "John Smith", "organization": "DOE"}]'}
+    monkeypatch.setattr(api.repository, 'get_hearing', lambda hearing_id: legacy)
+    response = client.get('/congressional-hearings/7/witnesses')
+    assert response.status_code == 200
+    assert response.json() == [{'name': 'John Smith', 'organization': 'DOE'}]
@@ -0,0 +1,173 @@
+from database.witness_entities import (APPEARANCES_TABLE, ENTITIES_TABLE, QUEUE_TABLE, EntityResolver, NameKey,
+                                       WitnessEntityStore, match_score, normalize_name, resolve_all, soundex)
+from tests.fake_supabase import FakeSupabase
+
+PRIMARY_KEYS = {ENTITIES_TABLE: ('entity_id',), APPEARANCES_TABLE: ('hearing_id', 'position'),
+                QUEUE_TABLE: ('hearing_id',)}
+
+
+def _entity(name, organization=None):
+    key = normalize_name(name)
+    return {'name_key': key.key, 'middle_initials': key.middle or None, 'organization': organization}
+
+
+def test_normalize_name():
+    assert normalize_name('John Smith') == NameKey('john', '', 'smith')
+    assert normalize_name('Smith, John Q.') == NameKey('john', 'q', 'smith')
+    assert normalize_name('Dr. José García, Ph.D.') == NameKey('jose', '', 'garcia')
+    assert normalize_name('The Honorable Robert "Bob" Jones III') == NameKey('robert', '', 'jones')
+    assert normalize_name('Mike Thompson (D-CA)') == NameKey('michael', '', 'thompson')
+    assert normalize_name("Mary-Kate O'Brien") == NameKey('mary-kate', '', 'obrien')
+    for name in ('Senator Smith', 'Smith', 'Smith, Jr.', '', None, 42):
+        assert normalize_name(name) is None
+
+
+def test_positions_after_the_name_are_dropped():
+    assert normalize_name('John Smith, Director') == NameKey('john', '', 'smith')
+    assert normalize_name('Hon. Jane Doe, Secretary, Department of Energy') == NameKey('jane', '', 'doe')
+    assert normalize_name('John Smith, Jr., President, Acme Corp.') == NameKey('john', '', 'smith')
+    assert normalize_name('Smith, John Q., Director') == NameKey('john', 'q', 'smith')
+
+
+def test_soundex_blocks_spelling_variants_together():
+    assert soundex('smith') == soundex('smyth') == 'S530'
+    assert normalize_name('Jon Smyth').block == normalize_name('John Smith').block
+
+
+def test_match_score():
+    entity = _entity('John Q. Smith', 'Department of Energy')
+    assert match_score(normalize_name('Smith, John'), None, entity) == 2
+    assert match_score(normalize_name('Jack Smith'), 'U.S. Department of Energy', entity) == 3
+    assert match_score(normalize_name('John R. Smith'), 'Department of Energy', entity) == 0
+    # Spelling variants and initials need the organization to agree
+    assert match_score(normalize_name('John Smithe'), 'Department of Energy', entity) == 1
+    assert match_score(normalize_name('J. Smith'), 'The Department of Energy', entity) == 1
+    assert match_score(normalize_name('John Smithe'), 'Acme Corp.', entity) == 0
+    assert match_score(normalize_name('John Smithe'), None, entity) == 0
+
+
+def test_resolve_all():
+    hearings = [
+        {'id': 1, 'hearing_name': 'Grid reliability', 'committee': 'Energy', 'hearing_date': '2023-02-01',
+         'witnesses': [{'name': 'Smith, John', 'title': 'Analyst', 'organization': 'Department of Energy'},
+                       {'name': 'Jane Doe, Director', 'organization': 'Acme'},
+                       {'name': 'Senator Smith'}]},
+        {'id': 2, 'hearing_name': 'Grid security', 'committee': 'Energy', 'hearing_date': '2024-05-01',
+         'witnesses': '[{"name": "Dr. John Q. Smith", "title": "Director", "organization": "Department of Energy"},'
+                      ' {"name": "John Smithe", "organization": "Department of Energy"}]'},
+        {'id': 3, 'hearing_name': 'Budget', 'committee': 'Appropriations', 'hearing_date': '2022-01-10',
+         'witnesses': [{'name': 'John Smith', 'organization': 'Acme'}, {'name': 'Jane Doe', 'organization': 'Acme'}]},
+    ]
+    entities, appearances = resolve_all(hearings)
+    by_id = {e['entity_id']: e for e in entities}
+    assert len(entities) == 2
+    smith, doe = by_id['hw-1-1'], by_id['hw-1-2']
+    assert smith['canonical_name'] == 'Dr. John Q. Smith'
+    assert smith['aliases'] == ['Smith, John', 'Dr. John Q. Smith', 'John Smithe', 'John Smith']
+    assert smith['hearing_ids'] == [1, 2, 3] and smith['hearing_count'] == 3
+    assert smith['committees'] == ['Energy', 'Appropriations']
+    # Title and organization as of the latest appearance, dates over all of them
+    assert (smith['title'], smith['organization']) == ('Director', 'Department of Energy')
+    assert (smith['first_seen'], smith['last_seen']) == ('2022-01-10', '2024-05-01')
+    assert doe['aliases'] == ['Jane Doe, Director', 'Jane Doe'] and doe['hearing_count'] == 2
+    assert [(a['hearing_id'], a['position'], a['entity_id']) for a in appearances] == [
+        (1, 1, 'hw-1-1'), (1, 2, 'hw-1-2'), (2, 1, 'hw-1-1'), (2, 2, 'hw-1-1'), (3, 1, 'hw-1-1'), (3, 2, 'hw-1-2'),
+    ]
+
+
+def test_new_entities_skip_taken_ids():
+    # An edited hearing resolved again: hw-1-1 still belongs to the witness it used to list
+    resolver = EntityResolver(taken_ids=['hw-1-1', 'hw-1-1-2'])
+    hearing = {'id': 1, 'hearing_date': '2024-01-01', 'witnesses': [{'name': 'Alice Green'}, {'name': 'Bob Brown'}]}
+    assert [a['entity_id'] for a in resolver.resolve_hearing(hearing)] == ['hw-1-1-3', 'hw-1-2']
+
+
+def _hearing(hearing_id, witnesses, hearing_date):
+    return {'id': hearing_id, 'hearing_name': f'Hearing {hearing_id}', 'committee': 'Energy',
+            'hearing_date': hearing_date, 'witnesses': witnesses}
+
+
+def _write(client, hearing, queued_at):
+    """Insert or replace a hearing and queue it, as the witness_entities.sql trigger does"""
+    hearings = client.tables.setdefault('congressional_hearings', [])
+    hearings[:] = [h for h in hearings if h['id'] != hearing['id']] + [hearing]
+    client.table(QUEUE_TABLE).upsert({'hearing_id': hearing['id'], 'queued_at': queued_at}).execute()
+
+
+def _assert_matches_full_resolution(client):
+    """Same entities and the same grouping of appearances as resolving every hearing at once"""
+    entities, appearances = resolve_all(sorted(client.tables['congressional_hearings'], key=lambda h: h['id']))
+    summary = lambda e: (e['canonical_name'], sorted(e['hearing_ids']), e['hearing_count'])
+    assert sorted(map(summary, client.tables[ENTITIES_TABLE])) == sorted(map(summary, entities))
+
+    def groups(rows):
+        by_entity = {}
+        for row in rows:
+            by_entity.setdefault(row['entity_id'], []).append((row['hearing_id'], row['position']))
+        return sorted(sorted(group) for group in by_entity.values())
+    assert groups(client.tables[APPEARANCES_TABLE]) == groups(appearances)
+    assert client.tables[QUEUE_TABLE] == []
+
+
+def test_hearings_committed_out_of_id_order_are_resolved():
+    client = FakeSupabase(primary_keys=PRIMARY_KEYS)
+    store = WitnessEntityStore(client)
+    # Two parallel insert batches: hearing 3 commits first and is resolved
+    _write(client, _hearing(3, [{'name': 'Jane Doe'}, {'name': 'Bob Brown'}], '2023-03-01'), 't1')
+    assert store.resolve_new_hearings()['hearings'] == 1
+    # Hearing 2 commits afterwards, below the highest id resolved so far
+    _write(client, _hearing(2, [{'name': 'John Smith', 'organization': 'DOE'}, {'name': 'Jane Doe'}],
+                            '2023-02-01'), 't2')
+    _write(client, _hearing(4, '[{"name": "Dr. John Smith", "organization": "DOE"}]', '2023-04-01'), 't2')
+    stats = store.resolve_new_hearings(batch_size=1)
+    assert (stats['hearings'], stats['appearances']) == (2, 3)
+    _assert_matches_full_resolution(client)
+    assert store.resolve_new_hearings()['hearings'] == 0
+
+
+def test_edited_hearings_are_resolved_again():
+    client = FakeSupabase(primary_keys=PRIMARY_KEYS)
+    store = WitnessEntityStore(client)
+    _write(client, _hearing(1, [{'name': 'John Smith', 'organization': 'DOE'}, {'name': 'Jane Doe'}],
+                            '2023-01-01'), 't1')
+    _write(client, _hearing(2, [{'name': 'John Smith', 'organization': 'DOE'}], '2023-02-01'), 't1')
+    _write(client, _hearing(3, [{'name': 'Jane Doe'}, {'name': 'Bob Brown'}], '2023-03-01'), 't1')
+    store.resolve_new_hearings()
+
+    # Smith (still listed by hearing 2) replaced and Doe dropped; Bob Brown, only seen here, renamed
+    _write(client, _hearing(1, [{'name': 'Alice Green'}], '2023-01-01'), 't2')
+    _write(client, _hearing(3, [{'name': 'Jane Doe'}, {'name': 'Robert Browne'}], '2023-03-01'), 't3')
+    _write(client, _hearing(4, [{'name': 'Alice Green'}], '2024-02-01'), 't3')
+    stats = store.resolve_new_hearings()
+    assert stats['hearings'] == 3 and stats['entities_removed'] == 1
+    _assert_matches_full_resolution(client)
+    # hw-1-1 still belongs to John Smith, so Alice Green, first seen at the same position, gets another ID
+    ids = {e['canonical_name']: e['entity_id'] for e in client.tables[ENTITIES_TABLE]}
+    assert ids['John Smith'] == 'hw-1-1' and ids['Alice Green'] == 'hw-1-1-2'
+
+    # Hearing 2 loses its only witness and later lists a new one: hw-2-1 is not among
+    # its appearances any more, but is still taken by the witness hearing 5 shares
+    _write(client, _hearing(5, [{'name': 'Carol White'}], '2024-03-01'), 't4')
+    _write(client, _hearing(2, [{'name': 'Carol White'}], '2023-02-01'), 't4')
+    store.resolve_new_hearings()
+    _write(client, _hearing(2, [], '2023-02-01'), 't5')
+    store.resolve_new_hearings()
+    _write(client, _hearing(2, [{'name': 'Dan Black'}], '2023-02-01'), 't6')
+    store.resolve_new_hearings()
+    _assert_matches_full_resolution(client)
+    ids = {e['canonical_name']: e['entity_id'] for e in client.tables[ENTITIES_TABLE]}
+    assert ids['Carol White'] == 'hw-2-1' and ids['Dan Black'] == 'hw-2-1-2'
+
+
+def test_rebuild_resolves_every_hearing_again():
+    client = FakeSupabase(primary_keys=PRIMARY_KEYS)
+    store = WitnessEntityStore(client)
+    for hearing_id in (1, 2, 3):
+        _write(client, _hearing(hearing_id, [{'name': f'Witness {hearing_id} Person'}], '2023-01-01'), 't1')
+    store.resolve_new_hearings()
+    client.tables[ENTITIES_TABLE][0]['canonical_name'] = 'Corrupted'
+    _write(client, _hearing(4, [{'name': 'Witness 1 Person'}], '2023-02-01'), 't2')
+
+    stats = store.rebuild(page_size=2)
+    assert stats['hearings'] == 4 and stats['appearances'] == 4
+    _assert_matches_full_resolution(client)